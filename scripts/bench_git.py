@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Benchmark reading git metadata directly against spawning git.
+
+Creates a few repositories (each with loose and packed commits, packed
+refs and remote branches) and compares the git commands the dashboard used
+to run with collectors.git_reader: last commit time for the repos panel,
+the current branch and last commit date for backup checks, and the remote
+branch listing for branch cleanup.
+
+Usage:
+    python scripts/bench_git.py                  # 10 repos, 200 rounds
+    python scripts/bench_git.py --repo ~/repos/x # benchmark an existing checkout
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def git(path: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True, env=ENV
+    )
+    return result.stdout.strip()
+
+
+def make_repo(path: Path, commits: int = 50, branches: int = 20) -> Path:
+    """A clone whose origin has ``branches`` branches; the newest commit is loose."""
+    origin = path.with_name(path.name + "-origin")
+    origin.mkdir(parents=True)
+    git(origin, "init", "-q", "-b", "main")
+    for i in range(commits):
+        (origin / "file.txt").write_text(f"change {i}\n")
+        git(origin, "add", "file.txt")
+        git(origin, "commit", "-q", "-m", f"change {i}")
+        if i and i % max(1, commits // branches) == 0:
+            git(origin, "branch", f"feature-{i}")
+    git(origin, "gc", "-q")
+    git(path.parent, "clone", "-q", str(origin), str(path))
+    (path / "file.txt").write_text("loose\n")
+    git(path, "commit", "-q", "-am", "loose")
+    return path
+
+
+def timed(label: str, rounds: int, fn: Callable[[], Any]) -> tuple[float, Any]:
+    """Run fn ``rounds`` times and print the time per round."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {label:<40} {elapsed * 1000:8.3f}ms")
+    return elapsed, result
+
+
+def bench_last_commit(paths: list[Path], rounds: int) -> None:
+    """Last commit time of every repository (repos.collect)."""
+    from openclaw_dash.collectors import git_reader
+
+    def spawn() -> list[str]:
+        return [git(p, "log", "-1", "--format=%ct") for p in paths]
+
+    def read() -> list[str]:
+        return [str(git_reader.get_reader(p).last_commit().timestamp) for p in paths]
+
+    print(f"Last commit of {len(paths)} repos:")
+    t_old, old = timed("git log -1 per repo", rounds, spawn)
+    git_reader.reset_readers()
+    timed("GitReader, first read", 1, read)
+    t_new, new = timed("GitReader, cached", rounds, read)
+    assert old == new, "last commit results differ"
+    print(f"  speedup: {t_old / t_new:.0f}x\n")
+
+
+def bench_sync_status(paths: list[Path], rounds: int) -> None:
+    """Branch, remotes and last commit date (BackupVerifier.check_sync_status)."""
+    from openclaw_dash.collectors import git_reader
+
+    def spawn() -> list[tuple[str, bool, str]]:
+        results = []
+        for p in paths:
+            git(p, "rev-parse", "--is-inside-work-tree")
+            results.append(
+                (
+                    git(p, "branch", "--show-current"),
+                    bool(git(p, "remote")),
+                    git(p, "log", "-1", "--format=%ct"),
+                )
+            )
+        return results
+
+    def read() -> list[tuple[str, bool, str]]:
+        results = []
+        for p in paths:
+            reader = git_reader.get_reader(git_reader.find_worktree(p))
+            commit = reader.last_commit()
+            results.append((reader.head().branch, bool(reader.remotes()), str(commit.timestamp)))
+        return results
+
+    print(f"Sync status of {len(paths)} repos (without rev-list/status):")
+    t_old, old = timed("rev-parse, branch, remote, log", rounds, spawn)
+    t_new, new = timed("GitReader", rounds, read)
+    assert old == new, "sync status results differ"
+    print(f"  speedup: {t_old / t_new:.0f}x\n")
+
+
+def bench_remote_branches(path: Path, rounds: int) -> None:
+    """Remote branches with dates and authors (PRAutomation.get_remote_branches)."""
+    from openclaw_dash.collectors import git_reader
+
+    def spawn() -> set[tuple[str, str, str]]:
+        out = git(
+            path,
+            "for-each-ref",
+            "--sort=-committerdate",
+            "refs/remotes/origin",
+            "--format=%(refname)|%(committerdate:unix)|%(authorname)",
+        )
+        return {tuple(line.split("|")) for line in out.splitlines()}  # type: ignore[misc]
+
+    def read() -> set[tuple[str, str, str]]:
+        reader = git_reader.get_reader(path)
+        results = set()
+        for ref, sha in reader.refs("refs/remotes/origin/").items():
+            commit = reader.commit(sha)
+            results.add((ref, str(commit.timestamp), commit.author))
+        return results
+
+    print(f"Remote branches of one repo ({len(spawn())} refs):")
+    t_old, old = timed("git for-each-ref", rounds, spawn)
+    t_new, new = timed("GitReader", rounds, read)
+    assert old == new, "remote branch results differ"
+    print(f"  speedup: {t_old / t_new:.0f}x\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=10, help="Synthetic repositories")
+    parser.add_argument("--rounds", type=int, default=200, help="Repetitions per measurement")
+    parser.add_argument("--repo", type=Path, help="Benchmark an existing checkout instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.repo is not None:
+            paths = [args.repo.expanduser().resolve()]
+        else:
+            print(f"Creating {args.repos} repositories...\n")
+            paths = [make_repo(Path(tmp) / f"repo-{i}") for i in range(args.repos)]
+
+        bench_last_commit(paths, args.rounds)
+        bench_sync_status(paths, args.rounds)
+        bench_remote_branches(paths[0], args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Benchmark gateway log scanning.
+
+Generates a synthetic gateway log (1GB by default) and compares the
+line-by-line text scan the dashboard used to do against the mmap-backed
+byte-level scan in collectors.logs / metrics.performance, the old
+keyword-scan level classifier against the single-pass one, and indexed log
+search (collectors.log_index) against a full scan.
+
+Usage:
+    python scripts/bench_logs.py                 # 1GB log in a temp dir
+    python scripts/bench_logs.py --size-mb 100   # smaller run
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+TAGS = ["gateway", "ws", "discord", "session", "tool", "cron", "error"]
+MESSAGES = [
+    "heartbeat ok",
+    "session main:discord updated (42 tokens)",
+    "exec: command completed in 245ms",
+    "client disconnected",
+    "request failed: upstream timeout",
+    "warning: context at 85%",
+    "listening on 127.0.0.1:18789",
+]
+ACTIONS = ["chat.send", "sessions.list", "tools.invoke", "status", "cron.list"]
+
+
+def generate_log(path: Path, size_mb: int, seed: int = 1) -> int:
+    """Write a synthetic gateway log of roughly size_mb megabytes.
+
+    Returns:
+        Number of lines written.
+    """
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    lines = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            block = []
+            for _ in range(10_000):
+                ts = f"2026-02-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00.000Z"
+                if rng.random() < 0.15:
+                    mark = "✗" if rng.random() < 0.05 else "✓"
+                    action = rng.choice(ACTIONS)
+                    block.append(f"{ts} [ws] SYNC res {mark} {action} {rng.randint(1, 900)}ms\n")
+                else:
+                    block.append(f"{ts} [{rng.choice(TAGS)}] {rng.choice(MESSAGES)}\n")
+            chunk = "".join(block)
+            f.write(chunk)
+            written += len(chunk.encode())
+            lines += len(block)
+    return lines
+
+
+def timed(label: str, fn: Callable[[], Any]) -> tuple[float, Any]:
+    """Run fn once and print its wall time."""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed:8.3f}s")
+    return elapsed, result
+
+
+def baseline_parse_logs(perf: Any, path: Path) -> dict[str, int]:
+    """The previous PerformanceMetrics.parse_logs loop: decode and parse every line."""
+    counts: dict[str, int] = {}
+    with open(path, errors="ignore") as f:
+        for line in f:
+            parsed = perf._parse_log_line(line)
+            if parsed and parsed.get("type") == "ws_response":
+                counts[parsed["action"]] = counts.get(parsed["action"], 0) + 1
+    return counts
+
+
+def bench_scan(path: Path) -> None:
+    """Compare full-file performance scans."""
+    from openclaw_dash.metrics import PerformanceMetrics
+
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        perf = PerformanceMetrics(metrics_dir=Path(metrics_dir))
+        print("Full scan (PerformanceMetrics.parse_logs):")
+        t_old, old = timed("line-by-line str decode", lambda: baseline_parse_logs(perf, path))
+        with patch.object(perf, "_find_log_files", return_value=[path]):
+            t_new, new = timed("mmap + byte prefilter", perf.parse_logs)
+
+    assert old == {name: m.count for name, m in new.items()}, "scan results differ"
+    print(f"  speedup: {t_old / t_new:.1f}x\n")
+
+
+def bench_tail(path: Path, n: int = 5000) -> None:
+    """Compare filtered tail reads of the log collector."""
+    from openclaw_dash.collectors import logs
+
+    def baseline() -> int:
+        kept = 0
+        for line in logs._tail_file_chunked(path, n):
+            parsed = logs.parse_log_line(line)
+            if parsed and logs.get_log_level(parsed["tag"], parsed["message"]) == "error":
+                kept += 1
+        return kept
+
+    def prefiltered() -> int:
+        prefilter = logs.make_line_prefilter(filter_level="error")
+        kept = 0
+        for line in logs.tail_file(path, n, prefilter=prefilter):
+            parsed = logs.parse_log_line(line)
+            if parsed and logs.get_log_level(parsed["tag"], parsed["message"]) == "error":
+                kept += 1
+        return kept
+
+    print(f"Tail {n} lines filtered to errors (logs.collect):")
+    t_old, old = timed("buffered read + decode all", baseline)
+    t_new, new = timed("mmap + byte prefilter", prefiltered)
+    assert old == new, "tail results differ"
+    print(f"  speedup: {t_old / t_new:.1f}x\n")
+
+
+def reference_log_level(tag: str, message: str) -> str:
+    """The previous get_log_level: keyword scans driven by any() generators."""
+    message_lower = message.lower()
+    tag_lower = tag.lower()
+
+    if any(word in message_lower for word in ["error", "failed", "exception"]):
+        return "error"
+    elif any(word in message_lower for word in ["warn", "warning"]):
+        return "warning"
+    elif any(word in tag_lower for word in ["error", "err"]):
+        return "error"
+    elif "disconnect" in message_lower or "shutting down" in message_lower:
+        return "warning"
+    elif "started" in message_lower or "ready" in message_lower or "listening" in message_lower:
+        return "info"
+    else:
+        return "debug"
+
+
+def bench_classifier(path: Path, n: int = 200_000) -> None:
+    """Compare the single-pass level classifier with the keyword scans."""
+    from openclaw_dash.collectors import logs
+
+    pairs = []
+    for line in logs.tail_file(path, n):
+        parsed = logs.parse_log_line(line)
+        if parsed:
+            pairs.append((parsed["tag"], parsed["message"]))
+
+    # One alternation regex finding every keyword in a single pass; kept for
+    # comparison since CPython's regex engine loses to C substring scans here
+    keyword_re = re.compile(
+        "startedisconnect|failedisconnect|erroready|error|failed|exception|warn"
+        "|disconnect|shutting down|started|ready|listening"
+    )
+    ranks = {"error": 0, "failed": 0, "exception": 0, "erroready": 0, "failedisconnect": 0}
+    ranks.update({"warn": 1, "disconnect": 3, "shutting down": 3, "startedisconnect": 3})
+    ranks.update({"started": 4, "ready": 4, "listening": 4})
+    levels = ("error", "warning", "error", "warning", "info", "debug")
+
+    def regex_level(tag: str, message: str) -> str:
+        rank = min(map(ranks.__getitem__, keyword_re.findall(message.lower())), default=5)
+        if rank > 2 and "err" in tag.lower():
+            return "error"
+        return levels[rank]
+
+    print(f"Classify {len(pairs):,} lines (logs.get_log_level):")
+    t_old, old = timed("any() keyword scans", lambda: [reference_log_level(t, m) for t, m in pairs])
+    timed("single-pass alternation regex", lambda: [regex_level(t, m) for t, m in pairs])
+    t_new, new = timed("substring chain", lambda: [logs.get_log_level(t, m) for t, m in pairs])
+    assert old == new, "classifier results differ"
+    print(f"  speedup: {t_old / t_new:.1f}x\n")
+
+
+def bench_search(path: Path) -> None:
+    """Time index build, reload and first-page searches against a full scan."""
+    from openclaw_dash.collectors import log_index
+
+    queries = ["timeout", "tag:ws chat send", "tag:error disconnected", "since:2026-02-27 ready"]
+    with tempfile.TemporaryDirectory() as index_dir:
+        print("Log search (collectors.log_index):")
+        index = log_index.LogIndex(path, Path(index_dir))
+        timed("build index", index.update)
+        timed("save index", lambda: index.save(force=True))
+        timed("load index", log_index.LogIndex(path, Path(index_dir)).load)
+        for text in queries:
+            query = log_index.LogQuery.parse(text)
+            tokens = query.term_tokens
+
+            def full_scan(query: Any = query, tokens: set[bytes] = tokens) -> list[str]:
+                found = []
+                with open(path, "rb") as f:
+                    for raw in f:
+                        entry = log_index.matches_line(raw.rstrip(b"\n"), query, tokens)
+                        if entry is not None:
+                            found.append(entry["raw"])
+                return found[-50:][::-1]
+
+            t_old, old = timed(f"scan: {text}", full_scan)
+            t_new, new = timed(
+                f"index: {text}",
+                lambda text=text: log_index.search(
+                    text, limit=50, log_files=[path], index_dir=Path(index_dir)
+                ),
+            )
+            assert old == [e["raw"] for e in new["entries"]], "search results differ"
+        print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024, help="Synthetic log size")
+    parser.add_argument("--log", type=Path, help="Benchmark an existing log instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.log
+        if path is None:
+            path = Path(tmp) / "gateway.log"
+            print(f"Generating {args.size_mb}MB synthetic log...")
+            lines = generate_log(path, args.size_mb)
+            print(f"  {lines:,} lines\n")
+
+        bench_scan(path)
+        bench_tail(path)
+        bench_classifier(path)
+        bench_search(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,7 +27,7 @@ from openclaw_dash.widgets.channels import ChannelsPanel
 from openclaw_dash.widgets.connection_warning import ConnectionWarningBanner
 from openclaw_dash.widgets.help_panel import HelpScreen
 from openclaw_dash.widgets.input_pane import CommandSent, InputPane
-from openclaw_dash.widgets.logs import LogsPanel
+from openclaw_dash.widgets.logs import LogSearchScreen, LogsPanel
 from openclaw_dash.widgets.metric_boxes import MetricBoxesBar
 from openclaw_dash.widgets.metrics import MetricsPanel
 from openclaw_dash.widgets.notifications import (
@@ -124,24 +124,48 @@ class ActivityPanel(Static):
 
 
 class ReposPanel(Static):
-    """Repository status panel."""
+    """Repository status panel.
+
+    Repositories are collected on a worker thread: each row appears as soon
+    as its repository's git work finishes, and its PR count and health
+    follow once the batched GitHub request returns.
+    """
 
     def compose(self) -> ComposeResult:
         table: DataTable[str] = DataTable(id="repos-table", zebra_stripes=True)
-        table.add_columns("Repo", "Health", "PRs", "Last Commit")
+        self._columns = table.add_columns("Repo", "Health", "PRs", "Last Commit")
         yield table
 
     def refresh_data(self) -> None:
-        data = repos.collect()
+        self.run_worker(self._collect, thread=True, exclusive=True, group="repos")
+
+    def _collect(self) -> None:
+        data = repos.collect(on_repo=lambda r: self.app.call_from_thread(self._show_repo, r))
+        self.app.call_from_thread(self._show_repos, data.get("repos", []))
+
+    def _show_repo(self, r: dict[str, Any]) -> None:
+        """Add or update one repository's row."""
+        table: DataTable[str] = self.query_one("#repos-table", DataTable)
+        pending = r.get("open_prs") is None
+        cells = (
+            r.get("name", "?"),
+            "…" if pending else r.get("health", "?"),
+            "…" if pending else str(r.get("open_prs", 0)),
+            r.get("last_commit", "?"),
+        )
+        key = r.get("name", "?")
+        if key in table.rows:
+            for column, value in zip(self._columns, cells):
+                table.update_cell(key, column, value)
+        else:
+            table.add_row(*cells, key=key)
+
+    def _show_repos(self, entries: list[dict[str, Any]]) -> None:
+        """Replace the rows with the final entries, in the configured order."""
         table: DataTable[str] = self.query_one("#repos-table", DataTable)
         table.clear()
-        for r in data.get("repos", []):
-            table.add_row(
-                r.get("name", "?"),
-                r.get("health", "?"),
-                str(r.get("open_prs", 0)),
-                r.get("last_commit", "?"),
-            )
+        for r in entries:
+            self._show_repo(r)
 
 
 class CronPanel(Static):
@@ -411,6 +435,7 @@ class DashboardApp(App):
         ("c", "focus_panel('cron-panel')", "Cron"),
         ("p", "focus_panel('repos-panel')", "Repos"),
         ("l", "focus_panel('logs-panel')", "Logs"),
+        ("ctrl+f", "search_logs", "Search Logs"),
         ("n", "focus_panel('agents-panel')", "Agents"),
         ("x", "toggle_resources", "Resources"),
         # Jump mode
@@ -743,6 +768,10 @@ class DashboardApp(App):
         """Show the help panel with keyboard shortcuts."""
         self.push_screen(HelpScreen())
 
+    def action_search_logs(self) -> None:
+        """Show the log search screen."""
+        self.push_screen(LogSearchScreen())
+
     def action_settings(self) -> None:
         """Show the settings screen."""
         self.push_screen(SettingsScreen())
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from openclaw_dash.collectors.git_reader import find_worktree, get_reader
+
 
 @dataclass
 class BackupConfig:
@@ -155,9 +157,9 @@ class BackupVerifier:
         """Check git sync status of workspace."""
         workspace = self.config.workspace_path
 
-        # Check if it's a git repo
-        code, _, _ = run(["git", "rev-parse", "--is-inside-work-tree"], cwd=workspace)
-        if code != 0:
+        # Check if it's a git repo; refs and the last commit are read from .git directly
+        root = find_worktree(workspace) if workspace.is_dir() else None
+        if root is None:
             return SyncCheck(
                 is_git_repo=False,
                 has_remote=False,
@@ -169,16 +171,17 @@ class BackupVerifier:
                 status="not-a-repo",
             )
 
-        # Get current branch
-        _, branch, _ = run(["git", "branch", "--show-current"], cwd=workspace)
+        reader = get_reader(root)
+        head = reader.head()
+        branch = head.branch or ""
 
         # Check for remote
-        code, remotes, _ = run(["git", "remote"], cwd=workspace)
-        has_remote = bool(remotes.strip())
+        has_remote = bool(reader.remotes())
 
-        # Get ahead/behind counts
+        # Get ahead/behind counts (only needs git when the branches differ)
         ahead, behind = 0, 0
-        if has_remote:
+        upstream = reader.resolve(f"refs/remotes/origin/{branch}") if branch else None
+        if has_remote and upstream is not None and upstream != head.sha:
             _, status, _ = run(
                 ["git", "rev-list", "--left-right", "--count", f"origin/{branch}...HEAD"],
                 cwd=workspace,
@@ -194,14 +197,9 @@ class BackupVerifier:
         _, diff_output, _ = run(["git", "status", "--porcelain"], cwd=workspace)
         uncommitted = len([line for line in diff_output.split("\n") if line.strip()])
 
-        # Get last commit date
-        _, commit_date_str, _ = run(["git", "log", "-1", "--format=%ci"], cwd=workspace)
-        try:
-            last_commit_date = datetime.fromisoformat(
-                commit_date_str.replace(" ", "T").split("+")[0]
-            )
-        except ValueError:
-            last_commit_date = None
+        # Get last commit date (committer's local time, as ``git log --format=%ci`` shows it)
+        commit = reader.last_commit()
+        last_commit_date = commit.committed_at.replace(tzinfo=None) if commit else None
 
         # Determine status
         if uncommitted > 0:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from openclaw_dash.collectors.git_reader import find_worktree, get_reader
+from openclaw_dash.collectors.github import get_github_data, repo_slug
 from openclaw_dash.pr_workflow import PRWorkflow
 
 
@@ -81,59 +82,35 @@ class PRAutomation:
         self.repo_name = repo_path.name
 
     def get_open_prs(self) -> list[PRInfo]:
-        """Get all open PRs for the repository."""
-        code, stdout, stderr = run(
-            [
-                "gh",
-                "pr",
-                "list",
-                "--json",
-                "number,title,headRefName,state,mergeable,statusCheckRollup,reviews,labels,author,createdAt,url",
-            ],
-            cwd=self.repo_path,
-        )
-
-        if code != 0:
-            raise RuntimeError(f"Failed to list PRs: {stderr}")
-
-        prs = []
-        for pr_data in json.loads(stdout or "[]"):
-            # Determine CI status
-            checks = pr_data.get("statusCheckRollup", []) or []
-            if not checks:
-                ci_status = "pending"
-            elif all(
-                c.get("conclusion") == "SUCCESS" or c.get("state") == "SUCCESS" for c in checks
-            ):
-                ci_status = "success"
-            elif any(
-                c.get("conclusion") == "FAILURE" or c.get("state") == "FAILURE" for c in checks
-            ):
-                ci_status = "failure"
-            else:
-                ci_status = "pending"
-
-            # Count approvals
-            reviews = pr_data.get("reviews", []) or []
-            approvals = sum(1 for r in reviews if r.get("state") == "APPROVED")
-
-            prs.append(
-                PRInfo(
-                    number=pr_data["number"],
-                    title=pr_data["title"],
-                    branch=pr_data["headRefName"],
-                    state=pr_data["state"],
-                    mergeable=pr_data.get("mergeable", "UNKNOWN") == "MERGEABLE",
-                    ci_status=ci_status,
-                    approvals=approvals,
-                    labels=[lbl.get("name", "") for lbl in (pr_data.get("labels") or [])],
-                    author=pr_data.get("author", {}).get("login", "unknown"),
-                    created_at=pr_data.get("createdAt", ""),
-                    url=pr_data.get("url", ""),
-                )
+        """Get all open PRs for the repository.
+
+        Reads the shared batched GitHub data, so repos prefetched together
+        (see cmd_auto_merge) cost no extra API calls here.
+        """
+        slug = repo_slug(self.repo_path)
+        if slug is None:
+            raise RuntimeError(f"Failed to list PRs: no GitHub remote for {self.repo_path}")
+
+        snapshot = get_github_data().repo(slug)
+        if snapshot.error:
+            raise RuntimeError(f"Failed to list PRs: {snapshot.error}")
+
+        return [
+            PRInfo(
+                number=pr.number,
+                title=pr.title,
+                branch=pr.branch,
+                state=pr.state,
+                mergeable=pr.mergeable == "MERGEABLE",
+                ci_status=pr.ci_status,
+                approvals=pr.approvals,
+                labels=list(pr.labels),
+                author=pr.author,
+                created_at=pr.created_at,
+                url=pr.url,
             )
-
-        return prs
+            for pr in snapshot.open_prs
+        ]
 
     def is_safe_to_merge(
         self,
@@ -170,6 +147,7 @@ class PRAutomation:
     def auto_merge(self, config: MergeConfig, workflow: PRWorkflow | None = None) -> list[dict]:
         """Auto-merge eligible PRs."""
         results = []
+        merged = False
         prs = self.get_open_prs()
 
         for pr in prs:
@@ -195,6 +173,7 @@ class PRAutomation:
                     code, stdout, stderr = run(merge_cmd, cwd=self.repo_path)
 
                     if code == 0:
+                        merged = True
                         results.append(
                             {
                                 "pr": pr.number,
@@ -225,6 +204,11 @@ class PRAutomation:
                     }
                 )
 
+        if merged:
+            slug = repo_slug(self.repo_path)
+            if slug:
+                get_github_data().invalidate(slug)
+
         return results
 
     def get_remote_branches(self) -> list[BranchInfo]:
@@ -232,20 +216,13 @@ class PRAutomation:
         # Fetch latest
         run(["git", "fetch", "--prune"], cwd=self.repo_path)
 
-        # Get branches with last commit date
-        code, stdout, stderr = run(
-            [
-                "git",
-                "for-each-ref",
-                "--sort=-committerdate",
-                "refs/remotes/origin",
-                "--format=%(refname:short)|%(committerdate:iso)|%(authorname)",
-            ],
-            cwd=self.repo_path,
-        )
-
-        if code != 0:
-            raise RuntimeError(f"Failed to list branches: {stderr}")
+        # Get branches with last commit date, read from .git directly
+        root = find_worktree(self.repo_path) if self.repo_path.is_dir() else None
+        if root is None:
+            raise RuntimeError(f"Failed to list branches: {self.repo_path} is not a git repository")
+        reader = get_reader(root)
+        prefix = "refs/remotes/origin/"
+        refs = reader.refs(prefix)
 
         # Get list of merged branches (try main first, fall back to master)
         _, merged_stdout, _ = run(
@@ -260,40 +237,29 @@ class PRAutomation:
         merged_branches = {b.strip() for b in merged_stdout.split("\n") if b.strip()}
 
         branches = []
-        for line in stdout.split("\n"):
-            if not line.strip():
-                continue
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-
-            name = parts[0].replace("origin/", "")
+        for ref, sha in refs.items():
+            name = ref[len(prefix) :]
             if name in ("HEAD", "main", "master"):
                 continue
 
-            try:
-                # Parse date and ensure it's timezone-aware (assume UTC if naive)
-                raw_date = parts[1].strip().replace(" ", "T")
-                # Strip timezone suffix for consistent parsing, then add UTC
-                for sep in ("+", "-", "Z"):
-                    if sep in raw_date[10:]:  # Don't split on date separators
-                        raw_date = raw_date.split(sep)[0] if sep != "Z" else raw_date.rstrip("Z")
-                        break
-                commit_date = datetime.fromisoformat(raw_date).replace(tzinfo=timezone.utc)
-            except ValueError:
-                commit_date = datetime.now(timezone.utc)
-
+            commit = reader.commit(sha)
             is_merged = f"origin/{name}" in merged_branches
 
             branches.append(
                 BranchInfo(
                     name=name,
-                    last_commit_date=commit_date,
+                    last_commit_date=(
+                        commit.committed_at.astimezone(timezone.utc)
+                        if commit
+                        else datetime.now(timezone.utc)
+                    ),
                     is_merged=is_merged,
-                    author=parts[2].strip(),
+                    author=commit.author if commit else "",
                 )
             )
 
+        # Most recently committed first, as ``git for-each-ref --sort=-committerdate``
+        branches.sort(key=lambda b: b.last_commit_date, reverse=True)
         return branches
 
     def is_branch_protected(self, branch_name: str, protect_patterns: list[str]) -> bool:
@@ -231,6 +231,49 @@ def print_metrics_text(metrics: dict[str, Any]) -> None:
         console.print(table)
 
 
+def print_backfill_text(result: dict[str, Any]) -> None:
+    """Print performance backfill results in human-readable format.
+
+    Args:
+        result: Dictionary returned by PerformanceMetrics.backfill().
+    """
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+
+    mb = result.get("bytes", 0) / (1024 * 1024)
+    seconds = result.get("duration_ms", 0) / 1000
+    rate = mb / seconds if seconds > 0 else 0
+    console.print(
+        f"[bold cyan]Backfilled[/] {result.get('files', 0)} files "
+        f"({mb:.1f} MB, {result.get('responses', 0):,} responses) "
+        f"in {seconds:.2f}s with {result.get('jobs', 1)} workers ({rate:.1f} MB/s)"
+    )
+
+    days = result.get("days", {})
+    if not days:
+        console.print("[dim]No gateway response lines found.[/]")
+        return
+
+    table = Table(title="Performance History", box=box.SIMPLE)
+    table.add_column("Date")
+    table.add_column("Calls", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Avg", justify="right")
+    table.add_column("p95", justify="right")
+    for day, d in sorted(days.items()):
+        table.add_row(
+            day,
+            f"{d['total_calls']:,}",
+            str(d["total_errors"]),
+            f"{d['avg_latency_ms']:.0f}ms",
+            f"{d['p95_latency_ms']:.0f}ms",
+        )
+    console.print(table)
+
+
 def print_status_text(status: dict[str, Any]) -> None:
     """Print status in human-readable format.
 
@@ -598,6 +641,7 @@ def cmd_auto_merge(args: argparse.Namespace) -> int:
         PRAutomation,
         format_merge_results,
     )
+    from openclaw_dash.collectors.github import get_github_data, repo_slug
 
     repos = ["synapse-engine", "r3LAY", "t3rra1n", "openclaw-dash"]
     if args.repo:
@@ -605,8 +649,12 @@ def cmd_auto_merge(args: argparse.Namespace) -> int:
 
     config = MergeConfig(dry_run=args.dry_run)
 
-    for repo in repos:
-        repo_path = Path.home() / "repos" / repo
+    # Fetch the open PRs of every repo in one batched query up front
+    repo_paths = [Path.home() / "repos" / repo for repo in repos]
+    slugs = [repo_slug(path) for path in repo_paths if path.exists()]
+    get_github_data().repos([slug for slug in slugs if slug])
+
+    for repo, repo_path in zip(repos, repo_paths):
         if not repo_path.exists():
             continue
         automation = PRAutomation(repo_path)
@@ -1027,6 +1075,24 @@ def main() -> int:
     metrics_parser.add_argument("--costs", action="store_true", help="Show only costs")
     metrics_parser.add_argument("--performance", action="store_true", help="Show only performance")
     metrics_parser.add_argument("--github", action="store_true", help="Show only GitHub metrics")
+    metrics_parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Rebuild performance history from all gateway logs in parallel",
+    )
+    metrics_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for --backfill (default: CPU count)",
+    )
+    metrics_parser.add_argument(
+        "--migrate-sqlite",
+        action="store_true",
+        help="Import JSON metrics history into metrics.db and switch to the SQLite backend",
+    )
 
     # Auto subcommand
     auto_parser = subparsers.add_parser("auto", help="Automation commands")
@@ -1171,6 +1237,33 @@ def main() -> int:
 
     # Handle metrics command
     if args.command == "metrics":
+        if args.migrate_sqlite:
+            from openclaw_dash.config import load_config
+            from openclaw_dash.metrics.costs import DEFAULT_METRICS_DIR
+            from openclaw_dash.metrics.store import DB_FILENAME, MetricsStore
+
+            store = MetricsStore(DEFAULT_METRICS_DIR / DB_FILENAME)
+            counts = store.migrate_from_json(DEFAULT_METRICS_DIR)
+            store.close()
+            load_config().update(metrics_backend="sqlite")
+            if args.metrics_json:
+                print(json.dumps({"database": str(store.path), "imported": counts}, indent=2))
+            else:
+                imported = ", ".join(f"{n} {table}" for table, n in counts.items())
+                print(f"Imported {imported} into {store.path}")
+                print("Metrics backend set to sqlite in config.toml")
+            return 0
+
+        if args.backfill:
+            from openclaw_dash.metrics import PerformanceMetrics
+
+            result = PerformanceMetrics().backfill(jobs=args.jobs)
+            if args.metrics_json:
+                print(json.dumps(result, indent=2, default=str))
+            else:
+                print_backfill_text(result)
+            return 0
+
         metrics = get_metrics()
 
         # Filter if specific metric requested
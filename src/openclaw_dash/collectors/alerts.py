@@ -16,6 +16,7 @@ from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
+from openclaw_dash.collectors.github import get_github_data
 from openclaw_dash.demo import is_demo_mode
 
 
@@ -76,70 +77,55 @@ CONTEXT_CRITICAL_PCT = 90
 
 
 def collect_ci_failures(repos: list[str] | None = None) -> list[Alert]:
-    """Collect recent CI/CD failures from GitHub Actions."""
+    """Collect recent CI/CD failures from GitHub Actions.
+
+    Failed runs for all repos come from one batched GitHub query (see
+    openclaw_dash.collectors.github).
+    """
     alerts: list[Alert] = []
     repos_to_check = repos or _load_repos_from_config()
+    if not repos_to_check:
+        return alerts
 
+    snapshots = get_github_data().repos(repos_to_check)
     for repo in repos_to_check:
-        try:
-            # Get recent failed workflow runs
-            result = subprocess.run(
-                [
-                    "gh",
-                    "run",
-                    "list",
-                    "--repo",
-                    repo,
-                    "--status",
-                    "failure",
-                    "--limit",
-                    "5",
-                    "--json",
-                    "databaseId,name,conclusion,createdAt,headBranch,url",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
+        snapshot = snapshots[repo]
+        if snapshot.error:
+            continue
 
-            if result.returncode != 0:
+        for run in snapshot.failed_runs:
+            # Only alert on failures from last 24h
+            try:
+                created = datetime.fromisoformat(run.created_at.replace("Z", "+00:00"))
+            except ValueError:
                 continue
+            age_hours = (datetime.now(created.tzinfo) - created).total_seconds() / 3600
 
-            runs = json.loads(result.stdout) if result.stdout.strip() else []
-
-            for run in runs:
-                # Only alert on failures from last 24h
-                created = datetime.fromisoformat(run["createdAt"].replace("Z", "+00:00"))
-                age_hours = (datetime.now(created.tzinfo) - created).total_seconds() / 3600
-
-                if age_hours > 24:
-                    continue
+            if age_hours > 24:
+                continue
 
-                # Determine severity based on branch
-                branch = run.get("headBranch", "")
-                if branch in ("main", "master"):
-                    severity = Severity.CRITICAL
-                elif branch.startswith("release"):
-                    severity = Severity.HIGH
-                else:
-                    severity = Severity.MEDIUM
+            # Determine severity based on branch
+            branch = run.branch
+            if branch in ("main", "master"):
+                severity = Severity.CRITICAL
+            elif branch.startswith("release"):
+                severity = Severity.HIGH
+            else:
+                severity = Severity.MEDIUM
 
-                repo_name = repo.split("/")[-1] if "/" in repo else repo
+            repo_name = repo.split("/")[-1] if "/" in repo else repo
 
-                alerts.append(
-                    Alert(
-                        severity=severity,
-                        title=f"CI failed: {run.get('name', 'workflow')}",
-                        source=f"github/{repo_name}",
-                        description=f"Branch: {branch}",
-                        timestamp=created.replace(tzinfo=None),
-                        url=run.get("url"),
-                        metadata={"run_id": run.get("databaseId"), "repo": repo},
-                    )
+            alerts.append(
+                Alert(
+                    severity=severity,
+                    title=f"CI failed: {run.name}",
+                    source=f"github/{repo_name}",
+                    description=f"Branch: {branch}",
+                    timestamp=created.replace(tzinfo=None),
+                    url=run.url,
+                    metadata={"run_id": run.run_id, "repo": repo},
                 )
-
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-            continue
+            )
 
     return alerts
 
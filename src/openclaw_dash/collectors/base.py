@@ -47,6 +47,7 @@ class CollectorResult:
     collected_at: datetime = field(default_factory=datetime.now)
     duration_ms: float = 0.0
     retry_count: int = 0
+    timings_ms: dict[str, float] = field(default_factory=dict)  # Per step, e.g. per repo
 
     @property
     def ok(self) -> bool:
@@ -71,6 +72,8 @@ class CollectorResult:
             result["_error_type"] = self.error_type
         if self.retry_count > 0:
             result["_retry_count"] = self.retry_count
+        if self.timings_ms:
+            result["_timings_ms"] = self.timings_ms
         return result
 
 
@@ -3,19 +3,55 @@
 Supports:
 - OpenAI: Uses the Organization Usage/Costs API (requires OPENAI_ADMIN_KEY)
 - Anthropic: Falls back to local estimation (no public billing API)
+
+Daily history is fetched as one ranged request per provider (providers in
+parallel) and kept in a per-day disk cache: a day's costs are final once it
+has settled, so only today and recently ended days are ever refetched.
 """
 
 from __future__ import annotations
 
+import json
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 import httpx
 
 from openclaw_dash.demo import is_demo_mode
 
+DEFAULT_CACHE_FILE = Path.home() / ".openclaw" / "workspace" / "metrics" / "billing-days.json"
+
+# Seconds before a cached day that may still change (today) is refetched
+TODAY_TTL = 300.0
+
+# Seconds after a (UTC) day ends before its costs are treated as final
+SETTLE_DELAY = 6 * 3600.0
+
+# Page sizes: the Costs API allows up to 180 daily buckets, usage up to 31
+COSTS_PAGE_LIMIT = 180
+USAGE_PAGE_LIMIT = 31
+
+
+class BillingAPIError(Exception):
+    """A billing API request failed."""
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    """UTC start and end of a day, the boundaries of the API's 1d buckets."""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
 
 @dataclass
 class BillingResult:
@@ -202,6 +238,93 @@ class OpenAIBilling:
             # Fall back to usage-based calculation
             return self.get_usage(start_time, end_time)
 
+    def get_daily(self, first_day: date, last_day: date) -> dict[str, BillingResult]:
+        """Fetch per-day costs for a range of UTC days in one ranged request.
+
+        Uses the Costs API's daily buckets, falling back to daily usage
+        buckets priced locally. Days the API returns no bucket for cost
+        nothing; if both endpoints fail every day carries the error.
+
+        Returns:
+            Mapping of ISO date to BillingResult.
+        """
+        days = [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+        start = _day_bounds(first_day)[0]
+        end = _day_bounds(last_day)[1]
+
+        try:
+            buckets = self._fetch_buckets("/costs", "line_item", start, end, COSTS_PAGE_LIMIT)
+            parse = self._parse_costs_response
+        except Exception:
+            try:
+                buckets = self._fetch_buckets(
+                    "/usage/completions", "model", start, end, USAGE_PAGE_LIMIT
+                )
+                parse = self._parse_usage_response
+            except Exception as e:
+                error = "API timeout" if isinstance(e, httpx.TimeoutException) else str(e)
+                return {
+                    day.isoformat(): BillingResult(
+                        provider="openai",
+                        source="estimated",
+                        cost_usd=0.0,
+                        input_tokens=0,
+                        output_tokens=0,
+                        period_start=_day_bounds(day)[0],
+                        period_end=_day_bounds(day)[1],
+                        error=error,
+                    )
+                    for day in days
+                }
+
+        by_day: dict[str, list[dict[str, Any]]] = {day.isoformat(): [] for day in days}
+        for bucket in buckets:
+            key = datetime.fromtimestamp(bucket.get("start_time", 0), timezone.utc).date()
+            if key.isoformat() in by_day:
+                by_day[key.isoformat()].append(bucket)
+
+        return {
+            day.isoformat(): parse({"data": by_day[day.isoformat()]}, *_day_bounds(day))
+            for day in days
+        }
+
+    def _fetch_buckets(
+        self, path: str, group_by: str, start: datetime, end: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        """Fetch every daily bucket of an endpoint between two times, following pages.
+
+        Raises:
+            BillingAPIError: If the API answers with a non-200 status.
+        """
+        params: dict[str, Any] = {
+            "start_time": int(start.timestamp()),
+            "end_time": int(end.timestamp()),
+            "bucket_width": "1d",
+            "group_by": [group_by],
+            "limit": limit,
+        }
+        buckets: list[dict[str, Any]] = []
+        while True:
+            response = httpx.get(
+                f"{self.BASE_URL}{path}",
+                params=params,
+                headers={
+                    "Authorization": f"Bearer {self.admin_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=10,
+            )
+            if response.status_code == 401:
+                raise BillingAPIError("Invalid OPENAI_ADMIN_KEY")
+            if response.status_code != 200:
+                raise BillingAPIError(f"API error: {response.status_code}")
+
+            data = response.json()
+            buckets.extend(data.get("data", []))
+            if not data.get("has_more") or not data.get("next_page"):
+                return buckets
+            params = {**params, "page": data["next_page"]}
+
     def _parse_usage_response(
         self, data: dict[str, Any], start_time: datetime, end_time: datetime
     ) -> BillingResult:
@@ -264,30 +387,19 @@ class OpenAIBilling:
         )
 
     def _calculate_cost(self, breakdown: dict[str, dict[str, int]]) -> float:
-        """Calculate cost from token counts using OpenAI pricing."""
-        # OpenAI pricing per 1M tokens (as of early 2025)
-        # Order matters: more specific matches first
-        pricing = [
-            ("gpt-4o-mini", {"input": 0.15, "output": 0.60}),
-            ("gpt-4o", {"input": 2.50, "output": 10.00}),
-            ("gpt-4-turbo", {"input": 10.00, "output": 30.00}),
-            ("gpt-4", {"input": 30.00, "output": 60.00}),
-            ("gpt-3.5-turbo", {"input": 0.50, "output": 1.50}),
-            ("o1-mini", {"input": 3.00, "output": 12.00}),
-            ("o1", {"input": 15.00, "output": 60.00}),
-        ]
+        """Calculate cost from token counts using the shared pricing table."""
+        from openclaw_dash.metrics.pricing import price_for
+
+        # Unknown models are priced as gpt-4o rather than the table default
         default_pricing = {"input": 2.50, "output": 10.00}
 
         total = 0.0
         for model, tokens in breakdown.items():
-            # Find matching pricing (handle model variants)
-            # More specific matches first due to ordering
-            model_pricing = default_pricing
-            model_lower = model.lower()
-            for key, prices in pricing:
-                if key in model_lower:
-                    model_pricing = prices
-                    break
+            price = price_for(model)
+            if price.key == "default":
+                model_pricing = default_pricing
+            else:
+                model_pricing = {"input": price.input, "output": price.output}
 
             input_cost = (tokens["input_tokens"] / 1_000_000) * model_pricing["input"]
             output_cost = (tokens["output_tokens"] / 1_000_000) * model_pricing["output"]
@@ -336,13 +448,96 @@ class AnthropicBilling:
             error="Anthropic does not provide a billing API - using local estimation",
         )
 
+    def get_daily(self, first_day: date, last_day: date) -> dict[str, BillingResult]:
+        """Per-day estimation notices for a range of UTC days."""
+        results = {}
+        for i in range((last_day - first_day).days + 1):
+            day = first_day + timedelta(days=i)
+            results[day.isoformat()] = self.get_usage(*_day_bounds(day))
+        return results
+
+
+def _result_dict(result: BillingResult) -> dict[str, Any]:
+    return {
+        "source": result.source,
+        "cost_usd": result.cost_usd,
+        "input_tokens": result.input_tokens,
+        "output_tokens": result.output_tokens,
+        "period_start": result.period_start.isoformat(),
+        "period_end": result.period_end.isoformat(),
+        "breakdown": result.breakdown,
+        "error": result.error,
+    }
+
+
+class BillingDayCache:
+    """Per-provider, per-day billing results kept on disk.
+
+    A day fetched after it settled (SETTLE_DELAY past its end) never changes
+    and is served from the cache forever; any other day is refetched once its
+    entry is older than TODAY_TTL. Only successful API results are stored.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_CACHE_FILE
+        self._lock = threading.Lock()
+        self._days: dict[str, dict[str, dict[str, Any]]] | None = None
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._days is None:
+            try:
+                self._days = json.loads(self.path.read_text())
+            except (OSError, json.JSONDecodeError):
+                self._days = {}
+        return self._days
+
+    def get(self, provider: str, day: date, now: float | None = None) -> dict[str, Any] | None:
+        """The cached result for a day, or None if missing or due for a refetch."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._load().get(provider, {}).get(day.isoformat())
+        if entry is None:
+            return None
+        fetched_at = entry.get("fetched_at", 0)
+        settled_at = _day_bounds(day)[1].timestamp() + SETTLE_DELAY
+        if fetched_at >= settled_at or now - fetched_at < TODAY_TTL:
+            return entry["result"]
+        return None
+
+    def put(
+        self, provider: str, results: dict[str, dict[str, Any]], now: float | None = None
+    ) -> None:
+        """Store fetched results (ISO date -> result dict) and write the file."""
+        now = time.time() if now is None else now
+        cacheable = {
+            key: {"fetched_at": now, "result": result}
+            for key, result in results.items()
+            if result["source"] == "api" and not result["error"]
+        }
+        if not cacheable:
+            return
+        with self._lock:
+            self._load().setdefault(provider, {}).update(cacheable)
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._days, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
 
 class BillingCollector:
     """Unified billing collector that aggregates data from all providers."""
 
-    def __init__(self):
+    def __init__(self, cache_file: Path | None = None):
         self.openai = OpenAIBilling()
         self.anthropic = AnthropicBilling()
+        self.cache = BillingDayCache(cache_file)
 
     def collect(
         self,
@@ -378,19 +573,7 @@ class BillingCollector:
         results["anthropic"] = anthropic_result
 
         return {
-            "providers": {
-                name: {
-                    "source": result.source,
-                    "cost_usd": result.cost_usd,
-                    "input_tokens": result.input_tokens,
-                    "output_tokens": result.output_tokens,
-                    "period_start": result.period_start.isoformat(),
-                    "period_end": result.period_end.isoformat(),
-                    "breakdown": result.breakdown,
-                    "error": result.error,
-                }
-                for name, result in results.items()
-            },
+            "providers": {name: _result_dict(result) for name, result in results.items()},
             "total_api_cost": total_cost,
             "has_api_data": has_api_data,
             "api_available": {
@@ -401,32 +584,72 @@ class BillingCollector:
         }
 
     def get_daily_costs(self, days: int = 7) -> list[dict[str, Any]]:
-        """Get daily cost breakdown for the past N days.
+        """Get daily cost breakdown for the past N (UTC) days.
 
-        Returns list of daily cost records with API vs estimated breakdown.
+        Each provider is asked for all the days it has no fresh cache entry
+        for in a single ranged request, and providers are queried in parallel.
+
+        Returns list of daily cost records with API vs estimated breakdown,
+        oldest first.
         """
         if is_demo_mode():
             return self._mock_daily_costs(days)
 
-        daily_costs = []
-        end_time = datetime.now().replace(hour=23, minute=59, second=59, microsecond=0)
+        today = _utc_today()
+        day_list = [today - timedelta(days=days - 1 - i) for i in range(days)]
 
-        for i in range(days):
-            day_end = end_time - timedelta(days=i)
-            day_start = day_end.replace(hour=0, minute=0, second=0, microsecond=0)
+        providers: dict[str, OpenAIBilling | AnthropicBilling] = {}
+        if self.openai.is_available():
+            providers["openai"] = self.openai
+        providers["anthropic"] = self.anthropic
 
-            result = self.collect(day_start, day_end)
+        with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+            futures = {
+                name: pool.submit(self._provider_days, name, provider, day_list)
+                for name, provider in providers.items()
+            }
+            per_provider = {name: future.result() for name, future in futures.items()}
 
+        daily_costs = []
+        for day in day_list:
+            key = day.isoformat()
+            day_results = {name: results[key] for name, results in per_provider.items()}
+            api_results = [
+                r for r in day_results.values() if r["source"] == "api" and not r["error"]
+            ]
             daily_costs.append(
                 {
-                    "date": day_start.strftime("%Y-%m-%d"),
-                    "api_cost": result["total_api_cost"],
-                    "has_api_data": result["has_api_data"],
-                    "providers": result["providers"],
+                    "date": key,
+                    "api_cost": sum(r["cost_usd"] for r in api_results),
+                    "has_api_data": bool(api_results),
+                    "providers": day_results,
                 }
             )
-
-        return list(reversed(daily_costs))
+        return daily_costs
+
+    def _provider_days(
+        self, name: str, provider: OpenAIBilling | AnthropicBilling, day_list: list[date]
+    ) -> dict[str, dict[str, Any]]:
+        """One provider's results for each day, fetching only what the cache lacks."""
+        results: dict[str, dict[str, Any]] = {}
+        missing = []
+        for day in day_list:
+            cached = self.cache.get(name, day)
+            if cached is None:
+                missing.append(day)
+            else:
+                results[day.isoformat()] = cached
+
+        if missing:
+            fetched = {
+                key: _result_dict(result)
+                for key, result in provider.get_daily(missing[0], missing[-1]).items()
+            }
+            if provider.is_available():
+                self.cache.put(name, fetched)
+            for day in missing:
+                results[day.isoformat()] = fetched[day.isoformat()]
+        return results
 
     def _mock_data(self) -> dict[str, Any]:
         """Return mock data for demo mode."""
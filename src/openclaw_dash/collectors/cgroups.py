@@ -0,0 +1,282 @@
+"""Container resource usage and limits from cgroups (v1 and v2).
+
+Inside a container psutil reports the host's CPU and memory, so a container
+close to its memory limit can look nearly idle. CgroupMonitor reads the
+container's own usage and limits straight from /sys/fs/cgroup (a few small
+file reads per sample, no subprocesses) and reports utilization against
+those limits, with CPU throttling and block I/O rates computed from counter
+deltas between samples.
+
+The resource sampler (collectors.resources) calls sample() on its thread.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_CGROUP = Path("/proc/self/cgroup")
+UNLIMITED_V1 = 1 << 60  # v1 reports "no limit" as a huge page-aligned number
+V1_CONTROLLERS = ("memory", "cpu", "cpuacct", "blkio")
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _read_int(path: Path) -> int | None:
+    """An integer file; None if missing, unreadable or "max"."""
+    text = _read(path)
+    try:
+        return int(text) if text is not None else None
+    except ValueError:
+        return None
+
+
+def _read_keyed(path: Path) -> dict[str, int]:
+    """A flat keyed file such as memory.stat or cpu.stat ("key value" lines)."""
+    values: dict[str, int] = {}
+    for line in (_read(path) or "").splitlines():
+        key, _, value = line.partition(" ")
+        try:
+            values[key] = int(value)
+        except ValueError:
+            continue
+    return values
+
+
+def _own_cgroups(proc_cgroup: Path) -> dict[str, str]:
+    """Controller -> cgroup path from /proc/self/cgroup ("" is the v2 hierarchy)."""
+    paths: dict[str, str] = {}
+    for line in (_read(proc_cgroup) or "").splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        for controller in parts[1].split(",") if parts[1] else [""]:
+            paths[controller] = parts[2]
+    return paths
+
+
+def _resolve(mount: Path, cgroup: str) -> Path:
+    """The directory for ``cgroup`` under ``mount``.
+
+    With a private cgroup namespace the path is already relative to the
+    mount. Without one, /proc/self/cgroup names a host path that may not
+    be visible in the container, so walk up to the nearest ancestor that
+    exists (at worst the mount itself).
+    """
+    path = mount / cgroup.lstrip("/")
+    while path != mount and not path.is_dir():
+        path = path.parent
+    return path
+
+
+@dataclass
+class CgroupCounters:
+    """One raw read of a cgroup's files; None where a file is unavailable."""
+
+    memory_used: int | None = None
+    memory_limit: int | None = None
+    memory_inactive_file: int | None = None
+    oom_kills: int | None = None
+    cpu_usage_usec: int | None = None
+    cpu_limit: float | None = None  # Cores allowed by the CFS quota
+    nr_periods: int | None = None
+    nr_throttled: int | None = None
+    throttled_usec: int | None = None
+    io_read_bytes: int | None = None
+    io_write_bytes: int | None = None
+
+
+class CgroupMonitor:
+    """Reads a cgroup's usage and limits and turns counters into rates.
+
+    Create one with detect(); it returns None where there is no cgroup
+    filesystem (macOS, Windows, or /sys not mounted).
+    """
+
+    def __init__(self, version: int, dirs: dict[str, Path]) -> None:
+        self.version = version
+        self.dirs = dirs  # Controller -> directory; v2 uses "" for the unified hierarchy
+        self._previous: tuple[float, CgroupCounters] | None = None
+
+    @classmethod
+    def detect(
+        cls, root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_CGROUP
+    ) -> CgroupMonitor | None:
+        """Find this process's cgroup, preferring the v2 unified hierarchy."""
+        own = _own_cgroups(proc_cgroup)
+        if (root / "cgroup.controllers").exists():
+            return cls(2, {"": _resolve(root, own.get("", "/"))})
+        dirs = {
+            controller: _resolve(root / controller, own.get(controller, "/"))
+            for controller in V1_CONTROLLERS
+            if (root / controller).is_dir()
+        }
+        if "memory" not in dirs and "cpu" not in dirs:
+            return None
+        return cls(1, dirs)
+
+    def read(self) -> CgroupCounters:
+        """Read the current counters and limits."""
+        return self._read_v2() if self.version == 2 else self._read_v1()
+
+    def _read_v2(self) -> CgroupCounters:
+        base = self.dirs[""]
+        counters = CgroupCounters(
+            memory_used=_read_int(base / "memory.current"),
+            memory_limit=_read_int(base / "memory.max"),
+            memory_inactive_file=_read_keyed(base / "memory.stat").get("inactive_file"),
+            oom_kills=_read_keyed(base / "memory.events").get("oom_kill"),
+        )
+        cpu = _read_keyed(base / "cpu.stat")
+        counters.cpu_usage_usec = cpu.get("usage_usec")
+        counters.nr_periods = cpu.get("nr_periods")
+        counters.nr_throttled = cpu.get("nr_throttled")
+        counters.throttled_usec = cpu.get("throttled_usec")
+        quota, _, period = (_read(base / "cpu.max") or "").partition(" ")
+        if quota.strip().isdigit() and period.strip().isdigit() and int(period) > 0:
+            counters.cpu_limit = int(quota) / int(period)
+
+        io = _read(base / "io.stat")
+        if io is not None:
+            # "8:0 rbytes=1 wbytes=2 rios=3 ..." per device
+            counters.io_read_bytes = counters.io_write_bytes = 0
+            for line in io.splitlines():
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        counters.io_read_bytes += int(value)
+                    elif key == "wbytes":
+                        counters.io_write_bytes += int(value)
+        return counters
+
+    def _read_v1(self) -> CgroupCounters:
+        counters = CgroupCounters()
+        memory = self.dirs.get("memory")
+        if memory is not None:
+            counters.memory_used = _read_int(memory / "memory.usage_in_bytes")
+            limit = _read_int(memory / "memory.limit_in_bytes")
+            counters.memory_limit = limit if limit is not None and limit < UNLIMITED_V1 else None
+            stat = _read_keyed(memory / "memory.stat")
+            counters.memory_inactive_file = stat.get(
+                "total_inactive_file", stat.get("inactive_file")
+            )
+            counters.oom_kills = _read_keyed(memory / "memory.oom_control").get("oom_kill")
+
+        cpuacct = self.dirs.get("cpuacct")
+        if cpuacct is not None:
+            usage_ns = _read_int(cpuacct / "cpuacct.usage")
+            counters.cpu_usage_usec = usage_ns // 1000 if usage_ns is not None else None
+        cpu = self.dirs.get("cpu")
+        if cpu is not None:
+            stat = _read_keyed(cpu / "cpu.stat")
+            counters.nr_periods = stat.get("nr_periods")
+            counters.nr_throttled = stat.get("nr_throttled")
+            if "throttled_time" in stat:
+                counters.throttled_usec = stat["throttled_time"] // 1000
+            quota = _read_int(cpu / "cpu.cfs_quota_us")
+            period = _read_int(cpu / "cpu.cfs_period_us")
+            if quota is not None and quota > 0 and period:
+                counters.cpu_limit = quota / period
+
+        blkio = self.dirs.get("blkio")
+        if blkio is not None:
+            # "8:0 Read 1234" per device and operation, then "Total N"
+            io = _read(blkio / "blkio.throttle.io_service_bytes")
+            if io is not None:
+                counters.io_read_bytes = counters.io_write_bytes = 0
+                for line in io.splitlines():
+                    fields = line.split()
+                    if len(fields) != 3:
+                        continue
+                    if fields[1] == "Read":
+                        counters.io_read_bytes += int(fields[2])
+                    elif fields[1] == "Write":
+                        counters.io_write_bytes += int(fields[2])
+        return counters
+
+    def sample(self, now: float | None = None) -> dict[str, Any]:
+        """Usage against the cgroup's limits, with rates since the previous sample.
+
+        CPU percent is relative to the CPU quota when one is set, otherwise
+        to all host CPUs. Memory is the working set (usage minus inactive
+        page cache, as the kernel reclaims that before an OOM kill), as a
+        percentage of the limit when there is one.
+        """
+        now = time.monotonic() if now is None else now
+        current = self.read()
+        previous, self._previous = self._previous, (now, current)
+
+        working_set = None
+        if current.memory_used is not None:
+            working_set = max(0, current.memory_used - (current.memory_inactive_file or 0))
+        limit = current.memory_limit
+        memory = {
+            "used": current.memory_used,
+            "working_set": working_set,
+            "limit": limit,
+            "percent": (
+                round(working_set / limit * 100, 1) if working_set is not None and limit else None
+            ),
+            "working_set_mb": round(working_set / (1024**2), 1)
+            if working_set is not None
+            else None,
+            "limit_mb": round(limit / (1024**2), 1) if limit else None,
+            "oom_kills": current.oom_kills,
+        }
+        cpu: dict[str, Any] = {
+            "limit_cores": current.cpu_limit,
+            "percent": None,
+            "throttled_percent": None,
+            "nr_throttled": current.nr_throttled,
+            "throttled_seconds": (
+                round(current.throttled_usec / 1e6, 2)
+                if current.throttled_usec is not None
+                else None
+            ),
+        }
+        io: dict[str, Any] = {"read_bps": None, "write_bps": None}
+
+        if previous is not None and now > previous[0]:
+            elapsed = now - previous[0]
+            before = previous[1]
+            delta = _delta(current.cpu_usage_usec, before.cpu_usage_usec)
+            if delta is not None:
+                cores = current.cpu_limit or os.cpu_count() or 1
+                cpu["percent"] = round(min(100.0, delta / (elapsed * 1e6 * cores) * 100), 1)
+            periods = _delta(current.nr_periods, before.nr_periods)
+            throttled = _delta(current.nr_throttled, before.nr_throttled)
+            if periods and throttled is not None:
+                cpu["throttled_percent"] = round(min(100.0, throttled / periods * 100), 1)
+            elif periods == 0:
+                cpu["throttled_percent"] = 0.0
+            for key, now_value, before_value in (
+                ("read_bps", current.io_read_bytes, before.io_read_bytes),
+                ("write_bps", current.io_write_bytes, before.io_write_bytes),
+            ):
+                delta = _delta(now_value, before_value)
+                if delta is not None:
+                    io[key] = delta / elapsed
+
+        return {
+            "version": self.version,
+            "limited": limit is not None or current.cpu_limit is not None,
+            "memory": memory,
+            "cpu": cpu,
+            "io": io,
+        }
+
+
+def _delta(current: int | None, previous: int | None) -> int | None:
+    """Increase of a counter; None if unknown or reset (the cgroup was recreated)."""
+    if current is None or previous is None or current < previous:
+        return None
+    return current - previous
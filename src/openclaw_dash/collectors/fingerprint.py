@@ -0,0 +1,247 @@
+"""Change detection for local repositories.
+
+Most of what the dashboard derives from a checkout (last commit, TODO
+counts, test counts) only changes when HEAD, the index or a ref changes.
+repo_fingerprint() captures those as the (mtime, inode) stamps of a
+handful of files and directories; ChangeGate recomputes a value only when
+the fingerprint differs from the one it was computed under.
+
+On Linux the gate can also watch those paths with inotify, so an
+unchanged repository costs no stat() calls at all until an event arrives.
+Values derived from GitHub (PRs, CI) are not gated here; they keep their
+own TTLs in collectors.github.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import threading
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from openclaw_dash.collectors.git_reader import Stamp, _stamp, find_git_dirs
+
+T = TypeVar("T")
+
+Fingerprint = tuple[tuple[str, Stamp], ...]
+
+# inotify(7) event masks
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_Q_OVERFLOW = 0x4000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (followed by the name)
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    INOTIFY_AVAILABLE = sys.platform.startswith("linux") and hasattr(_libc, "inotify_init1")
+except OSError:
+    INOTIFY_AVAILABLE = False
+
+
+def file_stamp(path: Path) -> Stamp:
+    """A single file's fingerprint: its (mtime, inode), or None if it is missing."""
+    return _stamp(path)
+
+
+def _watched_paths(path: Path) -> list[Path] | None:
+    """The files and directories whose changes a fingerprint covers."""
+    dirs = find_git_dirs(path)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    paths = [git_dir / "HEAD", git_dir / "index", common_dir / "packed-refs"]
+    # Ref updates rename a lock file into place, which changes the directory's mtime
+    for root, subdirs, _ in os.walk(common_dir / "refs"):
+        subdirs.sort()
+        paths.append(Path(root))
+    return paths
+
+
+def repo_fingerprint(path: Path) -> Fingerprint | None:
+    """A cheap value that changes when HEAD, the index, packed-refs or refs/ change.
+
+    Returns None for a directory that is not a git checkout.
+    """
+    paths = _watched_paths(path)
+    if paths is None:
+        return None
+    return tuple((p.name, _stamp(p)) for p in paths)
+
+
+class _Inotify:
+    """A non-blocking inotify instance watching the directories of several repositories."""
+
+    def __init__(self) -> None:
+        self.fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._repos: dict[int, set[Path]] = {}  # Watch descriptor -> repositories
+
+    def watch(self, repo: Path, paths: list[Path]) -> bool:
+        """Watch the directories holding ``paths``; False if any could not be watched."""
+        ok = True
+        for directory in {p if p.is_dir() else p.parent for p in paths}:
+            wd = _libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                ok = False  # Out of watches (fs.inotify.max_user_watches) or unreadable
+                continue
+            self._repos.setdefault(wd, set()).add(repo)
+        return ok
+
+    def changed(self) -> set[Path] | None:
+        """Repositories with events since the last call; None if events were lost."""
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            pos = 0
+            while pos + _EVENT.size <= len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, pos)
+                pos += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                changed |= self._repos.get(wd, set())
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ChangeGate:
+    """Caches values derived from local repositories until they change.
+
+    ``repo(path, name, compute)`` returns the value ``compute()`` gave
+    under the repository's current fingerprint, calling it again only
+    after HEAD, the index or a ref changed. ``get(key, fingerprint,
+    compute)`` does the same for any other fingerprint. Safe to share
+    between threads; ``compute`` may run concurrently for different keys.
+    """
+
+    def __init__(self, watch: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[Hashable, tuple[Hashable, Any]] = {}
+        self._fingerprints: dict[Path, Fingerprint | None] = {}  # Valid while watched
+        self._inotify: _Inotify | None = None
+        if watch and INOTIFY_AVAILABLE:
+            try:
+                self._inotify = _Inotify()
+            except OSError:
+                self._inotify = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def watching(self) -> bool:
+        return self._inotify is not None
+
+    def get(self, key: Hashable, fingerprint: Hashable | None, compute: Callable[[], T]) -> T:
+        """The cached value for ``key`` if its fingerprint is unchanged, else ``compute()``.
+
+        A None fingerprint (nothing to compare) always recomputes.
+        """
+        with self._lock:
+            cached = self._values.get(key)
+            if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        value = compute()
+        if fingerprint is not None:
+            with self._lock:
+                self._values[key] = (fingerprint, value)
+        return value
+
+    def repo(self, path: Path, name: str, compute: Callable[[], T]) -> T:
+        """``compute()``'s value for a repository, recomputed only when it changes."""
+        return self.get((path, name), self.fingerprint(path), compute)
+
+    def fingerprint(self, path: Path) -> Fingerprint | None:
+        """The repository's fingerprint; with a watch, only re-read after an event."""
+        if self._inotify is None:
+            return repo_fingerprint(path)
+        with self._lock:
+            changed = self._inotify.changed()
+            if changed is None:
+                self._fingerprints.clear()
+            else:
+                for repo in changed:
+                    self._fingerprints.pop(repo, None)
+            if path in self._fingerprints:
+                return self._fingerprints[path]
+            paths = _watched_paths(path)
+            if paths is None:
+                return None
+            # Watch before reading, so a change in between is not missed
+            watched = self._inotify.watch(path, paths)
+            fingerprint = tuple((p.name, _stamp(p)) for p in paths)
+            if watched:
+                self._fingerprints[path] = fingerprint
+            return fingerprint
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Forget cached values for one repository, or all of them."""
+        with self._lock:
+            if path is None:
+                self._values.clear()
+                self._fingerprints.clear()
+                return
+            self._fingerprints.pop(path, None)
+            for key in [k for k in self._values if isinstance(k, tuple) and k[0] == path]:
+                del self._values[key]
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the cached values whose keys match ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._values if predicate(k)]:
+                del self._values[key]
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+_GATE: ChangeGate | None = None
+_GATE_LOCK = threading.Lock()
+
+
+def get_gate() -> ChangeGate:
+    """The process-wide gate for repository-derived values (watching where possible)."""
+    global _GATE
+    with _GATE_LOCK:
+        if _GATE is None:
+            _GATE = ChangeGate(watch=True)
+        return _GATE
+
+
+def reset_gate() -> None:
+    """Discard the process-wide gate (used by tests)."""
+    global _GATE
+    with _GATE_LOCK:
+        gate, _GATE = _GATE, None
+    if gate is not None:
+        gate.close()
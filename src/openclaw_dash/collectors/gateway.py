@@ -14,6 +14,7 @@ from openclaw_dash.collectors.base import (
 )
 from openclaw_dash.collectors.cache import cached_collector
 from openclaw_dash.collectors.openclaw_cli import get_openclaw_status, status_to_gateway_data
+from openclaw_dash.collectors.timeseries import get_timeseries
 from openclaw_dash.demo import is_demo_mode, mock_gateway_status
 
 COLLECTOR_NAME = "gateway"
@@ -93,6 +94,15 @@ def _collect_gateway_impl() -> dict[str, Any]:
 
     duration_ms = (time.time() - start_time) * 1000
 
+    healthy = bool(data and data.get("healthy"))
+    get_timeseries().record(
+        {
+            "gateway.healthy": 1.0 if healthy else 0.0,
+            "gateway.latency_ms": duration_ms if healthy else None,
+            "gateway.context_pct": data.get("context_pct") if data else None,
+        }
+    )
+
     if data and data.get("healthy"):
         # Success - reset failure counter
         _connection_failures = 0
@@ -0,0 +1,474 @@
+"""Read git metadata straight from a repository's .git directory.
+
+Spawning ``git`` for every repository on every refresh costs far more than
+the answer: the current branch is one line in HEAD, a ref is a small file
+or a line in packed-refs, and a commit's timestamp is in the first few
+hundred bytes of a zlib-compressed object. GitReader reads those directly:
+
+- HEAD, loose refs and packed-refs (including worktrees via ``commondir``)
+- commits stored as loose objects, or undeltified in a pack (located with
+  the pack's .idx fanout table and a binary search)
+
+Resolved refs are cached by the mtime and inode of the files they came
+from and commits by SHA, so an unchanged repository costs a few stat() calls. Anything
+unusual (SHA-256 repositories, deltified commits, unreadable files) falls
+back to the git CLI.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import re
+import subprocess
+import threading
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+MAX_SYMREF_DEPTH = 5  # Symbolic ref chains longer than this are treated as broken
+MAX_CACHED_COMMITS = 512  # Per repository; commits are immutable so this only bounds memory
+HEADER_CHUNK = 4096  # Compressed bytes inflated at a time while looking for the committer
+
+Stamp = tuple[int, int] | None
+
+_SHA1 = re.compile(r"^[0-9a-f]{40}$")
+_IDENT = re.compile(rb"^(.*) <[^>]*> (-?\d+) ([+-])(\d\d)(\d\d)$")
+_PACK_COMMIT = 1
+_IDX_MAGIC = b"\xfftOc"
+
+
+@dataclass(frozen=True)
+class Commit:
+    """The parts of a commit header the dashboard uses."""
+
+    sha: str
+    author: str
+    timestamp: int  # Committer time, seconds since the epoch
+    tz_offset: int  # Committer UTC offset, in minutes
+
+    @property
+    def committed_at(self) -> datetime:
+        """Committer date in the committer's own timezone."""
+        tz = timezone(timedelta(minutes=self.tz_offset))
+        return datetime.fromtimestamp(self.timestamp, tz)
+
+
+@dataclass(frozen=True)
+class Head:
+    """What HEAD points at."""
+
+    branch: str | None  # None when detached
+    sha: str | None  # None on an unborn branch
+
+
+class _Unsupported(Exception):
+    """Something this reader does not handle; the caller falls back to git."""
+
+
+def find_git_dirs(path: Path) -> tuple[Path, Path] | None:
+    """The git directory and common directory of a checkout, or None if not a repository.
+
+    They differ for linked worktrees, whose refs and objects live in the
+    main repository's git directory.
+    """
+    git_dir = path / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktree or submodule: "gitdir: <path>"
+            git_dir = (path / git_dir.read_text().split(":", 1)[1].strip()).resolve()
+        if not git_dir.is_dir():
+            return None
+        common = git_dir / "commondir"
+        common_dir = (
+            (git_dir / common.read_text().strip()).resolve() if common.is_file() else git_dir
+        )
+    except (OSError, IndexError):
+        return None
+    return git_dir, common_dir
+
+
+def find_worktree(path: Path) -> Path | None:
+    """The top of the checkout containing ``path`` (like ``git rev-parse --show-toplevel``)."""
+    for candidate in (path, *path.parents):
+        if find_git_dirs(candidate) is not None:
+            return candidate
+    return None
+
+
+def relative_date(timestamp: int, now: float) -> str:
+    """Format a timestamp like ``git log --format=%ar`` ("3 hours ago")."""
+    diff = int(now) - timestamp
+    if diff < 0:
+        return "in the future"
+
+    def plural(n: int, unit: str) -> str:
+        return f"{n} {unit}{'' if n == 1 else 's'}"
+
+    if diff < 90:
+        return f"{plural(diff, 'second')} ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return f"{plural(diff, 'minute')} ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return f"{plural(diff, 'hour')} ago"
+    days = (diff + 12) // 24
+    if days < 14:
+        return f"{plural(days, 'day')} ago"
+    if days < 70:
+        return f"{plural((days + 3) // 7, 'week')} ago"
+    if days < 365:
+        return f"{plural((days + 15) // 30, 'month')} ago"
+    if days < 1825:
+        total_months = (days * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+        return f"{plural(years, 'year')} ago"
+    return f"{plural((days + 183) // 365, 'year')} ago"
+
+
+def _parse_commit(sha: str, body: bytes) -> Commit:
+    author = b""
+    for line in body.split(b"\n"):
+        if not line:
+            break  # End of the header
+        if line.startswith(b"author "):
+            match = _IDENT.match(line[7:])
+            author = match.group(1) if match else b""
+        elif line.startswith(b"committer "):
+            match = _IDENT.match(line[10:])
+            if match is None:
+                break
+            sign = -1 if match.group(3) == b"-" else 1
+            offset = sign * (int(match.group(4)) * 60 + int(match.group(5)))
+            return Commit(sha, author.decode(errors="replace"), int(match.group(2)), offset)
+    raise _Unsupported(f"commit {sha} has no committer line")
+
+
+def _inflate_header(chunks: Iterable[bytes]) -> bytes:
+    """Inflate a zlib stream only as far as the end of the commit header."""
+    inflater = zlib.decompressobj()
+    out = b""
+    for chunk in chunks:
+        out += inflater.decompress(chunk)
+        if b"\n\n" in out or inflater.eof:
+            break
+    return out
+
+
+class _Pack:
+    """A pack's .idx (mapped) and .pack file, for looking up objects by SHA."""
+
+    def __init__(self, idx_path: Path) -> None:
+        self.idx_path = idx_path
+        self.pack_path = idx_path.with_suffix(".pack")
+        with open(idx_path, "rb") as f:
+            self.idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.idx[:4] != _IDX_MAGIC or int.from_bytes(self.idx[4:8], "big") != 2:
+            self.idx.close()
+            raise _Unsupported(f"{idx_path.name}: not a version 2 index")
+        self.count = int.from_bytes(self.idx[8 + 255 * 4 : 8 + 256 * 4], "big")
+        self._names = 8 + 256 * 4
+        self._offsets = self._names + self.count * 24  # After the SHAs and CRC32s
+        self._large = self._offsets + self.count * 4
+
+    def _sha_at(self, i: int) -> bytes:
+        return self.idx[self._names + i * 20 : self._names + i * 20 + 20]
+
+    def offset(self, sha: bytes) -> int | None:
+        """Offset of an object in the .pack file, or None if it is not in this pack."""
+        first = sha[0]
+        lo = int.from_bytes(self.idx[8 + (first - 1) * 4 : 8 + first * 4], "big") if first else 0
+        hi = int.from_bytes(self.idx[8 + first * 4 : 12 + first * 4], "big")
+        i = bisect.bisect_left(_ShaView(self), sha, lo, hi)
+        if i >= hi or self._sha_at(i) != sha:
+            return None
+        offset = int.from_bytes(self.idx[self._offsets + i * 4 : self._offsets + i * 4 + 4], "big")
+        if offset & 0x80000000:
+            large = self._large + (offset & 0x7FFFFFFF) * 8
+            offset = int.from_bytes(self.idx[large : large + 8], "big")
+        return offset
+
+    def read_commit(self, sha: str, offset: int) -> Commit:
+        with open(self.pack_path, "rb") as f:
+            f.seek(offset)
+            head = f.read(16)
+            kind = (head[0] >> 4) & 0x7
+            if kind != _PACK_COMMIT:
+                # Deltified (OFS_DELTA/REF_DELTA) commits are left to git
+                raise _Unsupported(f"{sha} is packed as type {kind}")
+            pos = 1
+            while head[pos - 1] & 0x80:  # Size continuation bytes
+                pos += 1
+            f.seek(offset + pos)
+            return _parse_commit(sha, _inflate_header(iter(lambda: f.read(HEADER_CHUNK), b"")))
+
+    def close(self) -> None:
+        self.idx.close()
+
+
+class _ShaView:
+    """Sequence view of a pack index's sorted SHAs, for bisect."""
+
+    def __init__(self, pack: _Pack) -> None:
+        self.pack = pack
+
+    def __len__(self) -> int:
+        return self.pack.count
+
+    def __getitem__(self, i: int) -> bytes:
+        return self.pack._sha_at(i)
+
+
+class GitReader:
+    """Reads refs and commits of one repository without running git.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        dirs = find_git_dirs(path)
+        self.git_dir, self.common_dir = dirs if dirs else (path / ".git", path / ".git")
+        self._lock = threading.Lock()
+        # Cached by the stamps (mtime, inode) of the files read, see _stamp()
+        self._refs: dict[str, tuple[tuple[Stamp, Stamp], str | None]] = {}
+        self._packed: tuple[Stamp, dict[str, str]] | None = None
+        self._packs: dict[Path, _Pack] = {}
+        self._pack_dir_stamp: Stamp | None = None
+        self._commits: dict[str, Commit] = {}
+        self.git_calls = 0  # Fallbacks to the git CLI so far
+
+    @property
+    def is_repo(self) -> bool:
+        return find_git_dirs(self.path) is not None
+
+    # --- refs ---
+
+    def head(self) -> Head:
+        """The checked-out branch and commit."""
+        try:
+            text = (self.git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return Head(None, None)
+        if text.startswith("ref: "):
+            ref = text[5:].strip()
+            branch = ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else ref
+            return Head(branch, self.resolve(ref))
+        return Head(None, text if _SHA1.match(text) else None)
+
+    def resolve(self, ref: str) -> str | None:
+        """The SHA a ref ("HEAD", "refs/heads/main", "refs/remotes/origin/x") points at."""
+        for _ in range(MAX_SYMREF_DEPTH):
+            value = self._read_ref(ref)
+            if value is None or not value.startswith("ref: "):
+                return value
+            ref = value[5:].strip()
+        return None
+
+    def _ref_file(self, ref: str) -> Path:
+        # HEAD and other per-worktree refs live in the worktree's git dir
+        if ref == "HEAD" or not ref.startswith("refs/"):
+            return self.git_dir / ref
+        return self.common_dir / ref
+
+    def _read_ref(self, ref: str) -> str | None:
+        """A ref's value (a SHA or "ref: ..."), from its loose file or packed-refs."""
+        path = self._ref_file(ref)
+        key = (_stamp(path), _stamp(self.common_dir / "packed-refs"))
+        with self._lock:
+            cached = self._refs.get(ref)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+        value: str | None = None
+        if key[0] is not None:
+            try:
+                value = path.read_text().strip() or None
+            except OSError:
+                value = None
+        if value is None:
+            value = self._packed_refs().get(ref)
+        with self._lock:
+            self._refs[ref] = (key, value)
+        return value
+
+    def _packed_refs(self) -> dict[str, str]:
+        path = self.common_dir / "packed-refs"
+        stamp = _stamp(path)
+        with self._lock:
+            if self._packed is not None and self._packed[0] == stamp:
+                return self._packed[1]
+        refs: dict[str, str] = {}
+        if stamp is not None:
+            try:
+                lines = path.read_text().splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                if line.startswith(("#", "^")):
+                    continue  # Header, or the peeled target of the tag above
+                sha, _, name = line.partition(" ")
+                if name:
+                    refs[name.strip()] = sha
+        with self._lock:
+            self._packed = (stamp, refs)
+        return refs
+
+    def refs(self, prefix: str) -> dict[str, str]:
+        """Every ref under ``prefix`` (e.g. "refs/remotes/origin/") and its SHA."""
+        found = {name: sha for name, sha in self._packed_refs().items() if name.startswith(prefix)}
+        base = self.common_dir / prefix
+        if base.is_dir():
+            for path in base.rglob("*"):
+                if path.is_file():
+                    name = prefix + path.relative_to(base).as_posix()
+                    value = self._read_ref(name)
+                    if value is not None:
+                        found[name] = value
+        # Resolve symbolic refs such as refs/remotes/origin/HEAD
+        resolved = {}
+        for name, value in found.items():
+            sha = self.resolve(name) if value.startswith("ref: ") else value
+            if sha is not None:
+                resolved[name] = sha
+        return resolved
+
+    def remotes(self) -> list[str]:
+        """Names of the configured remotes."""
+        try:
+            lines = (self.common_dir / "config").read_text().splitlines()
+        except OSError:
+            return []
+        names = []
+        for line in lines:
+            line = line.strip()
+            if line.startswith("[remote ") and line.endswith("]"):
+                names.append(line[len("[remote ") : -1].strip().strip('"'))
+        return names
+
+    # --- objects ---
+
+    def commit(self, sha: str) -> Commit | None:
+        """A commit's author and committer date, or None if it cannot be read."""
+        with self._lock:
+            cached = self._commits.get(sha)
+        if cached is not None:
+            return cached
+        commit: Commit | None
+        try:
+            commit = self._read_commit(sha)
+        except (_Unsupported, OSError, zlib.error, ValueError, IndexError):
+            commit = self._git_commit(sha)
+        if commit is not None:
+            with self._lock:
+                if len(self._commits) >= MAX_CACHED_COMMITS:
+                    self._commits.clear()
+                self._commits[sha] = commit
+        return commit
+
+    def last_commit(self) -> Commit | None:
+        """The commit HEAD points at."""
+        sha = self.head().sha
+        return self.commit(sha) if sha else None
+
+    def _read_commit(self, sha: str) -> Commit:
+        if not _SHA1.match(sha):
+            raise _Unsupported(f"not a SHA-1 object name: {sha!r}")
+        loose = self.common_dir / "objects" / sha[:2] / sha[2:]
+        try:
+            data = loose.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            raw = _inflate_header(
+                data[i : i + HEADER_CHUNK] for i in range(0, len(data), HEADER_CHUNK)
+            )
+            kind, _, rest = raw.partition(b" ")
+            if kind != b"commit":
+                raise _Unsupported(f"{sha} is a {kind.decode(errors='replace')}")
+            return _parse_commit(sha, rest.partition(b"\0")[2])
+
+        binary = bytes.fromhex(sha)
+        for pack in self._load_packs():
+            offset = pack.offset(binary)
+            if offset is not None:
+                return pack.read_commit(sha, offset)
+        raise _Unsupported(f"{sha} not found")
+
+    def _load_packs(self) -> list[_Pack]:
+        """The repository's pack indexes, reloaded when the pack directory changes."""
+        pack_dir = self.common_dir / "objects" / "pack"
+        stamp = _stamp(pack_dir)
+        with self._lock:
+            if stamp == self._pack_dir_stamp:
+                return list(self._packs.values())
+            current = set(pack_dir.glob("pack-*.idx")) if stamp is not None else set()
+            for path in set(self._packs) - current:
+                self._packs.pop(path).close()
+            for path in current - set(self._packs):
+                try:
+                    self._packs[path] = _Pack(path)
+                except (OSError, ValueError, _Unsupported):
+                    continue
+            self._pack_dir_stamp = stamp
+            return list(self._packs.values())
+
+    def _git_commit(self, sha: str) -> Commit | None:
+        """Read a commit with ``git cat-file`` when it cannot be read directly."""
+        self.git_calls += 1
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "commit", sha],
+                cwd=self.path,
+                capture_output=True,
+                timeout=5,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            return _parse_commit(sha, result.stdout)
+        except _Unsupported:
+            return None
+
+
+def _stamp(path: Path) -> Stamp:
+    """A file's (mtime, inode), or None if it does not exist.
+
+    git replaces refs and packed-refs by renaming a lock file over them, so
+    the inode changes on every update even where mtimes are coarse.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_ino
+
+
+_READERS: dict[Path, GitReader] = {}
+_READERS_LOCK = threading.Lock()
+
+
+def get_reader(path: Path) -> GitReader:
+    """The shared reader for a checkout (created on first use)."""
+    key = Path(path)
+    with _READERS_LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            reader = _READERS[key] = GitReader(key)
+        return reader
+
+
+def reset_readers() -> None:
+    """Discard all shared readers (used by tests)."""
+    with _READERS_LOCK:
+        readers = list(_READERS.values())
+        _READERS.clear()
+    for reader in readers:
+        for pack in reader._packs.values():
+            pack.close()
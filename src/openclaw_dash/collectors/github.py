@@ -0,0 +1,651 @@
+"""GitHub data layer: batched GraphQL queries shared by every consumer.
+
+The repos collector, CI failure alerts, GitHub metrics and PR automation
+read open PRs (with CI rollups and approvals), recently merged PRs and
+failed workflow runs from here instead of running ``gh`` per repository.
+
+Repositories are fetched together, up to MAX_REPOS_PER_QUERY in one
+GraphQL query, and each result is reused for SNAPSHOT_TTL seconds. Every
+repository asked for is watched for WATCH_TTL seconds, so whichever
+consumer refreshes first fetches what the others will ask for in the
+same query.
+
+Queries go through a pooled HTTP client when GITHUB_TOKEN or GH_TOKEN is
+set, and through ``gh api graphql`` (using gh's own login) otherwise.
+
+REST calls (the contribution streak's user and events lookups) are cached
+on disk with their ETag/Last-Modified and revalidated with conditional
+requests; a 304 answer does not count against the rate limit. The rate
+limits reported by every response are tracked, and once less than
+RATE_LIMIT_LOW of a budget is left, refreshes are spaced out so what
+remains lasts until the limit resets.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+from openclaw_dash.collectors.git_reader import find_git_dirs
+
+API_URL = "https://api.github.com"
+GRAPHQL_URL = API_URL + "/graphql"
+DEFAULT_CACHE_FILE = Path.home() / ".openclaw" / "workspace" / "metrics" / "github-cache.json"
+
+SNAPSHOT_TTL = 60.0  # Seconds a repository's data is reused
+WATCH_TTL = 600.0  # Seconds a repository stays in batched refreshes after it was asked for
+MAX_REPOS_PER_QUERY = 20
+QUERY_TIMEOUT = 30.0
+
+OPEN_PR_LIMIT = 30
+MERGED_PR_LIMIT = 20
+FAILED_RUN_LIMIT = 5
+
+MAX_CACHED_RESPONSES = 200
+RATE_LIMIT_LOW = 0.25  # Fraction of a budget below which refreshes are spaced out
+RATE_LIMIT_RESERVE = 10  # Requests kept back for explicit actions such as auto-merge
+
+_REPO_NAME = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]+([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+?)(?:\.git)?/*$")
+
+_FAILED_CONCLUSIONS = {"FAILURE", "TIMED_OUT", "STARTUP_FAILURE"}
+_CI_STATUS = {"SUCCESS": "success", "FAILURE": "failure", "ERROR": "failure"}
+
+_FRAGMENTS = """
+fragment PullRequestFields on PullRequest {
+  number title state headRefName createdAt mergedAt url
+  author { login }
+}
+fragment SuiteFields on CheckSuite {
+  conclusion
+  branch { name }
+  workflowRun { databaseId url createdAt workflow { name } }
+}
+fragment RepoFields on Repository {
+  nameWithOwner
+  openPullRequests: pullRequests(
+    states: OPEN, first: OPEN_PR_LIMIT, orderBy: {field: CREATED_AT, direction: DESC}
+  ) {
+    totalCount
+    nodes {
+      ...PullRequestFields
+      mergeable
+      reviews(states: APPROVED) { totalCount }
+      labels(first: 10) { nodes { name } }
+      commits(last: 1) {
+        nodes { commit {
+          statusCheckRollup { state }
+          checkSuites(first: 10) { nodes { ...SuiteFields } }
+        } }
+      }
+    }
+  }
+  mergedPullRequests: pullRequests(
+    states: MERGED, first: MERGED_PR_LIMIT, orderBy: {field: UPDATED_AT, direction: DESC}
+  ) {
+    nodes { ...PullRequestFields }
+  }
+  defaultBranchRef {
+    target { ... on Commit {
+      history(first: 5) { nodes { checkSuites(first: 10) { nodes { ...SuiteFields } } } }
+    } }
+  }
+}
+""".replace("OPEN_PR_LIMIT", str(OPEN_PR_LIMIT)).replace("MERGED_PR_LIMIT", str(MERGED_PR_LIMIT))
+
+
+class GitHubError(Exception):
+    """A GitHub query failed as a whole."""
+
+
+@dataclass
+class PullRequest:
+    """A pull request as the consumers need it."""
+
+    number: int
+    title: str
+    state: str
+    branch: str
+    created_at: str
+    merged_at: str | None = None
+    url: str = ""
+    author: str = "unknown"
+    mergeable: str = "UNKNOWN"
+    ci_status: str = "pending"  # success, failure, pending
+    approvals: int = 0
+    labels: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WorkflowRun:
+    """A failed GitHub Actions run."""
+
+    run_id: int | None
+    name: str
+    branch: str
+    created_at: str
+    url: str | None = None
+
+
+@dataclass
+class RepoSnapshot:
+    """Everything fetched for one repository."""
+
+    repo: str
+    open_pr_count: int = 0
+    open_prs: list[PullRequest] = field(default_factory=list)
+    merged_prs: list[PullRequest] = field(default_factory=list)
+    failed_runs: list[WorkflowRun] = field(default_factory=list)
+    error: str | None = None
+    fetched_at: float = 0.0
+
+
+@dataclass
+class RateLimit:
+    """One GitHub rate-limit budget ("core", "graphql", ...) as last reported."""
+
+    resource: str
+    limit: int
+    remaining: int
+    reset: float  # Epoch seconds when the budget refills
+    updated_at: float = 0.0
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str], now: float) -> RateLimit | None:
+        """Parse X-RateLimit-* response headers (names lower-cased)."""
+        try:
+            return cls(
+                resource=headers.get("x-ratelimit-resource", "core"),
+                limit=int(headers["x-ratelimit-limit"]),
+                remaining=int(headers["x-ratelimit-remaining"]),
+                reset=float(headers["x-ratelimit-reset"]),
+                updated_at=now,
+            )
+        except (KeyError, ValueError):
+            return None
+
+    def poll_interval(self, ttl: float, now: float) -> float:
+        """Seconds between refreshes so the remaining budget lasts until the reset."""
+        if self.limit <= 0 or now >= self.reset:
+            return ttl
+        if self.remaining <= RATE_LIMIT_RESERVE:
+            return max(ttl, self.reset - now)
+        if self.remaining >= self.limit * RATE_LIMIT_LOW:
+            return ttl
+        return max(ttl, (self.reset - now) / (self.remaining - RATE_LIMIT_RESERVE))
+
+
+class ResponseCache:
+    """REST response bodies with their validators, kept on disk.
+
+    Entries are keyed by path and query string. Only the
+    MAX_CACHED_RESPONSES most recently fetched are kept.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_CACHE_FILE
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._load().get(key)
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store an entry and write the file."""
+        entries = self._load()
+        entries[key] = entry
+        if len(entries) > MAX_CACHED_RESPONSES:
+            newest = sorted(entries, key=lambda k: entries[k]["fetched_at"], reverse=True)
+            self._entries = {k: entries[k] for k in newest[:MAX_CACHED_RESPONSES]}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def _split_http_output(output: str) -> tuple[int | None, dict[str, str], str]:
+    """Split ``gh api --include`` output into status, lower-cased headers and body.
+
+    Output without a status line is returned as the body.
+    """
+    if not output.startswith("HTTP/"):
+        return None, {}, output
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        return None, {}, output
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def repo_slug(path: Path) -> str | None:
+    """The "owner/name" of a local checkout's GitHub remote (origin preferred).
+
+    Reads .git/config directly rather than asking git or gh.
+    """
+    dirs = find_git_dirs(path)
+    if dirs is None:
+        return None
+    try:
+        lines = (dirs[1] / "config").read_text().splitlines()
+    except OSError:
+        return None
+
+    remotes: dict[str, str] = {}
+    section = ""
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            section = line
+        elif section.startswith("[remote ") and line.startswith("url"):
+            key, _, value = line.partition("=")
+            if key.strip() == "url":
+                match = _GITHUB_REMOTE.search(value.strip())
+                if match:
+                    name = section[len("[remote ") : -1].strip().strip('"')
+                    remotes.setdefault(name, f"{match.group(1)}/{match.group(2)}")
+    if not remotes:
+        return None
+    return remotes.get("origin") or next(iter(remotes.values()))
+
+
+def build_query(repos: list[str]) -> str:
+    """One GraphQL query for several "owner/name" repositories, aliased r0, r1, ..."""
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, name = repo.split("/", 1)
+        fields.append(
+            f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            "{ ...RepoFields }"
+        )
+    return "query {\n" + "\n".join(fields) + "\n}\n" + _FRAGMENTS
+
+
+def _pull_request(node: dict[str, Any]) -> PullRequest:
+    commits = (node.get("commits") or {}).get("nodes") or []
+    commit = (commits[-1].get("commit") or {}) if commits else {}
+    rollup = (commit.get("statusCheckRollup") or {}).get("state")
+    return PullRequest(
+        number=node["number"],
+        title=node.get("title", ""),
+        state=node.get("state", ""),
+        branch=node.get("headRefName", ""),
+        created_at=node.get("createdAt", ""),
+        merged_at=node.get("mergedAt"),
+        url=node.get("url", ""),
+        author=(node.get("author") or {}).get("login", "unknown"),
+        mergeable=node.get("mergeable") or "UNKNOWN",
+        ci_status=_CI_STATUS.get(rollup or "", "pending"),
+        approvals=(node.get("reviews") or {}).get("totalCount", 0),
+        labels=[label["name"] for label in (node.get("labels") or {}).get("nodes") or []],
+    )
+
+
+def _failed_runs(suites: list[dict[str, Any]]) -> list[WorkflowRun]:
+    """Failed workflow runs among check suites, newest first and deduplicated."""
+    runs: dict[Any, WorkflowRun] = {}
+    for suite in suites:
+        run = suite.get("workflowRun")
+        if not run or suite.get("conclusion") not in _FAILED_CONCLUSIONS:
+            continue
+        key = run.get("databaseId") or run.get("url")
+        runs.setdefault(
+            key,
+            WorkflowRun(
+                run_id=run.get("databaseId"),
+                name=(run.get("workflow") or {}).get("name", "workflow"),
+                branch=(suite.get("branch") or {}).get("name", ""),
+                created_at=run.get("createdAt", ""),
+                url=run.get("url"),
+            ),
+        )
+    return sorted(runs.values(), key=lambda r: r.created_at, reverse=True)[:FAILED_RUN_LIMIT]
+
+
+def parse_repository(repo: str, node: dict[str, Any], fetched_at: float) -> RepoSnapshot:
+    """Turn one aliased repository result into a RepoSnapshot."""
+    open_prs = node.get("openPullRequests") or {}
+    pr_nodes = [n for n in open_prs.get("nodes") or [] if n]
+
+    suites: list[dict[str, Any]] = []
+    target = (node.get("defaultBranchRef") or {}).get("target") or {}
+    for commit in (target.get("history") or {}).get("nodes") or []:
+        suites.extend((commit.get("checkSuites") or {}).get("nodes") or [])
+    for pr in pr_nodes:
+        for commit in (pr.get("commits") or {}).get("nodes") or []:
+            suites.extend(
+                ((commit.get("commit") or {}).get("checkSuites") or {}).get("nodes") or []
+            )
+
+    return RepoSnapshot(
+        repo=repo,
+        open_pr_count=open_prs.get("totalCount", len(pr_nodes)),
+        open_prs=[_pull_request(n) for n in pr_nodes],
+        merged_prs=[
+            _pull_request(n) for n in (node.get("mergedPullRequests") or {}).get("nodes") or [] if n
+        ],
+        failed_runs=_failed_runs(suites),
+        fetched_at=fetched_at,
+    )
+
+
+class GitHubData:
+    """Cached, batched access to GitHub repository data.
+
+    Safe to use from several threads; concurrent callers wait for one
+    query rather than issuing their own.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = GRAPHQL_URL,
+        token: str | None = None,
+        ttl: float = SNAPSHOT_TTL,
+        api_url: str = API_URL,
+        cache_file: Path | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.api_url = api_url
+        self.token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        self.ttl = ttl
+        self.cache = ResponseCache(cache_file)
+        self.rate_limits: dict[str, RateLimit] = {}
+        self._snapshots: dict[str, RepoSnapshot] = {}
+        self._watched: dict[str, float] = {}  # repo -> last asked for
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        self.queries = 0  # GraphQL requests issued
+        self.requests = 0  # REST requests issued
+        self.not_modified = 0  # REST requests answered 304 from the cache
+
+    def repos(self, repos: list[str]) -> dict[str, RepoSnapshot]:
+        """Snapshots for "owner/name" repositories, fetching stale ones in batches."""
+        now = time.time()
+        with self._lock:
+            for repo in repos:
+                self._watched[repo] = now
+            for repo, asked in list(self._watched.items()):
+                if now - asked > WATCH_TTL:
+                    del self._watched[repo]
+
+            if any(self._is_stale(repo, now) for repo in repos):
+                stale = [repo for repo in self._watched if self._is_stale(repo, now)]
+                self._fetch(stale, now)
+            return {repo: self._snapshots[repo] for repo in repos}
+
+    def repo(self, repo: str) -> RepoSnapshot:
+        """The snapshot for one "owner/name" repository."""
+        return self.repos([repo])[repo]
+
+    def rest(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """GET a REST endpoint, revalidating the cached body with a conditional request.
+
+        A cached body is returned without a request while it is younger than
+        the refresh interval (or the X-Poll-Interval GitHub asked for). If
+        the request fails, a cached body is served stale and retried on the
+        next call. The request itself is made without holding the lock.
+
+        Raises:
+            GitHubError: If the request fails and nothing usable is cached.
+        """
+        key = path.strip("/") + (f"?{urlencode(sorted(params.items()))}" if params else "")
+        now = time.time()
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                fresh_for = max(self._ttl("core", now), entry.get("poll_interval", 0))
+                if now - entry["fetched_at"] < fresh_for:
+                    return entry["body"]
+            self.requests += 1
+            if self.token:
+                self._http()  # Created here, not by racing requests
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        elif entry is not None and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            if self.token:
+                status, response_headers, body = self._get_http(key, headers)
+            else:
+                status, response_headers, body = self._get_gh(key, headers)
+            with self._lock:
+                self._track_rate_limit(response_headers, now)
+            updated = self._rest_entry(entry, status, response_headers, body, now)
+        except GitHubError:
+            if entry is None:
+                raise
+            return entry["body"]  # Stale; fetched_at is left alone so the next call retries
+
+        with self._lock:
+            if status == 304:
+                self.not_modified += 1
+            self.cache.put(key, updated)
+        return updated["body"]
+
+    @staticmethod
+    def _rest_entry(
+        entry: dict[str, Any] | None,
+        status: int,
+        headers: Mapping[str, str],
+        body: str,
+        now: float,
+    ) -> dict[str, Any]:
+        """The cache entry for a REST response, given the entry it revalidated."""
+        if status == 304 and entry is not None:
+            return {**entry, "fetched_at": now}
+        if status != 200:
+            raise GitHubError(f"GitHub API error: {status}")
+        try:
+            data = json.loads(body) if body.strip() else None
+        except json.JSONDecodeError:
+            raise GitHubError("Invalid JSON from GitHub API") from None
+        return {
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "poll_interval": float(headers.get("x-poll-interval") or 0),
+            "fetched_at": now,
+            "body": data,
+        }
+
+    def rate_limit(self, resource: str = "graphql") -> RateLimit | None:
+        """The last reported budget for a rate-limit resource, if any."""
+        return self.rate_limits.get(resource)
+
+    def invalidate(self, repo: str | None = None) -> None:
+        """Drop cached data (for one repository, or all) so the next read refetches."""
+        with self._lock:
+            if repo is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(repo, None)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _ttl(self, resource: str, now: float) -> float:
+        """The refresh interval, stretched while the resource's budget is low."""
+        limit = self.rate_limits.get(resource)
+        return limit.poll_interval(self.ttl, now) if limit else self.ttl
+
+    def _track_rate_limit(self, headers: Mapping[str, str], now: float) -> None:
+        limit = RateLimit.from_headers(headers, now)
+        if limit is not None:
+            self.rate_limits[limit.resource] = limit
+
+    def _is_stale(self, repo: str, now: float) -> bool:
+        snapshot = self._snapshots.get(repo)
+        return snapshot is None or now - snapshot.fetched_at >= self._ttl("graphql", now)
+
+    def _fetch(self, repos: list[str], now: float) -> None:
+        valid = []
+        for repo in repos:
+            if _REPO_NAME.match(repo):
+                valid.append(repo)
+            else:
+                self._snapshots[repo] = RepoSnapshot(
+                    repo=repo, error="Invalid repository name", fetched_at=now
+                )
+
+        for start in range(0, len(valid), MAX_REPOS_PER_QUERY):
+            batch = valid[start : start + MAX_REPOS_PER_QUERY]
+            try:
+                response = self._query(build_query(batch))
+            except GitHubError as e:
+                for repo in batch:
+                    self._snapshots[repo] = RepoSnapshot(repo=repo, error=str(e), fetched_at=now)
+                continue
+
+            data = response.get("data") or {}
+            errors = {
+                str((error.get("path") or [""])[0]): error.get("message", "GraphQL error")
+                for error in response.get("errors") or []
+            }
+            for i, repo in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node:
+                    self._snapshots[repo] = parse_repository(repo, node, now)
+                else:
+                    error = errors.get(f"r{i}", "Repository not found")
+                    self._snapshots[repo] = RepoSnapshot(repo=repo, error=error, fetched_at=now)
+
+    def _query(self, query: str) -> dict[str, Any]:
+        """Run a GraphQL query and return the response document."""
+        self.queries += 1
+        if self.token:
+            return self._query_http(query)
+        return self._query_gh(query)
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(
+                headers={"Authorization": f"bearer {self.token}"}, timeout=QUERY_TIMEOUT
+            )
+        return self._client
+
+    def _send_http(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        try:
+            response = self._http().request(method, url, **kwargs)
+        except httpx.TimeoutException:
+            raise GitHubError("GitHub API timed out") from None
+        except httpx.HTTPError as e:
+            raise GitHubError(f"GitHub API unreachable: {e}") from None
+        if response.status_code == 401:
+            raise GitHubError("GitHub token rejected")
+        return response
+
+    def _query_http(self, query: str) -> dict[str, Any]:
+        response = self._send_http("POST", self.endpoint, json={"query": query})
+        self._track_rate_limit(response.headers, time.time())
+        if response.status_code != 200:
+            raise GitHubError(f"GitHub API error: {response.status_code}")
+        try:
+            return response.json()
+        except ValueError:
+            raise GitHubError("Invalid JSON from GitHub API") from None
+
+    def _get_http(self, key: str, headers: dict[str, str]) -> tuple[int, dict[str, str], str]:
+        response = self._send_http("GET", f"{self.api_url}/{key}", headers=headers)
+        return response.status_code, dict(response.headers), response.text
+
+    def _run_gh(self, args: list[str]) -> subprocess.CompletedProcess[str]:
+        try:
+            return subprocess.run(
+                ["gh", "api", "--include", *args],
+                capture_output=True,
+                text=True,
+                timeout=QUERY_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            raise GitHubError("gh command timed out") from None
+        except FileNotFoundError:
+            raise GitHubError("GitHub CLI not installed") from None
+        except OSError as e:
+            raise GitHubError(str(e)) from None
+
+    @staticmethod
+    def _gh_error(result: subprocess.CompletedProcess[str], default: str) -> GitHubError:
+        stderr = (result.stderr or "").lower()
+        if "not logged in" in stderr or "auth login" in stderr:
+            return GitHubError("GitHub CLI not authenticated")
+        return GitHubError((result.stderr or "").strip() or default)
+
+    def _query_gh(self, query: str) -> dict[str, Any]:
+        result = self._run_gh(["graphql", "-f", f"query={query}"])
+        _, headers, body = _split_http_output(result.stdout or "")
+        self._track_rate_limit(headers, time.time())
+
+        # gh exits non-zero on partial GraphQL errors but still prints the document
+        try:
+            document = json.loads(body) if body.strip() else None
+        except json.JSONDecodeError:
+            document = None
+        if isinstance(document, dict) and ("data" in document or "errors" in document):
+            return document
+        raise self._gh_error(result, "Invalid JSON from gh")
+
+    def _get_gh(self, key: str, headers: dict[str, str]) -> tuple[int, dict[str, str], str]:
+        args = []
+        for name, value in headers.items():
+            args += ["-H", f"{name}: {value}"]
+        result = self._run_gh([*args, key])
+        # gh exits non-zero for a 304, but --include still prints the status line
+        status, response_headers, body = _split_http_output(result.stdout or "")
+        if status is None:
+            raise self._gh_error(result, "No response from gh")
+        return status, response_headers, body
+
+
+_DATA: GitHubData | None = None
+_DATA_LOCK = threading.Lock()
+
+
+def get_github_data() -> GitHubData:
+    """The process-wide GitHub data layer."""
+    global _DATA
+    with _DATA_LOCK:
+        if _DATA is None:
+            _DATA = GitHubData()
+        return _DATA
+
+
+def reset_github_data(data: GitHubData | None = None) -> None:
+    """Replace the process-wide data layer (used by tests)."""
+    global _DATA
+    with _DATA_LOCK:
+        if _DATA is not None:
+            _DATA.close()
+        _DATA = data
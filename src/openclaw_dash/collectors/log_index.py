@@ -0,0 +1,597 @@
+"""Inverted index for full-text search over gateway logs.
+
+Each plain log file is split into line-aligned blocks of about BLOCK_SIZE
+bytes. The index maps every lowercased word token to the ids of the blocks
+containing it, and records the earliest/latest timestamp of each block. A search
+intersects the posting lists of its terms, drops blocks outside the time
+range, and only reads and decodes the surviving blocks, newest first, until
+a page of results is full.
+
+Indexes are built incrementally: update() only tokenizes bytes appended
+since the last call, and the log tailer (logs.collect) refreshes indexes
+that a search has already opened. Indexes are persisted under INDEX_DIR so
+a restart does not re-read gigabytes of logs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import msgpack
+
+from openclaw_dash.collectors import logs
+
+INDEX_DIR = Path.home() / ".openclaw" / "workspace" / "log-index"
+INDEX_VERSION = 1
+
+# Target size of an indexed block; lines are never split across blocks
+BLOCK_SIZE = 64 * 1024
+
+# Re-save a persisted index once this many new bytes have been indexed
+SAVE_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Bytes hashed from the start of a log to detect it being replaced
+HEAD_BYTES = 1024
+
+# Lowercases ASCII letters and maps every byte that is not an ASCII letter,
+# digit or underscore to a space, so translate() + split() tokenizes in C
+_TOKEN_TABLE = bytes(
+    ord(chr(c).lower()) if chr(c).isascii() and (chr(c).isalnum() or c == ord("_")) else ord(" ")
+    for c in range(256)
+)
+
+TIMESTAMP_PATTERN = re.compile(rb"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z")
+TIMESTAMP_LENGTH = len("2026-02-01T08:09:41.294Z")
+RELATIVE_TIME_PATTERN = re.compile(r"^(\d+)([smhdw])$")
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+RELATIVE_TIME_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+_INDEXES: dict[Path, LogIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def tokenize(data: bytes) -> set[bytes]:
+    """Split raw bytes into the set of lowercased word tokens they contain."""
+    return set(data.translate(_TOKEN_TABLE).split())
+
+
+def format_log_timestamp(dt: datetime) -> str:
+    """Format a datetime the way gateway log lines stamp it (UTC, milliseconds).
+
+    Naive datetimes are taken to be UTC already.
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def parse_time_bound(value: str, now: datetime | None = None, *, upper: bool = False) -> datetime:
+    """Parse a search time bound: ISO date/datetime or a relative age like ``2h``.
+
+    With ``upper``, a bare date means the end of that day, so that
+    ``until:2026-02-01`` includes the whole of February 1st.
+
+    Raises:
+        ValueError: If the value is neither.
+    """
+    match = RELATIVE_TIME_PATTERN.match(value)
+    if match:
+        amount, unit = match.groups()
+        now = now or datetime.now(timezone.utc)
+        return now - timedelta(**{RELATIVE_TIME_UNITS[unit]: int(amount)})
+    if upper and DATE_PATTERN.fullmatch(value):
+        return datetime.combine(date.fromisoformat(value), datetime.max.time())
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass
+class LogQuery:
+    """A parsed log search.
+
+    Attributes:
+        terms: Words that must all appear in a line (case-insensitive).
+            A term with no word characters (``->``, ``[ws]``) is matched
+            as a substring instead.
+        tags: Only match lines with one of these tags, if any.
+        since: Only match lines stamped at or after this time.
+        until: Only match lines stamped at or before this time.
+    """
+
+    terms: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @classmethod
+    def parse(cls, text: str, now: datetime | None = None) -> LogQuery:
+        """Parse search box syntax: ``tag:ws since:1h until:2026-02-01 timeout``.
+
+        ``tag:`` may repeat. ``since:``/``until:`` take an ISO date/datetime
+        (UTC unless an offset is given) or a relative age (``30m``, ``2h``,
+        ``7d``); a bare ``until:`` date includes that whole day. Everything
+        else is a search term.
+
+        Raises:
+            ValueError: If a time bound cannot be parsed.
+        """
+        query = cls()
+        for word in text.split():
+            key, sep, value = word.partition(":")
+            if sep and value and key == "tag":
+                query.tags.append(value)
+            elif sep and value and key in ("since", "until"):
+                setattr(query, key, parse_time_bound(value, now, upper=key == "until"))
+            else:
+                query.terms.append(word)
+        return query
+
+    @property
+    def term_tokens(self) -> set[bytes]:
+        """Tokens every matching line must contain."""
+        return tokenize(" ".join(self.terms).encode())
+
+    @property
+    def literal_terms(self) -> list[str]:
+        """Case-folded terms without word tokens, matched as substrings."""
+        return [term.casefold() for term in self.terms if not tokenize(term.encode())]
+
+    @property
+    def since_stamp(self) -> bytes | None:
+        """Lower time bound as comparable log timestamp bytes."""
+        return format_log_timestamp(self.since).encode() if self.since else None
+
+    @property
+    def until_stamp(self) -> bytes | None:
+        """Upper time bound as comparable log timestamp bytes."""
+        return format_log_timestamp(self.until).encode() if self.until else None
+
+
+class LogIndex:
+    """Block-level inverted index over a single plain log file.
+
+    Attributes:
+        path: Indexed log file.
+        indexed_end: Offset up to which complete lines have been indexed.
+        offsets: Start offset of each block; a block ends where the next
+            starts, or at indexed_end for the last one.
+        first_ts: Earliest timestamp in each block (b"" if none).
+        last_ts: Latest timestamp in each block (b"" if none).
+        postings: Token -> ascending ids of blocks containing it.
+    """
+
+    def __init__(self, path: Path, index_dir: Path | None = None) -> None:
+        self.path = path
+        self.index_dir = index_dir or INDEX_DIR
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.identity: tuple[int, int] = (0, 0)
+        self.head_size = 0
+        self.head_digest = ""
+        self.indexed_end = 0
+        self.offsets: array[int] = array("Q")
+        self.first_ts: list[bytes] = []
+        self.last_ts: list[bytes] = []
+        self.postings: dict[bytes, array[int]] = {}
+        self._saved_end = 0
+
+    @property
+    def index_file(self) -> Path:
+        """Where this log's index is persisted."""
+        digest = hashlib.sha1(str(self.path.resolve()).encode()).hexdigest()[:16]
+        return self.index_dir / f"{self.path.name}-{digest}.msgpack"
+
+    @property
+    def block_count(self) -> int:
+        return len(self.offsets)
+
+    def block_range(self, block_id: int) -> tuple[int, int]:
+        """Return the (start, end) byte offsets of a block."""
+        end = self.offsets[block_id + 1] if block_id + 1 < len(self.offsets) else self.indexed_end
+        return self.offsets[block_id], end
+
+    def _is_same_file(self, mm: mmap.mmap, st: os.stat_result) -> bool:
+        """Whether the indexed prefix still belongs to the file on disk."""
+        if self.indexed_end == 0:
+            return True
+        return (
+            (st.st_dev, st.st_ino) == self.identity
+            and st.st_size >= self.indexed_end
+            and hashlib.sha1(mm[: self.head_size]).hexdigest() == self.head_digest
+        )
+
+    def update(self) -> int:
+        """Index complete lines appended since the last update.
+
+        Starts over if the file was truncated or replaced (e.g. rotated).
+        A trailing partial line is left for the next update.
+
+        Returns:
+            Number of newly indexed bytes.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        st = self.path.stat()
+        with logs.mapped_file(self.path) as mm:
+            if mm is None:
+                if self.indexed_end:
+                    self._reset()
+                return 0
+            if not self._is_same_file(mm, st):
+                self._reset()
+            if self.indexed_end == 0:
+                self.identity = (st.st_dev, st.st_ino)
+                self.head_size = min(HEAD_BYTES, len(mm))
+                self.head_digest = hashlib.sha1(mm[: self.head_size]).hexdigest()
+            return self._index_from(mm, self.indexed_end)
+
+    def _index_from(self, mm: mmap.mmap, pos: int) -> int:
+        size = len(mm)
+        start = pos
+        # Keep filling the last block, which an earlier incremental update
+        # may have left short, rather than starting one per few new lines
+        block_id = max(len(self.offsets) - 1, 0)
+        while pos < size:
+            block_start = self.offsets[block_id] if block_id < len(self.offsets) else pos
+            limit = min(block_start + BLOCK_SIZE, size)
+            end = mm.rfind(b"\n", pos, limit) + 1
+            if end <= pos:
+                if pos > block_start:
+                    block_id += 1  # Block is full; the next line starts a new one
+                    continue
+                # A single line longer than a block is taken whole
+                end = mm.find(b"\n", limit) + 1
+                if end <= 0:
+                    break  # Partial last line
+            self._add_to_block(block_id, mm, pos, end)
+            pos = end
+        self.indexed_end = pos
+        return pos - start
+
+    def _add_to_block(self, block_id: int, mm: mmap.mmap, start: int, end: int) -> None:
+        data = mm[start:end]
+        earliest, latest = _timestamp_range(data)
+        if block_id == len(self.offsets):
+            self.offsets.append(start)
+            self.first_ts.append(earliest)
+            self.last_ts.append(latest)
+        elif earliest:
+            if not self.first_ts[block_id] or earliest < self.first_ts[block_id]:
+                self.first_ts[block_id] = earliest
+            self.last_ts[block_id] = max(self.last_ts[block_id], latest)
+        postings = self.postings
+        for token in tokenize(data):
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = array("I", (block_id,))
+            elif ids[-1] != block_id:
+                ids.append(block_id)
+
+    def candidate_blocks(self, query: LogQuery) -> list[int]:
+        """Ids of blocks that may hold matches for query, ascending.
+
+        Blocks must contain every term token and, if tags are given, every
+        token of at least one tag; their timestamp range must overlap the
+        query's. Terms without word tokens are not indexed, so a query of
+        only such terms keeps every block. Lines still need checking with
+        matches_line().
+        """
+        required = query.term_tokens
+        blocks = self._blocks_with_all(required)
+        if query.tags:
+            tagged: set[int] = set()
+            for tag in query.tags:
+                tag_blocks = self._blocks_with_all(tokenize(tag.encode()))
+                if tag_blocks is None:
+                    tagged = set(range(self.block_count))
+                    break
+                tagged |= tag_blocks
+            blocks = tagged if blocks is None else blocks & tagged
+        if blocks is None:
+            ids: list[int] = list(range(self.block_count))
+        else:
+            ids = sorted(blocks)
+
+        since, until = query.since_stamp, query.until_stamp
+        if since is None and until is None:
+            return ids
+        return [
+            b
+            for b in ids
+            if self.first_ts[b]
+            and (since is None or self.last_ts[b] >= since)
+            and (until is None or self.first_ts[b] <= until)
+        ]
+
+    def _blocks_with_all(self, tokens: set[bytes]) -> set[int] | None:
+        """Blocks containing every token, or None when tokens is empty."""
+        if not tokens:
+            return None
+        lists = sorted((self.postings.get(t, array("I")) for t in tokens), key=len)
+        blocks = set(lists[0])
+        for ids in lists[1:]:
+            if not blocks:
+                break
+            blocks.intersection_update(ids)
+        return blocks
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for msgpack persistence."""
+        return {
+            "version": INDEX_VERSION,
+            "identity": list(self.identity),
+            "head_size": self.head_size,
+            "head_digest": self.head_digest,
+            "indexed_end": self.indexed_end,
+            "offsets": self.offsets.tobytes(),
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "postings": {token: ids.tobytes() for token, ids in self.postings.items()},
+        }
+
+    def load(self) -> bool:
+        """Load the persisted index, if any and compatible.
+
+        Returns:
+            True if an index was loaded.
+        """
+        try:
+            with open(self.index_file, "rb") as f:
+                data = msgpack.unpack(f, raw=False, strict_map_key=False)
+            if data.get("version") != INDEX_VERSION:
+                return False
+            offsets: array[int] = array("Q")
+            offsets.frombytes(data["offsets"])
+            postings: dict[bytes, array[int]] = {}
+            for token, raw in data["postings"].items():
+                ids: array[int] = array("I")
+                ids.frombytes(raw)
+                postings[token] = ids
+        except (OSError, ValueError, KeyError, TypeError, msgpack.UnpackException):
+            return False
+        self.identity = tuple(data["identity"])  # type: ignore[assignment]
+        self.head_size = data["head_size"]
+        self.head_digest = data["head_digest"]
+        self.indexed_end = data["indexed_end"]
+        self.offsets = offsets
+        self.first_ts = data["first_ts"]
+        self.last_ts = data["last_ts"]
+        self.postings = postings
+        self._saved_end = self.indexed_end
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """Persist the index if enough new data was indexed since the last save.
+
+        Args:
+            force: Save even below SAVE_THRESHOLD_BYTES of new data.
+
+        Returns:
+            True if the index was written.
+        """
+        if self.indexed_end == self._saved_end:
+            return False
+        if (
+            not force
+            and self._saved_end
+            and (self.indexed_end - self._saved_end < SAVE_THRESHOLD_BYTES)
+        ):
+            return False
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                msgpack.pack(self.to_dict(), f, use_bin_type=True)
+            tmp.replace(self.index_file)
+        except OSError:
+            return False
+        self._saved_end = self.indexed_end
+        return True
+
+
+def _timestamp_range(data: bytes) -> tuple[bytes, bytes]:
+    """Earliest and latest timestamps of the stamped lines in a run of lines.
+
+    Stamped lines start with their ISO timestamp, so the smallest and
+    largest lines carry them; lines without one (blank, continuations) are
+    only filtered out when they end up at either extreme.
+
+    Returns:
+        (earliest, latest), or (b"", b"") when no line is stamped.
+    """
+    lines = data.rstrip(b"\n").split(b"\n")
+    low, high = min(lines), max(lines)
+    if not (TIMESTAMP_PATTERN.match(low) and TIMESTAMP_PATTERN.match(high)):
+        stamped = [line for line in lines if TIMESTAMP_PATTERN.match(line)]
+        if not stamped:
+            return b"", b""
+        low, high = min(stamped), max(stamped)
+    return low[:TIMESTAMP_LENGTH], high[:TIMESTAMP_LENGTH]
+
+
+def matches_line(
+    raw: bytes, query: LogQuery, tokens: set[bytes], literals: list[str] | None = None
+) -> dict[str, Any] | None:
+    """Check one raw line against a query.
+
+    Args:
+        raw: Line bytes without the trailing newline.
+        query: Parsed query.
+        tokens: query.term_tokens, precomputed by the caller.
+        literals: query.literal_terms, computed here if not given.
+
+    Returns:
+        The parsed log entry (as logs.collect() returns them) or None.
+    """
+    if tokens:
+        lowered = raw.lower()
+        if not all(token in lowered for token in tokens):
+            return None
+        if not tokens <= tokenize(raw):
+            return None
+    if literals is None:
+        literals = query.literal_terms
+    if literals:
+        folded = raw.decode("utf-8", errors="replace").casefold()
+        if not all(literal in folded for literal in literals):
+            return None
+    parsed = logs.parse_log_line(raw.decode("utf-8", errors="replace"))
+    if parsed is None:
+        return None
+    if query.tags and parsed["tag"] not in query.tags:
+        return None
+    stamp = parsed["timestamp"].encode()
+    since, until = query.since_stamp, query.until_stamp
+    if (since is not None and stamp < since) or (until is not None and stamp > until):
+        return None
+    parsed["level"] = logs.get_log_level(parsed["tag"], parsed["message"])
+    return parsed
+
+
+def get_log_index(path: Path, index_dir: Path | None = None) -> LogIndex:
+    """Return the shared index for a log, loading a persisted one on first use."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            index = LogIndex(path, index_dir)
+            index.load()
+            _INDEXES[path] = index
+        return index
+
+
+def update_open_index(path: Path) -> None:
+    """Index new lines of a log whose index a search has opened.
+
+    Called by the tailer on every collect(). Never blocks: if a search is
+    using the index, the new lines are picked up by that search instead.
+    """
+    index = _INDEXES.get(path)
+    if index is None or not index.lock.acquire(blocking=False):
+        return
+    try:
+        index.update()
+    except OSError:
+        pass
+    finally:
+        index.lock.release()
+
+
+def reset_indexes() -> None:
+    """Forget all open indexes (persisted ones stay on disk)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+def searchable_log_files() -> list[Path]:
+    """Logs that can be indexed: the live logs and uncompressed rotations.
+
+    Compressed archives are left out; they cannot be read at random
+    offsets, which the block index relies on.
+    """
+    return [path for path in logs.find_log_files() if not logs.is_compressed_log(path)]
+
+
+def _search_file(
+    index: LogIndex, query: LogQuery, tokens: set[bytes], want: int
+) -> list[dict[str, Any]]:
+    """Up to ``want`` matches from one indexed file, newest first."""
+    found: list[dict[str, Any]] = []
+    literals = query.literal_terms
+    with logs.mapped_file(index.path) as mm:
+        if mm is None:
+            return found
+        for block_id in reversed(index.candidate_blocks(query)):
+            start, end = index.block_range(block_id)
+            for raw in reversed(mm[start:end].split(b"\n")):
+                if not raw:
+                    continue
+                entry = matches_line(raw, query, tokens, literals)
+                if entry is not None:
+                    entry["log_file"] = str(index.path)
+                    found.append(entry)
+                    if len(found) >= want:
+                        return found
+    return found
+
+
+def search(
+    query: LogQuery | str,
+    limit: int = 50,
+    offset: int = 0,
+    log_files: list[Path] | None = None,
+    index_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Search gateway logs, newest matches first.
+
+    Indexes are brought up to date (or built, the first time) before
+    searching, so the first search over a large log pays the indexing cost
+    once; later searches only index what was appended.
+
+    Args:
+        query: LogQuery or search box text (see LogQuery.parse).
+        limit: Page size.
+        offset: Number of matches to skip, for paging.
+        log_files: Logs to search, newest first. Defaults to
+            searchable_log_files().
+        index_dir: Where indexes are persisted. Defaults to INDEX_DIR.
+
+    Returns:
+        Dictionary with the page of entries, has_more, searched files,
+        indexed byte count and timing.
+
+    Raises:
+        ValueError: If query text has an invalid time bound.
+    """
+    started = time.perf_counter()
+    if isinstance(query, str):
+        query = LogQuery.parse(query)
+    files = searchable_log_files() if log_files is None else log_files
+    tokens = query.term_tokens
+    want = offset + limit + 1  # One extra to know whether another page exists
+
+    entries: list[dict[str, Any]] = []
+    searched: list[str] = []
+    indexed_bytes = 0
+    errors: list[str] = []
+    for path in files:
+        if len(entries) >= want:
+            break
+        index = get_log_index(path, index_dir)
+        with index.lock:
+            try:
+                index.update()
+                index.save()
+                entries.extend(_search_file(index, query, tokens, want - len(entries)))
+            except OSError as e:
+                errors.append(f"{path.name}: {e}")
+                continue
+            indexed_bytes += index.indexed_end
+        searched.append(str(path))
+
+    result: dict[str, Any] = {
+        "entries": entries[offset : offset + limit],
+        "total": len(entries[offset : offset + limit]),
+        "has_more": len(entries) > offset + limit,
+        "offset": offset,
+        "files": searched,
+        "indexed_bytes": indexed_bytes,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "collected_at": datetime.now().isoformat(),
+    }
+    if not files:
+        result["error"] = "Log file not found"
+    elif errors:
+        result["error"] = "; ".join(errors)
+    return result
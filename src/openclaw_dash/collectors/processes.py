@@ -0,0 +1,161 @@
+"""Per-process resource tracking for the gateway and local model servers.
+
+ProcessTracker finds the OpenClaw gateway, ``ollama serve``, LM Studio and
+vLLM by process name and command line, and keeps their psutil.Process
+handles between samples. psutil caches each handle's previous CPU times,
+so CPU percentages are cheap deltas. The process table is only scanned
+again when a tracked process has exited, or every REDISCOVER_INTERVAL
+seconds while something is not running.
+
+The resource sampler (collectors.resources) calls sample() on its thread.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+REDISCOVER_INTERVAL = 30.0  # Seconds between scans for processes that are not running
+
+
+@dataclass(frozen=True)
+class ProcessSpec:
+    """How to recognise one tracked process.
+
+    A process matches if its name starts with one of ``names`` (any name
+    when empty) and its command line contains every string in ``cmdline``.
+    Matching is case-insensitive. If several processes match, the oldest
+    (normally the parent) is tracked.
+    """
+
+    key: str
+    label: str
+    names: tuple[str, ...] = ()
+    cmdline: tuple[str, ...] = ()
+
+    def matches(self, name: str, cmdline: str) -> bool:
+        name = name.lower()
+        cmdline = cmdline.lower()
+        if self.names and not name.startswith(self.names):
+            return False
+        return all(part in cmdline for part in self.cmdline)
+
+
+PROCESS_SPECS: tuple[ProcessSpec, ...] = (
+    ProcessSpec("gateway", "Gateway", names=("node", "openclaw"), cmdline=("openclaw", "gateway")),
+    ProcessSpec("ollama", "Ollama", names=("ollama",), cmdline=("serve",)),
+    ProcessSpec("lm-studio", "LM Studio", names=("lm studio", "lm-studio", "lmstudio")),
+    ProcessSpec("vllm", "vLLM", names=("python", "vllm"), cmdline=("vllm",)),
+)
+
+
+class ProcessTracker:
+    """Samples CPU, memory, file descriptors, threads and I/O of tracked processes."""
+
+    def __init__(self, specs: tuple[ProcessSpec, ...] = PROCESS_SPECS) -> None:
+        self.specs = specs
+        self._handles: dict[str, psutil.Process] = {}
+        self._io: dict[str, tuple[float, int, int]] = {}  # key -> (monotonic, read, written)
+        self._last_scan: float | None = None
+        self.scans = 0  # Process table scans so far
+
+    def sample(self) -> list[dict[str, Any]]:
+        """One entry per spec, in spec order; ``running`` is False if not found."""
+        if not PSUTIL_AVAILABLE:
+            return []
+
+        now = time.monotonic()
+        vanished = False
+        for key, proc in list(self._handles.items()):
+            if not proc.is_running():
+                del self._handles[key]
+                self._io.pop(key, None)
+                vanished = True
+        missing = [spec for spec in self.specs if spec.key not in self._handles]
+        if missing and (
+            vanished or self._last_scan is None or now - self._last_scan >= REDISCOVER_INTERVAL
+        ):
+            self._discover(missing, now)
+
+        results = []
+        for spec in self.specs:
+            entry = None
+            proc = self._handles.get(spec.key)
+            if proc is not None:
+                entry = self._read(spec, proc, now)
+            results.append(entry or {"key": spec.key, "name": spec.label, "running": False})
+        return results
+
+    def _discover(self, specs: list[ProcessSpec], now: float) -> None:
+        """Scan the process table once for all the given specs."""
+        self._last_scan = now
+        self.scans += 1
+        found: dict[str, psutil.Process] = {}
+        own_pid = os.getpid()
+        for proc in psutil.process_iter(["name", "cmdline", "create_time"]):
+            if proc.pid == own_pid:
+                continue
+            info = proc.info
+            name = info.get("name") or ""
+            cmdline = " ".join(info.get("cmdline") or [])
+            for spec in specs:
+                if not spec.matches(name, cmdline):
+                    continue
+                current = found.get(spec.key)
+                if current is None or (info.get("create_time") or 0) < (
+                    current.info.get("create_time") or 0
+                ):
+                    found[spec.key] = proc
+        for key, proc in found.items():
+            proc.cpu_percent(interval=None)  # Baseline for the first delta
+            self._handles[key] = proc
+
+    def _read(self, spec: ProcessSpec, proc: psutil.Process, now: float) -> dict[str, Any] | None:
+        entry: dict[str, Any] = {
+            "key": spec.key,
+            "name": spec.label,
+            "running": True,
+            "pid": proc.pid,
+        }
+        try:
+            with proc.oneshot():
+                entry["cpu_percent"] = proc.cpu_percent(interval=None)
+                rss = proc.memory_info().rss
+                entry["rss"] = rss
+                entry["rss_mb"] = round(rss / (1024**2), 1)
+                entry["threads"] = proc.num_threads()
+                entry["fds"] = _optional(proc, "num_fds") or _optional(proc, "num_handles")
+                io = _optional(proc, "io_counters")
+        except psutil.NoSuchProcess:
+            self._handles.pop(spec.key, None)
+            self._io.pop(spec.key, None)
+            return None
+        except psutil.AccessDenied:
+            return entry
+
+        entry["read_bps"] = entry["write_bps"] = None
+        if io is not None:
+            previous = self._io.get(spec.key)
+            self._io[spec.key] = (now, io.read_bytes, io.write_bytes)
+            if previous is not None and now > previous[0]:
+                elapsed = now - previous[0]
+                entry["read_bps"] = max(0.0, (io.read_bytes - previous[1]) / elapsed)
+                entry["write_bps"] = max(0.0, (io.write_bytes - previous[2]) / elapsed)
+        return entry
+
+
+def _optional(proc: psutil.Process, method: str) -> Any:
+    """Call a psutil method that may be unsupported on this platform or denied."""
+    try:
+        return getattr(proc, method)()
+    except (AttributeError, NotImplementedError, psutil.AccessDenied):
+        return None
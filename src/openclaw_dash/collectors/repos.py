@@ -1,10 +1,21 @@
-"""Repository health collector."""
+"""Repository health collector.
+
+Open PR counts for all repositories come from one batched GitHub request,
+made on its own thread; the per-repository work (``git log``) runs on a
+bounded thread pool alongside it. Each entry is built as soon as its
+repository's git work finishes and its PR count is filled in once the
+GitHub batch returns, so a slow repository or a slow GitHub no longer
+holds up the others. Last commit times are reused until the repository's
+fingerprint changes; PR counts follow the GitHub cache's own TTL.
+"""
 
 from __future__ import annotations
 
-import json
 import subprocess
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,6 +25,10 @@ from openclaw_dash.collectors.base import (
     CollectorState,
     update_collector_state,
 )
+from openclaw_dash.collectors.fingerprint import get_gate
+from openclaw_dash.collectors.git_reader import get_reader, relative_date
+from openclaw_dash.collectors.github import RepoSnapshot, get_github_data, repo_slug
+from openclaw_dash.config import load_config
 from openclaw_dash.demo import is_demo_mode, mock_repos
 
 COLLECTOR_NAME = "repos"
@@ -21,69 +36,79 @@ DEFAULT_REPOS = ["synapse-engine", "r3LAY", "t3rra1n", "openclaw-dash"]
 REPO_BASE = Path.home() / "repos"
 
 
-def _get_open_prs(repo_path: Path) -> tuple[int, str | None]:
-    """Get open PR count for a repository.
+def _get_open_prs(slug: str | None, snapshots: dict[str, RepoSnapshot]) -> tuple[int, str | None]:
+    """Get open PR count for a repository from the batched GitHub data.
+
+    Args:
+        slug: The repository's "owner/name", or None if it has no GitHub remote.
+        snapshots: GitHub data fetched for all repositories at once.
 
     Returns:
         Tuple of (pr_count, error_message_or_none).
     """
+    if slug is None:
+        return 0, None  # Not on GitHub: treat as 0 PRs
+    snapshot = snapshots.get(slug)
+    if snapshot is None:
+        return 0, None
+    if snapshot.error:
+        return 0, snapshot.error
+    return snapshot.open_pr_count, None
+
+
+def _last_commit_time(repo_path: Path) -> tuple[int | None, str | None]:
+    """Unix time of a repository's last commit.
+
+    Reads HEAD and the commit from .git directly, falling back to
+    ``git log`` when the reader cannot. A timeout is raised rather than
+    returned so that it is not cached.
+
+    Returns:
+        Tuple of (timestamp, error_message_or_none).
+    """
+    commit = get_reader(repo_path).last_commit()
+    if commit is not None:
+        return commit.timestamp, None
+
     try:
         result = subprocess.run(
-            ["gh", "pr", "list", "--json", "number"],
+            ["git", "log", "-1", "--format=%ct"],
             cwd=repo_path,
             capture_output=True,
             text=True,
-            timeout=15,
+            timeout=5,
         )
-        if result.returncode == 0:
-            try:
-                prs_list = json.loads(result.stdout)
-                return len(prs_list), None
-            except json.JSONDecodeError:
-                return 0, "Invalid JSON from gh"
+        if result.returncode == 0 and result.stdout.strip().isdigit():
+            return int(result.stdout), None
         else:
-            # gh CLI not authenticated or other error
-            if "not logged in" in (result.stderr or "").lower():
-                return 0, "GitHub CLI not authenticated"
-            return 0, None  # Treat as 0 PRs
-
-    except subprocess.TimeoutExpired:
-        return 0, "gh command timed out"
+            return None, "git log failed"
 
     except FileNotFoundError:
-        return 0, "GitHub CLI not installed"
+        return None, "git not installed"
 
     except OSError:
-        return 0, None
+        return None, None
 
 
 def _get_last_commit(repo_path: Path) -> tuple[str | None, str | None]:
     """Get last commit time for a repository.
 
+    The commit time is only looked up again once HEAD, the index or a ref
+    has changed (see collectors.fingerprint); the relative date is
+    formatted on every call.
+
     Returns:
         Tuple of (last_commit_str, error_message_or_none).
     """
     try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ar"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
+        timestamp, error = get_gate().repo(
+            repo_path, "last_commit", lambda: _last_commit_time(repo_path)
         )
-        if result.returncode == 0:
-            return result.stdout.strip(), None
-        else:
-            return None, "git log failed"
-
     except subprocess.TimeoutExpired:
         return None, "git command timed out"
-
-    except FileNotFoundError:
-        return None, "git not installed"
-
-    except OSError:
-        return None, None
+    if timestamp is None:
+        return None, error
+    return relative_date(timestamp, time.time()), None
 
 
 def _health_emoji(prs_count: int) -> str:
@@ -98,14 +123,77 @@ def _health_emoji(prs_count: int) -> str:
         return "CRITICAL"
 
 
-def collect(repos: list[str] | None = None) -> dict[str, Any]:
+def _repo_entry(
+    repo_name: str, last_commit: str | None, commit_error: str | None
+) -> dict[str, Any]:
+    """Build one repository's entry; its PR fields stay None until GitHub answers."""
+    repo_data: dict[str, Any] = {
+        "name": repo_name,
+        "path": str(REPO_BASE / repo_name),
+        "open_prs": None,
+    }
+
+    # Last commit
+    if last_commit:
+        repo_data["last_commit"] = last_commit
+    else:
+        repo_data["last_commit"] = "unknown"
+        if commit_error:
+            repo_data["_commit_error"] = commit_error
+
+    repo_data["health"] = None
+    return repo_data
+
+
+def _add_prs(
+    repo_data: dict[str, Any], slug: str | None, snapshots: dict[str, RepoSnapshot]
+) -> None:
+    """Fill in an entry's open PR count and the health derived from it."""
+    open_prs, pr_error = _get_open_prs(slug, snapshots)
+    repo_data["open_prs"] = open_prs
+    if pr_error:
+        repo_data["_pr_error"] = pr_error
+    repo_data["health"] = _health_emoji(open_prs)
+
+
+def _entry_errors(repo_data: dict[str, Any]) -> list[dict[str, str]]:
+    """The errors found collecting one repository's entry."""
+    errors = []
+    for field, key in (("open_prs", "_pr_error"), ("last_commit", "_commit_error")):
+        if repo_data.get(key):
+            errors.append({"repo": repo_data["name"], "error": repo_data[key], "field": field})
+    return errors
+
+
+def _timed_last_commit(repo_path: Path) -> tuple[str | None, str | None, float]:
+    """_get_last_commit() plus how long it took, in milliseconds."""
+    started = time.perf_counter()
+    last_commit, error = _get_last_commit(repo_path)
+    return last_commit, error, (time.perf_counter() - started) * 1000
+
+
+def collect(
+    repos: list[str] | None = None,
+    max_workers: int | None = None,
+    on_repo: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
     """Collect repository health metrics with error tracking.
 
     Args:
         repos: List of repository names to check. Uses defaults if None.
+        max_workers: Repositories collected concurrently. Uses the
+            ``[repos] workers`` setting if None.
+        on_repo: Called on the calling thread with each repository's entry
+            as soon as its last commit is known, and again once its PR
+            count is filled in if GitHub answered later. Entries arrive in
+            completion order; ``open_prs`` and ``health`` are None until
+            the PR count is known.
 
     Returns:
         Dictionary containing repository health data and any errors encountered.
+        How long the GitHub batch (``github``) and each repository's git
+        work (``git:<name>``) took is recorded in the collector state's
+        ``timings_ms``.
     """
     start_time = time.time()
 
@@ -125,43 +213,49 @@ def collect(repos: list[str] | None = None) -> dict[str, Any]:
         return data
 
     repos = repos or DEFAULT_REPOS
-    results = []
-    errors: list[dict[str, str]] = []
-    missing_repos: list[str] = []
-
-    for repo_name in repos:
-        repo_path = REPO_BASE / repo_name
-
-        if not repo_path.exists():
-            missing_repos.append(repo_name)
-            continue
-
-        repo_data: dict[str, Any] = {
-            "name": repo_name,
-            "path": str(repo_path),
-        }
-
-        # Open PRs
-        open_prs, pr_error = _get_open_prs(repo_path)
-        repo_data["open_prs"] = open_prs
-        if pr_error:
-            repo_data["_pr_error"] = pr_error
-            errors.append({"repo": repo_name, "error": pr_error, "field": "open_prs"})
-
-        # Last commit
-        last_commit, commit_error = _get_last_commit(repo_path)
-        if last_commit:
-            repo_data["last_commit"] = last_commit
-        else:
-            repo_data["last_commit"] = "unknown"
-            if commit_error:
-                repo_data["_commit_error"] = commit_error
-                errors.append({"repo": repo_name, "error": commit_error, "field": "last_commit"})
-
-        # Health emoji
-        repo_data["health"] = _health_emoji(open_prs)
-
-        results.append(repo_data)
+    if max_workers is None:
+        max_workers = load_config().repo_workers
+    entries: dict[str, dict[str, Any]] = {}
+    timings: dict[str, float] = {}
+
+    # Resolve GitHub remotes (a file read each) and find the missing repositories
+    slugs = {name: repo_slug(REPO_BASE / name) for name in repos if (REPO_BASE / name).exists()}
+    missing_repos = [name for name in repos if name not in slugs]
+    github = get_github_data()
+
+    if slugs:
+        with (
+            ThreadPoolExecutor(max_workers=1) as github_pool,
+            ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(slugs)))) as pool,
+        ):
+            # Every repository's PRs in one batch, alongside the git work
+            github_started = time.perf_counter()
+            github_future = github_pool.submit(github.repos, [s for s in slugs.values() if s])
+            futures = {pool.submit(_timed_last_commit, REPO_BASE / name): name for name in slugs}
+            snapshots: dict[str, RepoSnapshot] | None = None
+            pending: list[Future[Any]] = [github_future, *futures]
+
+            for future in as_completed(pending):
+                if future is github_future:
+                    snapshots = github_future.result()
+                    timings["github"] = round((time.perf_counter() - github_started) * 1000, 1)
+                    for repo_name, repo_data in entries.items():
+                        _add_prs(repo_data, slugs[repo_name], snapshots)
+                        if on_repo is not None:
+                            on_repo(repo_data)
+                    continue
+                repo_name = futures[future]
+                last_commit, commit_error, git_ms = future.result()
+                repo_data = entries[repo_name] = _repo_entry(repo_name, last_commit, commit_error)
+                timings[f"git:{repo_name}"] = round(git_ms, 1)
+                if snapshots is not None:
+                    _add_prs(repo_data, slugs[repo_name], snapshots)
+                if on_repo is not None:
+                    on_repo(repo_data)
+
+    # Report in the requested order, whatever order the repositories finished in
+    results = [entries[name] for name in repos if name in entries]
+    errors = [error for repo_data in results for error in _entry_errors(repo_data)]
 
     duration_ms = (time.time() - start_time) * 1000
 
@@ -179,6 +273,10 @@ def collect(repos: list[str] | None = None) -> dict[str, Any]:
     if missing_repos:
         data["_missing_repos"] = missing_repos
 
+    rate_limit = github.rate_limit()
+    if rate_limit is not None:
+        data["rate_limit"] = asdict(rate_limit)
+
     # Determine overall state
     if not results and missing_repos:
         state = CollectorState.UNAVAILABLE
@@ -195,6 +293,7 @@ def collect(repos: list[str] | None = None) -> dict[str, Any]:
         state=state,
         error=error_msg,
         duration_ms=duration_ms,
+        timings_ms=timings,
     )
     update_collector_state(COLLECTOR_NAME, result)
     return data
@@ -1,10 +1,26 @@
-"""System resource collector using psutil."""
+"""System resource collector using psutil.
+
+A daemon thread (ResourceSampler) reads CPU, memory, disk, network, load,
+the container's cgroup usage and limits (see collectors.cgroups) and the
+tracked processes (see collectors.processes) every SAMPLE_INTERVAL seconds
+and records them in the time series store. CPU percentages are read with ``interval=None``, as the delta
+since the previous read, so sampling never sleeps; host facts that rarely
+change (CPU counts, mounts, disk usage) are cached in HostInfo. collect()
+returns the latest sample without blocking or locking.
+"""
 
 from __future__ import annotations
 
+import heapq
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+from openclaw_dash.collectors.cgroups import CgroupMonitor
+from openclaw_dash.collectors.processes import ProcessTracker
+from openclaw_dash.collectors.timeseries import get_timeseries
 from openclaw_dash.demo import is_demo_mode
 
 try:
@@ -14,6 +30,13 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+SAMPLE_INTERVAL = 2.0  # Seconds between background samples
+PRIME_DELAY = 0.1  # Delay of the first sample, so CPU percentages cover a real interval
+FIRST_SAMPLE_TIMEOUT = 1.0  # How long the very first collect() waits for a sample
+SLOW_INTERVAL = 30.0  # Seconds between disk usage and CPU frequency reads
+MOUNTS_INTERVAL = 60.0  # Seconds between partition scans where /proc/mounts is missing
+MOUNTS_FILE = Path("/proc/mounts")
+
 
 def _mock_resources() -> dict[str, Any]:
     """Return mock resource data for demo mode."""
@@ -71,19 +94,97 @@ def _mock_resources() -> dict[str, Any]:
             ],
         },
         "load": {"1min": 1.25, "5min": 1.50, "15min": 1.35},
+        "processes": [
+            {
+                "key": "gateway",
+                "name": "Gateway",
+                "running": True,
+                "pid": 4242,
+                "cpu_percent": 3.2,
+                "rss": 183500800,
+                "rss_mb": 175.0,
+                "threads": 11,
+                "fds": 48,
+                "read_bps": 0.0,
+                "write_bps": 2048.0,
+            },
+            {
+                "key": "ollama",
+                "name": "Ollama",
+                "running": True,
+                "pid": 1337,
+                "cpu_percent": 41.5,
+                "rss": 5368709120,
+                "rss_mb": 5120.0,
+                "threads": 24,
+                "fds": 32,
+                "read_bps": 1048576.0,
+                "write_bps": 0.0,
+            },
+            {"key": "lm-studio", "name": "LM Studio", "running": False},
+            {"key": "vllm", "name": "vLLM", "running": False},
+        ],
         "collected_at": datetime.now().isoformat(),
     }
 
 
+def _record(data: dict[str, Any]) -> None:
+    """Add a sample's headline numbers to the time series store."""
+    cpu = data.get("cpu", {})
+    memory = data.get("memory", {})
+    values: dict[str, float | None] = {
+        "cpu.percent": cpu.get("percent"),
+        "mem.percent": memory.get("percent"),
+        "swap.percent": memory.get("swap_percent"),
+        "load.1min": (data.get("load") or {}).get("1min"),
+    }
+    cgroup = data.get("cgroup")
+    if cgroup:
+        values["cgroup.cpu.percent"] = cgroup["cpu"].get("percent")
+        values["cgroup.mem.percent"] = cgroup["memory"].get("percent")
+        values["cgroup.cpu.throttled"] = cgroup["cpu"].get("throttled_percent")
+        values["cgroup.cpu.limit"] = cgroup["cpu"].get("limit_cores")
+    for i, pct in enumerate(cpu.get("per_core") or []):
+        values[f"cpu.core.{i}"] = pct
+    for proc in data.get("processes") or []:
+        if proc.get("running"):
+            values[f"proc.{proc['key']}.cpu"] = proc.get("cpu_percent")
+            values[f"proc.{proc['key']}.rss_mb"] = proc.get("rss_mb")
+    get_timeseries().record(values)
+
+
+def effective_usage(data: dict[str, Any]) -> tuple[float, float]:
+    """CPU and memory percent, measured against the cgroup's limits where set.
+
+    Inside a container, usage against its limits is what matters; a
+    resource the cgroup does not limit keeps the host's figure.
+    """
+    cpu = data.get("cpu", {}).get("percent", 0)
+    mem = data.get("memory", {}).get("percent", 0)
+    cgroup = data.get("cgroup") or {}
+    if cgroup.get("cpu", {}).get("limit_cores") and cgroup["cpu"].get("percent") is not None:
+        cpu = cgroup["cpu"]["percent"]
+    if cgroup.get("memory", {}).get("percent") is not None:
+        mem = cgroup["memory"]["percent"]
+    return cpu, mem
+
+
 def collect() -> dict[str, Any]:
     """Collect system resource metrics.
 
+    Returns the background sampler's latest sample (starting the sampler
+    on first use). The dict is shared between callers and must not be
+    modified.
+
     Returns:
-        Dictionary containing CPU, memory, disk, and network metrics.
+        Dictionary containing CPU, memory, disk, network (with rates) and
+        load metrics.
     """
     # Return mock data in demo mode
     if is_demo_mode():
-        return _mock_resources()
+        data = _mock_resources()
+        _record(data)
+        return data
 
     if not PSUTIL_AVAILABLE:
         return {
@@ -92,21 +193,129 @@ def collect() -> dict[str, Any]:
             "collected_at": datetime.now().isoformat(),
         }
 
+    sampler = get_sampler()
+    latest = sampler.latest
+    if latest is None:
+        latest = sampler.wait(FIRST_SAMPLE_TIMEOUT)
+    if latest is None:
+        return {
+            "available": False,
+            "error": "No resource sample yet",
+            "collected_at": datetime.now().isoformat(),
+        }
+    return latest
+
+
+def _disk_entry(mount: str, device: str, fstype: str) -> dict[str, Any] | None:
+    try:
+        usage = psutil.disk_usage(mount)
+    except (PermissionError, OSError):
+        return None
+    return {
+        "mount": mount,
+        "device": device,
+        "fstype": fstype,
+        "total": usage.total,
+        "used": usage.used,
+        "free": usage.free,
+        "percent": usage.percent,
+        "total_gb": round(usage.total / (1024**3), 2),
+        "used_gb": round(usage.used / (1024**3), 2),
+        "free_gb": round(usage.free / (1024**3), 2),
+    }
+
+
+def _cpu_freq() -> Any:
+    """psutil.cpu_freq(), or None where it is unsupported."""
     try:
-        # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
-        cpu_count_logical = psutil.cpu_count(logical=True)
-        cpu_count_physical = psutil.cpu_count(logical=False)
-        cpu_freq = psutil.cpu_freq()
+        return psutil.cpu_freq()
+    except (NotImplementedError, OSError):
+        return None
+
 
+class HostInfo:
+    """Host facts that never or rarely change, cached between samples.
+
+    CPU counts, the maximum frequency and the process's cgroup are found
+    once. The mounts to
+    report are chosen again only when /proc/mounts changes (or every
+    MOUNTS_INTERVAL seconds where it does not exist), and disk usage and
+    the current CPU frequency are read every SLOW_INTERVAL seconds.
+    """
+
+    def __init__(self) -> None:
+        self.cores_logical = psutil.cpu_count(logical=True)
+        self.cores_physical = psutil.cpu_count(logical=False)
+        freq = _cpu_freq()
+        self.freq_max = freq.max if freq else None
+        self.freq_current = freq.current if freq else None
+        self.cgroup = CgroupMonitor.detect()
+        self._mounts: list[tuple[str, str, str]] = []  # (mount, device, fstype)
+        self._mounts_key: int | float | None = None
+        self._disks: list[dict[str, Any]] = []
+        self._slow_at: float | None = None
+        self.partition_scans = 0
+
+    def disks(self, now: float) -> list[dict[str, Any]]:
+        """Usage of the key mounts, re-read every SLOW_INTERVAL seconds."""
+        mounts_changed = self._refresh_mounts(now)
+        if mounts_changed or self._slow_at is None or now - self._slow_at >= SLOW_INTERVAL:
+            self._slow_at = now
+            self._disks = self._read_disks()
+            freq = _cpu_freq()
+            self.freq_current = freq.current if freq else None
+        return self._disks
+
+    def _refresh_mounts(self, now: float) -> bool:
+        try:
+            key: int | float = hash(MOUNTS_FILE.read_bytes())
+        except OSError:
+            # No /proc: rescan on a timer instead
+            if self._mounts_key is not None and now - self._mounts_key < MOUNTS_INTERVAL:
+                return False
+            key = now
+        if key == self._mounts_key:
+            return False
+        self._mounts_key = key
+        self.partition_scans += 1
+        key_mounts = {"/", "/home", "/Users", "/var", "/tmp", "/opt"}
+        self._mounts = [
+            (partition.mountpoint, partition.device, partition.fstype)
+            for partition in psutil.disk_partitions()
+            # Skip special filesystems; only include key mounts or root-like mounts
+            if partition.fstype not in ("devfs", "tmpfs", "squashfs", "overlay")
+            and (
+                partition.mountpoint in key_mounts
+                or partition.mountpoint.startswith(("/Volumes", "/mnt", "/media"))
+            )
+        ]
+        return True
+
+    def _read_disks(self) -> list[dict[str, Any]]:
+        disks = [
+            entry for entry in (_disk_entry(*mount) for mount in self._mounts) if entry is not None
+        ]
+        # Also always include root if not already
+        if not any(d["mount"] == "/" for d in disks):
+            root = _disk_entry("/", "root", "unknown")
+            if root is not None:
+                disks.insert(0, root)
+        return disks
+
+
+def _read_resources(host: HostInfo) -> dict[str, Any]:
+    """Read every metric once, without sleeping; static facts come from ``host``."""
+    try:
+        now = time.monotonic()
+
+        # CPU metrics (since the previous read)
         cpu = {
-            "percent": cpu_percent,
-            "per_core": cpu_per_core,
-            "cores_logical": cpu_count_logical,
-            "cores_physical": cpu_count_physical,
-            "freq_current": cpu_freq.current if cpu_freq else None,
-            "freq_max": cpu_freq.max if cpu_freq else None,
+            "percent": psutil.cpu_percent(interval=None),
+            "per_core": psutil.cpu_percent(interval=None, percpu=True),
+            "cores_logical": host.cores_logical,
+            "cores_physical": host.cores_physical,
+            "freq_current": host.freq_current,
+            "freq_max": host.freq_max,
         }
 
         # Memory metrics
@@ -126,92 +335,42 @@ def collect() -> dict[str, Any]:
             "swap_percent": swap.percent,
         }
 
-        # Disk metrics - key mounts only
-        disk_partitions = psutil.disk_partitions()
-        disks = []
-        key_mounts = {"/", "/home", "/Users", "/var", "/tmp", "/opt"}
-
-        for partition in disk_partitions:
-            # Skip special filesystems
-            if partition.fstype in ("devfs", "tmpfs", "squashfs", "overlay"):
-                continue
-            # Only include key mounts or root-like mounts
-            if partition.mountpoint in key_mounts or partition.mountpoint.startswith(
-                ("/Volumes", "/mnt", "/media")
-            ):
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disks.append(
-                        {
-                            "mount": partition.mountpoint,
-                            "device": partition.device,
-                            "fstype": partition.fstype,
-                            "total": usage.total,
-                            "used": usage.used,
-                            "free": usage.free,
-                            "percent": usage.percent,
-                            "total_gb": round(usage.total / (1024**3), 2),
-                            "used_gb": round(usage.used / (1024**3), 2),
-                            "free_gb": round(usage.free / (1024**3), 2),
-                        }
-                    )
-                except (PermissionError, OSError):
-                    continue
+        # Disk metrics - key mounts only, on the slow cadence
+        disks = host.disks(now)
 
-        # Also always include root if not already
-        if not any(d["mount"] == "/" for d in disks):
-            try:
-                usage = psutil.disk_usage("/")
-                disks.insert(
-                    0,
-                    {
-                        "mount": "/",
-                        "device": "root",
-                        "fstype": "unknown",
-                        "total": usage.total,
-                        "used": usage.used,
-                        "free": usage.free,
-                        "percent": usage.percent,
-                        "total_gb": round(usage.total / (1024**3), 2),
-                        "used_gb": round(usage.used / (1024**3), 2),
-                        "free_gb": round(usage.free / (1024**3), 2),
-                    },
-                )
-            except (PermissionError, OSError):
-                pass
-
-        # Network I/O
-        net_io = psutil.net_io_counters()
+        # Network I/O: totals are the sum over interfaces, so one read covers both
+        net_per_if = psutil.net_io_counters(pernic=True)
+        counters = net_per_if.values()
+        bytes_sent = sum(c.bytes_sent for c in counters)
+        bytes_recv = sum(c.bytes_recv for c in counters)
         network = {
-            "bytes_sent": net_io.bytes_sent,
-            "bytes_recv": net_io.bytes_recv,
-            "packets_sent": net_io.packets_sent,
-            "packets_recv": net_io.packets_recv,
-            "bytes_sent_mb": round(net_io.bytes_sent / (1024**2), 2),
-            "bytes_recv_mb": round(net_io.bytes_recv / (1024**2), 2),
+            "bytes_sent": bytes_sent,
+            "bytes_recv": bytes_recv,
+            "packets_sent": sum(c.packets_sent for c in counters),
+            "packets_recv": sum(c.packets_recv for c in counters),
+            "bytes_sent_mb": round(bytes_sent / (1024**2), 2),
+            "bytes_recv_mb": round(bytes_recv / (1024**2), 2),
         }
 
         # Per-interface stats (top 3 active)
-        try:
-            net_per_if = psutil.net_io_counters(pernic=True)
-            interfaces = []
-            for name, stats in sorted(
-                net_per_if.items(), key=lambda x: x[1].bytes_sent + x[1].bytes_recv, reverse=True
-            )[:3]:
-                if name.startswith(("lo", "docker", "veth", "br-")):
-                    continue
-                interfaces.append(
-                    {
-                        "name": name,
-                        "bytes_sent": stats.bytes_sent,
-                        "bytes_recv": stats.bytes_recv,
-                        "sent_mb": round(stats.bytes_sent / (1024**2), 2),
-                        "recv_mb": round(stats.bytes_recv / (1024**2), 2),
-                    }
-                )
-            network["interfaces"] = interfaces
-        except Exception:
-            network["interfaces"] = []
+        busiest = heapq.nlargest(
+            3,
+            (
+                (stats.bytes_sent + stats.bytes_recv, name, stats)
+                for name, stats in net_per_if.items()
+                if not name.startswith(("lo", "docker", "veth", "br-"))
+            ),
+        )
+        network["interfaces"] = [
+            {
+                "name": name,
+                "bytes_sent": stats.bytes_sent,
+                "bytes_recv": stats.bytes_recv,
+                "sent_mb": round(stats.bytes_sent / (1024**2), 2),
+                "recv_mb": round(stats.bytes_recv / (1024**2), 2),
+            }
+            for _, name, stats in busiest
+        ]
 
         # Load average (Unix only)
         try:
@@ -224,6 +383,9 @@ def collect() -> dict[str, Any]:
         except (AttributeError, OSError):
             load = None
 
+        # Container usage against its cgroup limits (Linux only)
+        cgroup = host.cgroup.sample(now) if host.cgroup is not None else None
+
         return {
             "available": True,
             "cpu": cpu,
@@ -231,6 +393,7 @@ def collect() -> dict[str, Any]:
             "disks": disks,
             "network": network,
             "load": load,
+            "cgroup": cgroup,
             "collected_at": datetime.now().isoformat(),
         }
 
@@ -242,52 +405,150 @@ def collect() -> dict[str, Any]:
         }
 
 
-# Cache for calculating rates
-_last_network: dict[str, int] | None = None
-_last_network_time: float | None = None
+class ResourceSampler:
+    """Samples system resources on a daemon thread at a fixed rate.
+
+    Each sample is a new dict that is never modified once published, so
+    readers take ``latest`` without locking. Network rates are computed
+    between consecutive samples.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self._latest: dict[str, Any] | None = None
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._last_network: tuple[float, int, int] | None = None  # (monotonic, sent, recv)
+        self.processes = ProcessTracker()
+        self.host: HostInfo | None = None
+
+    @property
+    def latest(self) -> dict[str, Any] | None:
+        """The most recent sample, or None before the first one."""
+        return self._latest
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling; the first sample follows after PRIME_DELAY."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop_event.clear()
+            self._prime()
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self._stop_event.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.interval + 1)
+
+    def wait(self, timeout: float) -> dict[str, Any] | None:
+        """Wait up to ``timeout`` seconds for the first sample."""
+        self._ready.wait(timeout)
+        return self._latest
+
+    def sample(self) -> dict[str, Any]:
+        """Take a sample now, publish it and record it in the time series store."""
+        if self.host is None:
+            self.host = HostInfo()
+        data = _read_resources(self.host)
+        if data.get("available"):
+            self._add_rates(data["network"])
+            try:
+                data["processes"] = self.processes.sample()
+            except Exception:
+                data["processes"] = []
+            _record(data)
+            _record_rates(data["network"])
+        self._latest = data
+        self._ready.set()
+        return data
+
+    def _prime(self) -> None:
+        """Set the baselines the first sample's CPU percentages and rates are taken from."""
+        try:
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+            net_io = psutil.net_io_counters()
+            self._last_network = (time.monotonic(), net_io.bytes_sent, net_io.bytes_recv)
+        except Exception:
+            self._last_network = None
+
+    def _add_rates(self, network: dict[str, Any]) -> None:
+        now = time.monotonic()
+        previous = self._last_network
+        self._last_network = (now, network["bytes_sent"], network["bytes_recv"])
+        if previous is None or now <= previous[0]:
+            return
+        elapsed = now - previous[0]
+        sent_rate = max(0, (network["bytes_sent"] - previous[1]) / elapsed)
+        recv_rate = max(0, (network["bytes_recv"] - previous[2]) / elapsed)
+        network["rate_sent_bps"] = sent_rate
+        network["rate_recv_bps"] = recv_rate
+        network["rate_sent_kbps"] = round(sent_rate / 1024, 2)
+        network["rate_recv_kbps"] = round(recv_rate / 1024, 2)
+
+    def _run(self) -> None:
+        if self._stop_event.wait(PRIME_DELAY):
+            return
+        while True:
+            self.sample()
+            if self._stop_event.wait(self.interval):
+                return
+
+
+_SAMPLER: ResourceSampler | None = None
+_SAMPLER_LOCK = threading.Lock()
+
+
+def get_sampler() -> ResourceSampler:
+    """The process-wide resource sampler, started on first use."""
+    global _SAMPLER
+    with _SAMPLER_LOCK:
+        if _SAMPLER is None:
+            _SAMPLER = ResourceSampler()
+        sampler = _SAMPLER
+    sampler.start()
+    return sampler
+
+
+def reset_sampler() -> None:
+    """Stop and discard the process-wide sampler (used by tests)."""
+    global _SAMPLER
+    with _SAMPLER_LOCK:
+        sampler, _SAMPLER = _SAMPLER, None
+    if sampler is not None:
+        sampler.stop()
 
 
 def collect_with_rates() -> dict[str, Any]:
     """Collect system resources including network I/O rates.
 
-    Calculates bytes/second rates by comparing to previous collection.
+    Rates are computed by the sampler between consecutive samples.
     """
     # Return mock data in demo mode (with mock rates)
     if is_demo_mode():
-        data = _mock_resources()
+        data = collect()
         data["network"]["rate_sent_bps"] = 51200.0  # 50 KB/s
         data["network"]["rate_recv_bps"] = 256000.0  # 250 KB/s
         data["network"]["rate_sent_kbps"] = 50.0
         data["network"]["rate_recv_kbps"] = 250.0
+        _record_rates(data["network"])
         return data
 
-    global _last_network, _last_network_time
-
-    import time
-
-    data = collect()
-    if not data.get("available"):
-        return data
-
-    current_time = time.time()
-    current_network = {
-        "bytes_sent": data["network"]["bytes_sent"],
-        "bytes_recv": data["network"]["bytes_recv"],
-    }
-
-    # Calculate rates if we have previous data
-    if _last_network is not None and _last_network_time is not None:
-        elapsed = current_time - _last_network_time
-        if elapsed > 0:
-            sent_rate = (current_network["bytes_sent"] - _last_network["bytes_sent"]) / elapsed
-            recv_rate = (current_network["bytes_recv"] - _last_network["bytes_recv"]) / elapsed
-
-            data["network"]["rate_sent_bps"] = max(0, sent_rate)
-            data["network"]["rate_recv_bps"] = max(0, recv_rate)
-            data["network"]["rate_sent_kbps"] = round(max(0, sent_rate) / 1024, 2)
-            data["network"]["rate_recv_kbps"] = round(max(0, recv_rate) / 1024, 2)
+    return collect()
 
-    _last_network = current_network
-    _last_network_time = current_time
 
-    return data
+def _record_rates(network: dict[str, Any]) -> None:
+    get_timeseries().record(
+        {"net.sent_bps": network.get("rate_sent_bps"), "net.recv_bps": network.get("rate_recv_bps")}
+    )
@@ -13,6 +13,7 @@ from openclaw_dash.collectors.base import (
 )
 from openclaw_dash.collectors.cache import cached_collector
 from openclaw_dash.collectors.openclaw_cli import get_openclaw_status, status_to_sessions_data
+from openclaw_dash.collectors.timeseries import get_timeseries
 from openclaw_dash.demo import is_demo_mode, mock_sessions
 
 COLLECTOR_NAME = "sessions"
@@ -100,6 +101,14 @@ def _collect_sessions_impl() -> dict[str, Any]:
         data = status_to_sessions_data(status)
         data["collected_at"] = datetime.now().isoformat()
 
+        context = [s.get("context_pct", 0.0) for s in data.get("sessions", [])]
+        get_timeseries().record(
+            {
+                "sessions.active": data.get("active"),
+                "sessions.context_pct": sum(context) / len(context) if context else None,
+            }
+        )
+
         result = CollectorResult(
             data=data,
             state=CollectorState.OK,
@@ -0,0 +1,237 @@
+"""In-memory time series of resource and gateway metrics.
+
+Collectors record each sample here; sparklines, exports and sinks read the
+history back instead of keeping their own lists or collecting again.
+
+Each metric is a set of ring buffers ("tiers") at increasing resolution.
+A tier is a fixed number of time slots holding the sum and count of the
+samples that fell in each slot, so the slot for a timestamp is computed
+rather than searched for and coarser tiers are exact rollups (means) of
+the same samples. Timestamps are implied by the slot, so a slot costs 10
+bytes. With the default tiers (1 h at 1 s, 24 h at 10 s, 7 d at 1 min) a
+metric takes about 210 KB.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from typing import Any
+
+# (resolution in seconds, number of slots), finest first
+DEFAULT_TIERS: tuple[tuple[float, int], ...] = ((1.0, 3600), (10.0, 8640), (60.0, 10080))
+
+_MAX_COUNT = 0xFFFF  # array("H") slot counter
+
+
+class _Tier:
+    """One ring of time slots at a fixed resolution."""
+
+    __slots__ = ("resolution", "capacity", "sums", "counts", "head")
+
+    def __init__(self, resolution: float, capacity: int) -> None:
+        self.resolution = resolution
+        self.capacity = capacity
+        self.sums = array("d", bytes(8 * capacity))
+        self.counts = array("H", bytes(2 * capacity))
+        self.head: int | None = None  # Newest slot number written
+
+    @property
+    def span(self) -> float:
+        return self.resolution * self.capacity
+
+    def add(self, ts: float, value: float) -> None:
+        slot = int(ts // self.resolution)
+        head = self.head
+        if head is None:
+            head = self.head = slot
+        elif slot > head:
+            # Clear the slots skipped since the last sample
+            if slot - head >= self.capacity:
+                self.sums = array("d", bytes(8 * self.capacity))
+                self.counts = array("H", bytes(2 * self.capacity))
+            else:
+                for s in range(head + 1, slot + 1):
+                    i = s % self.capacity
+                    self.sums[i] = 0.0
+                    self.counts[i] = 0
+            self.head = slot
+        elif slot <= head - self.capacity:
+            return  # Older than the ring holds
+        i = slot % self.capacity
+        if self.counts[i] < _MAX_COUNT:
+            self.sums[i] += value
+            self.counts[i] += 1
+
+    def mean(self, slot: int) -> float:
+        """Mean of a slot's samples, NaN if it has none or has left the ring."""
+        head = self.head
+        if head is None or slot > head or slot <= head - self.capacity:
+            return math.nan
+        i = slot % self.capacity
+        count = self.counts[i]
+        return self.sums[i] / count if count else math.nan
+
+    def recent(self, points: int) -> list[float]:
+        """Up to ``points`` most recent non-empty slot means, oldest first."""
+        if self.head is None:
+            return []
+        values: list[float] = []
+        for slot in range(self.head, self.head - self.capacity, -1):
+            i = slot % self.capacity
+            count = self.counts[i]
+            if count:
+                values.append(self.sums[i] / count)
+                if len(values) == points:
+                    break
+        values.reverse()
+        return values
+
+    def window(self, start: float, end: float) -> list[tuple[float, float]]:
+        """(slot start time, mean) for non-empty slots between two timestamps."""
+        first = int(start // self.resolution)
+        last = int(end // self.resolution)
+        points = []
+        for slot in range(first, last + 1):
+            value = self.mean(slot)
+            if not math.isnan(value):
+                points.append((slot * self.resolution, value))
+        return points
+
+    @property
+    def nbytes(self) -> int:
+        return self.sums.itemsize * len(self.sums) + self.counts.itemsize * len(self.counts)
+
+
+class Series:
+    """A metric's samples at every tier resolution."""
+
+    def __init__(self, tiers: tuple[tuple[float, int], ...] = DEFAULT_TIERS) -> None:
+        self.tiers = [_Tier(resolution, capacity) for resolution, capacity in tiers]
+        self.last: tuple[float, float] | None = None  # (timestamp, value)
+
+    def add(self, value: float, ts: float) -> None:
+        for tier in self.tiers:
+            tier.add(ts, value)
+        if self.last is None or ts >= self.last[0]:
+            self.last = (ts, value)
+
+    def tier_for(self, seconds: float, max_points: int | None = None) -> _Tier:
+        """The finest tier covering ``seconds`` (in at most ``max_points`` slots)."""
+        for tier in self.tiers:
+            if tier.span >= seconds and (
+                max_points is None or seconds / tier.resolution <= max_points
+            ):
+                return tier
+        return self.tiers[-1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tier.nbytes for tier in self.tiers)
+
+
+class TimeSeriesStore:
+    """Named metric series, safe to record into from several threads.
+
+    Metric names are dotted, e.g. ``cpu.percent``, ``cpu.core.0``,
+    ``net.sent_bps``, ``gateway.latency_ms`` or ``sessions.active``.
+    """
+
+    def __init__(self, tiers: tuple[tuple[float, int], ...] = DEFAULT_TIERS) -> None:
+        self._tiers = tiers
+        self._series: dict[str, Series] = {}
+        self._lock = threading.Lock()
+
+    def record(self, values: dict[str, float | None], ts: float | None = None) -> None:
+        """Record one sample per metric; None values are skipped."""
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            for name, value in values.items():
+                if value is None:
+                    continue
+                series = self._series.get(name)
+                if series is None:
+                    series = self._series[name] = Series(self._tiers)
+                series.add(float(value), ts)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._series)
+
+    def latest(self, name: str, max_age: float | None = None) -> float | None:
+        """The most recent value of a metric, or None if absent or older than max_age."""
+        with self._lock:
+            series = self._series.get(name)
+            if series is None or series.last is None:
+                return None
+            ts, value = series.last
+        if max_age is not None and time.time() - ts > max_age:
+            return None
+        return value
+
+    def recent(self, name: str, points: int = 30) -> list[float]:
+        """The last ``points`` samples of a metric at the finest resolution, oldest first.
+
+        Suited to sparklines: gaps between samples are skipped.
+        """
+        with self._lock:
+            series = self._series.get(name)
+            return series.tiers[0].recent(points) if series else []
+
+    def window(
+        self,
+        name: str,
+        seconds: float,
+        max_points: int | None = None,
+        now: float | None = None,
+    ) -> list[tuple[float, float]]:
+        """(timestamp, value) points for the last ``seconds``, oldest first.
+
+        Reads the finest tier that covers the window (in at most max_points
+        slots); coarser tiers return per-slot means.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                return []
+            return series.tier_for(seconds, max_points).window(now - seconds, now)
+
+    def export(self, seconds: float = 3600, max_points: int = 360) -> dict[str, Any]:
+        """Every metric's recent history, JSON-serializable.
+
+        Returns:
+            Mapping of metric name to {"resolution": seconds, "points": [[ts, value], ...]}.
+        """
+        now = time.time()
+        result: dict[str, Any] = {}
+        with self._lock:
+            for name in sorted(self._series):
+                tier = self._series[name].tier_for(seconds, max_points)
+                result[name] = {
+                    "resolution": tier.resolution,
+                    "points": [[ts, round(v, 4)] for ts, v in tier.window(now - seconds, now)],
+                }
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the ring buffers."""
+        with self._lock:
+            return sum(series.nbytes for series in self._series.values())
+
+
+_STORE = TimeSeriesStore()
+
+
+def get_timeseries() -> TimeSeriesStore:
+    """The process-wide time series store."""
+    return _STORE
+
+
+def reset_timeseries() -> None:
+    """Drop all recorded history (used by tests)."""
+    global _STORE
+    _STORE = TimeSeriesStore()
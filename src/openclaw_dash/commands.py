@@ -45,6 +45,11 @@ class DashboardCommands(Provider):
             self.app.action_help,
             help="Show keyboard shortcuts (h)",
         )
+        yield DiscoveryHit(
+            "Search Logs",
+            self.app.action_search_logs,
+            help="Full-text search across gateway logs (Ctrl+F)",
+        )
         yield DiscoveryHit(
             "Export Data",
             self._export_data,
@@ -106,6 +111,7 @@ class DashboardCommands(Provider):
             ("Refresh All Panels", self.app.action_refresh, "Refresh dashboard data"),
             ("Cycle Theme", self.app.action_cycle_theme, "Switch to next theme"),
             ("Show Help", self.app.action_help, "Display keyboard shortcuts"),
+            ("Search Logs", self.app.action_search_logs, "Full-text search across gateway logs"),
             ("Export Dashboard Data", self._export_data, "Save data to JSON file"),
             ("Quit Application", self.app.action_quit, "Exit the dashboard"),
         ]
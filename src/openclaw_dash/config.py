@@ -34,6 +34,14 @@ class Config:
     custom_model_paths: list[str] = field(
         default_factory=list
     )  # Custom directories to scan for models
+    metrics_backend: str = "json"  # Metrics history storage: "json" or "sqlite"
+    retention_raw_days: int = 30  # Per-session cost records (0 = keep forever)
+    retention_daily_days: int = 365  # Daily cost entries before monthly rollup (0 = forever)
+    pricing_models: dict[str, dict[str, float]] = field(
+        default_factory=dict
+    )  # Extra model prices per 1M tokens: {"model": {"input": x, "output": y}}
+    pricing_aliases: dict[str, str] = field(default_factory=dict)  # Model name -> pricing key
+    repo_workers: int = 4  # Repositories collected concurrently
 
     # File path for this config (not persisted)
     _path: Path = field(default=DEFAULT_CONFIG_PATH, repr=False, compare=False)
@@ -49,12 +57,30 @@ class Config:
             "models": {
                 "custom_paths": self.custom_model_paths,
             },
+            "metrics": {
+                "backend": self.metrics_backend,
+                "retention": {
+                    "raw_days": self.retention_raw_days,
+                    "daily_days": self.retention_daily_days,
+                },
+            },
+            "pricing": {
+                "models": self.pricing_models,
+                "aliases": self.pricing_aliases,
+            },
+            "repos": {
+                "workers": self.repo_workers,
+            },
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], path: Path | None = None) -> Config:
         """Create config from dictionary."""
         models_data = data.get("models", {})
+        metrics_data = data.get("metrics", {})
+        retention_data = metrics_data.get("retention", {})
+        pricing_data = data.get("pricing", {})
+        repos_data = data.get("repos", {})
         return cls(
             theme=data.get("theme", "dark"),
             refresh_interval=data.get("refresh_interval", 30),
@@ -62,6 +88,12 @@ class Config:
             show_resources=data.get("show_resources", True),
             collapsed_panels=data.get("collapsed_panels", []),
             custom_model_paths=models_data.get("custom_paths", []),
+            metrics_backend=metrics_data.get("backend", "json"),
+            retention_raw_days=retention_data.get("raw_days", 30),
+            retention_daily_days=retention_data.get("daily_days", 365),
+            pricing_models=pricing_data.get("models", {}),
+            pricing_aliases=pricing_data.get("aliases", {}),
+            repo_workers=repos_data.get("workers", 4),
             _path=path or DEFAULT_CONFIG_PATH,
         )
 
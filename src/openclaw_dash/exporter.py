@@ -14,6 +14,7 @@ def collect_all_data() -> dict[str, Any]:
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from openclaw_dash.collectors import activity, alerts, channels, cron, gateway, repos, sessions
+    from openclaw_dash.collectors.timeseries import get_timeseries
     from openclaw_dash.metrics import CostTracker, GitHubMetrics, PerformanceMetrics
 
     # Define all collectors (flat structure for parallel execution)
@@ -56,6 +57,8 @@ def collect_all_data() -> dict[str, Any]:
             "performance": results.get("metrics_performance", {}),
             "github": results.get("metrics_github", {}),
         },
+        # Last hour of resource and gateway samples recorded by the collectors
+        "timeseries": get_timeseries().export(),
     }
 
 
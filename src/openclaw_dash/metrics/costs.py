@@ -29,14 +29,32 @@ Implementation notes:
 
 from __future__ import annotations
 
+import bisect
 import json
 import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from openclaw_dash.demo import is_demo_mode, mock_cost_data
+from openclaw_dash.metrics.forecast import LOOKBACK_DAYS, forecast_costs
+from openclaw_dash.metrics.pricing import (  # noqa: F401 - MODEL_PRICING kept importable here
+    MODEL_PRICING,
+    price_for,
+)
+from openclaw_dash.metrics.retention import RetentionPolicy, downsample_costs
+from openclaw_dash.metrics.store import MetricsStore, get_store
+
+try:
+    import fcntl
+except ImportError:  # Windows: instances are not coordinated
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -44,45 +62,41 @@ logger = logging.getLogger(__name__)
 MAX_TOKENS = 10_000_000  # 10M tokens - reasonable upper bound for a single session
 MAX_COSTS_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit for costs.json
 
-# Token pricing per 1M tokens (as of Feb 2025)
-# Prices are in USD per 1 million tokens
-MODEL_PRICING = {
-    # Claude 4.x series
-    "claude-opus-4-5": {"input": 15.00, "output": 75.00},
-    "claude-sonnet-4-5": {"input": 3.00, "output": 15.00},
-    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
-    "claude-haiku-4-5": {"input": 0.25, "output": 1.25},
-    "claude-haiku-4": {"input": 0.25, "output": 1.25},
-    # Claude 3.x series
-    "claude-3-opus": {"input": 15.00, "output": 75.00},
-    "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
-    "claude-3-sonnet": {"input": 3.00, "output": 15.00},
-    "claude-3-haiku": {"input": 0.25, "output": 1.25},
-    "claude-3-5-haiku": {"input": 0.25, "output": 1.25},
-    # OpenAI GPT-4 series
-    "gpt-4o": {"input": 2.50, "output": 10.00},
-    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-    "gpt-4-turbo": {"input": 10.00, "output": 30.00},
-    "gpt-4": {"input": 30.00, "output": 60.00},
-    # OpenAI GPT-3.5 series
-    "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
-    # O-series (reasoning models)
-    "o1": {"input": 15.00, "output": 60.00},
-    "o1-mini": {"input": 3.00, "output": 12.00},
-    "o3-mini": {"input": 1.10, "output": 4.40},
-    # Codex/GitHub Copilot (approximations based on public info)
-    "codex": {"input": 0.00, "output": 0.00},  # Usually bundled/free tier
-    "copilot": {"input": 0.00, "output": 0.00},  # Subscription-based
-    # Gemini series (Google)
-    "gemini-1.5-pro": {"input": 1.25, "output": 5.00},
-    "gemini-1.5-flash": {"input": 0.075, "output": 0.30},
-    "gemini-2.0-flash": {"input": 0.10, "output": 0.40},
-    # Default fallback (use Sonnet pricing as conservative estimate)
-    "default": {"input": 3.00, "output": 15.00},
-}
-
 DEFAULT_METRICS_DIR = Path.home() / ".openclaw" / "workspace" / "metrics"
 
+# Fold the append-only ledger into the costs.json snapshot once it grows past
+# this size, or once the snapshot is this old and the ledger is non-empty
+LEDGER_COMPACT_BYTES = 256 * 1024
+LEDGER_COMPACT_INTERVAL = 3600.0  # seconds
+
+# Apply the retention policy in a background thread on the first collect
+# and then at most this often per process
+RETENTION_INTERVAL = 6 * 3600.0  # seconds
+BACKGROUND_RETENTION = True
+
+
+@contextmanager
+def _locked(lock_file: Path, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock shared by all dashboard instances."""
+    if fcntl is None:
+        yield
+        return
+    with open(lock_file, "a+b") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _file_identity(path: Path) -> tuple[int, int, int] | None:
+    """(inode, size, mtime_ns) of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
 
 def _validate_token_count(value: Any, field_name: str) -> int:
     """Validate and sanitize a token count value.
@@ -148,16 +162,130 @@ class DailyCosts:
     session_count: int = 0
 
 
+@dataclass
+class _CostState:
+    """Cost history held in memory between collects.
+
+    ``history`` is the costs.json snapshot with every ledger event after it
+    applied, including per-hour cost buckets ("hourly", keyed YYYY-MM-DDTHH);
+    total_cost, dates and rolled_days (days folded into monthly rollups) are
+    kept in step so summaries need no pass over the history.
+    """
+
+    history: dict[str, Any]
+    snapshot_id: tuple[int, int, int] | None = None
+    ledger_offset: int = 0
+    seq: int = 0
+    total_cost: float = 0.0
+    dates: list[str] = field(default_factory=list)
+    rolled_days: int = 0
+
+    @classmethod
+    def from_history(
+        cls, history: dict[str, Any], snapshot_id: tuple[int, int, int] | None = None
+    ) -> _CostState:
+        history.setdefault("daily", {})
+        history.setdefault("sessions", {})
+        state = cls(history=history, snapshot_id=snapshot_id, seq=history.get("ledger_seq", 0))
+        state.refresh_totals()
+        return state
+
+    def refresh_totals(self) -> None:
+        """Recompute the summary fields from the history."""
+        daily = self.history["daily"]
+        monthly = self.history.get("monthly", {}).values()
+        self.total_cost = sum(d.get("total_cost", 0) for d in daily.values()) + sum(
+            m.get("total_cost", 0) for m in monthly
+        )
+        self.dates = sorted(daily)
+        self.rolled_days = sum(m.get("days", 0) for m in monthly)
+
+    @property
+    def days_tracked(self) -> int:
+        return len(self.dates) + self.rolled_days
+
+    def apply(self, event: dict[str, Any]) -> None:
+        """Apply one ledger event; events at or below the snapshot's seq are skipped."""
+        if event.get("seq", 0) <= self.seq:
+            return
+        self.seq = event["seq"]
+        day = event["day"]
+        daily = self.history["daily"]
+        if day not in daily:
+            daily[day] = asdict(DailyCosts(date=day))
+            bisect.insort(self.dates, day)
+        key = event.get("key")
+        if not key:
+            return  # Day marker only
+
+        model = event["model"]
+        day_data = daily[day]
+        day_data["total_input_tokens"] += event["in"]
+        day_data["total_output_tokens"] += event["out"]
+        day_data["total_cost"] += event["cost"]
+        day_data["session_count"] += 1
+        by_model = day_data["by_model"].setdefault(
+            model, {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+        )
+        by_model["input_tokens"] += event["in"]
+        by_model["output_tokens"] += event["out"]
+        by_model["cost"] += event["cost"]
+        self.total_cost += event["cost"]
+        hourly = self.history.setdefault("hourly", {})
+        hour = event["ts"][:13]
+        hourly[hour] = hourly.get(hour, 0.0) + event["cost"]
+
+        self.history["sessions"][key] = {
+            "total_tokens": event["total_tokens"],
+            "input_tokens": event["input_tokens"],
+            "output_tokens": event["output_tokens"],
+            "model": model,
+            "last_updated": event["ts"],
+        }
+
+
+# In-memory cost state per costs.json path. Shared across CostTracker
+# instances since widgets create one per refresh. Readers only hold the
+# file lock shared, so syncing a state also takes _STATES_LOCK.
+_COST_STATES: dict[Path, _CostState] = {}
+_STATES_LOCK = threading.Lock()
+
+# Last retention run per costs.json path (time.monotonic())
+_RETENTION_RUNS: dict[Path, float] = {}
+_RETENTION_LOCK = threading.Lock()
+
+# Last forecast per costs.json path, with the data version and hour it was made for
+_FORECASTS: dict[Path, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+
+
 class CostTracker:
-    """Track and persist token/API costs over time."""
+    """Track and persist token/API costs over time.
 
-    def __init__(self, metrics_dir: Path | None = None):
+    Each collect appends one event per changed session to an append-only
+    ledger (costs.ledger.jsonl) instead of rewriting costs.json. The ledger
+    is periodically folded into the costs.json snapshot. Dashboard instances
+    share the files under an advisory lock and replay each other's events.
+
+    Old history is downsampled in the background according to the
+    retention policy (see openclaw_dash.metrics.retention).
+    """
+
+    def __init__(
+        self,
+        metrics_dir: Path | None = None,
+        backend: str | None = None,
+        retention: RetentionPolicy | None = None,
+    ):
         self.metrics_dir = metrics_dir or DEFAULT_METRICS_DIR
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         self.costs_file = self.metrics_dir / "costs.json"
+        self.ledger_file = self.metrics_dir / "costs.ledger.jsonl"
+        self.lock_file = self.metrics_dir / "costs.lock"
+        self.store: MetricsStore | None = get_store(self.metrics_dir, backend)
+        self.retention = retention
 
-    def _load_history(self) -> dict[str, Any]:
-        """Load cost history from disk with security checks."""
+    def _load_snapshot(self) -> dict[str, Any]:
+        """Load the costs.json snapshot from disk with security checks."""
         if not self.costs_file.exists():
             return {"daily": {}, "sessions": {}}
 
@@ -191,9 +319,144 @@ class CostTracker:
             logger.error(f"Failed to read costs.json. Error: {e}. File: {self.costs_file}")
             return {"daily": {}, "sessions": {}}
 
+    def _load_history(self) -> dict[str, Any]:
+        """Load full cost history from disk: the snapshot plus the ledger."""
+        with _locked(self.lock_file, exclusive=False):
+            state = _CostState.from_history(self._load_snapshot())
+            self._replay_ledger(state)
+        return state.history
+
+    def _replay_ledger(self, state: _CostState) -> None:
+        """Apply ledger events past state.ledger_offset.
+
+        Only complete lines are consumed; a line still being written (or
+        cut short by a crash) is left for the next read.
+        """
+        try:
+            with open(self.ledger_file, "rb") as f:
+                f.seek(state.ledger_offset)
+                data = f.read()
+        except OSError:
+            return
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                state.apply(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    f"Skipping malformed cost ledger entry: {e}. File: {self.ledger_file}"
+                )
+        state.ledger_offset += end
+
+    def _sync_state(self) -> _CostState:
+        """Bring the shared in-memory state up to date with the files on disk.
+
+        Reloads the snapshot when another instance compacted it; otherwise
+        only reads ledger bytes appended since the last sync. Call with the
+        file lock held; threads sharing a state sync one at a time, so the
+        same ledger bytes are never replayed twice.
+        """
+        with _STATES_LOCK:
+            snapshot_id = _file_identity(self.costs_file)
+            ledger_id = _file_identity(self.ledger_file)
+            ledger_size = ledger_id[1] if ledger_id else 0
+            state = _COST_STATES.get(self.costs_file)
+            if (
+                state is None
+                or state.snapshot_id != snapshot_id
+                or ledger_size < state.ledger_offset
+            ):
+                state = _CostState.from_history(self._load_snapshot(), snapshot_id)
+                _COST_STATES[self.costs_file] = state
+            if ledger_size > state.ledger_offset:
+                self._replay_ledger(state)
+            return state
+
+    def _append_events(self, state: _CostState, events: list[dict[str, Any]]) -> None:
+        """Append already-applied events to the ledger. Call with the lock held."""
+        payload = b"".join(
+            json.dumps(event, separators=(",", ":")).encode() + b"\n" for event in events
+        )
+        with open(self.ledger_file, "ab") as f:
+            f.write(payload)
+            state.ledger_offset = f.tell()
+
+    def _should_compact(self, state: _CostState) -> bool:
+        if state.ledger_offset == 0:
+            return False
+        if state.ledger_offset >= LEDGER_COMPACT_BYTES or state.snapshot_id is None:
+            return True
+        age = time.time() - state.snapshot_id[2] / 1e9
+        return age >= LEDGER_COMPACT_INTERVAL
+
+    def _compact(self, state: _CostState) -> None:
+        """Fold the ledger into a new costs.json snapshot. Call with the lock held.
+
+        The snapshot records the last folded event's seq, so events left in
+        the ledger by a crash between the two steps are not applied twice.
+        """
+        state.history["ledger_seq"] = state.seq
+        self._save_history(state.history)
+        with open(self.ledger_file, "wb"):
+            pass
+        state.snapshot_id = _file_identity(self.costs_file)
+        state.ledger_offset = 0
+
+    def apply_retention(self, today: date | None = None) -> dict[str, int]:
+        """Downsample history older than the retention policy allows.
+
+        Reduces stale per-session records to their token counts and folds
+        old daily entries into monthly rollups; totals are unchanged, and a
+        session that is still active is only costed for new tokens.
+
+        Returns:
+            Number of session records reduced and daily entries folded.
+        """
+        policy = self.retention or RetentionPolicy.from_config()
+        raw_cutoff, daily_cutoff = policy.cutoffs(today)
+        if self.store is not None:
+            return self.store.apply_cost_retention(raw_cutoff, daily_cutoff)
+
+        with _locked(self.lock_file, exclusive=True):
+            state = self._sync_state()
+            counts = downsample_costs(state.history, raw_cutoff, daily_cutoff)
+            if any(counts.values()):
+                state.refresh_totals()
+                self._compact(state)
+        return counts
+
+    def _schedule_retention(self) -> threading.Thread | None:
+        """Start apply_retention() in a background thread if a run is due."""
+        if not BACKGROUND_RETENTION:
+            return None
+        now = time.monotonic()
+        with _RETENTION_LOCK:
+            last = _RETENTION_RUNS.get(self.costs_file)
+            if last is not None and now - last < RETENTION_INTERVAL:
+                return None
+            _RETENTION_RUNS[self.costs_file] = now
+
+        def run() -> None:
+            try:
+                counts = self.apply_retention()
+            except Exception as e:
+                logger.error(f"Cost history retention failed: {e}. Dir: {self.metrics_dir}")
+                return
+            if any(counts.values()):
+                logger.info(
+                    f"Cost history retention compacted {counts['sessions_dropped']} session "
+                    f"records and folded {counts['days_folded']} days into monthly rollups"
+                )
+
+        thread = threading.Thread(target=run, name="cost-retention", daemon=True)
+        thread.start()
+        return thread
+
     def _save_history(self, data: dict[str, Any]) -> None:
-        """Save cost history to disk."""
-        self.costs_file.write_text(json.dumps(data, indent=2, default=str))
+        """Atomically write a costs.json snapshot."""
+        tmp = self.costs_file.with_name(f".{self.costs_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, default=str))
+        tmp.replace(self.costs_file)
 
     @staticmethod
     def calculate_cost(
@@ -203,21 +466,15 @@ class CostTracker:
 
         Returns: (input_cost, output_cost, total_cost) in USD
 
+        Model names are resolved by openclaw_dash.metrics.pricing, so dated,
+        provider-prefixed and aliased names get their model's price.
+
         Note: For local models (Ollama, etc.), this returns $0.00.
         Future enhancement: Track energy consumption for local models.
         """
-        # Check if this looks like a local model (no cost)
-        local_indicators = ["ollama", "local", "llama", "mistral"]
-        if any(indicator in model.lower() for indicator in local_indicators):
-            return 0.0, 0.0, 0.0
-
-        # Get pricing for the model (with fallback to default)
-        pricing = MODEL_PRICING.get(
-            model, MODEL_PRICING.get("default", {"input": 3.0, "output": 15.0})
-        )
-
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
+        price = price_for(model)
+        input_cost = (input_tokens / 1_000_000) * price.input
+        output_cost = (output_tokens / 1_000_000) * price.output
         return input_cost, output_cost, input_cost + output_cost
 
     def get_sessions_data(self) -> list[dict[str, Any]]:
@@ -268,123 +525,234 @@ class CostTracker:
             }
 
         sessions = self.get_sessions_data()
-        history = self._load_history()
+        self._schedule_retention()
+        if self.store is not None:
+            return self._collect_sqlite(sessions, self.store)
+
+        today = date.today().isoformat()
+        now = datetime.now().isoformat()
+
+        with _locked(self.lock_file, exclusive=True):
+            state = self._sync_state()
+            history = state.history
+            events: list[dict[str, Any]] = []
+
+            def record(event: dict[str, Any]) -> None:
+                event["seq"] = state.seq + 1
+                state.apply(event)
+                events.append(event)
+
+            # Make sure today's entry exists
+            if today not in history["daily"]:
+                record({"day": today})
+
+            for session in sessions:
+                key = session.get("key", session.get("sessionKey", ""))
+                if not key:
+                    continue
+                event = self._session_event(session, history["sessions"].get(key, {}), today, now)
+                if event is not None:
+                    record(event)
+
+            if events:
+                self._append_events(state, events)
+            if self._should_compact(state):
+                self._compact(state)
+
+            today_data = history["daily"][today]
+            recent_dates = state.dates[-7:][::-1]
+            return self._build_result(
+                today_data,
+                state.total_cost,
+                state.days_tracked,
+                [(d, history["daily"][d].get("total_cost", 0)) for d in recent_dates],
+            )
+
+    def _collect_sqlite(
+        self, sessions: list[dict[str, Any]], store: MetricsStore
+    ) -> dict[str, Any]:
+        """collect() against the SQLite store: each increment updates the daily tables."""
         today = date.today().isoformat()
+        now = datetime.now().isoformat()
+        with store.transaction():
+            if not store.has_cost_day(today):
+                store.record_cost_event({"day": today})
+            for session in sessions:
+                key = session.get("key", session.get("sessionKey", ""))
+                if not key:
+                    continue
+                event = self._session_event(session, store.latest_session(key) or {}, today, now)
+                if event is not None:
+                    store.record_cost_event(event)
+
+            total_cost, days_tracked = store.cost_summary()
+            return self._build_result(
+                store.cost_day(today) or asdict(DailyCosts(date=today)),
+                total_cost,
+                days_tracked,
+                [(d["date"], d["total_cost"]) for d in store.cost_history(7)],
+            )
 
-        # Initialize today's data if needed
-        if today not in history["daily"]:
-            history["daily"][today] = asdict(DailyCosts(date=today))
+    def _session_event(
+        self, session: dict[str, Any], session_record: dict[str, Any], today: str, now: str
+    ) -> dict[str, Any] | None:
+        """Build the cost event for a session's token increase since its last record.
 
-        today_data = history["daily"][today]
+        Args:
+            session: Session as reported by the sessions collector.
+            session_record: The session's last recorded token counts (empty if new).
+            today: ISO date the increment is booked on.
+            now: Timestamp stored as the session's last update.
 
-        for session in sessions:
-            key = session.get("key", session.get("sessionKey", ""))
-            if not key:
-                continue
+        Returns:
+            The event, or None if the session used no new tokens.
+        """
+        key = session.get("key", session.get("sessionKey", ""))
+        model = session.get("model", "unknown")
 
-            model = session.get("model", "unknown")
+        # Validate and sanitize token counts (security: type confusion + overflow protection)
+        total_tokens = _validate_token_count(
+            session.get("totalTokens", 0) or 0, f"{key}.totalTokens"
+        )
+        current_input = _validate_token_count(
+            session.get("inputTokens", 0) or 0, f"{key}.inputTokens"
+        )
+        current_output = _validate_token_count(
+            session.get("outputTokens", 0) or 0, f"{key}.outputTokens"
+        )
 
-            # Validate and sanitize token counts (security: type confusion + overflow protection)
-            total_tokens = _validate_token_count(
-                session.get("totalTokens", 0) or 0, f"{key}.totalTokens"
-            )
-            current_input = _validate_token_count(
-                session.get("inputTokens", 0) or 0, f"{key}.inputTokens"
-            )
-            current_output = _validate_token_count(
-                session.get("outputTokens", 0) or 0, f"{key}.outputTokens"
-            )
+        # Skip if no tokens used
+        if total_tokens == 0:
+            return None
 
-            # Skip if no tokens used
-            if total_tokens == 0:
-                continue
-
-            # Check if we've already recorded this session state
-            session_record = history["sessions"].get(key, {})
-            prev_input = session_record.get("input_tokens", 0)
-            prev_output = session_record.get("output_tokens", 0)
-
-            # Calculate incremental tokens since last check
-            new_input = max(0, current_input - prev_input)
-            new_output = max(0, current_output - prev_output)
-
-            # If no actual input/output data available, fall back to estimation
-            # This handles older gateway versions or sessions without detailed tracking
-            if new_input == 0 and new_output == 0 and total_tokens > 0:
-                prev_total = session_record.get("total_tokens", 0)
-                new_total = max(0, total_tokens - prev_total)
-                if new_total > 0:
-                    # Estimate 60% input / 40% output as fallback
-                    new_input = int(new_total * 0.60)
-                    new_output = int(new_total * 0.40)
-
-            if new_input == 0 and new_output == 0:
-                continue
-
-            input_cost, output_cost, total_cost = self.calculate_cost(model, new_input, new_output)
-
-            # Update today's totals
-            today_data["total_input_tokens"] += new_input
-            today_data["total_output_tokens"] += new_output
-            today_data["total_cost"] += total_cost
-            today_data["session_count"] += 1
-
-            # Update model breakdown
-            if model not in today_data["by_model"]:
-                today_data["by_model"][model] = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
-            today_data["by_model"][model]["input_tokens"] += new_input
-            today_data["by_model"][model]["output_tokens"] += new_output
-            today_data["by_model"][model]["cost"] += total_cost
-
-            # Update session record with actual token counts
-            history["sessions"][key] = {
-                "total_tokens": total_tokens,
-                "input_tokens": current_input,
-                "output_tokens": current_output,
-                "model": model,
-                "last_updated": datetime.now().isoformat(),
-            }
+        # Calculate incremental tokens since last check
+        prev_input = session_record.get("input_tokens", 0)
+        prev_output = session_record.get("output_tokens", 0)
+        new_input = max(0, current_input - prev_input)
+        new_output = max(0, current_output - prev_output)
 
-        # Always save to ensure daily entry exists
-        self._save_history(history)
+        # If no actual input/output data available, fall back to estimation
+        # This handles older gateway versions or sessions without detailed tracking
+        if new_input == 0 and new_output == 0 and total_tokens > 0:
+            prev_total = session_record.get("total_tokens", 0)
+            new_total = max(0, total_tokens - prev_total)
+            if new_total > 0:
+                # Estimate 60% input / 40% output as fallback
+                new_input = int(new_total * 0.60)
+                new_output = int(new_total * 0.40)
 
-        # Calculate summary stats
-        total_all_time = sum(d.get("total_cost", 0) for d in history["daily"].values())
-        days_tracked = len(history["daily"])
-        avg_daily = total_all_time / days_tracked if days_tracked > 0 else 0
+        if new_input == 0 and new_output == 0:
+            return None
 
-        # Get last 7 days trend
-        recent_dates = sorted(history["daily"].keys(), reverse=True)[:7]
-        recent_costs = [history["daily"][d].get("total_cost", 0) for d in recent_dates]
+        _, _, total_cost = self.calculate_cost(model, new_input, new_output)
 
+        # The increment along with the session's current counts
+        return {
+            "day": today,
+            "ts": now,
+            "key": key,
+            "model": model,
+            "in": new_input,
+            "out": new_output,
+            "cost": total_cost,
+            "total_tokens": total_tokens,
+            "input_tokens": current_input,
+            "output_tokens": current_output,
+        }
+
+    @staticmethod
+    def _build_result(
+        today_data: dict[str, Any],
+        total_cost: float,
+        days_tracked: int,
+        recent: list[tuple[str, float]],
+    ) -> dict[str, Any]:
+        """Shape collect() output from today's entry, all-time totals and the 7-day trend."""
+        avg_daily = total_cost / days_tracked if days_tracked > 0 else 0
         return {
             "today": {
-                "date": today,
+                "date": today_data["date"],
                 "input_tokens": today_data["total_input_tokens"],
                 "output_tokens": today_data["total_output_tokens"],
                 "cost": round(today_data["total_cost"], 4),
-                "by_model": today_data["by_model"],
+                "by_model": {m: dict(v) for m, v in today_data["by_model"].items()},
             },
             "summary": {
-                "total_cost": round(total_all_time, 2),
+                "total_cost": round(total_cost, 2),
                 "days_tracked": days_tracked,
                 "avg_daily_cost": round(avg_daily, 2),
             },
             "trend": {
-                "dates": recent_dates,
-                "costs": [round(c, 4) for c in recent_costs],
+                "dates": [d for d, _ in recent],
+                "costs": [round(c, 4) for _, c in recent],
             },
             "collected_at": datetime.now().isoformat(),
         }
 
     def get_history(self, days: int = 30) -> list[dict[str, Any]]:
         """Get daily cost history."""
-        history = self._load_history()
-        dates = sorted(history["daily"].keys(), reverse=True)[:days]
-        return [
-            {
-                "date": d,
-                **history["daily"][d],
+        if self.store is not None:
+            return self.store.cost_history(days)
+        with _locked(self.lock_file, exclusive=False):
+            state = self._sync_state()
+            dates = state.dates[::-1][:days]
+            return [
+                {
+                    "date": d,
+                    **state.history["daily"][d],
+                }
+                for d in dates
+            ]
+
+    def forecast(self, now: datetime | None = None) -> dict[str, Any]:
+        """Project today's and this month's spend with confidence bands.
+
+        See openclaw_dash.metrics.forecast. The result is reused until a new
+        cost event is recorded (by any instance) or the hour changes.
+        """
+        now = now or datetime.now()
+        if is_demo_mode():
+            trend = mock_cost_data()["trend"]["values"]
+            today = now.date()
+            daily = {
+                (today - timedelta(days=len(trend) - i)).isoformat(): cost
+                for i, cost in enumerate(trend)
             }
-            for d in dates
-        ]
+            daily[today.isoformat()] = mock_cost_data()["today"]["total"]
+            return forecast_costs(daily, {}, now)
+
+        start = (now.date() - timedelta(days=LOOKBACK_DAYS)).isoformat()
+        hour = now.strftime("%Y-%m-%dT%H")
+        if self.store is not None:
+            version: tuple[Any, ...] = ("sqlite", self.store.cost_version(), hour)
+            cached = _FORECASTS.get(self.costs_file)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            days = self.store.cost_range(start, now.date().isoformat())
+            daily = {d["date"]: d["total_cost"] for d in days}
+            hourly = self.store.cost_hours(start)
+        else:
+            with _locked(self.lock_file, exclusive=False):
+                state = self._sync_state()
+                version = ("json", state.seq, hour)
+                cached = _FORECASTS.get(self.costs_file)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+                history = state.history
+                daily = {
+                    d: history["daily"][d].get("total_cost", 0.0)
+                    for d in state.dates[bisect.bisect_left(state.dates, start) :]
+                }
+                hourly = {h: c for h, c in history.get("hourly", {}).items() if h >= start}
+
+        result = forecast_costs(daily, hourly, now)
+        _FORECASTS[self.costs_file] = (version, result)
+        return result
+
+    def get_monthly_history(self, months: int = 12) -> list[dict[str, Any]]:
+        """Get monthly rollups of days past the daily retention window, newest first."""
+        if self.store is not None:
+            return self.store.cost_months(months)
+        with _locked(self.lock_file, exclusive=False):
+            monthly = self._sync_state().history.get("monthly", {})
+            return [dict(monthly[m]) for m in sorted(monthly, reverse=True)[:months]]
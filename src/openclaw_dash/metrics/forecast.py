@@ -0,0 +1,201 @@
+"""Cost burn-rate forecasting over the recorded cost history.
+
+The model is fitted to the last LOOKBACK_DAYS of history:
+
+- a level: an EWMA of complete days' costs with the weekday effect divided out,
+- weekday factors: each weekday's mean spend relative to the overall mean,
+  shrunk toward 1 while a weekday has few observations,
+- an hour-of-day profile: the share of a day's spend that falls in each
+  hour, from the per-hour cost buckets, shrunk toward uniform,
+- the spread of one-day-ahead errors, used for the confidence bands.
+
+From these it projects today's and this month's final spend. Errors are
+treated as independent per day, so a band over the rest of the month widens
+with the square root of the days left. Spend already recorded is never
+below the lower bound.
+
+NumPy, when installed, is used for the bucket aggregation; the results
+match the pure-Python path.
+"""
+
+from __future__ import annotations
+
+import calendar
+import math
+from datetime import date, datetime, timedelta
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+LOOKBACK_DAYS = 35  # Covers the whole current month
+ALPHA = 0.3  # EWMA smoothing of the daily level
+BAND_Z = 1.2816  # Two-sided 80% band
+WEEKDAY_PRIOR_DAYS = 1.0  # Pseudo-observations pulling a weekday factor toward 1
+PROFILE_PRIOR_DAYS = 3.0  # Pseudo-days of uniform spend in the hour profile
+TREND_DAYS = 7
+TREND_THRESHOLD_PCT = 5.0
+
+
+def _weekday_factors(costs: list[float], weekdays: list[int]) -> list[float]:
+    """Per-weekday spend relative to the mean, shrunk toward 1 and normalized to mean 1."""
+    if not costs:
+        return [1.0] * 7
+    if NUMPY_AVAILABLE:
+        sums = np.bincount(weekdays, weights=costs, minlength=7).tolist()
+        counts = np.bincount(weekdays, minlength=7).tolist()
+    else:
+        sums = [0.0] * 7
+        counts = [0] * 7
+        for cost, weekday in zip(costs, weekdays):
+            sums[weekday] += cost
+            counts[weekday] += 1
+
+    mean = sum(sums) / len(costs)
+    if mean <= 0:
+        return [1.0] * 7
+    factors = [
+        (sums[w] / mean + WEEKDAY_PRIOR_DAYS) / (counts[w] + WEEKDAY_PRIOR_DAYS) for w in range(7)
+    ]
+    scale = 7 / sum(factors)
+    return [f * scale for f in factors]
+
+
+def _hour_profile(hourly: dict[str, float], days: list[date]) -> list[float]:
+    """Share of a day's spend per hour over the given days, shrunk toward uniform."""
+    wanted = {d.isoformat() for d in days}
+    buckets = [(hour, cost) for hour, cost in hourly.items() if hour[:10] in wanted]
+    if NUMPY_AVAILABLE:
+        totals = np.zeros(24)
+        if buckets:
+            hours = np.fromiter((int(h[11:13]) for h, _ in buckets), dtype=np.intp)
+            np.add.at(totals, hours, np.fromiter((c for _, c in buckets), dtype=float))
+        totals = totals.tolist()
+    else:
+        totals = [0.0] * 24
+        for hour, cost in buckets:
+            totals[int(hour[11:13])] += cost
+
+    spend = sum(totals)
+    if spend <= 0:
+        return [1 / 24] * 24
+    observed = len({hour[:10] for hour, _ in buckets})
+    weight = observed / (observed + PROFILE_PRIOR_DAYS)
+    return [weight * t / spend + (1 - weight) / 24 for t in totals]
+
+
+def _fit_level(
+    costs: list[float], weekdays: list[int], factors: list[float]
+) -> tuple[float, float]:
+    """EWMA level of deseasonalized daily costs and the RMS one-day-ahead error."""
+    level = costs[0] / factors[weekdays[0]]
+    squared_errors = []
+    for cost, weekday in zip(costs[1:], weekdays[1:]):
+        squared_errors.append((cost - level * factors[weekday]) ** 2)
+        level = ALPHA * cost / factors[weekday] + (1 - ALPHA) * level
+    if len(squared_errors) < 2:
+        return level, level  # Too little history to judge the error: 100%
+    return level, math.sqrt(sum(squared_errors) / len(squared_errors))
+
+
+def _trend(costs: list[float]) -> tuple[str, float]:
+    recent = costs[-TREND_DAYS:]
+    prior = costs[-2 * TREND_DAYS : -TREND_DAYS]
+    if not recent or not prior:
+        return "→", 0.0
+    recent_avg = sum(recent) / len(recent)
+    prior_avg = sum(prior) / len(prior)
+    if prior_avg > 0:
+        pct = (recent_avg - prior_avg) / prior_avg * 100
+    else:
+        pct = 100.0 if recent_avg > 0 else 0.0
+    if pct > TREND_THRESHOLD_PCT:
+        return "↑", pct
+    if pct < -TREND_THRESHOLD_PCT:
+        return "↓", pct
+    return "→", pct
+
+
+def _band(so_far: float, expected: float, sd: float) -> dict[str, float]:
+    return {
+        "so_far": round(so_far, 4),
+        "expected": round(expected, 4),
+        "low": round(max(so_far, expected - BAND_Z * sd), 4),
+        "high": round(expected + BAND_Z * sd, 4),
+    }
+
+
+def forecast_costs(
+    daily: dict[str, float], hourly: dict[str, float], now: datetime | None = None
+) -> dict[str, Any]:
+    """Project today's and this month's spend from recorded costs.
+
+    Args:
+        daily: Cost per ISO date (local days); days missing after the first
+            recorded one count as zero spend.
+        hourly: Cost per local hour, keyed "YYYY-MM-DDTHH".
+        now: Time to forecast from (defaults to now).
+
+    Returns:
+        Dictionary with:
+            - day_end / month_end: {"so_far", "expected", "low", "high"} in USD
+            - daily_avg: Expected spend of an average day
+            - projected_monthly: Expected spend for the calendar month
+            - trend / trend_pct: Last 7 days against the 7 before
+            - weekday_factors: Relative spend Monday..Sunday
+            - days_observed: Complete days the model was fitted on
+    """
+    now = now or datetime.now()
+    today = now.date()
+    start = today - timedelta(days=LOOKBACK_DAYS)
+    recorded = [d for d in daily if start.isoformat() <= d < today.isoformat()]
+    first = date.fromisoformat(min(recorded)) if recorded else today
+    days = [first + timedelta(days=i) for i in range((today - first).days)]
+    costs = [daily.get(d.isoformat(), 0.0) for d in days]
+    weekdays = [d.weekday() for d in days]
+
+    factors = _weekday_factors(costs, weekdays)
+    profile = _hour_profile(hourly, days)
+    elapsed = sum(profile[: now.hour]) + profile[now.hour] * (now.minute / 60)
+    remaining = max(0.0, 1 - elapsed)
+    today_so_far = daily.get(today.isoformat(), 0.0)
+
+    if days:
+        level, sigma = _fit_level(costs, weekdays, factors)
+    else:
+        # No complete day yet: extrapolate today's run rate
+        level = today_so_far / elapsed if elapsed >= 1 / 24 else today_so_far
+        sigma = level
+
+    day_expected = today_so_far + level * factors[today.weekday()] * remaining
+    day_end = _band(today_so_far, day_expected, sigma * math.sqrt(remaining))
+
+    month_days = calendar.monthrange(today.year, today.month)[1]
+    rest = [today + timedelta(days=i) for i in range(1, month_days - today.day + 1)]
+    month_start = today.replace(day=1).isoformat()
+    month_so_far = today_so_far + sum(
+        cost for d, cost in daily.items() if month_start <= d < today.isoformat()
+    )
+    month_expected = (
+        month_so_far
+        + (day_expected - today_so_far)
+        + sum(level * factors[d.weekday()] for d in rest)
+    )
+    month_end = _band(month_so_far, month_expected, sigma * math.sqrt(remaining + len(rest)))
+
+    trend, trend_pct = _trend(costs)
+    return {
+        "day_end": day_end,
+        "month_end": month_end,
+        "daily_avg": round(level, 4),
+        "projected_monthly": round(month_expected, 2),
+        "trend": trend,
+        "trend_pct": round(trend_pct, 1),
+        "weekday_factors": [round(f, 3) for f in factors],
+        "days_observed": len(days),
+        "generated_at": now.isoformat(),
+    }
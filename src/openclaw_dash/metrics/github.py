@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 import subprocess
 from dataclasses import dataclass
@@ -9,11 +10,56 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from openclaw_dash.collectors.fingerprint import file_stamp, get_gate
+from openclaw_dash.collectors.github import (
+    GitHubData,
+    GitHubError,
+    get_github_data,
+    repo_slug,
+)
 from openclaw_dash.demo import is_demo_mode
+from openclaw_dash.metrics.store import MetricsStore, get_store
 
 DEFAULT_METRICS_DIR = Path.home() / ".openclaw" / "workspace" / "metrics"
 REPOS_SNAPSHOT_DIR = Path.home() / ".openclaw" / "workspace" / "repos"
 
+EVENTS_PER_PAGE = 100
+EVENTS_MAX_PAGES = 3  # The events API serves at most 300 events
+
+
+def _read_todo_count(todo_file: Path) -> int | None:
+    """The TODO count in a repo-scanner snapshot, or None if it cannot be read."""
+    try:
+        data = json.loads(todo_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    # Handle different formats
+    todo_count: int = 0
+    if isinstance(data, dict):
+        raw_count = data.get("todo_count", data.get("todos", 0))
+        todo_count = int(raw_count) if raw_count is not None else 0
+        if "items" in data:
+            todo_count = len(data["items"])
+    elif isinstance(data, list):
+        todo_count = len(data)
+    return todo_count
+
+
+def _snapshot_todo_count(todo_file: Path, stamp: tuple[int, int]) -> int | None:
+    """A snapshot's TODO count, parsed once per (mtime, inode)."""
+
+    def read() -> int | None:
+        return _read_todo_count(todo_file)
+
+    return get_gate().get(("todo_snapshot", todo_file), stamp, read)
+
+
+def _forget_snapshots(keep: set[Path]) -> None:
+    """Drop gated TODO counts of snapshots other than ``keep`` (e.g. deleted ones)."""
+    get_gate().forget(
+        lambda key: isinstance(key, tuple) and key[0] == "todo_snapshot" and key[1] not in keep
+    )
+
 
 @dataclass
 class PRMetrics:
@@ -28,14 +74,110 @@ class PRMetrics:
     repo: str
 
 
+class ActivityBitmap:
+    """Days with GitHub activity, one bit per day from ``start``.
+
+    Kept in github.json per user, so streaks can outlast the ~90 days the
+    events API covers. ``last_event_id`` is the newest event already
+    applied; only newer events are read on the next update.
+    """
+
+    def __init__(
+        self,
+        start: date | None = None,
+        bits: bytes = b"",
+        last_event_id: int | None = None,
+    ) -> None:
+        self.start = start
+        self.bits = bytearray(bits)
+        self.last_event_id = last_event_id
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ActivityBitmap:
+        try:
+            return cls(
+                start=date.fromisoformat(data["start"]) if data.get("start") else None,
+                bits=base64.b64decode(data.get("bits", "")),
+                last_event_id=data.get("last_event_id"),
+            )
+        except (TypeError, ValueError):
+            return cls()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat() if self.start else None,
+            "bits": base64.b64encode(bytes(self.bits)).decode(),
+            "last_event_id": self.last_event_id,
+        }
+
+    def mark(self, day: date) -> None:
+        """Record activity on a day."""
+        if self.start is None:
+            self.start = day
+        offset = (day - self.start).days
+        if offset < 0:
+            # Grow backwards by whole bytes so existing bits keep their positions
+            grow = (-offset + 7) // 8
+            self.bits[:0] = bytes(grow)
+            self.start -= timedelta(days=8 * grow)
+            offset += 8 * grow
+        if offset // 8 >= len(self.bits):
+            self.bits.extend(bytes(offset // 8 + 1 - len(self.bits)))
+        self.bits[offset // 8] |= 1 << (offset % 8)
+
+    def is_active(self, day: date) -> bool:
+        if self.start is None:
+            return False
+        offset = (day - self.start).days
+        if offset < 0 or offset // 8 >= len(self.bits):
+            return False
+        return bool(self.bits[offset // 8] >> (offset % 8) & 1)
+
+    def last_active(self) -> date | None:
+        """The most recent day with activity."""
+        if self.start is None:
+            return None
+        for index in range(len(self.bits) - 1, -1, -1):
+            byte = self.bits[index]
+            if byte:
+                return self.start + timedelta(days=8 * index + byte.bit_length() - 1)
+        return None
+
+    def streak(self, today: date) -> int:
+        """Consecutive active days ending today, or yesterday if today has none yet."""
+        day = today if self.is_active(today) else today - timedelta(days=1)
+        if self.start is None or not self.is_active(day):
+            return 0
+        offset = (day - self.start).days
+        streak = 0
+        # Walk back bit by bit to a byte boundary, then skip over full bytes
+        while offset >= 0 and self.bits[offset // 8] >> (offset % 8) & 1:
+            streak += 1
+            if offset % 8 == 0:
+                index = offset // 8 - 1
+                while index >= 0 and self.bits[index] == 0xFF:
+                    streak += 8
+                    index -= 1
+                offset = 8 * index + 7
+            else:
+                offset -= 1
+        return streak
+
+
 class GitHubMetrics:
     """Collect GitHub-related metrics."""
 
-    def __init__(self, metrics_dir: Path | None = None, repos: list[str] | None = None):
+    def __init__(
+        self,
+        metrics_dir: Path | None = None,
+        repos: list[str] | None = None,
+        backend: str | None = None,
+    ):
         self.metrics_dir = metrics_dir or DEFAULT_METRICS_DIR
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         self.github_file = self.metrics_dir / "github.json"
         self.repos = repos or []
+        self.store: MetricsStore | None = get_store(self.metrics_dir, backend)
 
     def _load_history(self) -> dict[str, Any]:
         """Load GitHub metrics history from disk."""
@@ -68,70 +210,91 @@ class GitHubMetrics:
     def get_contribution_streak(self, username: str | None = None) -> dict[str, Any]:
         """Calculate current contribution streak.
 
-        Uses `gh api` to fetch contribution data.
+        Events newer than the last one seen are folded into the user's
+        activity bitmap in github.json; the streak is read off the bitmap.
         """
-        # Get authenticated user if not provided
-        if not username:
-            user_result = subprocess.run(
-                ["gh", "api", "user", "--jq", ".login"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if user_result.returncode == 0:
-                username = user_result.stdout.strip()
-            else:
-                return {"streak_days": 0, "error": "Could not determine username"}
+        data = get_github_data()
+        try:
+            # Get authenticated user if not provided
+            if not username:
+                user = data.rest("user")
+                username = user.get("login") if isinstance(user, dict) else None
+                if not username:
+                    return {"streak_days": 0, "error": "Could not determine username"}
+        except GitHubError:
+            return {"streak_days": 0, "error": "Could not determine username"}
+
+        history = self._load_history()
+        activity = history.setdefault("activity", {})
+        bitmap = ActivityBitmap.from_dict(activity.get(username, {}))
 
-        # Fetch recent events to detect activity
+        error = None
         try:
-            result = subprocess.run(
-                ["gh", "api", f"users/{username}/events", "--jq", ".[].created_at"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-            if result.returncode != 0:
+            changed = self._apply_new_events(data, username, bitmap)
+        except GitHubError:
+            if bitmap.start is None:
                 return {"streak_days": 0, "error": "Could not fetch events"}
+            changed, error = False, "Could not fetch events"
 
-            # Parse dates
-            dates_with_activity: set[str] = set()
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    try:
-                        dt = datetime.fromisoformat(line.replace("Z", "+00:00"))
-                        dates_with_activity.add(dt.date().isoformat())
-                    except ValueError:
-                        continue
-
-            # Count consecutive days from today
-            streak = 0
-            check_date = date.today()
-            while check_date.isoformat() in dates_with_activity:
-                streak += 1
-                check_date -= timedelta(days=1)
-
-            # Also check yesterday if today hasn't had activity yet
-            if streak == 0:
-                yesterday = date.today() - timedelta(days=1)
-                if yesterday.isoformat() in dates_with_activity:
-                    streak = 1
-                    check_date = yesterday - timedelta(days=1)
-                    while check_date.isoformat() in dates_with_activity:
-                        streak += 1
-                        check_date -= timedelta(days=1)
+        if changed:
+            activity[username] = bitmap.to_dict()
+            self._save_history(history)
 
-            return {
-                "username": username,
-                "streak_days": streak,
-                "last_activity": max(dates_with_activity) if dates_with_activity else None,
-            }
+        last_activity = bitmap.last_active()
+        result: dict[str, Any] = {
+            "username": username,
+            "streak_days": bitmap.streak(date.today()),
+            "last_activity": last_activity.isoformat() if last_activity else None,
+        }
+        if error:
+            result["error"] = error
+        return result
+
+    def _apply_new_events(self, data: GitHubData, username: str, bitmap: ActivityBitmap) -> bool:
+        """Mark the days of events newer than ``bitmap.last_event_id``.
+
+        Events come newest first; further pages are read only while every
+        event on a page is new.
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return {"streak_days": 0, "error": "gh command failed"}
+        Returns:
+            True if the bitmap changed.
+        """
+        newest = bitmap.last_event_id
+        for page in range(1, EVENTS_MAX_PAGES + 1):
+            params = {"per_page": EVENTS_PER_PAGE}
+            if page > 1:
+                params["page"] = page
+            events = data.rest(f"users/{username}/events", params)
+            if not isinstance(events, list):
+                break
+
+            reached_seen = False
+            for event in events:
+                try:
+                    event_id = int(event["id"])
+                    created = datetime.fromisoformat(event["created_at"].replace("Z", "+00:00"))
+                except (KeyError, TypeError, AttributeError, ValueError):
+                    continue
+                if bitmap.last_event_id is not None and event_id <= bitmap.last_event_id:
+                    reached_seen = True
+                    break
+                bitmap.mark(created.date())
+                newest = max(newest or 0, event_id)
+
+            if reached_seen or len(events) < EVENTS_PER_PAGE:
+                break
+
+        if newest == bitmap.last_event_id:
+            return False
+        bitmap.last_event_id = newest
+        return True
 
     def get_pr_cycle_times(self, repo: str | None = None, limit: int = 20) -> list[PRMetrics]:
-        """Get PR cycle times (opened → merged)."""
+        """Get PR cycle times (opened → merged).
+
+        Merged PRs for all repos come from one batched GitHub query (see
+        openclaw_dash.collectors.github); "." means the current directory's repo.
+        """
         prs: list[PRMetrics] = []
 
         repos_to_check = [repo] if repo else self.repos
@@ -139,54 +302,39 @@ class GitHubMetrics:
             # Try to get repos from current directory
             repos_to_check = ["."]
 
-        for r in repos_to_check:
-            try:
-                cmd = [
-                    "gh",
-                    "pr",
-                    "list",
-                    "--repo",
-                    r,
-                    "--state",
-                    "merged",
-                    "--limit",
-                    str(limit),
-                    "--json",
-                    "number,title,state,createdAt,mergedAt",
-                ]
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    data = json.loads(result.stdout)
-                    for pr in data:
-                        created = datetime.fromisoformat(pr["createdAt"].replace("Z", "+00:00"))
-                        merged = (
-                            datetime.fromisoformat(pr["mergedAt"].replace("Z", "+00:00"))
-                            if pr.get("mergedAt")
-                            else None
-                        )
-
-                        cycle_hours: float | None = None
-                        if merged:
-                            cycle_hours = round((merged - created).total_seconds() / 3600, 2)
-
-                        prs.append(
-                            PRMetrics(
-                                number=pr["number"],
-                                title=pr["title"],
-                                state=pr["state"],
-                                created_at=pr["createdAt"],
-                                merged_at=pr.get("mergedAt"),
-                                cycle_hours=cycle_hours,
-                                repo=r,
-                            )
-                        )
-            except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        slugs = {r: repo_slug(Path.cwd()) if r == "." else r for r in repos_to_check}
+        snapshots = get_github_data().repos([s for s in slugs.values() if s])
+
+        for r, slug in slugs.items():
+            snapshot = snapshots.get(slug) if slug else None
+            if snapshot is None or snapshot.error:
                 continue
+            for pr in snapshot.merged_prs[:limit]:
+                try:
+                    created = datetime.fromisoformat(pr.created_at.replace("Z", "+00:00"))
+                    merged = (
+                        datetime.fromisoformat(pr.merged_at.replace("Z", "+00:00"))
+                        if pr.merged_at
+                        else None
+                    )
+                except ValueError:
+                    continue
+
+                cycle_hours: float | None = None
+                if merged:
+                    cycle_hours = round((merged - created).total_seconds() / 3600, 2)
+
+                prs.append(
+                    PRMetrics(
+                        number=pr.number,
+                        title=pr.title,
+                        state=pr.state,
+                        created_at=pr.created_at,
+                        merged_at=pr.merged_at,
+                        cycle_hours=cycle_hours,
+                        repo=r,
+                    )
+                )
 
         return prs
 
@@ -194,7 +342,10 @@ class GitHubMetrics:
         """Get TODO trends from repo-scanner snapshots."""
         trends: dict[str, list[dict[str, Any]]] = {}
 
+        seen: set[Path] = set()
+
         if not REPOS_SNAPSHOT_DIR.exists():
+            _forget_snapshots(seen)
             return {"repos": {}, "error": "No snapshot directory found"}
 
         # Look for repo scan results
@@ -209,32 +360,29 @@ class GitHubMetrics:
                 continue
 
             repo_trends: list[dict[str, Any]] = []
-            for todo_file in sorted(todo_files, key=lambda p: p.stat().st_mtime)[-30:]:
-                try:
-                    data = json.loads(todo_file.read_text())
-                    # Handle different formats
-                    todo_count: int = 0
-                    if isinstance(data, dict):
-                        raw_count = data.get("todo_count", data.get("todos", 0))
-                        todo_count = int(raw_count) if raw_count is not None else 0
-                        if "items" in data:
-                            todo_count = len(data["items"])
-                    elif isinstance(data, list):
-                        todo_count = len(data)
-
-                    mtime = datetime.fromtimestamp(todo_file.stat().st_mtime)
-                    repo_trends.append(
-                        {
-                            "date": mtime.date().isoformat(),
-                            "count": todo_count,
-                        }
-                    )
-                except (OSError, json.JSONDecodeError):
+            stamped: list[tuple[Path, tuple[int, int]]] = []
+            for todo_file in todo_files:
+                stamp = file_stamp(todo_file)
+                if stamp is not None:
+                    stamped.append((todo_file, stamp))
+            for todo_file, stamp in sorted(stamped, key=lambda fs: fs[1][0])[-30:]:
+                # Snapshots are rarely rewritten: parse each one once per (mtime, inode)
+                seen.add(todo_file)
+                todo_count = _snapshot_todo_count(todo_file, stamp)
+                if todo_count is None:
                     continue
+                mtime = datetime.fromtimestamp(stamp[0] / 1e9)
+                repo_trends.append(
+                    {
+                        "date": mtime.date().isoformat(),
+                        "count": todo_count,
+                    }
+                )
 
             if repo_trends:
                 trends[repo_name] = repo_trends
 
+        _forget_snapshots(seen)
         return {"repos": trends}
 
     def collect(self) -> dict[str, Any]:
@@ -261,9 +409,7 @@ class GitHubMetrics:
                 "collected_at": datetime.now().isoformat(),
             }
 
-        history = self._load_history()
-
-        # Get contribution streak
+        # Get contribution streak (updates the activity bitmap in github.json)
         streak = self.get_contribution_streak()
 
         # Get PR cycle times
@@ -275,8 +421,12 @@ class GitHubMetrics:
         todo_trends = self.get_todo_trends()
 
         # Update history
+        history = self._load_history()
         today = date.today().isoformat()
-        history["streaks"][today] = streak
+        if self.store is not None:
+            self.store.upsert_streak(today, streak)
+        else:
+            history["streaks"][today] = streak
         history["todo_trends"] = todo_trends
 
         self._save_history(history)
@@ -295,6 +445,8 @@ class GitHubMetrics:
 
     def get_streak_history(self, days: int = 30) -> list[dict[str, Any]]:
         """Get streak history over time."""
+        if self.store is not None:
+            return self.store.streak_history(days)
         history = self._load_history()
         dates = sorted(history.get("streaks", {}).keys(), reverse=True)[:days]
         return [{"date": d, **history["streaks"][d]} for d in dates]
@@ -3,18 +3,51 @@
 from __future__ import annotations
 
 import json
+import math
+import os
 import re
-from dataclasses import asdict, dataclass
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from openclaw_dash.collectors.logs import (
+    find_rotated_logs,
+    is_archived_log,
+    is_compressed_log,
+    iter_matching_lines,
+    iter_stream_matching_lines,
+    mapped_file,
+)
 from openclaw_dash.demo import is_demo_mode, mock_metrics
+from openclaw_dash.metrics.store import MetricsStore, get_store
 
 DEFAULT_METRICS_DIR = Path.home() / ".openclaw" / "workspace" / "metrics"
 GATEWAY_LOG_DIR = Path.home() / ".openclaw" / "logs"
 TMP_LOG_DIR = Path("/tmp/openclaw")
 
+# Plain-text gateway response lines: "[ws] SYNC res ✓ <action> <n>ms"
+WS_RESPONSE_PATTERN = re.compile(r"\[ws\] SYNC res ([✓✗]) (\S+) (\d+)ms")
+WS_RESPONSE_MARKER = b"[ws] SYNC res"
+# Structured (JSON) log lines can carry the same data as "type": "ws_response"
+WS_RESPONSE_JSON_MARKER = b"ws_response"
+WS_RESPONSE_NEEDLES = (WS_RESPONSE_MARKER, WS_RESPONSE_JSON_MARKER)
+TOOL_ERROR_PATTERN = re.compile(r"tool.*(?:error|failed|exception)", re.IGNORECASE)
+LINE_DATE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})T")
+
+# Backfill splits log files into ranges of roughly this many bytes
+BACKFILL_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Parsed aggregates of archived logs, keyed by cache file path. Shared across
+# PerformanceMetrics instances since widgets create one per refresh.
+_ARCHIVE_CACHES: dict[str, dict[str, Any]] = {}
+
+# Relative accuracy of the latency sketch (1% error on quantiles)
+SKETCH_ACCURACY = 0.01
+
 
 @dataclass
 class ToolCallMetric:
@@ -29,17 +62,216 @@ class ToolCallMetric:
     error_rate: float = 0
 
 
+@dataclass
+class LatencySketch:
+    """Mergeable latency histogram with logarithmic buckets.
+
+    Quantiles are accurate to within ``SKETCH_ACCURACY`` relative error, and
+    two sketches merge by summing bucket counts, so partial results from
+    backfill workers combine exactly.
+    """
+
+    buckets: dict[int, int] = field(default_factory=dict)
+    zero_count: int = 0
+    count: int = 0
+
+    _GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    def add(self, value: float) -> None:
+        """Record a single latency sample in milliseconds."""
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._LOG_GAMMA)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: LatencySketch) -> None:
+        """Fold another sketch into this one."""
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile (0.0-1.0) of recorded samples."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return round(2 * self._GAMMA**key / (self._GAMMA + 1), 2)
+        return round(2 * self._GAMMA ** max(self.buckets) / (self._GAMMA + 1), 2)
+
+
+@dataclass
+class BackfillPartial:
+    """Aggregates produced by one backfill worker for one byte range."""
+
+    responses: int = 0
+    bytes: int = 0
+    by_day: dict[str, dict[str, ToolCallMetric]] = field(default_factory=dict)
+    sketches: dict[str, LatencySketch] = field(default_factory=dict)
+
+    def merge(self, other: BackfillPartial) -> None:
+        """Fold another partial result into this one."""
+        self.responses += other.responses
+        self.bytes += other.bytes
+        for day, actions in other.by_day.items():
+            day_actions = self.by_day.setdefault(day, {})
+            for name, m in actions.items():
+                target = day_actions.get(name)
+                if target is None:
+                    day_actions[name] = m
+                    continue
+                target.count += m.count
+                target.success_count += m.success_count
+                target.error_count += m.error_count
+                target.total_ms += m.total_ms
+        for day, sketch in other.sketches.items():
+            if day in self.sketches:
+                self.sketches[day].merge(sketch)
+            else:
+                self.sketches[day] = sketch
+
+
+def split_line_ranges(path: Path, chunk_size: int = BACKFILL_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split a file into byte ranges whose boundaries fall just after a newline.
+
+    Args:
+        path: File to split.
+        chunk_size: Target size of each range in bytes.
+
+    Returns:
+        List of (start, end) offsets covering the whole file without overlap.
+    """
+    size = path.stat().st_size
+    if size == 0:
+        return []
+
+    ranges: list[tuple[int, int]] = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()  # advance to the next line boundary
+                end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_log_line(line: str) -> dict[str, Any] | None:
+    """Parse a single log line for relevant metrics."""
+    # Try JSON format first
+    try:
+        if line.strip().startswith("{"):
+            data = json.loads(line)
+            # Check for embedded log content
+            if "0" in data and isinstance(data["0"], str):
+                # Nested content, skip for now
+                return None
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    # Try plain text ws pattern
+    match = WS_RESPONSE_PATTERN.search(line)
+    if match:
+        success = match.group(1) == "✓"
+        action = match.group(2)
+        latency_ms = int(match.group(3))
+        return {
+            "type": "ws_response",
+            "action": action,
+            "success": success,
+            "latency_ms": latency_ms,
+        }
+
+    # Check for tool errors
+    if TOOL_ERROR_PATTERN.search(line):
+        return {"type": "tool_error", "raw": line[:200]}
+
+    return None
+
+
+def parse_log_range(path: Path, start: int, end: int, fallback_day: str) -> BackfillPartial:
+    """Parse one line-aligned byte range of a log file.
+
+    Runs inside backfill worker processes, so it only touches module-level
+    state. Lines without a leading ISO timestamp are attributed to
+    ``fallback_day`` (the file's modification date). Lines are parsed
+    with parse_log_line(), like PerformanceMetrics.parse_logs() does.
+    """
+    partial = BackfillPartial(bytes=end - start)
+    with ExitStack() as stack:
+        if is_compressed_log(path):
+            # Compressed logs cannot be split, so they arrive as one whole-file range
+            lines = iter_stream_matching_lines(path, WS_RESPONSE_NEEDLES)
+        else:
+            mm = stack.enter_context(mapped_file(path))
+            if mm is None:
+                return partial
+            lines = iter_matching_lines(mm, WS_RESPONSE_NEEDLES, start, end)
+
+        for raw in lines:
+            line = raw.decode("utf-8", errors="ignore")
+            parsed = parse_log_line(line)
+            if not parsed or parsed.get("type") != "ws_response":
+                continue
+
+            date_match = LINE_DATE_PATTERN.match(line)
+            day = date_match.group(1) if date_match else fallback_day
+            action = parsed["action"]
+            latency_ms = parsed["latency_ms"]
+            partial.responses += 1
+
+            actions = partial.by_day.setdefault(day, {})
+            m = actions.get(action)
+            if m is None:
+                m = actions[action] = ToolCallMetric(name=action)
+            m.count += 1
+            m.total_ms += latency_ms
+            if parsed["success"]:
+                m.success_count += 1
+            else:
+                m.error_count += 1
+
+            sketch = partial.sketches.get(day)
+            if sketch is None:
+                sketch = partial.sketches[day] = LatencySketch()
+            sketch.add(latency_ms)
+    return partial
+
+
+def _parse_log_range_task(task: tuple[str, int, int, str]) -> BackfillPartial:
+    """Unpack a pickled task tuple for ``ProcessPoolExecutor.map``."""
+    path, start, end, fallback_day = task
+    return parse_log_range(Path(path), start, end, fallback_day)
+
+
 class PerformanceMetrics:
     """Collect and analyze performance metrics from logs."""
 
-    def __init__(self, metrics_dir: Path | None = None):
+    def __init__(self, metrics_dir: Path | None = None, backend: str | None = None):
         self.metrics_dir = metrics_dir or DEFAULT_METRICS_DIR
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         self.perf_file = self.metrics_dir / "performance.json"
+        self.archive_cache_file = self.metrics_dir / "log_archive_cache.json"
+        self.store: MetricsStore | None = get_store(self.metrics_dir, backend)
 
         # Patterns for log parsing
-        self.ws_pattern = re.compile(r"\[ws\] SYNC res ([✓✗]) (\S+) (\d+)ms")
-        self.tool_error_pattern = re.compile(r"tool.*(?:error|failed|exception)", re.IGNORECASE)
+        self.ws_pattern = WS_RESPONSE_PATTERN
+        self.tool_error_pattern = TOOL_ERROR_PATTERN
 
     def _load_history(self) -> dict[str, Any]:
         """Load performance history from disk."""
@@ -54,81 +286,136 @@ class PerformanceMetrics:
         """Save performance history to disk."""
         self.perf_file.write_text(json.dumps(data, indent=2, default=str))
 
-    def _find_log_files(self) -> list[Path]:
-        """Find gateway log files to parse."""
+    def _find_log_files(self, limit: int | None = 3) -> list[Path]:
+        """Find gateway log files to parse, newest first.
+
+        Includes logrotate siblings (``*.log.N``, ``*.gz``, ``*.zst``).
+
+        Args:
+            limit: Maximum number of files to return (None for all).
+        """
         logs: list[Path] = []
 
         # Check ~/.openclaw/logs/
-        if GATEWAY_LOG_DIR.exists():
-            logs.extend(GATEWAY_LOG_DIR.glob("gateway*.log"))
+        logs.extend(find_rotated_logs(GATEWAY_LOG_DIR, "gateway"))
 
         # Check /tmp/openclaw/
-        if TMP_LOG_DIR.exists():
-            logs.extend(TMP_LOG_DIR.glob("openclaw-*.log"))
-
-        return sorted(logs, key=lambda p: p.stat().st_mtime, reverse=True)[:3]
+        logs.extend(find_rotated_logs(TMP_LOG_DIR, "openclaw-"))
+
+        return sorted(logs, key=lambda p: p.stat().st_mtime, reverse=True)[:limit]
+
+    def _load_archive_cache(self) -> dict[str, Any]:
+        """Load cached aggregates for archived logs (memory first, then disk)."""
+        key = str(self.archive_cache_file)
+        if key not in _ARCHIVE_CACHES:
+            entries: dict[str, Any] = {}
+            if self.archive_cache_file.exists():
+                try:
+                    entries = json.loads(self.archive_cache_file.read_text())
+                except (OSError, json.JSONDecodeError):
+                    entries = {}
+            _ARCHIVE_CACHES[key] = entries
+        return _ARCHIVE_CACHES[key]
+
+    def _save_archive_cache(self, entries: dict[str, Any]) -> None:
+        """Persist archived-log aggregates, dropping files that no longer exist."""
+        for path in [p for p in entries if not Path(p).exists()]:
+            del entries[path]
+        try:
+            self.archive_cache_file.write_text(json.dumps(entries))
+        except OSError:
+            pass
 
     def _parse_log_line(self, line: str) -> dict[str, Any] | None:
         """Parse a single log line for relevant metrics."""
-        # Try JSON format first
-        try:
-            if line.strip().startswith("{"):
-                data = json.loads(line)
-                # Check for embedded log content
-                if "0" in data and isinstance(data["0"], str):
-                    # Nested content, skip for now
-                    return None
-                return data
-        except json.JSONDecodeError:
-            pass
+        return parse_log_line(line)
 
-        # Try plain text ws pattern
-        match = self.ws_pattern.search(line)
-        if match:
-            success = match.group(1) == "✓"
-            action = match.group(2)
-            latency_ms = int(match.group(3))
-            return {
-                "type": "ws_response",
-                "action": action,
-                "success": success,
-                "latency_ms": latency_ms,
-            }
+    def _scan_log_file(self, log_file: Path) -> dict[str, ToolCallMetric]:
+        """Aggregate ws_response metrics from one log file.
 
-        # Check for tool errors
-        if self.tool_error_pattern.search(line):
-            return {"type": "tool_error", "raw": line[:200]}
+        Plain logs are memory-mapped; compressed ones are decompressed as a
+        stream. Either way only lines that can yield a ws_response are
+        decoded and parsed.
+        """
+        needles = WS_RESPONSE_NEEDLES
+        tool_metrics: dict[str, ToolCallMetric] = {}
+
+        with ExitStack() as stack:
+            if is_compressed_log(log_file):
+                lines = iter_stream_matching_lines(log_file, needles)
+            else:
+                mm = stack.enter_context(mapped_file(log_file))
+                lines = iter_matching_lines(mm, needles) if mm is not None else iter(())
+
+            for raw in lines:
+                parsed = self._parse_log_line(raw.decode("utf-8", errors="ignore"))
+                if not parsed or parsed.get("type") != "ws_response":
+                    continue
+
+                action = parsed["action"]
+                if action not in tool_metrics:
+                    tool_metrics[action] = ToolCallMetric(name=action)
+
+                m = tool_metrics[action]
+                m.count += 1
+                m.total_ms += parsed["latency_ms"]
+                if parsed["success"]:
+                    m.success_count += 1
+                else:
+                    m.error_count += 1
 
-        return None
+        return tool_metrics
 
     def parse_logs(self) -> dict[str, ToolCallMetric]:
-        """Parse gateway logs for performance data."""
+        """Parse gateway logs for performance data.
+
+        Archived logs (rotated or compressed) never change, so their
+        aggregates are cached by (path, size, mtime) and only scanned once.
+        """
         logs: list[Path] = self._find_log_files()
         tool_metrics: dict[str, ToolCallMetric] = {}
+        archive_cache: dict[str, Any] | None = None
+        archive_cache_dirty = False
 
         for log_file in logs:
             try:
-                with open(log_file, errors="ignore") as f:
-                    for line in f:
-                        parsed = self._parse_log_line(line)
-                        if not parsed:
-                            continue
-
-                        if parsed.get("type") == "ws_response":
-                            action = parsed["action"]
-                            if action not in tool_metrics:
-                                tool_metrics[action] = ToolCallMetric(name=action)
-
-                            m = tool_metrics[action]
-                            m.count += 1
-                            m.total_ms += parsed["latency_ms"]
-                            if parsed["success"]:
-                                m.success_count += 1
-                            else:
-                                m.error_count += 1
-            except OSError:
+                if is_archived_log(log_file):
+                    if archive_cache is None:
+                        archive_cache = self._load_archive_cache()
+                    stat = log_file.stat()
+                    entry = archive_cache.get(str(log_file))
+                    if entry and (entry["size"], entry["mtime"]) == (stat.st_size, stat.st_mtime):
+                        file_metrics = {
+                            name: ToolCallMetric(**fields)
+                            for name, fields in entry["actions"].items()
+                        }
+                    else:
+                        file_metrics = self._scan_log_file(log_file)
+                        archive_cache[str(log_file)] = {
+                            "size": stat.st_size,
+                            "mtime": stat.st_mtime,
+                            "actions": {name: asdict(m) for name, m in file_metrics.items()},
+                        }
+                        archive_cache_dirty = True
+                else:
+                    file_metrics = self._scan_log_file(log_file)
+            except (OSError, EOFError, ImportError):
+                # Unreadable, truncated or undecodable (no zstd module) logs are skipped
                 continue
 
+            for name, fm in file_metrics.items():
+                m = tool_metrics.get(name)
+                if m is None:
+                    tool_metrics[name] = fm
+                    continue
+                m.count += fm.count
+                m.success_count += fm.success_count
+                m.error_count += fm.error_count
+                m.total_ms += fm.total_ms
+
+        if archive_cache is not None and archive_cache_dirty:
+            self._save_archive_cache(archive_cache)
+
         # Calculate averages
         for m in tool_metrics.values():
             if m.count > 0:
@@ -160,7 +447,6 @@ class PerformanceMetrics:
                 "collected_at": datetime.now().isoformat(),
             }
 
-        history = self._load_history()
         today = datetime.now().date().isoformat()
 
         # Parse logs
@@ -185,24 +471,17 @@ class PerformanceMetrics:
         )[:5]
 
         # Update daily history
-        if today not in history["daily"]:
-            history["daily"][today] = {
-                "total_calls": 0,
-                "total_errors": 0,
-                "avg_latency_ms": 0,
-            }
-
-        history["daily"][today].update(
+        self._update_days(
             {
-                "total_calls": total_calls,
-                "total_errors": total_errors,
-                "avg_latency_ms": avg_latency,
-                "updated_at": datetime.now().isoformat(),
+                today: {
+                    "total_calls": total_calls,
+                    "total_errors": total_errors,
+                    "avg_latency_ms": avg_latency,
+                    "updated_at": datetime.now().isoformat(),
+                }
             }
         )
 
-        self._save_history(history)
-
         return {
             "summary": {
                 "total_calls": total_calls,
@@ -221,8 +500,105 @@ class PerformanceMetrics:
             "collected_at": datetime.now().isoformat(),
         }
 
+    def _update_days(self, days: dict[str, dict[str, Any]]) -> None:
+        """Merge per-day rollups into the stored history."""
+        if self.store is not None:
+            self.store.upsert_perf_days(days)
+            return
+        history = self._load_history()
+        for day, values in days.items():
+            history["daily"].setdefault(day, {}).update(values)
+        self._save_history(history)
+
     def get_trend(self, days: int = 7) -> list[dict[str, Any]]:
         """Get daily performance trend."""
+        if self.store is not None:
+            return self.store.perf_trend(days)
         history = self._load_history()
         dates = sorted(history["daily"].keys(), reverse=True)[:days]
         return [{"date": d, **history["daily"][d]} for d in dates]
+
+    def backfill(
+        self,
+        jobs: int | None = None,
+        chunk_size: int = BACKFILL_CHUNK_SIZE,
+        log_files: list[Path] | None = None,
+    ) -> dict[str, Any]:
+        """Rebuild daily performance history from every available log file.
+
+        Files are split into line-aligned byte ranges which are parsed in a
+        process pool. Each worker returns per-day aggregates and latency
+        sketches that are merged here and written into ``performance.json``.
+
+        Args:
+            jobs: Worker processes (defaults to CPU count; 1 parses inline).
+            chunk_size: Target bytes per range.
+            log_files: Override the discovered log files.
+
+        Returns:
+            Dictionary with per-day results, totals and timing.
+        """
+        started = time.monotonic()
+        files = log_files if log_files is not None else self._find_log_files(limit=None)
+        jobs = max(1, jobs or os.cpu_count() or 1)
+
+        tasks: list[tuple[str, int, int, str]] = []
+        for log_file in files:
+            try:
+                stat = log_file.stat()
+                fallback_day = datetime.fromtimestamp(stat.st_mtime).date().isoformat()
+                if is_compressed_log(log_file):
+                    tasks.append((str(log_file), 0, stat.st_size, fallback_day))
+                    continue
+                for start, end in split_line_ranges(log_file, chunk_size):
+                    tasks.append((str(log_file), start, end, fallback_day))
+            except OSError:
+                continue
+
+        merged = BackfillPartial()
+        if jobs == 1 or len(tasks) <= 1:
+            for task in tasks:
+                try:
+                    merged.merge(_parse_log_range_task(task))
+                except (OSError, EOFError, ImportError):
+                    continue
+        else:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+                futures = [executor.submit(_parse_log_range_task, task) for task in tasks]
+                for future in futures:
+                    try:
+                        merged.merge(future.result())
+                    except (OSError, EOFError, ImportError):
+                        continue
+
+        days: dict[str, dict[str, Any]] = {}
+        for day in sorted(merged.by_day):
+            actions = merged.by_day[day]
+            sketch = merged.sketches.get(day, LatencySketch())
+            total_calls = sum(m.count for m in actions.values())
+            total_errors = sum(m.error_count for m in actions.values())
+            total_latency = sum(m.total_ms for m in actions.values())
+            days[day] = {
+                "total_calls": total_calls,
+                "total_errors": total_errors,
+                "avg_latency_ms": round(total_latency / total_calls, 2) if total_calls else 0,
+                "p50_latency_ms": sketch.quantile(0.50),
+                "p95_latency_ms": sketch.quantile(0.95),
+                "p99_latency_ms": sketch.quantile(0.99),
+            }
+
+        updated_at = datetime.now().isoformat()
+        self._update_days(
+            {day: {**values, "updated_at": updated_at} for day, values in days.items()}
+        )
+
+        return {
+            "days": days,
+            "files": len(files),
+            "bytes": merged.bytes,
+            "responses": merged.responses,
+            "jobs": jobs,
+            "chunks": len(tasks),
+            "duration_ms": round((time.monotonic() - started) * 1000, 2),
+            "collected_at": datetime.now().isoformat(),
+        }
@@ -0,0 +1,213 @@
+"""Model pricing lookup.
+
+Session and billing model names rarely match the pricing table exactly:
+they carry provider prefixes (``anthropic/``, ``us.anthropic.``), release
+dates (``-20250929``, ``-2024-08-06``, ``@20240620``), version or tag
+suffixes (``-v1:0``, ``:latest``) and dotted versions (``claude-3.5-sonnet``).
+PricingResolver normalizes a name, then tries an exact or alias match, the
+local-model check and finally the longest table entry that is a prefix on
+a ``-`` boundary (``gpt-4o-mini-search`` -> ``gpt-4o-mini``, never
+``gpt-4o``). A dotted version is never cut: ``gpt-4.1`` is a different
+model from ``gpt-4``, not a variant of it. Each distinct name is resolved
+once and memoized.
+
+Extra models and aliases can be configured in config.toml::
+
+    [pricing.models."my-finetune"]
+    input = 3.0
+    output = 15.0
+
+    [pricing.aliases]
+    "sonnet" = "claude-sonnet-4-5"
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+
+# Token pricing per 1M tokens (as of Feb 2025)
+# Prices are in USD per 1 million tokens
+MODEL_PRICING = {
+    # Claude 4.x series
+    "claude-opus-4-5": {"input": 15.00, "output": 75.00},
+    "claude-opus-4": {"input": 15.00, "output": 75.00},
+    "claude-sonnet-4-5": {"input": 3.00, "output": 15.00},
+    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "claude-haiku-4-5": {"input": 0.25, "output": 1.25},
+    "claude-haiku-4": {"input": 0.25, "output": 1.25},
+    # Claude 3.x series
+    "claude-3-opus": {"input": 15.00, "output": 75.00},
+    "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
+    "claude-3-sonnet": {"input": 3.00, "output": 15.00},
+    "claude-3-haiku": {"input": 0.25, "output": 1.25},
+    "claude-3-5-haiku": {"input": 0.25, "output": 1.25},
+    # OpenAI GPT-4 series
+    "gpt-4.5": {"input": 75.00, "output": 150.00},
+    "gpt-4.1": {"input": 2.00, "output": 8.00},
+    "gpt-4.1-mini": {"input": 0.40, "output": 1.60},
+    "gpt-4.1-nano": {"input": 0.10, "output": 0.40},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4-turbo": {"input": 10.00, "output": 30.00},
+    "gpt-4": {"input": 30.00, "output": 60.00},
+    # OpenAI GPT-3.5 series
+    "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
+    # O-series (reasoning models)
+    "o1": {"input": 15.00, "output": 60.00},
+    "o1-mini": {"input": 3.00, "output": 12.00},
+    "o3-mini": {"input": 1.10, "output": 4.40},
+    # Codex/GitHub Copilot (approximations based on public info)
+    "codex": {"input": 0.00, "output": 0.00},  # Usually bundled/free tier
+    "copilot": {"input": 0.00, "output": 0.00},  # Subscription-based
+    # Gemini series (Google)
+    "gemini-1.5-pro": {"input": 1.25, "output": 5.00},
+    "gemini-1.5-flash": {"input": 0.075, "output": 0.30},
+    "gemini-2.0-flash": {"input": 0.10, "output": 0.40},
+    # Default fallback (use Sonnet pricing as conservative estimate)
+    "default": {"input": 3.00, "output": 15.00},
+}
+
+# Substrings marking self-hosted models (Ollama etc.), which cost nothing
+LOCAL_INDICATORS = ("ollama", "local", "llama", "mistral")
+
+# Cap on memoized names; the cache is cleared when reached
+MAX_CACHED_MODELS = 4096
+
+_VENDOR_PREFIX = re.compile(
+    r"^(?:[a-z]{2}\.)?(?:anthropic|openai|google|meta|mistral|cohere|amazon)\."
+)
+_SUFFIXES = re.compile(r"(?:-\d{8}|-\d{4}-\d{2}-\d{2}|-latest|-v\d+)$")
+_DOTTED_VERSION = re.compile(r"(?<=\d)\.(?=\d)")
+_VERSION_SEGMENT = re.compile(r"\d+(?:\.\d+)+")
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Resolved price of a model in USD per 1M tokens."""
+
+    input: float
+    output: float
+    key: str  # Table entry it resolved to, "local" or "default"
+
+
+def normalize_model(model: str) -> str:
+    """Reduce a model name to the form pricing table keys are matched in.
+
+    Lowercases, drops provider paths and vendor prefixes, tags (``:...``,
+    ``@...``) and release/version suffixes, and writes dotted versions with
+    dashes (``3.5`` -> ``3-5``).
+    """
+    return _DOTTED_VERSION.sub("-", _strip_model(model))
+
+
+def _strip_model(model: str) -> str:
+    """normalize_model() without rewriting dotted versions."""
+    name = model.strip().lower().rsplit("/", 1)[-1]
+    name = _VENDOR_PREFIX.sub("", name)
+    name = name.split("@", 1)[0].split(":", 1)[0]
+    while True:
+        stripped = _SUFFIXES.sub("", name)
+        if stripped == name:
+            return name
+        name = stripped
+
+
+class PricingResolver:
+    """Map model names to prices from a pricing table.
+
+    Args:
+        table: Model key -> {"input": usd_per_1m, "output": usd_per_1m}. Must
+            include a "default" entry for unmatched models.
+        aliases: Extra names -> table key.
+    """
+
+    def __init__(
+        self,
+        table: dict[str, dict[str, float]] | None = None,
+        aliases: dict[str, str] | None = None,
+    ) -> None:
+        self.table = dict(MODEL_PRICING if table is None else table)
+        default = self.table.get("default", MODEL_PRICING["default"])
+        self.default = ModelPrice(default["input"], default["output"], "default")
+        self._prices: dict[str, ModelPrice] = {}
+        for key, rates in self.table.items():
+            if key != "default":
+                self._prices[normalize_model(key)] = ModelPrice(
+                    float(rates["input"]), float(rates["output"]), key
+                )
+        self._aliases: dict[str, ModelPrice] = {}
+        for alias, target in (aliases or {}).items():
+            target_price = self._prices.get(normalize_model(target))
+            if target_price is not None:
+                self._aliases[normalize_model(alias)] = target_price
+        self._cache: dict[str, ModelPrice] = {}
+
+    def resolve(self, model: str) -> ModelPrice:
+        """Price for a model name (memoized)."""
+        price = self._cache.get(model)
+        if price is None:
+            price = self._resolve(model)
+            if len(self._cache) >= MAX_CACHED_MODELS:
+                self._cache.clear()
+            self._cache[model] = price
+        return price
+
+    def _resolve(self, model: str) -> ModelPrice:
+        name = normalize_model(model)
+        price = self._prices.get(name) or self._aliases.get(name)
+        if price is not None:
+            return price
+        if any(indicator in model.lower() for indicator in LOCAL_INDICATORS):
+            return ModelPrice(0.0, 0.0, "local")
+        # Split before dots become dashes, so "4.1" stays one segment
+        parts = _strip_model(model).split("-")
+        for end in range(len(parts) - 1, 0, -1):
+            if _VERSION_SEGMENT.fullmatch(parts[end]):
+                break  # "gpt-4.1" is not a "gpt" variant either
+            prefix = _DOTTED_VERSION.sub("-", "-".join(parts[:end]))
+            price = self._prices.get(prefix) or self._aliases.get(prefix)
+            if price is not None:
+                return price
+        return self.default
+
+
+def configured_pricing() -> tuple[dict[str, dict[str, float]], dict[str, str]]:
+    """Extra pricing table entries and aliases from config.toml."""
+    from openclaw_dash.config import load_config
+
+    config = load_config()
+    models: dict[str, dict[str, float]] = {}
+    for name, price in config.pricing_models.items():
+        try:
+            models[name] = {"input": float(price["input"]), "output": float(price["output"])}
+        except (KeyError, TypeError, ValueError):
+            continue  # Incomplete entry
+    return models, dict(config.pricing_aliases)
+
+
+_RESOLVER: PricingResolver | None = None
+_RESOLVER_LOCK = threading.Lock()
+
+
+def get_resolver() -> PricingResolver:
+    """The shared resolver for MODEL_PRICING plus the configured extras."""
+    global _RESOLVER
+    with _RESOLVER_LOCK:
+        if _RESOLVER is None:
+            models, aliases = configured_pricing()
+            _RESOLVER = PricingResolver({**MODEL_PRICING, **models}, aliases)
+        return _RESOLVER
+
+
+def reset_resolver() -> None:
+    """Rebuild the shared resolver on next use (e.g. after a config change)."""
+    global _RESOLVER
+    with _RESOLVER_LOCK:
+        _RESOLVER = None
+
+
+def price_for(model: str) -> ModelPrice:
+    """Resolve a model name with the shared resolver."""
+    return get_resolver().resolve(model)
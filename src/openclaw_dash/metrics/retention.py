@@ -0,0 +1,128 @@
+"""Retention and downsampling of cost history.
+
+History moves through three tiers as it ages:
+
+1. Raw: per-session token records (used to cost each session's increments)
+   and hourly cost buckets, kept for ``raw_days``. After that a session
+   record shrinks to its token counts, the baseline its next increment is
+   costed against, so a session the gateway still lists is never charged
+   twice.
+2. Daily: one entry per day, kept for ``daily_days``.
+3. Monthly: older days are folded into one entry per month, kept forever.
+
+Rollups add the folded values, so all-time totals, token counts and
+per-model breakdowns are unchanged by downsampling. A tier length of 0
+keeps that tier forever.
+
+Configured under ``[metrics.retention]`` in config.toml.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+DEFAULT_RAW_DAYS = 30
+DEFAULT_DAILY_DAYS = 365
+
+# What is kept of a session record once it is older than the raw tier
+SESSION_BASELINE_KEYS = ("input_tokens", "output_tokens", "total_tokens")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long each history tier is kept, in days (0 = forever)."""
+
+    raw_days: int = DEFAULT_RAW_DAYS
+    daily_days: int = DEFAULT_DAILY_DAYS
+
+    @classmethod
+    def from_config(cls) -> RetentionPolicy:
+        """The policy configured in config.toml."""
+        from openclaw_dash.config import load_config
+
+        config = load_config()
+        return cls(
+            raw_days=max(0, int(config.retention_raw_days)),
+            daily_days=max(0, int(config.retention_daily_days)),
+        )
+
+    def cutoffs(self, today: date | None = None) -> tuple[str | None, str | None]:
+        """ISO dates before which raw and daily records are downsampled.
+
+        Returns:
+            (raw_cutoff, daily_cutoff); None where the tier is kept forever.
+        """
+        today = today or date.today()
+        raw = (today - timedelta(days=self.raw_days)).isoformat() if self.raw_days else None
+        daily = (today - timedelta(days=self.daily_days)).isoformat() if self.daily_days else None
+        return raw, daily
+
+
+def empty_month(month: str) -> dict[str, Any]:
+    return {
+        "month": month,
+        "days": 0,
+        "total_input_tokens": 0,
+        "total_output_tokens": 0,
+        "total_cost": 0.0,
+        "session_count": 0,
+        "by_model": {},
+    }
+
+
+def downsample_costs(
+    history: dict[str, Any], raw_cutoff: str | None, daily_cutoff: str | None
+) -> dict[str, int]:
+    """Apply retention to a costs.json history in place.
+
+    Args:
+        history: History with "daily", "sessions" and optionally "monthly".
+        raw_cutoff: Reduce session records last updated before this date to
+            their token count baseline, and drop hourly cost buckets
+            before it.
+        daily_cutoff: Fold daily entries before this date into "monthly".
+
+    Returns:
+        Number of session records reduced to baselines and daily entries folded.
+    """
+    dropped = 0
+    if raw_cutoff:
+        sessions = history.get("sessions", {})
+        stale = [
+            k
+            for k, s in sessions.items()
+            if set(s) - set(SESSION_BASELINE_KEYS)
+            and (s.get("last_updated") or "")[:10] < raw_cutoff
+        ]
+        for key in stale:
+            record = sessions[key]
+            sessions[key] = {k: record.get(k, 0) for k in SESSION_BASELINE_KEYS}
+        dropped = len(stale)
+        hourly = history.get("hourly", {})
+        for hour in [h for h in hourly if h[:10] < raw_cutoff]:
+            del hourly[hour]
+
+    folded = 0
+    if daily_cutoff:
+        daily = history.get("daily", {})
+        monthly = history.setdefault("monthly", {})
+        for day in sorted(d for d in daily if d < daily_cutoff):
+            data = daily.pop(day)
+            month = monthly.setdefault(day[:7], empty_month(day[:7]))
+            month["days"] += 1
+            month["total_input_tokens"] += data.get("total_input_tokens", 0)
+            month["total_output_tokens"] += data.get("total_output_tokens", 0)
+            month["total_cost"] += data.get("total_cost", 0.0)
+            month["session_count"] += data.get("session_count", 0)
+            for model, values in data.get("by_model", {}).items():
+                target = month["by_model"].setdefault(
+                    model, {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+                )
+                target["input_tokens"] += values.get("input_tokens", 0)
+                target["output_tokens"] += values.get("output_tokens", 0)
+                target["cost"] += values.get("cost", 0.0)
+            folded += 1
+
+    return {"sessions_dropped": dropped, "days_folded": folded}
@@ -0,0 +1,569 @@
+"""SQLite metrics store (optional backend).
+
+An alternative to the JSON history files in the metrics directory. Daily
+and hourly costs, per-session token snapshots, performance rollups and GitHub streaks
+live in tables keyed and indexed by date (and session), so range queries
+and 30/90-day trends read only the rows they return instead of loading
+and sorting a whole JSON file.
+
+Enable with ``backend = "sqlite"`` under ``[metrics]`` in config.toml, and
+import existing JSON history once with ``openclaw-dash metrics --migrate-sqlite``.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 3
+DB_FILENAME = "metrics.db"
+BACKENDS = ("json", "sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_costs (
+    date TEXT PRIMARY KEY,
+    total_input_tokens INTEGER NOT NULL DEFAULT 0,
+    total_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS daily_model_costs (
+    date TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, model)
+);
+CREATE TABLE IF NOT EXISTS session_snapshots (
+    session_key TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    date TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    PRIMARY KEY (session_key, recorded_at)
+);
+CREATE INDEX IF NOT EXISTS idx_session_snapshots_date ON session_snapshots (date);
+CREATE TABLE IF NOT EXISTS monthly_costs (
+    month TEXT PRIMARY KEY,
+    days INTEGER NOT NULL DEFAULT 0,
+    total_input_tokens INTEGER NOT NULL DEFAULT 0,
+    total_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS monthly_model_costs (
+    month TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, model)
+);
+CREATE TABLE IF NOT EXISTS hourly_costs (
+    hour TEXT PRIMARY KEY,
+    cost REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS perf_daily (
+    date TEXT PRIMARY KEY,
+    total_calls INTEGER NOT NULL DEFAULT 0,
+    total_errors INTEGER NOT NULL DEFAULT 0,
+    avg_latency_ms REAL NOT NULL DEFAULT 0,
+    p50_latency_ms REAL,
+    p95_latency_ms REAL,
+    p99_latency_ms REAL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS github_streaks (
+    date TEXT PRIMARY KEY,
+    username TEXT,
+    streak_days INTEGER NOT NULL DEFAULT 0,
+    last_activity TEXT,
+    error TEXT
+);
+"""
+
+PERF_COLUMNS = (
+    "total_calls",
+    "total_errors",
+    "avg_latency_ms",
+    "p50_latency_ms",
+    "p95_latency_ms",
+    "p99_latency_ms",
+    "updated_at",
+)
+
+# Open stores, keyed by database path. Shared across tracker instances
+# since widgets create them per refresh.
+_STORES: dict[Path, MetricsStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def configured_backend() -> str:
+    """The metrics backend selected in config.toml ("json" or "sqlite")."""
+    from openclaw_dash.config import load_config
+
+    backend = load_config().metrics_backend
+    return backend if backend in BACKENDS else "json"
+
+
+def get_store(metrics_dir: Path, backend: str | None = None) -> MetricsStore | None:
+    """Return the shared store for a metrics directory if the sqlite backend is in use.
+
+    Args:
+        metrics_dir: Directory holding the metrics files.
+        backend: "json" or "sqlite"; defaults to configured_backend().
+
+    Returns:
+        The open MetricsStore, or None for the JSON backend.
+    """
+    if (backend or configured_backend()) != "sqlite":
+        return None
+    path = metrics_dir / DB_FILENAME
+    with _STORES_LOCK:
+        store = _STORES.get(path)
+        if store is None:
+            store = MetricsStore(path)
+            _STORES[path] = store
+        return store
+
+
+def close_stores() -> None:
+    """Close every shared store."""
+    with _STORES_LOCK:
+        for store in _STORES.values():
+            store.close()
+        _STORES.clear()
+
+
+def _row_dict(row: sqlite3.Row, skip_null: bool = False) -> dict[str, Any]:
+    return {k: row[k] for k in row.keys() if not (skip_null and row[k] is None)}
+
+
+class MetricsStore:
+    """SQLite-backed metrics history.
+
+    Uses WAL mode so dashboard instances and CLI commands can read while
+    another writes. Writes that depend on earlier reads (cost increments
+    against the last session snapshot) go through transaction(), which
+    takes the write lock up front.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the enclosed reads and writes atomically (BEGIN IMMEDIATE).
+
+        Nested use joins the outer transaction.
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # Costs
+
+    def has_cost_day(self, day: str) -> bool:
+        return bool(self._query("SELECT 1 FROM daily_costs WHERE date = ?", (day,)))
+
+    def latest_session(self, key: str) -> dict[str, Any] | None:
+        """Most recent token snapshot of a session, shaped like costs.json session records."""
+        rows = self._query(
+            "SELECT input_tokens, output_tokens, total_tokens, model, recorded_at"
+            " FROM session_snapshots WHERE session_key = ?"
+            " ORDER BY recorded_at DESC LIMIT 1",
+            (key,),
+        )
+        if not rows:
+            return None
+        record = _row_dict(rows[0])
+        record["last_updated"] = record.pop("recorded_at")
+        return record
+
+    def record_cost_event(self, event: dict[str, Any]) -> None:
+        """Apply one cost event (see CostTracker.collect) to the daily tables.
+
+        Events without a session key only make sure the day exists.
+        """
+        with self.transaction():
+            self._conn.execute(
+                "INSERT OR IGNORE INTO daily_costs (date) VALUES (?)", (event["day"],)
+            )
+            if not event.get("key"):
+                return
+            self._conn.execute(
+                "UPDATE daily_costs SET total_input_tokens = total_input_tokens + ?,"
+                " total_output_tokens = total_output_tokens + ?,"
+                " total_cost = total_cost + ?, session_count = session_count + 1"
+                " WHERE date = ?",
+                (event["in"], event["out"], event["cost"], event["day"]),
+            )
+            self._conn.execute(
+                "INSERT INTO daily_model_costs (date, model, input_tokens, output_tokens, cost)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (date, model) DO UPDATE SET"
+                " input_tokens = input_tokens + excluded.input_tokens,"
+                " output_tokens = output_tokens + excluded.output_tokens,"
+                " cost = cost + excluded.cost",
+                (event["day"], event["model"], event["in"], event["out"], event["cost"]),
+            )
+            self._conn.execute(
+                "INSERT INTO hourly_costs (hour, cost) VALUES (?, ?)"
+                " ON CONFLICT (hour) DO UPDATE SET cost = cost + excluded.cost",
+                (event["ts"][:13], event["cost"]),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO session_snapshots (session_key, recorded_at, date, model,"
+                " input_tokens, output_tokens, total_tokens) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    event["key"],
+                    event["ts"],
+                    event["day"],
+                    event["model"],
+                    event["input_tokens"],
+                    event["output_tokens"],
+                    event["total_tokens"],
+                ),
+            )
+
+    def _cost_days(
+        self, where: str, params: tuple[Any, ...], limit: int | None
+    ) -> list[dict[str, Any]]:
+        sql = f"SELECT * FROM daily_costs {where} ORDER BY date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (*params, limit)
+        days = [_row_dict(row) for row in self._query(sql, params)]
+        if not days:
+            return []
+        by_model: dict[str, dict[str, Any]] = {day["date"]: {} for day in days}
+        for row in self._query(
+            "SELECT * FROM daily_model_costs WHERE date BETWEEN ? AND ?",
+            (days[-1]["date"], days[0]["date"]),
+        ):
+            if row["date"] in by_model:
+                by_model[row["date"]][row["model"]] = {
+                    "input_tokens": row["input_tokens"],
+                    "output_tokens": row["output_tokens"],
+                    "cost": row["cost"],
+                }
+        for day in days:
+            day["by_model"] = by_model[day["date"]]
+        return days
+
+    def cost_day(self, day: str) -> dict[str, Any] | None:
+        """One day's costs shaped like a costs.json daily entry."""
+        days = self._cost_days("WHERE date = ?", (day,), None)
+        return days[0] if days else None
+
+    def cost_history(self, days: int = 30) -> list[dict[str, Any]]:
+        """The most recent ``days`` daily cost entries, newest first."""
+        return self._cost_days("", (), days)
+
+    def cost_range(self, start: str, end: str) -> list[dict[str, Any]]:
+        """Daily cost entries with start <= date <= end (ISO dates), newest first."""
+        return self._cost_days("WHERE date BETWEEN ? AND ?", (start, end), None)
+
+    def cost_hours(self, start: str) -> dict[str, float]:
+        """Cost per hour ("YYYY-MM-DDTHH") from the start of an ISO date."""
+        rows = self._query("SELECT hour, cost FROM hourly_costs WHERE hour >= ?", (start,))
+        return {row["hour"]: row["cost"] for row in rows}
+
+    def cost_version(self) -> tuple[Any, ...]:
+        """A value that changes whenever a cost event is recorded (by any process)."""
+        row = self._query("SELECT COUNT(*), TOTAL(total_cost) FROM daily_costs")[0]
+        return tuple(row)
+
+    def cost_summary(self) -> tuple[float, int]:
+        """(All-time total cost, number of days tracked), monthly rollups included."""
+        row = self._query(
+            "SELECT (SELECT COALESCE(SUM(total_cost), 0) FROM daily_costs)"
+            " + (SELECT COALESCE(SUM(total_cost), 0) FROM monthly_costs),"
+            " (SELECT COUNT(*) FROM daily_costs)"
+            " + (SELECT COALESCE(SUM(days), 0) FROM monthly_costs)"
+        )[0]
+        return row[0], row[1]
+
+    def cost_months(self, months: int = 12) -> list[dict[str, Any]]:
+        """The most recent ``months`` monthly rollups, newest first."""
+        rows = self._query("SELECT * FROM monthly_costs ORDER BY month DESC LIMIT ?", (months,))
+        result = [_row_dict(row) for row in rows]
+        if not result:
+            return []
+        by_model: dict[str, dict[str, Any]] = {m["month"]: {} for m in result}
+        for row in self._query(
+            "SELECT * FROM monthly_model_costs WHERE month BETWEEN ? AND ?",
+            (result[-1]["month"], result[0]["month"]),
+        ):
+            by_model[row["month"]][row["model"]] = {
+                "input_tokens": row["input_tokens"],
+                "output_tokens": row["output_tokens"],
+                "cost": row["cost"],
+            }
+        for month in result:
+            month["by_model"] = by_model[month["month"]]
+        return result
+
+    def apply_cost_retention(
+        self, raw_cutoff: str | None, daily_cutoff: str | None
+    ) -> dict[str, int]:
+        """Downsample cost history (see openclaw_dash.metrics.retention).
+
+        Args:
+            raw_cutoff: Delete session snapshots (except each session's latest) and
+                hourly costs recorded before this date.
+            daily_cutoff: Fold daily rows before this date into the monthly tables.
+
+        Returns:
+            Number of session snapshots dropped and daily rows folded.
+        """
+        dropped = folded = 0
+        with self.transaction():
+            if raw_cutoff:
+                # Each session's latest snapshot stays as the baseline for its next increment
+                dropped = self._conn.execute(
+                    "DELETE FROM session_snapshots WHERE date < ? AND recorded_at <"
+                    " (SELECT MAX(recorded_at) FROM session_snapshots AS latest"
+                    " WHERE latest.session_key = session_snapshots.session_key)",
+                    (raw_cutoff,),
+                ).rowcount
+                self._conn.execute("DELETE FROM hourly_costs WHERE hour < ?", (raw_cutoff,))
+            if daily_cutoff:
+                self._conn.execute(
+                    "INSERT INTO monthly_costs (month, days, total_input_tokens,"
+                    " total_output_tokens, total_cost, session_count)"
+                    " SELECT substr(date, 1, 7), COUNT(*), SUM(total_input_tokens),"
+                    " SUM(total_output_tokens), SUM(total_cost), SUM(session_count)"
+                    " FROM daily_costs WHERE date < ? GROUP BY substr(date, 1, 7)"
+                    " ON CONFLICT (month) DO UPDATE SET days = days + excluded.days,"
+                    " total_input_tokens = total_input_tokens + excluded.total_input_tokens,"
+                    " total_output_tokens = total_output_tokens + excluded.total_output_tokens,"
+                    " total_cost = total_cost + excluded.total_cost,"
+                    " session_count = session_count + excluded.session_count",
+                    (daily_cutoff,),
+                )
+                self._conn.execute(
+                    "INSERT INTO monthly_model_costs (month, model, input_tokens,"
+                    " output_tokens, cost)"
+                    " SELECT substr(date, 1, 7), model, SUM(input_tokens), SUM(output_tokens),"
+                    " SUM(cost) FROM daily_model_costs WHERE date < ?"
+                    " GROUP BY substr(date, 1, 7), model"
+                    " ON CONFLICT (month, model) DO UPDATE SET"
+                    " input_tokens = input_tokens + excluded.input_tokens,"
+                    " output_tokens = output_tokens + excluded.output_tokens,"
+                    " cost = cost + excluded.cost",
+                    (daily_cutoff,),
+                )
+                self._conn.execute("DELETE FROM daily_model_costs WHERE date < ?", (daily_cutoff,))
+                folded = self._conn.execute(
+                    "DELETE FROM daily_costs WHERE date < ?", (daily_cutoff,)
+                ).rowcount
+        return {"sessions_dropped": dropped, "days_folded": folded}
+
+    # Performance
+
+    def upsert_perf_days(self, days: dict[str, dict[str, Any]]) -> None:
+        """Insert or update daily performance rollups; missing fields keep their value."""
+        with self.transaction():
+            for day, values in days.items():
+                fields = [c for c in PERF_COLUMNS if c in values]
+                self._conn.execute("INSERT OR IGNORE INTO perf_daily (date) VALUES (?)", (day,))
+                if fields:
+                    self._conn.execute(
+                        f"UPDATE perf_daily SET {', '.join(f'{c} = ?' for c in fields)}"
+                        " WHERE date = ?",
+                        (*(values[c] for c in fields), day),
+                    )
+
+    def perf_trend(self, days: int = 7) -> list[dict[str, Any]]:
+        """The most recent ``days`` performance rollups, newest first."""
+        rows = self._query("SELECT * FROM perf_daily ORDER BY date DESC LIMIT ?", (days,))
+        return [_row_dict(row, skip_null=True) for row in rows]
+
+    # GitHub
+
+    def upsert_streak(self, day: str, streak: dict[str, Any]) -> None:
+        """Record the contribution streak observed on a day."""
+        with self.transaction():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO github_streaks (date, username, streak_days,"
+                " last_activity, error) VALUES (?, ?, ?, ?, ?)",
+                (
+                    day,
+                    streak.get("username"),
+                    streak.get("streak_days", 0),
+                    streak.get("last_activity"),
+                    streak.get("error"),
+                ),
+            )
+
+    def streak_history(self, days: int = 30) -> list[dict[str, Any]]:
+        """The most recent ``days`` streak observations, newest first."""
+        rows = self._query("SELECT * FROM github_streaks ORDER BY date DESC LIMIT ?", (days,))
+        return [_row_dict(row, skip_null=True) for row in rows]
+
+    # Migration
+
+    def migrate_from_json(self, metrics_dir: Path) -> dict[str, int]:
+        """Import costs.json (with its ledger), performance.json and github.json.
+
+        Rows for dates (and months) already in the store are replaced by the JSON values,
+        so running the migration twice gives the same result.
+
+        Returns:
+            Rows imported per table.
+        """
+        from openclaw_dash.metrics.costs import CostTracker
+
+        costs = CostTracker(metrics_dir=metrics_dir, backend="json")._load_history()
+        perf = _read_json(metrics_dir / "performance.json")
+        github = _read_json(metrics_dir / "github.json")
+        counts = {
+            "daily_costs": 0,
+            "monthly_costs": 0,
+            "hourly_costs": 0,
+            "session_snapshots": 0,
+            "perf_daily": 0,
+            "github_streaks": 0,
+        }
+
+        with self.transaction():
+            for day, data in costs.get("daily", {}).items():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO daily_costs (date, total_input_tokens,"
+                    " total_output_tokens, total_cost, session_count) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        day,
+                        data.get("total_input_tokens", 0),
+                        data.get("total_output_tokens", 0),
+                        data.get("total_cost", 0.0),
+                        data.get("session_count", 0),
+                    ),
+                )
+                self._conn.execute("DELETE FROM daily_model_costs WHERE date = ?", (day,))
+                for model, m in data.get("by_model", {}).items():
+                    self._conn.execute(
+                        "INSERT INTO daily_model_costs (date, model, input_tokens,"
+                        " output_tokens, cost) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            day,
+                            model,
+                            m.get("input_tokens", 0),
+                            m.get("output_tokens", 0),
+                            m.get("cost", 0.0),
+                        ),
+                    )
+                counts["daily_costs"] += 1
+
+            for month, data in costs.get("monthly", {}).items():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO monthly_costs (month, days, total_input_tokens,"
+                    " total_output_tokens, total_cost, session_count)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        month,
+                        data.get("days", 0),
+                        data.get("total_input_tokens", 0),
+                        data.get("total_output_tokens", 0),
+                        data.get("total_cost", 0.0),
+                        data.get("session_count", 0),
+                    ),
+                )
+                self._conn.execute("DELETE FROM monthly_model_costs WHERE month = ?", (month,))
+                for model, m in data.get("by_model", {}).items():
+                    self._conn.execute(
+                        "INSERT INTO monthly_model_costs (month, model, input_tokens,"
+                        " output_tokens, cost) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            month,
+                            model,
+                            m.get("input_tokens", 0),
+                            m.get("output_tokens", 0),
+                            m.get("cost", 0.0),
+                        ),
+                    )
+                counts["monthly_costs"] += 1
+
+            for hour, cost in costs.get("hourly", {}).items():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO hourly_costs (hour, cost) VALUES (?, ?)", (hour, cost)
+                )
+                counts["hourly_costs"] += 1
+
+            for key, record in costs.get("sessions", {}).items():
+                recorded_at = record.get("last_updated") or ""
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO session_snapshots (session_key, recorded_at, date,"
+                    " model, input_tokens, output_tokens, total_tokens)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        recorded_at,
+                        recorded_at[:10],
+                        record.get("model", "unknown"),
+                        record.get("input_tokens", 0),
+                        record.get("output_tokens", 0),
+                        record.get("total_tokens", 0),
+                    ),
+                )
+                counts["session_snapshots"] += 1
+
+            perf_days = perf.get("daily", {})
+            self.upsert_perf_days(perf_days)
+            counts["perf_daily"] = len(perf_days)
+
+            for day, streak in github.get("streaks", {}).items():
+                self.upsert_streak(day, streak)
+                counts["github_streaks"] += 1
+
+        return counts
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError, RecursionError):
+        return {}
+    return data if isinstance(data, dict) else {}
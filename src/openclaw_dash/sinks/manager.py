@@ -11,9 +11,14 @@ import logging
 from typing import Any
 
 from openclaw_dash.collectors import alerts, gateway, resources
+from openclaw_dash.collectors.timeseries import get_timeseries
 
 logger = logging.getLogger(__name__)
 
+# Publish CPU/memory samples already in the time series store if they are
+# at most this old, rather than sampling again
+RESOURCE_MAX_AGE = 60.0  # seconds
+
 
 def _load_sink_config() -> dict[str, dict[str, Any]]:
     """Load sink configuration from the user's config.toml.
@@ -110,8 +115,9 @@ class SinkManager:
     def refresh_and_publish(self) -> None:
         """Collect current metrics and push them to all sinks.
 
-        Gathers data from resource, gateway, and alert collectors,
-        merges into a single payload, and fans out to every active sink.
+        Gathers data from resource (including tracked processes), gateway,
+        and alert collectors, merges into a single payload, and fans out to
+        every active sink.
         """
         if not self._sinks:
             return
@@ -120,10 +126,18 @@ class SinkManager:
 
         # Resource metrics (CPU, memory)
         try:
-            payload["resources"] = resources.collect()
+            payload["resources"] = self._recent_resources() or resources.collect()
         except Exception:
             logger.debug("Resource collection failed for sink publish")
 
+        # Tracked processes (gateway, model servers)
+        try:
+            processes = self._recent_processes()
+            if processes is not None:
+                payload["processes"] = processes
+        except Exception:
+            logger.debug("Process sampling failed for sink publish")
+
         # Gateway status
         try:
             payload["gateway"] = gateway.collect()
@@ -140,6 +154,37 @@ class SinkManager:
         for sink in self._sinks:
             sink.publish_batch(payload)
 
+    @staticmethod
+    def _recent_resources() -> dict[str, Any] | None:
+        """CPU and memory percent from the time series store, if recently sampled.
+
+        As in the dashboard, usage against the container's cgroup limits
+        replaces the host's figure for each resource the cgroup limits.
+        """
+        store = get_timeseries()
+        cpu = store.latest("cpu.percent", max_age=RESOURCE_MAX_AGE)
+        mem = store.latest("mem.percent", max_age=RESOURCE_MAX_AGE)
+        if cpu is None or mem is None:
+            return None
+        cgroup_cpu = store.latest("cgroup.cpu.percent", max_age=RESOURCE_MAX_AGE)
+        if cgroup_cpu is not None and store.latest("cgroup.cpu.limit", max_age=RESOURCE_MAX_AGE):
+            cpu = cgroup_cpu
+        # Only recorded under a memory limit
+        cgroup_mem = store.latest("cgroup.mem.percent", max_age=RESOURCE_MAX_AGE)
+        if cgroup_mem is not None:
+            mem = cgroup_mem
+        return {"cpu": {"percent": cpu}, "memory": {"percent": mem}}
+
+    @staticmethod
+    def _recent_processes() -> list[dict[str, Any]] | None:
+        """Running tracked processes from the resource sampler's latest sample."""
+        if not resources.PSUTIL_AVAILABLE:
+            return None
+        sample = resources.get_sampler().latest
+        if not sample or "processes" not in sample:
+            return None
+        return [proc for proc in sample["processes"] if proc.get("running")]
+
     # -- Factory methods -----------------------------------------------------
 
     @staticmethod
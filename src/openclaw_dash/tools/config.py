@@ -227,3 +227,20 @@ def require_org() -> str:
 def get_config_path() -> Path:
     """Get the config file path (for display/debugging)."""
     return _get_config_path()
+
+
+def get_cache_path(filename: str) -> Path:
+    """
+    Get the path of a tool cache file, respecting XDG_CACHE_HOME.
+
+    Caches only hold values that can be recomputed; deleting them is safe.
+
+    Args:
+        filename: Cache file name (e.g., "repo-scanner.json")
+
+    Returns:
+        Path under ~/.cache/openclaw-dash (the directory may not exist yet)
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "openclaw-dash" / filename
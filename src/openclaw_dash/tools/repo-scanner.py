@@ -8,8 +8,15 @@ Tracks:
 - Open PRs
 - Last commit activity
 
+TODO items are cached per file by git blob SHA, so each scan only reads
+files that changed since the last one, staged or not. Test counts are
+cached per repo and reused while the repo's git fingerprint (HEAD, index,
+packed-refs, refs/) is unchanged; open PRs are always fetched.
+
 Usage:
     python3 repo-scanner.py [--format FORMAT] [--save] [--repo-base PATH] [--org ORG]
+    python3 repo-scanner.py --no-cache   # Recount tests in every repo
+    python3 repo-scanner.py --jobs 8     # Parallel scan, same output as serial
 
 Configuration:
     Config file: ~/.config/openclaw-dash/tools.yaml
@@ -19,17 +26,20 @@ Configuration:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib.util
 import json
+import os
 import subprocess
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 # Use shared config module for common settings
 from config import get_config as get_shared_config
-from config import get_config_path, get_repo_base
+from config import get_cache_path, get_config_path, get_repo_base
 
 # Tool configuration schema for discovery
 CONFIG_SCHEMA = {
@@ -57,6 +67,8 @@ CONFIG_SCHEMA = {
 }
 
 GIT_TIMEOUT = 30
+CACHE_FILE = get_cache_path("repo-scanner.json")
+CACHE_VERSION = 1
 
 
 # -----------------------------------------------------------------------------
@@ -107,129 +119,224 @@ def run(cmd: list[str], cwd: Path | None = None, timeout: int = GIT_TIMEOUT) ->
         return -1, f"Command timed out after {timeout}s"
 
 
-def count_todos(repo_path: Path, *, skip_docstrings: bool = False) -> dict:
-    """Count TODOs and FIXMEs in tracked files only (via git ls-files).
+# -----------------------------------------------------------------------------
+# TODO counting, cached per git blob
+# -----------------------------------------------------------------------------
+SOURCE_EXTENSIONS = {".py", ".ts", ".tsx", ".js", ".jsx"}
+TODO_KEYWORDS = ["TODO", "FIXME", "HACK", "XXX"]
+GREP_BATCH = 1000  # Files per grep invocation, well below ARG_MAX
+SCAN_CHUNK = 200  # Files per worker task with --jobs
 
-    Args:
-        repo_path: Path to the repository
-        skip_docstrings: If True, use smart categorization to separate
-            actionable TODOs from docstring TODOs
-    """
-    todos = {"TODO": 0, "FIXME": 0, "HACK": 0, "XXX": 0}
-    files_with_todos: list[str] = []
-    docstring_count = 0
-    actionable_count = 0
 
-    # Get list of tracked files from git
+def _tracked_blobs(repo_path: Path) -> dict[str, str | None] | None:
+    """Tracked source files and their blob SHAs (``git ls-files -s``).
+
+    Files with unstaged changes map to None: their content no longer
+    matches the indexed blob, so they are always rescanned. Returns None
+    if git timed out.
+    """
     try:
-        ls_result = subprocess.run(
-            ["git", "ls-files"],
+        staged = subprocess.run(
+            ["git", "ls-files", "-s", "-z"],
+            capture_output=True,
+            text=True,
+            cwd=repo_path,
+            timeout=GIT_TIMEOUT,
+        )
+        modified = subprocess.run(
+            ["git", "ls-files", "-m", "-z"],
             capture_output=True,
             text=True,
             cwd=repo_path,
             timeout=GIT_TIMEOUT,
         )
     except subprocess.TimeoutExpired:
-        return {
-            "counts": todos,
-            "total": 0,
-            "files_affected": 0,
-            "actionable": 0,
-            "in_docstrings": 0,
-        }
+        return None
 
-    tracked_files = ls_result.stdout.strip().split("\n") if ls_result.stdout.strip() else []
+    blobs: dict[str, str | None] = {}
+    for record in staged.stdout.split("\0"):
+        meta, _, rel_path = record.partition("\t")
+        if not rel_path or Path(rel_path).suffix not in SOURCE_EXTENSIONS:
+            continue
+        mode, sha, _ = meta.split(" ")
+        if mode != "160000":  # Skip submodules
+            blobs[rel_path] = sha
+    for rel_path in modified.stdout.split("\0"):
+        if rel_path in blobs:
+            blobs[rel_path] = None
+    return blobs
 
-    # Filter to source files we care about
-    extensions = {".py", ".ts", ".tsx", ".js", ".jsx"}
-    source_files = [f for f in tracked_files if Path(f).suffix in extensions]
 
-    if not source_files:
-        return {
-            "counts": todos,
-            "total": 0,
-            "files_affected": 0,
-            "actionable": 0,
-            "in_docstrings": 0,
-        }
+def _blob_cache_path(repo_path: Path) -> Path:
+    digest = hashlib.sha1(str(repo_path.resolve()).encode()).hexdigest()[:16]
+    return get_cache_path("todo-blobs") / f"{digest}.json"
 
-    # If smart categorization is available and requested, use it
-    if skip_docstrings and _smart_scanner is not None:
-        for rel_path in source_files:
-            filepath = repo_path / rel_path
-            if not filepath.exists():
-                continue
-            items = _smart_scanner.scan_file(filepath)
-            for item in items:
-                # Count by keyword based on the task marker match
-                text_upper = (item.text or "").upper()
-                matched = False
-                for kw in ["FIXME", "HACK", "XXX", "TODO"]:
-                    if kw in text_upper:
-                        todos[kw] += 1
-                        matched = True
-                        break
-                if not matched:
-                    todos["TODO"] += 1
 
-                if item.category == "DOCSTRING":
-                    docstring_count += 1
-                else:
-                    actionable_count += 1
-
-                if rel_path not in files_with_todos:
-                    files_with_todos.append(rel_path)
+def _load_blob_cache(repo_path: Path, mode: str) -> dict[str, list]:
+    """Cached TODO items by blob SHA for one repo and scan mode."""
+    try:
+        data = json.loads(_blob_cache_path(repo_path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get(mode, {})
 
-        total = sum(todos.values())
-        return {
-            "counts": todos,
-            "total": total,
-            "files_affected": len(files_with_todos),
-            "actionable": actionable_count,
-            "in_docstrings": docstring_count,
-        }
 
-    # Fallback: Use grep on just the tracked source files
+def _save_blob_cache(repo_path: Path, mode: str, blobs: dict[str, list]) -> None:
+    path = _blob_cache_path(repo_path)
     try:
-        grep_result = subprocess.run(
-            ["grep", "-Hn", r"TODO\|FIXME\|HACK\|XXX", "--", *source_files],
-            capture_output=True,
-            text=True,
-            cwd=repo_path,
-            timeout=GIT_TIMEOUT,
+        data = json.loads(path.read_text())
+        if data.get("version") != CACHE_VERSION:
+            data = {}
+    except (OSError, json.JSONDecodeError, AttributeError):
+        data = {}
+    data["version"] = CACHE_VERSION
+    data[mode] = blobs
+    _write_json_atomic(path, data)
+
+
+def _scan_smart_chunk(repo_path: Path, rel_paths: list[str]) -> dict[str, list]:
+    """[line, category, text] items per file, from the smart task marker scanner.
+
+    Runs in worker processes with --jobs, so it only takes and returns
+    picklable values.
+    """
+    results: dict[str, list] = {}
+    for rel_path in rel_paths:
+        filepath = repo_path / rel_path
+        if not filepath.exists():
+            continue
+        items = _smart_scanner.scan_file(filepath)
+        results[rel_path] = [[item.line, item.category, item.text] for item in items]
+    return results
+
+
+def _scan_smart(
+    repo_path: Path, rel_paths: list[str], pool: Executor | None = None
+) -> dict[str, list]:
+    """Scan files with the smart scanner, in chunks across ``pool`` if given."""
+    if pool is None or len(rel_paths) <= SCAN_CHUNK:
+        return _scan_smart_chunk(repo_path, rel_paths)
+    results: dict[str, list] = {}
+    chunks = [rel_paths[i : i + SCAN_CHUNK] for i in range(0, len(rel_paths), SCAN_CHUNK)]
+    for chunk_results in pool.map(_scan_smart_chunk, [repo_path] * len(chunks), chunks):
+        results.update(chunk_results)
+    return results
+
+
+def _scan_grep(repo_path: Path, rel_paths: list[str]) -> dict[str, list] | None:
+    """[line, None, text] items per file for every line grep matches.
+
+    Returns None if grep timed out.
+    """
+    results: dict[str, list] = {rel_path: [] for rel_path in rel_paths}
+    for i in range(0, len(rel_paths), GREP_BATCH):
+        try:
+            grep_result = subprocess.run(
+                ["grep", "-HnZ", r"TODO\|FIXME\|HACK\|XXX", "--", *rel_paths[i : i + GREP_BATCH]],
+                capture_output=True,
+                text=True,
+                cwd=repo_path,
+                timeout=GIT_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        for line in grep_result.stdout.splitlines():
+            fname, _, rest = line.partition("\0")
+            lineno, _, text = rest.partition(":")
+            if fname in results and lineno.isdigit():
+                results[fname].append([int(lineno), None, text])
+    return results
+
+
+def count_todos(
+    repo_path: Path, *, skip_docstrings: bool = False, pool: Executor | None = None
+) -> dict:
+    """Count TODOs and FIXMEs in tracked files only (via git ls-files).
+
+    Each file's TODO items are cached by its git blob SHA, so only files
+    whose content changed since the last scan are read again.
+
+    Args:
+        repo_path: Path to the repository
+        skip_docstrings: If True, use smart categorization to separate
+            actionable TODOs from docstring TODOs
+        pool: Process pool to spread the smart scan across (--jobs)
+    """
+    todos = dict.fromkeys(TODO_KEYWORDS, 0)
+    empty = {
+        "counts": todos,
+        "total": 0,
+        "files_affected": 0,
+        "actionable": 0,
+        "in_docstrings": 0,
+    }
+
+    blobs = _tracked_blobs(repo_path)
+    if not blobs:
+        return empty
+
+    smart = skip_docstrings and _smart_scanner is not None
+    mode = "smart" if smart else "grep"
+    cached = _load_blob_cache(repo_path, mode)
+    items_by_file: dict[str, list] = {}
+    misses: list[str] = []
+    for rel_path, sha in blobs.items():
+        if sha is not None and sha in cached:
+            items_by_file[rel_path] = cached[sha]
+        else:
+            misses.append(rel_path)
+
+    if misses:
+        scanned: dict[str, list] | None
+        if smart:
+            scanned = _scan_smart(repo_path, misses, pool)
+        else:
+            scanned = _scan_grep(repo_path, misses)
+        if scanned is None:
+            return empty
+        items_by_file.update(scanned)
+        # Keep only blobs still tracked, so the cache does not grow without bound
+        _save_blob_cache(
+            repo_path,
+            mode,
+            {
+                sha: items_by_file[rel_path]
+                for rel_path, sha in blobs.items()
+                if sha is not None and rel_path in items_by_file
+            },
         )
-    except subprocess.TimeoutExpired:
-        return {
-            "counts": todos,
-            "total": 0,
-            "files_affected": 0,
-            "actionable": 0,
-            "in_docstrings": 0,
-        }
 
-    output = grep_result.stdout.strip()
-    if output:
-        for line in output.split("\n"):
-            if "TODO" in line:
-                todos["TODO"] += 1
-            if "FIXME" in line:
-                todos["FIXME"] += 1
-            if "HACK" in line:
-                todos["HACK"] += 1
-            if "XXX" in line:
-                todos["XXX"] += 1
-            if ":" in line:
-                fname = line.split(":")[0]
-                if fname not in files_with_todos:
-                    files_with_todos.append(fname)
+    files_with_todos: set[str] = set()
+    docstring_count = 0
+    actionable_count = 0
+    for rel_path, items in items_by_file.items():
+        if items:
+            files_with_todos.add(rel_path)
+        for _, category, text in items:
+            if smart:
+                # Count by keyword based on the task marker match
+                text_upper = (text or "").upper()
+                keyword = next((kw for kw in ("FIXME", "HACK", "XXX") if kw in text_upper), "TODO")
+                todos[keyword] += 1
+                if category == "DOCSTRING":
+                    docstring_count += 1
+                else:
+                    actionable_count += 1
+            else:
+                for kw in TODO_KEYWORDS:
+                    if kw in text:
+                        todos[kw] += 1
 
     total = sum(todos.values())
     return {
         "counts": todos,
         "total": total,
         "files_affected": len(files_with_todos),
-        "actionable": total,  # Without smart scan, all are "actionable"
-        "in_docstrings": 0,
+        # Without smart scan, all are "actionable"
+        "actionable": actionable_count if smart else total,
+        "in_docstrings": docstring_count,
     }
 
 
@@ -292,10 +399,99 @@ def get_last_commit(repo_path: Path) -> str:
     return output or "Unknown"
 
 
+# -----------------------------------------------------------------------------
+# Change detection: reuse local counts while a repo is unchanged
+# -----------------------------------------------------------------------------
+def _git_dirs(repo_path: Path) -> tuple[Path, Path] | None:
+    """(git dir, common dir) of a checkout, following worktree .git files."""
+    git_dir = repo_path / ".git"
+    if git_dir.is_file():  # Worktree or submodule: "gitdir: <path>"
+        try:
+            text = git_dir.read_text().strip()
+        except OSError:
+            return None
+        if not text.startswith("gitdir:"):
+            return None
+        git_dir = (repo_path / text[len("gitdir:") :].strip()).resolve()
+    if not (git_dir / "HEAD").exists():
+        return None
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+    return git_dir, common_dir
+
+
+def repo_fingerprint(repo_path: Path) -> list | None:
+    """Stamps (mtime, inode) of .git/HEAD, the index, packed-refs and refs/.
+
+    Commits, checkouts, staging and ref updates all change the fingerprint;
+    edits that are not staged yet and untracked files do not.
+    Returns None if repo_path is not a git checkout.
+    """
+    dirs = _git_dirs(repo_path)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    paths = [git_dir / "HEAD", git_dir / "index", common_dir / "packed-refs"]
+    # Ref updates rename a lock file into place, which changes the directory's mtime
+    for root, subdirs, _ in os.walk(common_dir / "refs"):
+        subdirs.sort()
+        paths.append(Path(root))
+
+    fingerprint = []
+    for path in paths:
+        try:
+            st = path.stat()
+            fingerprint.append([str(path), st.st_mtime_ns, st.st_ino])
+        except OSError:
+            fingerprint.append([str(path), None, None])
+    return fingerprint
+
+
+def load_scan_cache(path: Path = CACHE_FILE) -> dict:
+    """Load cached per-repo counts ({} if missing, unreadable or outdated)."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("repos", {})
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write a cache file atomically; a cache that cannot be written is skipped."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def save_scan_cache(cache: dict, path: Path = CACHE_FILE) -> None:
+    """Write the per-repo count cache."""
+    _write_json_atomic(path, {"version": CACHE_VERSION, "repos": cache})
+
+
 def scan_repo(
-    repo: str, repo_base: Path, github_org: str, *, skip_docstrings: bool = False
+    repo: str,
+    repo_base: Path,
+    github_org: str,
+    *,
+    skip_docstrings: bool = False,
+    cache: dict | None = None,
+    pool: Executor | None = None,
 ) -> dict:
-    """Scan a single repo for health metrics."""
+    """Scan a single repo for health metrics.
+
+    TODOs are always counted, behind count_todos()'s per-blob cache, so
+    unstaged edits are picked up. If ``cache`` is given, the test count
+    computed under the same fingerprint is reused, and a new count is
+    stored in it. ``pool`` is passed on to count_todos().
+    """
     repo_path = repo_base / repo
 
     if not repo_path.exists():
@@ -303,11 +499,23 @@ def scan_repo(
 
     run(["git", "fetch", "--quiet"], cwd=repo_path)
 
+    todos = count_todos(repo_path, skip_docstrings=skip_docstrings, pool=pool)
+
+    key = str(repo_path)
+    fingerprint = repo_fingerprint(repo_path) if cache is not None else None
+    entry = cache.get(key) if cache is not None else None
+    if fingerprint is not None and entry and entry.get("fingerprint") == fingerprint:
+        test_files = entry["test_files"]
+    else:
+        test_files = count_tests(repo_path)
+        if cache is not None and fingerprint is not None:
+            cache[key] = {"fingerprint": fingerprint, "test_files": test_files}
+
     return {
         "name": repo,
         "path": str(repo_path),
-        "todos": count_todos(repo_path, skip_docstrings=skip_docstrings),
-        "test_files": count_tests(repo_path),
+        "todos": todos,
+        "test_files": test_files,
         "open_prs": get_open_prs(repo, github_org),
         "last_commit": get_last_commit(repo_path),
         "scanned_at": datetime.now().isoformat(),
@@ -488,6 +696,68 @@ def progress(msg: str, current: int, total: int) -> None:
     print(f"[{current}/{total}] {msg}...", file=sys.stderr)
 
 
+def _start_process_pool(jobs: int) -> ProcessPoolExecutor:
+    """A process pool for ``jobs`` workers, all of them already running.
+
+    Where workers are forked, the pool starts them all on its first task.
+    Doing that here, before any scan threads exist, keeps fork() from
+    copying a process with other threads running.
+    """
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    pool.submit(os.getpid).result()
+    return pool
+
+
+def scan_repos(
+    repos: list[str],
+    repo_base: Path,
+    github_org: str,
+    *,
+    skip_docstrings: bool = False,
+    cache: dict | None = None,
+    jobs: int = 1,
+) -> list[dict]:
+    """Scan repos, reporting progress; results are in the order of ``repos``.
+
+    With ``jobs`` > 1, repos are scanned concurrently in threads (git and
+    gh calls are mostly waiting) and the smart TODO scan of their files is
+    spread across ``jobs`` processes. Progress is reported as each repo
+    completes.
+    """
+    total = len(repos)
+    if jobs <= 1 or total == 0:
+        results = []
+        for i, repo in enumerate(repos, 1):
+            progress(f"Scanning {repo}", i, total)
+            results.append(
+                scan_repo(repo, repo_base, github_org, skip_docstrings=skip_docstrings, cache=cache)
+            )
+        return results
+
+    results_by_index: dict[int, dict] = {}
+    with (
+        _start_process_pool(jobs) as pool,  # Workers start before the threads
+        ThreadPoolExecutor(max_workers=min(jobs, total)) as threads,
+    ):
+        futures = {
+            threads.submit(
+                scan_repo,
+                repo,
+                repo_base,
+                github_org,
+                skip_docstrings=skip_docstrings,
+                cache=cache,
+                pool=pool,
+            ): i
+            for i, repo in enumerate(repos)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            results_by_index[i] = future.result()
+            progress(f"Scanned {repos[i]}", done, total)
+    return [results_by_index[i] for i in range(total)]
+
+
 def main():
     config = load_config()
 
@@ -503,6 +773,8 @@ Examples:
   %(prog)s --org myorg            # Override GitHub org
   %(prog)s --save                 # Save snapshot for trending
   %(prog)s --all-todos            # Include TODOs in docstrings
+  %(prog)s --no-cache             # Recount tests even in unchanged repos
+  %(prog)s --jobs 8               # Scan repos and files in parallel
 
 Configuration:
   Config file: {get_config_path()}
@@ -565,6 +837,20 @@ Environment:
         action="store_true",
         help="Count all TODOs including those in docstrings",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Recount tests in every repo (refreshes {CACHE_FILE}); TODOs are always "
+        "rescanned in files changed since the last scan, staged or not",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Scan with N worker processes and repos concurrently (0: one per CPU; default: 1)",
+    )
     args = parser.parse_args()
 
     # Resolve configuration with CLI overrides
@@ -595,11 +881,12 @@ Environment:
     # Determine task marker filtering mode
     skip_docstrings = not args.all_todos  # Default is to skip docstrings
 
-    results = []
-    total = len(repos)
-    for i, repo in enumerate(repos, 1):
-        progress(f"Scanning {repo}", i, total)
-        results.append(scan_repo(repo, repo_base, github_org, skip_docstrings=skip_docstrings))
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    cache = {} if args.no_cache else load_scan_cache()
+    results = scan_repos(
+        repos, repo_base, github_org, skip_docstrings=skip_docstrings, cache=cache, jobs=jobs
+    )
+    save_scan_cache(cache)
 
     if args.save:
         snapshot = save_snapshot(results, Path(__file__))
@@ -9,15 +9,18 @@ Usage:
     python3 status.py --ci         # Include CI status (slower)
     python3 status.py --skip-docstrings   # Smart TODO counting
     python3 status.py --json       # Output as JSON
+    python3 status.py --jobs 8     # Scan repos and files in parallel
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +29,7 @@ from typing import Any
 from config import get_repo_base, get_repos, require_org
 
 GIT_TIMEOUT = 30
+SCAN_CHUNK = 200  # Files per worker task with --jobs
 
 
 # ============================================================================
@@ -326,8 +330,23 @@ def scan_file_for_todos(filepath: Path) -> list[TodoItem]:
     return todos
 
 
-def count_todos_smart(repo_path: Path) -> dict[str, Any]:
-    """Count TODOs with smart categorization (separating docstrings)."""
+def _count_categories(repo_path: Path, rel_paths: list[str]) -> dict[str, int]:
+    """TODO counts by category for some files (a worker task with --jobs)."""
+    by_category: dict[str, int] = {"DOCSTRING": 0, "COMMENT": 0, "INLINE": 0}
+    for f in rel_paths:
+        filepath = repo_path / f
+        if filepath.exists():
+            todos = scan_file_for_todos(filepath)
+            for todo in todos:
+                by_category[todo.category] += 1
+    return by_category
+
+
+def count_todos_smart(repo_path: Path, pool: Executor | None = None) -> dict[str, Any]:
+    """Count TODOs with smart categorization (separating docstrings).
+
+    With a ``pool``, files are scanned in chunks across its workers.
+    """
     by_category: dict[str, int] = {"DOCSTRING": 0, "COMMENT": 0, "INLINE": 0}
 
     # Get tracked files from git
@@ -346,12 +365,13 @@ def count_todos_smart(repo_path: Path) -> dict[str, Any]:
     extensions = {".py", ".ts", ".tsx", ".js", ".jsx"}
     source_files = [f for f in tracked_files if Path(f).suffix in extensions]
 
-    for f in source_files:
-        filepath = repo_path / f
-        if filepath.exists():
-            todos = scan_file_for_todos(filepath)
-            for todo in todos:
-                by_category[todo.category] += 1
+    if pool is None or len(source_files) <= SCAN_CHUNK:
+        by_category = _count_categories(repo_path, source_files)
+    else:
+        chunks = [source_files[i : i + SCAN_CHUNK] for i in range(0, len(source_files), SCAN_CHUNK)]
+        for counts in pool.map(_count_categories, [repo_path] * len(chunks), chunks):
+            for category, count in counts.items():
+                by_category[category] += count
 
     actionable = by_category["COMMENT"] + by_category["INLINE"]
     docstrings = by_category["DOCSTRING"]
@@ -411,9 +431,14 @@ def count_todos_simple(repo_path: Path) -> int:
 
 
 def scan_repo(
-    repo: str, repo_base: Path, github_org: str, fetch_ci: bool, skip_docstrings: bool
+    repo: str,
+    repo_base: Path,
+    github_org: str,
+    fetch_ci: bool,
+    skip_docstrings: bool,
+    pool: Executor | None = None,
 ) -> dict[str, Any]:
-    """Scan a single repo for combined status."""
+    """Scan a single repo for combined status (``pool``: see count_todos_smart)."""
     repo_path = (repo_base / repo).resolve()
     resolved_base = repo_base.resolve()
 
@@ -435,7 +460,7 @@ def scan_repo(
 
     # Count TODOs
     if skip_docstrings:
-        todo_data = count_todos_smart(repo_path)
+        todo_data = count_todos_smart(repo_path, pool)
     else:
         todo_count = count_todos_simple(repo_path)
         todo_data = {"actionable": todo_count, "docstrings": 0, "total": todo_count}
@@ -573,6 +598,59 @@ def progress(msg: str, current: int, total: int) -> None:
     print(f"[{current}/{total}] {msg}...", file=sys.stderr)
 
 
+def _start_process_pool(jobs: int) -> ProcessPoolExecutor:
+    """A process pool for ``jobs`` workers, all of them already running.
+
+    Where workers are forked, the pool starts them all on its first task.
+    Doing that here, before any scan threads exist, keeps fork() from
+    copying a process with other threads running.
+    """
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    pool.submit(os.getpid).result()
+    return pool
+
+
+def scan_repos(
+    repos: list[str],
+    repo_base: Path,
+    github_org: str,
+    fetch_ci: bool,
+    skip_docstrings: bool,
+    jobs: int = 1,
+) -> list[dict[str, Any]]:
+    """Scan repos, reporting progress; results are in the order of ``repos``.
+
+    With ``jobs`` > 1, repos are scanned concurrently in threads (PR
+    fetches are mostly waiting on the network) and the smart TODO scan is
+    spread across ``jobs`` processes. Progress is reported as each repo
+    completes.
+    """
+    total = len(repos)
+    if jobs <= 1 or total == 0:
+        results = []
+        for i, repo in enumerate(repos, 1):
+            progress(f"Scanning {repo}", i, total)
+            results.append(scan_repo(repo, repo_base, github_org, fetch_ci, skip_docstrings))
+        return results
+
+    results_by_index: dict[int, dict[str, Any]] = {}
+    with (
+        _start_process_pool(jobs) as pool,  # Workers start before the threads
+        ThreadPoolExecutor(max_workers=min(jobs, total)) as threads,
+    ):
+        futures = {
+            threads.submit(
+                scan_repo, repo, repo_base, github_org, fetch_ci, skip_docstrings, pool
+            ): i
+            for i, repo in enumerate(repos)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            results_by_index[i] = future.result()
+            progress(f"Scanned {repos[i]}", done, total)
+    return [results_by_index[i] for i in range(total)]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Combined status report for repos and PRs.",
@@ -584,6 +662,7 @@ Examples:
   status.py --skip-docstrings     Smart TODO counting (exclude docstrings)
   status.py --json                Output as JSON
   status.py --repo myrepo         Scan specific repo(s)
+  status.py --jobs 8              Scan in parallel (same output as serial)
 """,
     )
     parser.add_argument(
@@ -613,6 +692,14 @@ Examples:
         metavar="ORG",
         help="GitHub org/user (default: GITHUB_ORG env var)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Scan with N worker processes and repos concurrently (0: one per CPU; default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -626,11 +713,8 @@ Examples:
         return 1
 
     # Scan repos
-    results = []
-    total = len(repos)
-    for i, repo in enumerate(repos, 1):
-        progress(f"Scanning {repo}", i, total)
-        results.append(scan_repo(repo, repo_base, org, args.ci, args.skip_docstrings))
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    results = scan_repos(repos, repo_base, org, args.ci, args.skip_docstrings, jobs)
 
     # Output
     if args.output_json:
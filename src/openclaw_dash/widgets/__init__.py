@@ -35,7 +35,7 @@ from openclaw_dash.widgets.gateway_status import (
 )
 from openclaw_dash.widgets.help_panel import HelpScreen
 from openclaw_dash.widgets.input_pane import CommandSent, InputPane
-from openclaw_dash.widgets.logs import LogsPanel, LogsSummaryPanel
+from openclaw_dash.widgets.logs import LogSearchScreen, LogsPanel, LogsSummaryPanel
 from openclaw_dash.widgets.metric_boxes import (
     MetricBox,
     MetricBoxesBar,
@@ -173,6 +173,7 @@ __all__ = [
     # Input pane
     "InputPane",
     "CommandSent",
+    "LogSearchScreen",
     "LogsPanel",
     "LogsSummaryPanel",
     "SecurityPanel",
@@ -1,18 +1,25 @@
 """Logs panel widget for the TUI dashboard.
 
 This module provides widgets for displaying gateway logs with color-coded
-log levels and relative timestamps.
+log levels and relative timestamps, and a search screen over full log
+history backed by collectors.log_index.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
+from rich.markup import escape
+from textual import on, work
 from textual.app import ComposeResult
-from textual.widgets import Static
+from textual.binding import Binding
+from textual.containers import Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Input, Static
 
-from openclaw_dash.collectors import logs
+from openclaw_dash.collectors import log_index, logs
 
 
 class LogsPanel(Static):
@@ -183,3 +190,147 @@ class LogsSummaryPanel(Static):
                 break
 
         content.update(" ".join(parts))
+
+
+class LogSearchScreen(ModalScreen[None]):
+    """Modal full-text search over gateway logs, newest matches first.
+
+    Query syntax: words that must all appear, plus optional ``tag:NAME``
+    (repeatable) and ``since:``/``until:`` bounds given as ISO times or
+    relative ages (``30m``, ``2h``, ``7d``).
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close", priority=True),
+        Binding("pagedown", "next_page", "Next page"),
+        Binding("pageup", "prev_page", "Previous page"),
+    ]
+
+    CSS = """
+    LogSearchScreen {
+        align: center middle;
+    }
+
+    #log-search-container {
+        width: 90%;
+        height: 85%;
+        background: $surface;
+        border: thick $primary;
+        padding: 0 1;
+    }
+
+    #log-search-input {
+        margin-bottom: 1;
+    }
+
+    #log-search-status {
+        color: $text-muted;
+        height: 1;
+    }
+
+    #log-search-scroll {
+        height: 1fr;
+    }
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, query: str = "") -> None:
+        """Initialize the search screen.
+
+        Args:
+            query: Initial search text; searched immediately if non-empty.
+        """
+        super().__init__()
+        self._query = query
+        self._offset = 0
+        self._has_more = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="log-search-container"):
+            yield Input(
+                value=self._query,
+                placeholder="Search logs: words tag:ws since:1h until:2026-02-01",
+                id="log-search-input",
+            )
+            yield Static("", id="log-search-status")
+            with VerticalScroll(id="log-search-scroll"):
+                yield Static("", id="log-search-results")
+
+    def on_mount(self) -> None:
+        self.query_one("#log-search-input", Input).focus()
+        if self._query:
+            self._run_search()
+
+    @on(Input.Submitted, "#log-search-input")
+    def on_search_submitted(self, event: Input.Submitted) -> None:
+        """Start a new search from the first page."""
+        self._query = event.value.strip()
+        self._offset = 0
+        self._run_search()
+
+    def action_next_page(self) -> None:
+        """Show the next page of matches."""
+        if self._has_more:
+            self._offset += self.PAGE_SIZE
+            self._run_search()
+
+    def action_prev_page(self) -> None:
+        """Show the previous page of matches."""
+        if self._offset > 0:
+            self._offset = max(self._offset - self.PAGE_SIZE, 0)
+            self._run_search()
+
+    @work(exclusive=True)
+    async def _run_search(self) -> None:
+        """Search in a thread; the first search of a large log builds its index."""
+        status = self.query_one("#log-search-status", Static)
+        if not self._query:
+            status.update("")
+            self.query_one("#log-search-results", Static).update("")
+            return
+        status.update("[dim]Searching...[/]")
+        try:
+            result = await asyncio.to_thread(
+                log_index.search, self._query, self.PAGE_SIZE, self._offset
+            )
+        except ValueError as e:
+            status.update(f"[red]✗ {escape(str(e))}[/]")
+            return
+        self._show_results(result)
+
+    def _show_results(self, result: dict[str, Any]) -> None:
+        """Render a page of search results."""
+        status = self.query_one("#log-search-status", Static)
+        content = self.query_one("#log-search-results", Static)
+        self._has_more = bool(result.get("has_more"))
+
+        if result.get("error") and not result.get("entries"):
+            status.update(f"[red]✗ {escape(result['error'])}[/]")
+            content.update("")
+            return
+
+        entries = result.get("entries", [])
+        first = result.get("offset", 0) + 1
+        page = f"{first}-{first + len(entries) - 1}" if entries else "0"
+        more = " · PgDn for more" if self._has_more else ""
+        status.update(
+            f"[dim]{page} matches · {result.get('duration_ms', 0):.0f}ms · "
+            f"{len(result.get('files', []))} file(s){more}[/]"
+        )
+        if not entries:
+            content.update("[dim]No matches[/]")
+            return
+
+        lines = []
+        for entry in entries:
+            level = entry.get("level", "debug")
+            color = logs.get_level_color(level)
+            lines.append(
+                f"[dim]{escape(entry.get('timestamp', ''))}[/] "
+                f"[{color}]{logs.get_level_icon(level)}[/] "
+                f"[bold dim]{escape(entry.get('tag', ''))}[/] "
+                f"[{color}]{escape(entry.get('message', ''))}[/]"
+            )
+        content.update("\n".join(lines))
+        self.query_one("#log-search-scroll", VerticalScroll).scroll_home(animate=False)
@@ -21,6 +21,7 @@ from textual.containers import Horizontal
 from textual.widgets import Static
 
 from openclaw_dash.collectors import gateway
+from openclaw_dash.collectors.timeseries import get_timeseries
 from openclaw_dash.metrics import CostTracker, GitHubMetrics, PerformanceMetrics
 from openclaw_dash.widgets.ascii_art import (
     STATUS_SYMBOLS,
@@ -241,9 +242,12 @@ class MetricBoxesBar(Static):
                     uptime_display = uptime[:10]  # Truncate if too long
                 else:
                     uptime_display = uptime
+                # Health-check latency over recent collections
+                latency = get_timeseries().recent("gateway.latency_ms", 6)
+                spark = f" {sparkline(latency, width=6)}" if len(latency) > 1 else ""
                 box.update_metric(
                     value=f"{STATUS_SYMBOLS['ok']} Online",
-                    detail=f"↑ {uptime_display}",
+                    detail=f"↑ {uptime_display}{spark}",
                     status="ok",
                 )
             else:
@@ -29,7 +29,10 @@ from openclaw_dash.widgets.ascii_art import (
 def calculate_cost_forecast(
     daily_costs: list[dict[str, Any]], lookback_days: int = 7
 ) -> dict[str, Any]:
-    """Calculate cost forecast based on recent spending patterns.
+    """Calculate a simple cost forecast by averaging recent daily costs.
+
+    The panels use CostTracker.forecast(), which models time of day and
+    weekday; this is the fallback when that is unavailable.
 
     Args:
         daily_costs: List of daily cost records with 'date' and 'cost' keys.
@@ -197,10 +200,23 @@ class CostsPanel(Static):
         lines.append(separator(30, style="dotted"))
 
         # Cost Forecast section with source-aware data
-        forecast = calculate_cost_forecast(daily_history)
         forecast_source = "[green]API[/]" if has_api_data else "[yellow]Est[/]"
         lines.append(f"[bold] Forecast:[/] {forecast_source}")
-        lines.append(f"  Proj/Mo: ${forecast['projected_monthly']:.2f} {forecast['trend']}")
+        try:
+            forecast = tracker.forecast()
+            month_end = forecast["month_end"]
+            day_end = forecast["day_end"]
+            lines.append(
+                f"  Proj/Mo: ${month_end['expected']:.2f} {forecast['trend']} "
+                f"[dim](${month_end['low']:.2f}-${month_end['high']:.2f})[/]"
+            )
+            lines.append(
+                f"  Today by EOD: ${day_end['expected']:.2f} "
+                f"[dim](${day_end['low']:.2f}-${day_end['high']:.2f})[/]"
+            )
+        except Exception:
+            forecast = calculate_cost_forecast(daily_history)
+            lines.append(f"  Proj/Mo: ${forecast['projected_monthly']:.2f} {forecast['trend']}")
         lines.append(f"  Avg/Day: ${forecast['daily_avg']:.2f}")
 
         lines.append(separator(30, style="dotted"))
@@ -457,8 +473,10 @@ class MetricsPanel(Static):
                 display_cost = today_cost
                 source_indicator = "[yellow]Est[/]"
 
-            # Calculate forecast
-            forecast = calculate_cost_forecast(daily_history)
+            try:
+                forecast = tracker.forecast()
+            except Exception:
+                forecast = calculate_cost_forecast(daily_history)
 
             cost_line = f"[bold] Costs:[/] ${display_cost:.2f} {source_indicator}"
             if cost_values:
@@ -1,15 +1,19 @@
 """System resources panel widget for the TUI dashboard.
 
 This module provides widgets for monitoring system resources including
-CPU, memory, disk, and network usage with visual indicators and sparklines.
+CPU, memory, disk, network usage, container (cgroup) limits and tracked
+processes with visual indicators and sparklines.
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 from textual.app import ComposeResult
 from textual.widgets import Static
 
 from openclaw_dash.collectors import resources
+from openclaw_dash.collectors.timeseries import get_timeseries
 from openclaw_dash.widgets.ascii_art import (
     STATUS_SYMBOLS,
     mini_bar,
@@ -19,11 +23,7 @@ from openclaw_dash.widgets.ascii_art import (
     status_indicator,
 )
 
-# History tracking for sparklines
-_cpu_history: list[float] = []
-_mem_history: list[float] = []
-_net_sent_history: list[float] = []
-_net_recv_history: list[float] = []
+# Samples shown in sparklines (read from the time series store)
 MAX_HISTORY: int = 30
 
 
@@ -61,6 +61,59 @@ def _format_rate(bps: float) -> str:
         return f"{bps / (1024 * 1024):.1f} MB/s"
 
 
+def _format_process(proc: dict[str, Any]) -> str:
+    """One line for a tracked process: CPU, RSS, fds/threads and I/O rate."""
+    cpu = proc.get("cpu_percent")
+    parts = [f"  {proc.get('name', '?')[:10]:<10}"]
+    parts.append(f"{cpu:5.1f}%" if cpu is not None else "    ?%")
+    if proc.get("rss") is not None:
+        parts.append(f"{_format_bytes(proc['rss']):>7}")
+    counts = [f"{proc[k]}{k[0]}" for k in ("fds", "threads") if proc.get(k) is not None]
+    if counts:
+        parts.append("/".join(counts))
+    read_bps, write_bps = proc.get("read_bps"), proc.get("write_bps")
+    if read_bps is not None and write_bps is not None:
+        parts.append(f"io {_format_rate(read_bps + write_bps)}")
+    return " ".join(parts)
+
+
+def _usage_status(pct: float, warning: float) -> str:
+    return "error" if pct > 90 else "warning" if pct > warning else "ok"
+
+
+def _format_container(cgroup: dict[str, Any]) -> list[str]:
+    """Lines for the container's usage against its cgroup limits."""
+    lines = []
+    mem = cgroup.get("memory", {})
+    if mem.get("percent") is not None:
+        pct = mem["percent"]
+        oom = f" [red]{mem['oom_kills']} OOM[/]" if mem.get("oom_kills") else ""
+        lines.append(
+            f"  {status_indicator(_usage_status(pct, 75))} mem {pct:.0f}% "
+            f"{mini_bar(pct / 100, width=8)} "
+            f"{_format_bytes(mem['working_set'])}/{_format_bytes(mem['limit'])}{oom}"
+        )
+    cpu = cgroup.get("cpu", {})
+    if cpu.get("limit_cores") is not None:
+        pct = cpu.get("percent")
+        usage = f"{pct:.0f}% {mini_bar(pct / 100, width=8)}" if pct is not None else "?%"
+        throttled = cpu.get("throttled_percent")
+        status = _usage_status(pct or 0, 70)
+        if throttled:
+            status = "warning" if status == "ok" else status
+        line = f"  {status_indicator(status)} cpu {usage} of {cpu['limit_cores']:g} cores"
+        if throttled:
+            line += f" [yellow]{throttled:.0f}% throttled[/]"
+        lines.append(line)
+    io = cgroup.get("io", {})
+    if io.get("read_bps") is not None and io.get("write_bps") is not None:
+        lines.append(
+            f"  io {STATUS_SYMBOLS['arrow_down']} {_format_rate(io['read_bps'])} "
+            f"{STATUS_SYMBOLS['arrow_up']} {_format_rate(io['write_bps'])}"
+        )
+    return lines
+
+
 class ResourcesPanel(Static):
     """System resources monitoring panel.
 
@@ -69,6 +122,7 @@ class ResourcesPanel(Static):
     - Memory usage with swap information
     - Disk usage for mounted volumes
     - Network I/O rates with sparkline history
+    - Container usage against its cgroup limits, when limits are set
     """
 
     def compose(self) -> ComposeResult:
@@ -85,9 +139,8 @@ class ResourcesPanel(Static):
         Collects current CPU, memory, disk, and network metrics and
         updates the display with visual indicators and sparklines.
         """
-        global _cpu_history, _mem_history, _net_sent_history, _net_recv_history
-
         data = resources.collect_with_rates()
+        history = get_timeseries()
         content = self.query_one("#resources-content", Static)
 
         if not data.get("available"):
@@ -99,14 +152,16 @@ class ResourcesPanel(Static):
 
         lines = []
 
+        # Inside a container, usage against its limits drives the bars and thresholds
+        cpu_pct, mem_pct = resources.effective_usage(data)
+        cgroup = data.get("cgroup") or {}
+        cpu_limited = bool(cgroup.get("cpu", {}).get("limit_cores"))
+        mem_limited = cgroup.get("memory", {}).get("percent") is not None
+        cpu_series = "cgroup.cpu.percent" if cpu_limited else "cpu.percent"
+        mem_series = "cgroup.mem.percent" if mem_limited else "mem.percent"
+
         # === CPU Section ===
         cpu = data.get("cpu", {})
-        cpu_pct = cpu.get("percent", 0)
-
-        # Track history
-        _cpu_history.append(cpu_pct)
-        if len(_cpu_history) > MAX_HISTORY:
-            _cpu_history.pop(0)
 
         # CPU status color based on usage
         if cpu_pct > 90:
@@ -117,7 +172,8 @@ class ResourcesPanel(Static):
             cpu_status = "ok"
 
         cpu_bar = progress_bar(cpu_pct / 100, width=12, show_percent=False, style="smooth")
-        spark = sparkline(_cpu_history, width=10) if len(_cpu_history) > 1 else ""
+        cpu_history = history.recent(cpu_series, MAX_HISTORY)
+        spark = sparkline(cpu_history, width=10) if len(cpu_history) > 1 else ""
 
         lines.append(
             f"{status_indicator(cpu_status)} [bold]CPU:[/] {cpu_pct:.1f}% {cpu_bar} {spark}"
@@ -140,12 +196,6 @@ class ResourcesPanel(Static):
 
         # === Memory Section ===
         mem = data.get("memory", {})
-        mem_pct = mem.get("percent", 0)
-
-        # Track history
-        _mem_history.append(mem_pct)
-        if len(_mem_history) > MAX_HISTORY:
-            _mem_history.pop(0)
 
         # Memory status
         if mem_pct > 90:
@@ -156,7 +206,8 @@ class ResourcesPanel(Static):
             mem_status = "ok"
 
         mem_bar = progress_bar(mem_pct / 100, width=12, show_percent=False, style="smooth")
-        spark = sparkline(_mem_history, width=10) if len(_mem_history) > 1 else ""
+        mem_history = history.recent(mem_series, MAX_HISTORY)
+        spark = sparkline(mem_history, width=10) if len(mem_history) > 1 else ""
 
         lines.append(
             f"{status_indicator(mem_status)} [bold]MEM:[/] {mem_pct:.1f}% {mem_bar} {spark}"
@@ -174,6 +225,12 @@ class ResourcesPanel(Static):
 
         lines.append(separator(40, "dotted"))
 
+        # === Container Section ===
+        if cgroup.get("limited"):
+            lines.append(f"[bold]{STATUS_SYMBOLS['square_empty']} CONTAINER[/]")
+            lines.extend(_format_container(cgroup))
+            lines.append(separator(40, "dotted"))
+
         # === Disk Section ===
         disks = data.get("disks", [])
         if disks:
@@ -205,22 +262,13 @@ class ResourcesPanel(Static):
         rate_sent = net.get("rate_sent_bps")
         rate_recv = net.get("rate_recv_bps")
 
-        # Track rate history for sparklines
-        if rate_sent is not None:
-            _net_sent_history.append(rate_sent / 1024)  # KB/s
-            if len(_net_sent_history) > MAX_HISTORY:
-                _net_sent_history.pop(0)
-
-        if rate_recv is not None:
-            _net_recv_history.append(rate_recv / 1024)  # KB/s
-            if len(_net_recv_history) > MAX_HISTORY:
-                _net_recv_history.pop(0)
-
         lines.append(f"[bold]{STATUS_SYMBOLS['lightning']} NET[/]")
 
         if rate_sent is not None and rate_recv is not None:
-            sent_spark = sparkline(_net_sent_history, width=8) if len(_net_sent_history) > 1 else ""
-            recv_spark = sparkline(_net_recv_history, width=8) if len(_net_recv_history) > 1 else ""
+            sent_history = history.recent("net.sent_bps", MAX_HISTORY)
+            recv_history = history.recent("net.recv_bps", MAX_HISTORY)
+            sent_spark = sparkline(sent_history, width=8) if len(sent_history) > 1 else ""
+            recv_spark = sparkline(recv_history, width=8) if len(recv_history) > 1 else ""
 
             lines.append(f"  {STATUS_SYMBOLS['arrow_up']} {_format_rate(rate_sent)} {sent_spark}")
             lines.append(f"  {STATUS_SYMBOLS['arrow_down']} {_format_rate(rate_recv)} {recv_spark}")
@@ -233,6 +281,14 @@ class ResourcesPanel(Static):
                 f"  {STATUS_SYMBOLS['arrow_down']} {_format_bytes(net.get('bytes_recv', 0))} total"
             )
 
+        # === Processes Section ===
+        running = [p for p in data.get("processes") or [] if p.get("running")]
+        if running:
+            lines.append(separator(40, "dotted"))
+            lines.append(f"[bold]{STATUS_SYMBOLS['diamond']} PROCS[/]")
+            for proc in running:
+                lines.append(_format_process(proc))
+
         content.update("\n".join(lines))
 
 
@@ -264,8 +320,7 @@ class CompactResourcesPanel(Static):
             content.update("[dim]Resources: unavailable[/]")
             return
 
-        cpu = data.get("cpu", {}).get("percent", 0)
-        mem = data.get("memory", {}).get("percent", 0)
+        cpu, mem = resources.effective_usage(data)
 
         cpu_bar = mini_bar(cpu / 100, width=4)
         mem_bar = mini_bar(mem / 100, width=4)
@@ -23,3 +23,77 @@ def demo_mode():
     demo.enable_demo_mode()
     yield
     demo.disable_demo_mode()
+
+
+@pytest.fixture(autouse=True)
+def json_metrics_backend(monkeypatch):
+    """Use the JSON metrics backend regardless of the user's config.toml.
+
+    Tests that exercise the SQLite store pass backend="sqlite" explicitly.
+    """
+    from openclaw_dash.metrics import store
+
+    monkeypatch.setattr(store, "configured_backend", lambda: "json")
+    yield
+    store.close_stores()
+
+
+@pytest.fixture(autouse=True)
+def builtin_pricing(monkeypatch):
+    """Price models from the built-in table regardless of the user's config.toml."""
+    from openclaw_dash.metrics import pricing
+
+    monkeypatch.setattr(pricing, "configured_pricing", lambda: ({}, {}))
+    pricing.reset_resolver()
+    yield
+    pricing.reset_resolver()
+
+
+@pytest.fixture(autouse=True)
+def no_background_retention(monkeypatch):
+    """Keep cost history retention out of collect() unless a test runs it."""
+    from openclaw_dash.metrics import costs
+
+    monkeypatch.setattr(costs, "BACKGROUND_RETENTION", False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_timeseries():
+    """Give every test an empty time series store."""
+    from openclaw_dash.collectors import timeseries
+
+    timeseries.reset_timeseries()
+    yield
+    timeseries.reset_timeseries()
+
+
+@pytest.fixture(autouse=True)
+def fresh_github_data(monkeypatch, tmp_path):
+    """Give every test an empty GitHub data cache that queries through gh."""
+    from openclaw_dash.collectors import github
+
+    monkeypatch.setattr(github, "DEFAULT_CACHE_FILE", tmp_path / "github-cache.json")
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    github.reset_github_data()
+    yield
+    github.reset_github_data()
+
+
+@pytest.fixture(autouse=True)
+def fresh_resource_sampler():
+    """Stop the background resource sampler a test started."""
+    from openclaw_dash.collectors import resources
+
+    yield
+    resources.reset_sampler()
+
+
+@pytest.fixture(autouse=True)
+def fresh_change_gate():
+    """Give every test an empty change gate for repository-derived values."""
+    from openclaw_dash.collectors import fingerprint
+
+    fingerprint.reset_gate()
+    yield
+    fingerprint.reset_gate()
@@ -175,16 +175,28 @@ class TestCollectCIFailures:
         import json
 
         now = datetime.now()
-        mock_response = [
-            {
+        suite = {
+            "conclusion": "FAILURE",
+            "branch": {"name": "main"},
+            "workflowRun": {
                 "databaseId": 123,
-                "name": "CI",
-                "conclusion": "failure",
-                "createdAt": now.isoformat() + "Z",
-                "headBranch": "main",
                 "url": "https://github.com/test/repo/actions/runs/123",
+                "createdAt": now.isoformat() + "Z",
+                "workflow": {"name": "CI"},
+            },
+        }
+        mock_response = {
+            "data": {
+                "r0": {
+                    "nameWithOwner": "test/repo",
+                    "openPullRequests": {"totalCount": 0, "nodes": []},
+                    "mergedPullRequests": {"nodes": []},
+                    "defaultBranchRef": {
+                        "target": {"history": {"nodes": [{"checkSuites": {"nodes": [suite]}}]}}
+                    },
+                }
             }
-        ]
+        }
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout=json.dumps(mock_response),
@@ -193,6 +205,7 @@ class TestCollectCIFailures:
         assert len(result) == 1
         assert result[0].source == "github/repo"
         assert result[0].severity == Severity.CRITICAL  # main branch
+        assert result[0].metadata["run_id"] == 123
 
 
 class TestCollectContextWarnings:
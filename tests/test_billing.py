@@ -1,13 +1,19 @@
 """Tests for the billing collector."""
 
-from datetime import datetime
+import json
+import threading
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
+from openclaw_dash.collectors import billing
 from openclaw_dash.collectors.billing import (
     AnthropicBilling,
     BillingCollector,
+    BillingDayCache,
     BillingResult,
     OpenAIBilling,
     collect,
@@ -266,6 +272,188 @@ class TestBillingCollector:
         assert all(day["has_api_data"] for day in result)
 
 
+class _StubOrganizationAPI(BaseHTTPRequestHandler):
+    """Serves /costs and /usage/completions daily buckets like the OpenAI API.
+
+    Each day costs (day of month) / 100 dollars or uses 1M gpt-4o-mini input
+    tokens; pages hold at most ``page_size`` buckets.
+    """
+
+    requests: list[tuple[str, dict[str, list[str]]]] = []
+    costs_status = 200
+    page_size = 180
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        type(self).requests.append((url.path, query))
+        if url.path.endswith("/costs") and self.costs_status != 200:
+            self.send_response(self.costs_status)
+            self.end_headers()
+            return
+
+        start = int(query["start_time"][0])
+        end = int(query["end_time"][0])
+        starts = list(range(start, end, 86400))
+        offset = int(query.get("page", ["0"])[0])
+        page = starts[offset : offset + min(self.page_size, int(query["limit"][0]))]
+        buckets = []
+        for ts in page:
+            day = datetime.fromtimestamp(ts, timezone.utc).day
+            if url.path.endswith("/costs"):
+                result = {"amount": {"value": day / 100}, "line_item": "completions"}
+            else:
+                result = {"model": "gpt-4o-mini", "input_tokens": 1_000_000, "output_tokens": 0}
+            buckets.append({"start_time": ts, "end_time": ts + 86400, "results": [result]})
+        more = offset + len(page) < len(starts)
+        body = {
+            "data": buckets,
+            "has_more": more,
+            "next_page": str(offset + len(page)) if more else None,
+        }
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDailyCosts:
+    """Tests for ranged daily cost fetching against a local stub of the API."""
+
+    @pytest.fixture
+    def api(self):
+        _StubOrganizationAPI.requests = []
+        _StubOrganizationAPI.costs_status = 200
+        _StubOrganizationAPI.page_size = 180
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOrganizationAPI)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield _StubOrganizationAPI, f"http://127.0.0.1:{server.server_port}/v1/organization"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def collector(self, api, tmp_path):
+        _, base_url = api
+        collector = BillingCollector(cache_file=tmp_path / "billing-days.json")
+        collector.openai.admin_key = "sk-admin-test"
+        collector.openai.BASE_URL = base_url
+        return collector
+
+    def _expected(self, days):
+        today = datetime.now(timezone.utc).date()
+        return [today - timedelta(days=days - 1 - i) for i in range(days)]
+
+    def test_one_request_for_all_days(self, api, collector):
+        stub, _ = api
+        result = collector.get_daily_costs(days=7)
+
+        assert len(stub.requests) == 1
+        path, query = stub.requests[0]
+        assert path.endswith("/costs")
+        assert query["bucket_width"] == ["1d"]
+        assert [d["date"] for d in result] == [d.isoformat() for d in self._expected(7)]
+        for record, day in zip(result, self._expected(7)):
+            assert record["has_api_data"] is True
+            assert record["api_cost"] == pytest.approx(day.day / 100)
+            assert record["providers"]["openai"]["breakdown"] == {"completions": day.day / 100}
+            assert record["providers"]["anthropic"]["source"] == "estimated"
+
+    def test_follows_pages(self, api, collector):
+        stub, _ = api
+        stub.page_size = 3
+        result = collector.get_daily_costs(days=7)
+
+        assert len(stub.requests) == 3
+        assert all(d["has_api_data"] for d in result)
+
+    def test_falls_back_to_ranged_usage(self, api, collector):
+        stub, _ = api
+        stub.costs_status = 500
+        result = collector.get_daily_costs(days=5)
+
+        paths = [path for path, _ in stub.requests]
+        assert paths[0].endswith("/costs")
+        assert paths[1:] == ["/v1/organization/usage/completions"]
+        assert all(d["api_cost"] == pytest.approx(0.15) for d in result)
+
+    def test_cached_days_not_refetched(self, api, collector, tmp_path):
+        stub, _ = api
+        first = collector.get_daily_costs(days=7)
+        stub.requests.clear()
+
+        # A fresh collector reads the same cache file
+        again = BillingCollector(cache_file=tmp_path / "billing-days.json")
+        again.openai.admin_key = "sk-admin-test"
+        again.openai.BASE_URL = collector.openai.BASE_URL
+        assert again.get_daily_costs(days=7) == first
+        assert stub.requests == []
+
+    def test_only_unsettled_days_refetched_after_ttl(self, api, collector):
+        stub, _ = api
+        collector.get_daily_costs(days=7)
+        stub.requests.clear()
+
+        # Age every entry: settled days stay final, today and yesterday expire
+        expired = datetime.now(timezone.utc).timestamp() - billing.TODAY_TTL - 1
+        today = self._expected(1)[0]
+        for entry in collector.cache._days["openai"].values():
+            entry["fetched_at"] = min(entry["fetched_at"], expired)
+        collector.cache._days["openai"][(today - timedelta(days=5)).isoformat()]["fetched_at"] = (
+            expired - 86400 * 30
+        )
+
+        collector.get_daily_costs(days=7)
+
+        assert len(stub.requests) == 1
+        _, query = stub.requests[0]
+        start = datetime.fromtimestamp(int(query["start_time"][0]), timezone.utc).date()
+        assert start == today - timedelta(days=5)
+
+    def test_errors_not_cached(self, api, collector):
+        stub, _ = api
+        collector.openai.BASE_URL = "http://127.0.0.1:1/v1/organization"
+        result = collector.get_daily_costs(days=3)
+
+        assert all(d["has_api_data"] is False for d in result)
+        assert all(d["providers"]["openai"]["error"] for d in result)
+        assert not collector.cache.path.exists()
+
+
+class TestBillingDayCache:
+    """Tests for the per-day billing cache."""
+
+    RESULT = {"source": "api", "cost_usd": 1.0, "error": None}
+
+    def test_settled_day_is_final(self, tmp_path):
+        cache = BillingDayCache(tmp_path / "cache.json")
+        day = date(2025, 1, 10)
+        fetched = datetime(2025, 1, 12, tzinfo=timezone.utc).timestamp()
+        cache.put("openai", {day.isoformat(): self.RESULT}, now=fetched)
+
+        assert cache.get("openai", day, now=fetched + 86400 * 365) == self.RESULT
+
+    def test_unsettled_day_expires(self, tmp_path):
+        cache = BillingDayCache(tmp_path / "cache.json")
+        day = date(2025, 1, 10)
+        fetched = datetime(2025, 1, 10, 12, tzinfo=timezone.utc).timestamp()
+        cache.put("openai", {day.isoformat(): self.RESULT}, now=fetched)
+
+        assert cache.get("openai", day, now=fetched + 10) == self.RESULT
+        assert cache.get("openai", day, now=fetched + billing.TODAY_TTL + 1) is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        assert BillingDayCache(path).get("openai", date(2025, 1, 1)) is None
+
+
 class TestCollectFunction:
     """Tests for the convenience collect function."""
 
@@ -0,0 +1,292 @@
+"""Tests for container resource metrics read from cgroups."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openclaw_dash.collectors import resources
+from openclaw_dash.collectors.cgroups import CgroupMonitor
+from openclaw_dash.sinks.manager import SinkManager
+from openclaw_dash.widgets.resources import ResourcesPanel, _format_container
+
+GIB = 1024**3
+
+
+def _write(base: Path, files: dict[str, str]) -> None:
+    base.mkdir(parents=True, exist_ok=True)
+    for name, text in files.items():
+        (base / name).write_text(text)
+
+
+@pytest.fixture
+def v2(tmp_path):
+    """A cgroup v2 hierarchy with this process in /app.slice."""
+    root = tmp_path / "cgroup"
+    _write(root, {"cgroup.controllers": "cpu io memory\n"})
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text("0::/app.slice\n")
+
+    def write(usage_usec=0, nr_periods=0, nr_throttled=0, rbytes=0, wbytes=0, **files):
+        _write(
+            root / "app.slice",
+            {
+                "memory.current": str(3 * GIB),
+                "memory.max": str(4 * GIB),
+                "memory.stat": f"anon {2 * GIB}\ninactive_file {GIB}\nactive_file 0\n",
+                "memory.events": "low 0\nhigh 0\nmax 4\noom 1\noom_kill 1\n",
+                "cpu.stat": (
+                    f"usage_usec {usage_usec}\nuser_usec 0\nsystem_usec 0\n"
+                    f"nr_periods {nr_periods}\nnr_throttled {nr_throttled}\n"
+                    "throttled_usec 2500000\n"
+                ),
+                "cpu.max": "200000 100000\n",
+                "io.stat": (
+                    f"8:0 rbytes={rbytes} wbytes={wbytes} rios=1 wios=1 dbytes=0 dios=0\n"
+                    "8:16 rbytes=0 wbytes=0 rios=0 wios=0 dbytes=0 dios=0\n"
+                ),
+                **files,
+            },
+        )
+
+    write()
+    return root, proc, write
+
+
+@pytest.fixture
+def v1(tmp_path):
+    """A cgroup v1 hierarchy whose host path is not visible in the container."""
+    root = tmp_path / "cgroup"
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text(
+        "12:memory:/docker/abc\n"
+        "11:cpu,cpuacct:/docker/abc\n"
+        "10:blkio:/docker/abc\n"
+        "0::/system.slice/docker.service\n"
+    )
+    _write(
+        root / "memory",
+        {
+            "memory.usage_in_bytes": str(GIB),
+            "memory.limit_in_bytes": "9223372036854771712",
+            "memory.stat": "cache 0\ntotal_inactive_file 0\n",
+            "memory.oom_control": "oom_kill_disable 0\nunder_oom 0\noom_kill 0\n",
+        },
+    )
+    _write(
+        root / "cpu",
+        {
+            "cpu.cfs_quota_us": "50000\n",
+            "cpu.cfs_period_us": "100000\n",
+            "cpu.stat": "nr_periods 10\nnr_throttled 0\nthrottled_time 0\n",
+        },
+    )
+    _write(root / "cpuacct", {"cpuacct.usage": "0\n"})
+    _write(
+        root / "blkio",
+        {"blkio.throttle.io_service_bytes": "8:0 Read 100\n8:0 Write 50\nTotal 150\n"},
+    )
+    return root, proc
+
+
+class TestDetection:
+    """Tests for finding this process's cgroup."""
+
+    def test_v2(self, v2):
+        root, proc, _ = v2
+        monitor = CgroupMonitor.detect(root, proc)
+        assert monitor.version == 2
+        assert monitor.dirs == {"": root / "app.slice"}
+
+    def test_v1_falls_back_to_visible_ancestor(self, v1):
+        root, proc = v1
+        monitor = CgroupMonitor.detect(root, proc)
+        assert monitor.version == 1
+        assert monitor.dirs == {name: root / name for name in ("memory", "cpu", "cpuacct", "blkio")}
+
+    def test_v1_nested_path(self, v1):
+        root, proc = v1
+        (root / "memory" / "docker" / "abc").mkdir(parents=True)
+        monitor = CgroupMonitor.detect(root, proc)
+        assert monitor.dirs["memory"] == root / "memory" / "docker" / "abc"
+
+    def test_no_cgroups(self, tmp_path):
+        assert CgroupMonitor.detect(tmp_path, tmp_path / "missing") is None
+
+
+class TestSample:
+    """Tests for usage against limits."""
+
+    def test_v2_limits(self, v2):
+        root, proc, _ = v2
+        data = CgroupMonitor.detect(root, proc).sample(now=0.0)
+
+        assert data["version"] == 2 and data["limited"]
+        memory = data["memory"]
+        assert memory["working_set"] == 2 * GIB  # Inactive page cache is excluded
+        assert memory["limit"] == 4 * GIB and memory["percent"] == 50.0
+        assert memory["oom_kills"] == 1
+        assert data["cpu"]["limit_cores"] == 2.0
+        assert data["cpu"]["throttled_seconds"] == 2.5
+        assert data["cpu"]["percent"] is None  # Needs two samples
+        assert data["io"] == {"read_bps": None, "write_bps": None}
+
+    def test_v2_rates_between_samples(self, v2):
+        root, proc, write = v2
+        monitor = CgroupMonitor.detect(root, proc)
+        monitor.sample(now=0.0)
+        # One of two allowed cores busy for 2s; 5 of 20 periods throttled
+        write(usage_usec=2_000_000, nr_periods=20, nr_throttled=5, rbytes=4096, wbytes=2048)
+        data = monitor.sample(now=2.0)
+
+        assert data["cpu"]["percent"] == 50.0
+        assert data["cpu"]["throttled_percent"] == 25.0
+        assert data["io"] == {"read_bps": 2048.0, "write_bps": 1024.0}
+
+    def test_v2_unlimited(self, v2):
+        root, proc, write = v2
+        write(**{"memory.max": "max\n", "cpu.max": "max 100000\n"})
+        data = CgroupMonitor.detect(root, proc).sample(now=0.0)
+        assert not data["limited"]
+        assert data["memory"]["limit"] is None and data["memory"]["percent"] is None
+        assert data["cpu"]["limit_cores"] is None
+
+    def test_v1(self, v1):
+        root, proc = v1
+        monitor = CgroupMonitor.detect(root, proc)
+        monitor.sample(now=0.0)
+        (root / "cpuacct" / "cpuacct.usage").write_text(str(250_000_000))  # 0.25s in ns
+        (root / "cpu" / "cpu.stat").write_text(
+            "nr_periods 20\nnr_throttled 10\nthrottled_time 1500000000\n"
+        )
+        data = monitor.sample(now=1.0)
+
+        assert data["version"] == 1 and data["limited"]
+        assert data["memory"]["limit"] is None  # Huge v1 value means unlimited
+        assert data["memory"]["working_set"] == GIB
+        assert data["cpu"]["limit_cores"] == 0.5
+        assert data["cpu"]["percent"] == 50.0
+        assert data["cpu"]["throttled_percent"] == 100.0
+        assert data["cpu"]["throttled_seconds"] == 1.5
+        assert data["io"] == {"read_bps": 0.0, "write_bps": 0.0}
+
+    def test_counter_reset_gives_no_rate(self, v2):
+        root, proc, write = v2
+        monitor = CgroupMonitor.detect(root, proc)
+        write(usage_usec=5_000_000)
+        monitor.sample(now=0.0)
+        write(usage_usec=1_000)
+        assert monitor.sample(now=1.0)["cpu"]["percent"] is None
+
+    def test_missing_files(self, tmp_path):
+        monitor = CgroupMonitor(2, {"": tmp_path})
+        data = monitor.sample(now=0.0)
+        assert not data["limited"]
+        assert data["memory"]["working_set"] is None
+
+
+class TestReporting:
+    """Tests for the sampler and panel."""
+
+    def test_sampler_records_cgroup(self, v2):
+        root, proc, _ = v2
+        monitor = CgroupMonitor.detect(root, proc)
+        sampler = resources.ResourceSampler()
+        sampler.host = resources.HostInfo()
+        sampler.host.cgroup = monitor
+        data = sampler.sample()
+
+        assert data["cgroup"]["memory"]["percent"] == 50.0
+        assert resources.get_timeseries().latest("cgroup.mem.percent") == 50.0
+
+    def test_format_container(self):
+        lines = _format_container(
+            {
+                "memory": {
+                    "percent": 95.0,
+                    "working_set": 3.8 * GIB,
+                    "limit": 4 * GIB,
+                    "oom_kills": 2,
+                },
+                "cpu": {"limit_cores": 1.5, "percent": 40.0, "throttled_percent": 12.0},
+                "io": {"read_bps": 2048.0, "write_bps": 0.0},
+            }
+        )
+        assert "95%" in lines[0] and "4.0GB" in lines[0] and "2 OOM" in lines[0]
+        assert "of 1.5 cores" in lines[1] and "12% throttled" in lines[1]
+        assert "2.0 KB/s" in lines[2]
+
+        assert _format_container({"memory": {}, "cpu": {"limit_cores": None}, "io": {}}) == []
+
+    @pytest.mark.parametrize(
+        ("cgroup", "expected"),
+        [
+            (None, (20.0, 30.0)),
+            (
+                {"cpu": {"limit_cores": None, "percent": 5.0}, "memory": {"percent": None}},
+                (20.0, 30.0),
+            ),
+            (
+                {"cpu": {"limit_cores": 2.0, "percent": 80.0}, "memory": {"percent": 95.0}},
+                (80.0, 95.0),
+            ),
+            (
+                {"cpu": {"limit_cores": None, "percent": 5.0}, "memory": {"percent": 95.0}},
+                (20.0, 95.0),
+            ),
+        ],
+        ids=["host", "unlimited", "limited", "memory-only"],
+    )
+    def test_effective_usage(self, cgroup, expected):
+        data = {"cpu": {"percent": 20.0}, "memory": {"percent": 30.0}, "cgroup": cgroup}
+        assert resources.effective_usage(data) == expected
+
+    @pytest.mark.parametrize(
+        ("limit", "expected_cpu"), [(None, 12.0), (1.5, 80.0)], ids=["mem-limit", "both"]
+    )
+    def test_sink_publishes_usage_against_limits(self, limit, expected_cpu):
+        resources.get_timeseries().record(
+            {
+                "cpu.percent": 12.0,
+                "mem.percent": 34.0,
+                "cgroup.cpu.percent": 80.0,
+                "cgroup.cpu.limit": limit,
+                "cgroup.mem.percent": 95.0,
+            }
+        )
+        manager = SinkManager()
+        sink = MagicMock()
+        manager._sinks = [sink]
+        with (
+            patch("openclaw_dash.sinks.manager.gateway.collect", return_value={}),
+            patch("openclaw_dash.sinks.manager.alerts.collect", return_value={}),
+        ):
+            manager.refresh_and_publish()
+        payload = sink.publish_batch.call_args[0][0]
+        assert payload["resources"] == {
+            "cpu": {"percent": expected_cpu},
+            "memory": {"percent": 95.0},
+        }
+
+    def test_panel_bars_use_limits(self):
+        data = {
+            "available": True,
+            "cpu": {"percent": 12.0},
+            "memory": {"percent": 34.0},
+            "cgroup": {
+                "limited": True,
+                "memory": {"percent": 95.0, "working_set": 3.8 * GIB, "limit": 4 * GIB},
+                "cpu": {"limit_cores": None, "percent": 80.0},
+                "io": {},
+            },
+        }
+        panel = ResourcesPanel()
+        content = MagicMock()
+        with (
+            patch.object(resources, "collect_with_rates", return_value=data),
+            patch.object(panel, "query_one", return_value=content),
+        ):
+            panel.refresh_data()
+        text = content.update.call_args[0][0]
+        assert "CPU:[/] 12.0%" in text  # No CPU limit: the host's figure
+        assert "[bold]MEM:[/] 95.0%" in text
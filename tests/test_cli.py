@@ -1,5 +1,6 @@
 """Tests for CLI."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -80,3 +81,25 @@ class TestRunTui:
         run_tui(refresh_interval=5)
         mock_app_class.assert_called_once_with(refresh_interval=5)
         mock_app.run.assert_called_once()
+
+
+class TestMetricsBackfill:
+    @patch("openclaw_dash.metrics.PerformanceMetrics")
+    @patch("sys.argv", ["openclaw-dash", "metrics", "--backfill", "--jobs", "4", "--json"])
+    def test_backfill_flag_passes_jobs(self, mock_perf, capsys):
+        mock_perf.return_value.backfill.return_value = {"days": {}, "files": 0}
+        assert main() == 0
+        mock_perf.return_value.backfill.assert_called_once_with(jobs=4)
+        assert '"files": 0' in capsys.readouterr().out
+
+
+class TestMetricsMigrateSqlite:
+    @patch("openclaw_dash.config.load_config")
+    @patch("sys.argv", ["openclaw-dash", "metrics", "--migrate-sqlite", "--json"])
+    def test_migrate_switches_backend(self, mock_load_config, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr("openclaw_dash.metrics.costs.DEFAULT_METRICS_DIR", tmp_path)
+        assert main() == 0
+        mock_load_config.return_value.update.assert_called_once_with(metrics_backend="sqlite")
+        output = json.loads(capsys.readouterr().out)
+        assert output["database"] == str(tmp_path / "metrics.db")
+        assert output["imported"]["daily_costs"] == 0
@@ -1,9 +1,12 @@
 """Tests for data collectors."""
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from openclaw_dash.collectors import activity, channels, cron, gateway, repos, sessions
+from openclaw_dash.collectors.base import get_collector_state
 
 
 class TestGatewayCollector:
@@ -103,6 +106,84 @@ class TestReposCollector:
         result = repos.collect(repos=["nonexistent-xyz-123"])
         assert result["total"] == 0
 
+    def test_repos_collected_concurrently(self, tmp_path, monkeypatch) -> None:
+        """Slow git calls overlap; results keep the requested order."""
+        names = ["slow", "fast", "medium"]
+        delays = {"slow": 0.3, "fast": 0.0, "medium": 0.15}
+        for name in names:
+            (tmp_path / name).mkdir()
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+
+        def fake_last_commit(path):
+            time.sleep(delays[path.name])
+            return f"{path.name} ago", None
+
+        monkeypatch.setattr(repos, "_get_last_commit", fake_last_commit)
+        finished = []
+
+        started = time.monotonic()
+        result = repos.collect(repos=names, max_workers=3, on_repo=finished.append)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.4  # Not 0.45s of serial sleeps
+        first_seen = list(dict.fromkeys(r["name"] for r in finished))
+        assert first_seen == ["fast", "medium", "slow"]
+        assert [r["name"] for r in result["repos"]] == names
+        timings = get_collector_state("repos").timings_ms
+        assert timings["git:slow"] >= 300
+        assert set(timings) == {"github"} | {f"git:{name}" for name in names}
+
+    def test_slow_github_does_not_hold_up_git(self, tmp_path, monkeypatch) -> None:
+        """Entries arrive before a slow GitHub batch; PR counts are filled in after."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+        monkeypatch.setattr(repos, "repo_slug", lambda path: f"o/{path.name}")
+        monkeypatch.setattr(repos, "_get_last_commit", lambda path: ("1 hour ago", None))
+        github = MagicMock()
+        github.rate_limit.return_value = None
+
+        def slow_batch(slugs):
+            time.sleep(0.3)
+            return {slug: MagicMock(error=None, open_pr_count=3) for slug in slugs}
+
+        github.repos.side_effect = slow_batch
+        monkeypatch.setattr(repos, "get_github_data", lambda: github)
+        calls = []
+
+        started = time.monotonic()
+        result = repos.collect(
+            repos=["a", "b"],
+            max_workers=2,
+            on_repo=lambda r: calls.append((time.monotonic() - started, dict(r))),
+        )
+
+        early = [entry for at, entry in calls if at < 0.25]
+        assert sorted(entry["name"] for entry in early) == ["a", "b"]
+        assert all(entry["open_prs"] is None for entry in early)
+        assert [entry["open_prs"] for _, entry in calls[2:]] == [3, 3]
+        assert [(r["open_prs"], r["health"]) for r in result["repos"]] == [(3, "MEDIUM")] * 2
+        timings = get_collector_state("repos").timings_ms
+        assert timings["github"] >= 300
+        assert timings["git:a"] < 250
+
+    def test_worker_limit(self, tmp_path, monkeypatch) -> None:
+        """No more than max_workers repositories are collected at once."""
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / name).mkdir()
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+        threads = set()
+
+        def fake_last_commit(path):
+            threads.add(threading.current_thread().name)
+            return "now", None
+
+        monkeypatch.setattr(repos, "_get_last_commit", fake_last_commit)
+        result = repos.collect(repos=["a", "b", "c", "d"], max_workers=1)
+
+        assert result["total"] == 4
+        assert len(threads) == 1
+
 
 class TestActivityCollector:
     """Tests for the activity collector."""
@@ -36,7 +36,43 @@ class TestConfig:
             "models": {
                 "custom_paths": [],
             },
+            "metrics": {
+                "backend": "json",
+                "retention": {"raw_days": 30, "daily_days": 365},
+            },
+            "pricing": {"models": {}, "aliases": {}},
+            "repos": {"workers": 4},
+        }
+
+    def test_from_dict_metrics_backend(self):
+        """Metrics backend is read from the [metrics] table."""
+        config = Config.from_dict({"metrics": {"backend": "sqlite"}})
+        assert config.metrics_backend == "sqlite"
+        assert Config.from_dict({}).metrics_backend == "json"
+
+    def test_from_dict_metrics_retention(self):
+        """Retention tiers are read from the [metrics.retention] table."""
+        config = Config.from_dict({"metrics": {"retention": {"raw_days": 7, "daily_days": 0}}})
+        assert config.retention_raw_days == 7
+        assert config.retention_daily_days == 0
+        assert Config.from_dict({"metrics": {}}).retention_daily_days == 365
+
+    def test_from_dict_pricing(self):
+        """Extra model prices and aliases are read from the [pricing] table."""
+        data = {
+            "pricing": {
+                "models": {"my-model": {"input": 1.0, "output": 2.0}},
+                "aliases": {"sonnet": "claude-sonnet-4-5"},
+            }
         }
+        config = Config.from_dict(data)
+        assert config.pricing_models == {"my-model": {"input": 1.0, "output": 2.0}}
+        assert config.pricing_aliases == {"sonnet": "claude-sonnet-4-5"}
+
+    def test_from_dict_repo_workers(self):
+        """Repository collection concurrency is read from the [repos] table."""
+        assert Config.from_dict({"repos": {"workers": 8}}).repo_workers == 8
+        assert Config.from_dict({}).repo_workers == 4
 
     def test_from_dict(self):
         """Config deserializes from dictionary."""
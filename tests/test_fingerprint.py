@@ -0,0 +1,187 @@
+"""Tests for repository change detection."""
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from openclaw_dash.collectors import fingerprint, repos
+from openclaw_dash.collectors.fingerprint import ChangeGate, repo_fingerprint
+from openclaw_dash.metrics import github as github_metrics
+from openclaw_dash.metrics.github import GitHubMetrics
+
+ENV = {
+    "GIT_AUTHOR_NAME": "Ada",
+    "GIT_AUTHOR_EMAIL": "ada@example.com",
+    "GIT_COMMITTER_NAME": "Ada",
+    "GIT_COMMITTER_EMAIL": "ada@example.com",
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(path, *args):
+    subprocess.run(["git", *args], cwd=path, capture_output=True, check=True, env=ENV)
+
+
+def commit(path, message):
+    (path / "file.txt").write_text(message)
+    git(path, "add", "file.txt")
+    git(path, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    commit(path, "first")
+    return path
+
+
+@needs_git
+class TestRepoFingerprint:
+    """Tests for repo_fingerprint()."""
+
+    def test_stable_without_changes(self, repo):
+        assert repo_fingerprint(repo) == repo_fingerprint(repo)
+        (repo / "untracked.txt").write_text("not staged")
+        assert repo_fingerprint(repo) == repo_fingerprint(repo)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda repo: commit(repo, "second"),
+            lambda repo: git(repo, "branch", "feature"),
+            lambda repo: git(repo, "pack-refs", "--all"),
+            lambda repo: git(repo, "checkout", "-q", "-b", "other"),
+            lambda repo: [(repo / "new.txt").write_text("x"), git(repo, "add", "new.txt")],
+        ],
+        ids=["commit", "branch", "pack-refs", "checkout", "stage"],
+    )
+    def test_changes(self, repo, change):
+        before = repo_fingerprint(repo)
+        change(repo)
+        assert repo_fingerprint(repo) != before
+
+    def test_not_a_repo(self, tmp_path):
+        assert repo_fingerprint(tmp_path) is None
+
+
+class TestChangeGate:
+    """Tests for ChangeGate."""
+
+    def test_recomputes_only_on_change(self):
+        gate = ChangeGate()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert gate.get("key", ("a",), compute) == 1
+        assert gate.get("key", ("a",), compute) == 1
+        assert gate.get("key", ("b",), compute) == 2
+        assert gate.get("key", None, compute) == 3  # No fingerprint: never cached
+        assert (gate.hits, gate.misses) == (1, 3)
+
+    def test_forget(self):
+        gate = ChangeGate()
+        gate.get(("a", 1), ("x",), lambda: 1)
+        gate.get(("b", 2), ("x",), lambda: 2)
+        gate.forget(lambda key: key[0] == "a")
+        assert gate.get(("a", 1), ("x",), lambda: 3) == 3
+        assert gate.get(("b", 2), ("x",), lambda: 4) == 2
+
+    def test_errors_are_not_cached(self):
+        gate = ChangeGate()
+
+        def fail():
+            raise TimeoutError
+
+        with pytest.raises(TimeoutError):
+            gate.get("key", ("a",), fail)
+        assert gate.get("key", ("a",), lambda: "ok") == "ok"
+
+    @needs_git
+    def test_repo(self, repo):
+        gate = ChangeGate()
+        calls = []
+        gate.repo(repo, "n", lambda: calls.append(1))
+        gate.repo(repo, "n", lambda: calls.append(1))
+        assert len(calls) == 1
+        commit(repo, "second")
+        gate.repo(repo, "n", lambda: calls.append(1))
+        assert len(calls) == 2
+
+        gate.invalidate(repo)
+        gate.repo(repo, "n", lambda: calls.append(1))
+        assert len(calls) == 3
+
+    @needs_git
+    @pytest.mark.skipif(not fingerprint.INOTIFY_AVAILABLE, reason="inotify not available")
+    def test_watch(self, repo, monkeypatch):
+        gate = ChangeGate(watch=True)
+        assert gate.watching
+        first = gate.fingerprint(repo)
+
+        stats = []
+        real_stamp = fingerprint._stamp
+        monkeypatch.setattr(fingerprint, "_stamp", lambda p: stats.append(p) or real_stamp(p))
+        assert gate.fingerprint(repo) == first
+        assert stats == []  # No events: nothing re-read
+
+        commit(repo, "second")
+        assert gate.fingerprint(repo) != first
+        assert stats
+        gate.close()
+
+
+@needs_git
+class TestGatedCollectors:
+    """Tests for the collectors using the process-wide gate."""
+
+    def test_last_commit_read_once(self, repo, monkeypatch):
+        calls = []
+        real = repos._last_commit_time
+        monkeypatch.setattr(repos, "_last_commit_time", lambda p: calls.append(p) or real(p))
+
+        assert repos._get_last_commit(repo)[0].endswith("ago")
+        assert repos._get_last_commit(repo)[0].endswith("ago")
+        assert len(calls) == 1
+
+        commit(repo, "second")
+        repos._get_last_commit(repo)
+        assert len(calls) == 2
+
+    def test_todo_trends_parse_once(self, tmp_path, monkeypatch):
+        snapshots = tmp_path / "repos"
+        (snapshots / "app").mkdir(parents=True)
+        snapshot = snapshots / "app" / "todo-1.json"
+        snapshot.write_text(json.dumps({"todo_count": 3}))
+        monkeypatch.setattr(github_metrics, "REPOS_SNAPSHOT_DIR", snapshots)
+        reads = []
+        real = github_metrics._read_todo_count
+        monkeypatch.setattr(
+            github_metrics, "_read_todo_count", lambda f: reads.append(f) or real(f)
+        )
+        metrics = GitHubMetrics(metrics_dir=tmp_path)
+
+        assert metrics.get_todo_trends()["repos"]["app"][0]["count"] == 3
+        assert metrics.get_todo_trends()["repos"]["app"][0]["count"] == 3
+        assert len(reads) == 1
+
+        snapshot.write_text(json.dumps({"items": [1, 2, 3, 4]}))
+        os.utime(snapshot, ns=(0, 1_800_000_000 * 10**9))
+        assert metrics.get_todo_trends()["repos"]["app"][0]["count"] == 4
+        assert len(reads) == 2
+
+        # A deleted snapshot's count does not stay in the process-wide gate
+        assert ("todo_snapshot", snapshot) in fingerprint.get_gate()._values
+        snapshot.unlink()
+        assert metrics.get_todo_trends()["repos"] == {}
+        assert ("todo_snapshot", snapshot) not in fingerprint.get_gate()._values
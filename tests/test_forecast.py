@@ -0,0 +1,193 @@
+"""Tests for cost forecasting."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from openclaw_dash.metrics import CostTracker, forecast
+from openclaw_dash.metrics.forecast import forecast_costs
+from openclaw_dash.metrics.store import MetricsStore
+
+
+def _days(end: date, costs: list[float]) -> dict[str, float]:
+    """Daily costs for the days before ``end``, oldest first."""
+    return {
+        (end - timedelta(days=len(costs) - i)).isoformat(): cost for i, cost in enumerate(costs)
+    }
+
+
+def _session(key, inp, out):
+    return {
+        "key": key,
+        "model": "gpt-4o",
+        "inputTokens": inp,
+        "outputTokens": out,
+        "totalTokens": inp + out,
+    }
+
+
+def _collect(tracker, *sessions):
+    with patch("openclaw_dash.collectors.sessions.collect") as mock_collect:
+        mock_collect.return_value = {"sessions": list(sessions)}
+        return tracker.collect()
+
+
+class TestForecastCosts:
+    """Tests for the forecasting model."""
+
+    def test_steady_spend(self):
+        now = datetime(2026, 3, 10, 12, 0)
+        daily = _days(now.date(), [2.0] * 28)
+        daily["2026-03-10"] = 1.0
+
+        result = forecast_costs(daily, {}, now)
+
+        assert result["daily_avg"] == pytest.approx(2.0)
+        assert result["day_end"]["expected"] == pytest.approx(2.0)
+        # Nine days of March so far, today, then 21 more days at $2
+        month_end = result["month_end"]
+        assert month_end["so_far"] == pytest.approx(19.0)
+        assert month_end["expected"] == pytest.approx(62.0)
+        assert result["projected_monthly"] == pytest.approx(62.0)
+        # No day-to-day variation: the band collapses onto the expectation
+        assert month_end["low"] == pytest.approx(month_end["high"])
+        assert result["trend"] == "→"
+
+    def test_weekday_seasonality(self):
+        # Weekdays cost $3, weekends $0.50
+        now = datetime(2026, 3, 14, 0, 0)  # A Saturday
+        daily = {}
+        for i in range(1, 29):
+            day = now.date() - timedelta(days=i)
+            daily[day.isoformat()] = 0.5 if day.weekday() >= 5 else 3.0
+
+        result = forecast_costs(daily, {}, now)
+
+        factors = result["weekday_factors"]
+        assert factors[5] < 0.5 < 1.2 < factors[0]
+        assert result["day_end"]["expected"] < 1.0
+
+    def test_hour_profile_sets_day_end(self):
+        # All spend falls between 09:00 and 17:00
+        now = datetime(2026, 3, 10, 18, 0)
+        daily = _days(now.date(), [8.0] * 14)
+        hourly = {f"{day}T{hour:02d}": 1.0 for day in daily for hour in range(9, 17)}
+        daily["2026-03-10"] = 8.0
+
+        result = forecast_costs(daily, hourly, now)
+        # Only the uniform prior is left in the evening
+        assert result["day_end"]["expected"] < 8.0 + 8.0 * 0.3
+        assert result["day_end"]["expected"] > 8.0
+
+        morning = forecast_costs(daily | {"2026-03-10": 0.0}, hourly, now.replace(hour=6))
+        assert morning["day_end"]["expected"] > 6.0
+
+    def test_band_widens_and_respects_spend(self):
+        now = datetime(2026, 3, 2, 12, 0)
+        daily = _days(now.date(), [1.0, 5.0] * 14)
+        daily["2026-03-02"] = 4.0
+
+        result = forecast_costs(daily, {}, now)
+
+        day_end, month_end = result["day_end"], result["month_end"]
+        assert day_end["low"] >= day_end["so_far"] == 4.0
+        assert month_end["low"] >= month_end["so_far"]
+        assert month_end["high"] - month_end["expected"] > day_end["high"] - day_end["expected"]
+
+    def test_without_history_extrapolates_today(self):
+        now = datetime(2026, 3, 10, 12, 0)
+        result = forecast_costs({"2026-03-10": 1.0}, {}, now)
+
+        assert result["days_observed"] == 0
+        assert result["daily_avg"] == pytest.approx(2.0)
+        assert result["day_end"]["expected"] == pytest.approx(2.0)
+
+    def test_empty(self):
+        result = forecast_costs({}, {}, datetime(2026, 3, 10, 12, 0))
+        assert result["month_end"]["expected"] == 0.0
+        assert result["trend"] == "→"
+
+    def test_trend(self):
+        now = datetime(2026, 3, 20, 12, 0)
+        result = forecast_costs(_days(now.date(), [1.0] * 7 + [2.0] * 7), {}, now)
+        assert result["trend"] == "↑"
+        assert result["trend_pct"] == pytest.approx(100.0)
+
+    def test_numpy_matches_pure_python(self, monkeypatch):
+        pytest.importorskip("numpy")
+        now = datetime(2026, 3, 17, 15, 30)
+        daily = _days(now.date(), [0.5 + (i % 7) * 0.3 + (i % 3) * 0.1 for i in range(30)])
+        hourly = {f"{day}T{(i * 5) % 24:02d}": cost for i, (day, cost) in enumerate(daily.items())}
+
+        with_numpy = forecast_costs(daily, hourly, now)
+        monkeypatch.setattr(forecast, "NUMPY_AVAILABLE", False)
+        assert forecast_costs(daily, hourly, now) == pytest.approx(with_numpy)
+
+
+class TestTrackerForecast:
+    """Tests for CostTracker.forecast()."""
+
+    def test_records_hourly_buckets(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        _collect(tracker, _session("a", 1_000_000, 0))
+
+        hourly = tracker._load_history()["hourly"]
+        assert sum(hourly.values()) == pytest.approx(2.5)
+        assert all(len(hour) == 13 for hour in hourly)
+
+    def test_cached_until_new_cost_event(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        _collect(tracker, _session("a", 1_000_000, 0))
+        now = datetime.now()
+
+        with patch("openclaw_dash.metrics.costs.forecast_costs", wraps=forecast_costs) as fit:
+            first = tracker.forecast(now)
+            assert CostTracker(metrics_dir=tmp_path).forecast(now) is first
+            assert fit.call_count == 1
+
+            _collect(tracker, _session("a", 2_000_000, 0))
+            second = tracker.forecast(now)
+            assert fit.call_count == 2
+            assert second["day_end"]["so_far"] == pytest.approx(5.0)
+
+            tracker.forecast(now + timedelta(hours=1))
+            assert fit.call_count == 3
+
+    def test_sqlite_matches_json(self, tmp_path):
+        json_tracker = CostTracker(metrics_dir=tmp_path / "json", backend="json")
+        sqlite_tracker = CostTracker(metrics_dir=tmp_path / "sqlite", backend="sqlite")
+        for tracker in (json_tracker, sqlite_tracker):
+            _collect(tracker, _session("a", 1_000_000, 0))
+            _collect(tracker, _session("a", 1_500_000, 100_000))
+
+        now = datetime.now()
+        assert sqlite_tracker.forecast(now) == json_tracker.forecast(now)
+        hours = sqlite_tracker.store.cost_hours(now.date().isoformat())
+        assert hours == pytest.approx(json_tracker._load_history()["hourly"])
+
+    def test_store_retention_drops_hours(self, tmp_path):
+        store = MetricsStore(tmp_path / "metrics.db")
+        for ts in ("2026-01-01T10:00:00", "2026-02-01T10:00:00"):
+            store.record_cost_event(
+                {
+                    "day": ts[:10],
+                    "ts": ts,
+                    "key": "a",
+                    "model": "gpt-4o",
+                    "in": 1,
+                    "out": 1,
+                    "cost": 1.0,
+                    "total_tokens": 2,
+                    "input_tokens": 1,
+                    "output_tokens": 1,
+                }
+            )
+        store.apply_cost_retention("2026-01-15", None)
+        assert store.cost_hours("2025-01-01") == {"2026-02-01T10": 1.0}
+        store.close()
+
+    def test_demo_mode(self, tmp_path, demo_mode):
+        result = CostTracker(metrics_dir=tmp_path).forecast()
+        assert result["month_end"]["expected"] > 0
+        assert result["day_end"]["so_far"] == pytest.approx(2.45)
@@ -0,0 +1,222 @@
+"""Tests for reading git metadata directly from .git."""
+
+import shutil
+import subprocess
+import time
+from datetime import timezone
+
+import pytest
+
+from openclaw_dash.automation.backup import BackupConfig, BackupVerifier
+from openclaw_dash.automation.pr_auto import PRAutomation
+from openclaw_dash.collectors import git_reader, repos
+from openclaw_dash.collectors.git_reader import GitReader, find_worktree, relative_date
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+ENV = {
+    "GIT_AUTHOR_NAME": "Ada",
+    "GIT_AUTHOR_EMAIL": "ada@example.com",
+    "GIT_COMMITTER_NAME": "Ada",
+    "GIT_COMMITTER_EMAIL": "ada@example.com",
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+
+def git(path, *args, date=None):
+    env = dict(ENV)
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    result = subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True, env=env
+    )
+    return result.stdout.strip()
+
+
+def commit(path, message, date=None):
+    (path / "file.txt").write_text(message)
+    git(path, "add", "file.txt")
+    git(path, "commit", "-q", "-m", message, date=date)
+    return git(path, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    commit(path, "first", date="2026-01-02T03:04:05+02:00")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fresh_readers():
+    yield
+    git_reader.reset_readers()
+
+
+class TestRefs:
+    """Tests for HEAD, loose and packed refs."""
+
+    def test_head(self, repo):
+        sha = git(repo, "rev-parse", "HEAD")
+        head = GitReader(repo).head()
+        assert head.branch == "main" and head.sha == sha
+
+    def test_packed_refs(self, repo):
+        git(repo, "branch", "feature")
+        git(repo, "pack-refs", "--all")
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+
+        reader = GitReader(repo)
+        sha = git(repo, "rev-parse", "HEAD")
+        assert reader.head().sha == sha
+        assert reader.refs("refs/heads/") == {"refs/heads/main": sha, "refs/heads/feature": sha}
+
+    def test_detached_and_unborn(self, repo):
+        sha = git(repo, "rev-parse", "HEAD")
+        git(repo, "checkout", "-q", "--detach")
+        assert GitReader(repo).head() == git_reader.Head(None, sha)
+
+        git(repo, "checkout", "-q", "--orphan", "empty")
+        assert GitReader(repo).head() == git_reader.Head("empty", None)
+
+    def test_refs_reread_when_changed(self, repo):
+        reader = GitReader(repo)
+        first = reader.head().sha
+        second = commit(repo, "second")
+        assert second != first
+        assert reader.head().sha == second
+
+    def test_worktree(self, repo, tmp_path):
+        git(repo, "worktree", "add", "-q", "-b", "wt", str(tmp_path / "wt"))
+        head = GitReader(tmp_path / "wt").head()
+        assert head.branch == "wt" and head.sha == git(repo, "rev-parse", "HEAD")
+        assert find_worktree(tmp_path / "wt") == tmp_path / "wt"
+
+    def test_find_worktree(self, repo, tmp_path):
+        (repo / "sub" / "dir").mkdir(parents=True)
+        assert find_worktree(repo / "sub" / "dir") == repo
+        assert find_worktree(tmp_path) is None
+
+    def test_remotes(self, repo):
+        git(repo, "remote", "add", "origin", "https://github.com/o/n.git")
+        assert GitReader(repo).remotes() == ["origin"]
+
+
+class TestCommits:
+    """Tests for reading commits from loose objects and packs."""
+
+    def test_loose_commit(self, repo):
+        commit = GitReader(repo).last_commit()
+        assert commit.author == "Ada"
+        assert commit.timestamp == int(git(repo, "log", "-1", "--format=%ct"))
+        assert commit.tz_offset == 120
+        assert commit.committed_at.isoformat() == "2026-01-02T03:04:05+02:00"
+
+    def test_packed_commits(self, repo):
+        shas = [commit(repo, f"change {i}") for i in range(5)]
+        git(repo, "gc", "-q")
+        assert not list((repo / ".git" / "objects").glob("??/*"))
+
+        reader = GitReader(repo)
+        for sha in shas:
+            assert reader.commit(sha).timestamp == int(git(repo, "log", "-1", "--format=%ct", sha))
+        assert reader.git_calls == 0
+
+    def test_new_pack_is_found(self, repo):
+        reader = GitReader(repo)
+        reader.last_commit()
+        sha = commit(repo, "second")
+        git(repo, "gc", "-q")
+        assert reader.commit(sha).sha == sha
+
+    def test_falls_back_to_git(self, repo, monkeypatch):
+        def unsupported(self, sha):
+            raise git_reader._Unsupported("deltified")
+
+        monkeypatch.setattr(GitReader, "_read_commit", unsupported)
+        reader = GitReader(repo)
+        assert reader.last_commit().author == "Ada"
+        assert reader.git_calls == 1
+        reader.last_commit()
+        assert reader.git_calls == 1  # Cached by SHA
+
+    def test_missing_commit(self, repo):
+        assert GitReader(repo).commit("0" * 40) is None
+
+
+class TestRelativeDate:
+    """Tests for git's "%ar" relative dates."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (1, "1 second ago"),
+            (89, "89 seconds ago"),
+            (90, "2 minutes ago"),
+            (3 * 3600, "3 hours ago"),
+            (35 * 3600, "35 hours ago"),
+            (2 * 86400, "2 days ago"),
+            (20 * 86400, "3 weeks ago"),
+            (100 * 86400, "3 months ago"),
+            (400 * 86400, "1 year, 1 month ago"),
+            (730 * 86400, "2 years ago"),
+            (3000 * 86400, "8 years ago"),
+            (-5, "in the future"),
+        ],
+    )
+    def test_matches_git(self, seconds, expected):
+        now = 1_800_000_000
+        assert relative_date(now - seconds, now) == expected
+
+
+class TestCallers:
+    """Tests for the collectors and automation reading .git directly."""
+
+    def test_last_commit_without_git(self, repo, monkeypatch):
+        def no_git(*args, **kwargs):
+            raise AssertionError("git was run")
+
+        monkeypatch.setattr(repos.subprocess, "run", no_git)
+        last_commit, error = repos._get_last_commit(repo)
+        assert error is None and last_commit.endswith("ago")
+
+    def test_backup_sync_status(self, repo, tmp_path):
+        clone = tmp_path / "clone"
+        git(tmp_path, "clone", "-q", str(repo), str(clone))
+        verifier = BackupVerifier(BackupConfig(workspace_path=clone))
+
+        check = verifier.check_sync_status()
+        assert check.is_git_repo and check.has_remote
+        assert check.branch == "main" and check.status == "synced"
+        assert check.last_commit_date.isoformat() == "2026-01-02T03:04:05"
+
+        commit(clone, "local")
+        check = verifier.check_sync_status()
+        assert check.status == "ahead" and check.ahead == 1
+
+        config = BackupConfig(workspace_path=tmp_path / "missing")
+        assert BackupVerifier(config).check_sync_status().status == "not-a-repo"
+
+    def test_remote_branches(self, repo, tmp_path):
+        git(repo, "checkout", "-q", "-b", "old-feature")
+        commit(repo, "old", date="2025-06-01T00:00:00+00:00")
+        git(repo, "checkout", "-q", "-b", "new-feature", "main")
+        commit(repo, "new", date=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()))
+        git(repo, "checkout", "-q", "main")
+        clone = tmp_path / "clone"
+        git(tmp_path, "clone", "-q", str(repo), str(clone))
+
+        branches = PRAutomation(clone).get_remote_branches()
+
+        assert [b.name for b in branches] == ["new-feature", "old-feature"]
+        old = branches[1]
+        assert old.author == "Ada" and not old.is_merged
+        assert old.last_commit_date.tzinfo == timezone.utc
+        assert old.last_commit_date.year == 2025
+
+        (clone / "src").mkdir()
+        from_subdir = PRAutomation(clone / "src").get_remote_branches()
+        assert [b.name for b in from_subdir] == ["new-feature", "old-feature"]
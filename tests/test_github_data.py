@@ -0,0 +1,634 @@
+"""Tests for the batched GitHub data layer."""
+
+import json
+import re
+import subprocess
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openclaw_dash.automation.pr_auto import MergeConfig, PRAutomation
+from openclaw_dash.collectors import alerts, github, repos
+from openclaw_dash.collectors.github import (
+    GitHubData,
+    RateLimit,
+    build_query,
+    get_github_data,
+    repo_slug,
+    reset_github_data,
+)
+from openclaw_dash.metrics.github import GitHubMetrics
+
+_ALIAS = re.compile(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)')
+
+
+def _iso(hours_ago: float) -> str:
+    ts = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _suite(run_id: int, branch: str, hours_ago: float, conclusion: str = "FAILURE") -> dict:
+    return {
+        "conclusion": conclusion,
+        "branch": {"name": branch},
+        "workflowRun": {
+            "databaseId": run_id,
+            "url": f"https://github.com/o/r/actions/runs/{run_id}",
+            "createdAt": _iso(hours_ago),
+            "workflow": {"name": "CI"},
+        },
+    }
+
+
+def _repository(owner: str, name: str) -> dict:
+    """A repository result: two open PRs, one merged PR and two failed runs."""
+    return {
+        "nameWithOwner": f"{owner}/{name}",
+        "openPullRequests": {
+            "totalCount": 2,
+            "nodes": [
+                {
+                    "number": 7,
+                    "title": "Add feature",
+                    "state": "OPEN",
+                    "headRefName": "feature",
+                    "createdAt": _iso(30),
+                    "mergedAt": None,
+                    "url": f"https://github.com/{owner}/{name}/pull/7",
+                    "author": {"login": "alice"},
+                    "mergeable": "MERGEABLE",
+                    "reviews": {"totalCount": 1},
+                    "labels": {"nodes": [{"name": "ready"}]},
+                    "commits": {
+                        "nodes": [
+                            {
+                                "commit": {
+                                    "statusCheckRollup": {"state": "SUCCESS"},
+                                    "checkSuites": {"nodes": [_suite(2, "feature", 1, "SUCCESS")]},
+                                }
+                            }
+                        ]
+                    },
+                },
+                {
+                    "number": 8,
+                    "title": "WIP",
+                    "state": "OPEN",
+                    "headRefName": "wip",
+                    "createdAt": _iso(2),
+                    "mergedAt": None,
+                    "url": f"https://github.com/{owner}/{name}/pull/8",
+                    "author": None,
+                    "mergeable": "CONFLICTING",
+                    "reviews": {"totalCount": 0},
+                    "labels": {"nodes": []},
+                    "commits": {
+                        "nodes": [
+                            {
+                                "commit": {
+                                    "statusCheckRollup": {"state": "FAILURE"},
+                                    "checkSuites": {"nodes": [_suite(3, "wip", 2)]},
+                                }
+                            }
+                        ]
+                    },
+                },
+            ],
+        },
+        "mergedPullRequests": {
+            "nodes": [
+                {
+                    "number": 5,
+                    "title": "Fix bug",
+                    "state": "MERGED",
+                    "headRefName": "fix",
+                    "createdAt": "2026-01-01T00:00:00Z",
+                    "mergedAt": "2026-01-01T06:00:00Z",
+                    "url": f"https://github.com/{owner}/{name}/pull/5",
+                    "author": {"login": "bob"},
+                }
+            ]
+        },
+        "defaultBranchRef": {
+            "target": {
+                "history": {
+                    "nodes": [
+                        {"checkSuites": {"nodes": [_suite(1, "main", 1), _suite(3, "wip", 2)]}},
+                        {"checkSuites": {"nodes": [_suite(4, "main", 48)]}},
+                    ]
+                }
+            }
+        },
+    }
+
+
+class _StubGraphQL(BaseHTTPRequestHandler):
+    """Answers batched repository queries like the GitHub GraphQL API.
+
+    Repositories named "missing" are reported as GraphQL errors. GET
+    requests serve /user and /users/alice/events with an ETag, answering
+    304 when the client already has the current version.
+    """
+
+    queries: list[list[str]] = []
+    gets: list[tuple[str, str | None]] = []
+    status = 200
+    remaining = 4000
+    events_etag = '"e1"'
+    poll_interval = 0
+
+    def _rate_headers(self, resource):
+        self.send_header("X-RateLimit-Resource", resource)
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", str(self.remaining))
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+
+    def _reject(self):
+        if self.status != 200 or self.headers.get("Authorization") != "bearer t":
+            self.send_response(self.status if self.status != 200 else 401)
+            self.end_headers()
+            return True
+        return False
+
+    def do_GET(self):
+        type(self).gets.append((self.path, self.headers.get("If-None-Match")))
+        if self._reject():
+            return
+        if self.path == "/user":
+            etag, body = '"u1"', {"login": "alice"}
+        else:
+            etag = self.events_etag
+            body = [
+                {"id": str(3 - i), "type": "PushEvent", "created_at": _iso(hours)}
+                for i, hours in enumerate((0, 24, 72))
+            ]
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self._rate_headers("core")
+            self.end_headers()
+            return
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self._rate_headers("core")
+        self.send_header("ETag", etag)
+        self.send_header("X-Poll-Interval", str(self.poll_interval))
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self._reject():
+            return
+
+        data, errors, repos_asked = {}, [], []
+        for alias, owner, name in _ALIAS.findall(body["query"]):
+            repos_asked.append(f"{owner}/{name}")
+            if name == "missing":
+                data[alias] = None
+                errors.append({"path": [alias], "message": "Could not resolve to a Repository"})
+            else:
+                data[alias] = _repository(owner, name)
+        type(self).queries.append(repos_asked)
+
+        payload = json.dumps({"data": data, "errors": errors}).encode()
+        self.send_response(200)
+        self._rate_headers("graphql")
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api():
+    _StubGraphQL.queries = []
+    _StubGraphQL.gets = []
+    _StubGraphQL.status = 200
+    _StubGraphQL.remaining = 4000
+    _StubGraphQL.events_etag = '"e1"'
+    _StubGraphQL.poll_interval = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGraphQL)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield _StubGraphQL, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def data(api):
+    """The shared data layer, pointed at the stub API."""
+    _, base_url = api
+    layer = GitHubData(endpoint=f"{base_url}/graphql", token="t", api_url=base_url)
+    reset_github_data(layer)
+    return layer
+
+
+def _checkout(path, url, remote="origin"):
+    (path / ".git").mkdir(parents=True)
+    (path / ".git" / "config").write_text(
+        f'[core]\n\tbare = false\n[remote "{remote}"]\n\turl = {url}\n'
+        f"\tfetch = +refs/heads/*:refs/remotes/{remote}/*\n"
+    )
+    return path
+
+
+class TestGitHubData:
+    """Tests for batching and caching."""
+
+    def test_one_query_for_many_repos(self, api, data):
+        stub, _ = api
+        result = data.repos(["o/a", "o/b", "o/c"])
+
+        assert stub.queries == [["o/a", "o/b", "o/c"]]
+        snapshot = result["o/b"]
+        assert snapshot.error is None
+        assert snapshot.open_pr_count == 2
+        first, second = snapshot.open_prs
+        assert (first.number, first.ci_status, first.approvals) == (7, "success", 1)
+        assert first.labels == ["ready"] and first.author == "alice"
+        assert (second.ci_status, second.author, second.mergeable) == (
+            "failure",
+            "unknown",
+            "CONFLICTING",
+        )
+        assert [pr.number for pr in snapshot.merged_prs] == [5]
+
+    def test_failed_runs_from_check_suites(self, data):
+        runs = data.repo("o/a").failed_runs
+        # Successful suites are dropped and a run seen twice is reported once
+        assert [run.run_id for run in runs] == [1, 3, 4]
+        assert runs[0].branch == "main" and runs[0].name == "CI"
+
+    def test_chunks_large_batches(self, api, data):
+        stub, _ = api
+        names = [f"o/r{i}" for i in range(github.MAX_REPOS_PER_QUERY + 5)]
+        result = data.repos(names)
+
+        assert [len(q) for q in stub.queries] == [github.MAX_REPOS_PER_QUERY, 5]
+        assert all(result[name].error is None for name in names)
+
+    def test_cached_within_ttl(self, api, data):
+        stub, _ = api
+        data.repos(["o/a"])
+        data.repos(["o/a"])
+        assert len(stub.queries) == 1
+
+        data.invalidate("o/a")
+        data.repos(["o/a"])
+        assert len(stub.queries) == 2
+
+    def test_refetches_after_ttl(self, api, data):
+        stub, _ = api
+        data.ttl = 0
+        data.repo("o/a")
+        data.repo("o/a")
+        assert len(stub.queries) == 2
+
+    def test_stale_watched_repos_refresh_together(self, api, data):
+        stub, _ = api
+        data.repos(["o/a", "o/b"])  # e.g. the repos collector
+        data.repo("o/c")  # e.g. PR automation
+        assert stub.queries == [["o/a", "o/b"], ["o/c"]]
+
+        data.invalidate()
+        data.repo("o/c")
+        assert sorted(stub.queries[-1]) == ["o/a", "o/b", "o/c"]
+
+    def test_per_repo_errors(self, api, data):
+        stub, _ = api
+        result = data.repos(["o/a", "o/missing", "not a repo"])
+
+        assert stub.queries == [["o/a", "o/missing"]]
+        assert result["o/a"].error is None
+        assert result["o/missing"].error == "Could not resolve to a Repository"
+        assert result["not a repo"].error == "Invalid repository name"
+
+    def test_http_errors(self, api, data):
+        stub, _ = api
+        stub.status = 502
+        assert data.repo("o/a").error == "GitHub API error: 502"
+
+        data.token = "wrong"
+        data.close()
+        data.invalidate()
+        stub.status = 200
+        assert data.repo("o/a").error == "GitHub token rejected"
+
+    def test_build_query_escapes_names(self):
+        query = build_query(["o/a", "o/b.c"])
+        assert 'r0: repository(owner: "o", name: "a")' in query
+        assert 'r1: repository(owner: "o", name: "b.c")' in query
+        assert "fragment RepoFields on Repository" in query
+
+
+class TestGhFallback:
+    """Tests for querying through the GitHub CLI."""
+
+    @patch("subprocess.run")
+    def test_uses_gh_without_token(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=json.dumps({"data": {"r0": _repository("o", "a")}}), stderr=""
+        )
+        snapshot = GitHubData().repo("o/a")
+
+        assert snapshot.open_pr_count == 2
+        args = mock_run.call_args[0][0]
+        assert args[:4] == ["gh", "api", "--include", "graphql"]
+        assert args[5].startswith("query=query {")
+
+    @patch("subprocess.run")
+    def test_partial_errors_keep_data(self, mock_run):
+        document = {
+            "data": {"r0": _repository("o", "a"), "r1": None},
+            "errors": [{"path": ["r1"], "message": "Could not resolve to a Repository"}],
+        }
+        mock_run.return_value = MagicMock(returncode=1, stdout=json.dumps(document), stderr="")
+        result = GitHubData().repos(["o/a", "o/missing"])
+
+        assert result["o/a"].error is None
+        assert result["o/missing"].error == "Could not resolve to a Repository"
+
+    @pytest.mark.parametrize(
+        ("effect", "error"),
+        [
+            (FileNotFoundError(), "GitHub CLI not installed"),
+            (subprocess.TimeoutExpired("gh", 30), "gh command timed out"),
+            (
+                MagicMock(returncode=4, stdout="", stderr="To get started, run: gh auth login"),
+                "GitHub CLI not authenticated",
+            ),
+        ],
+    )
+    def test_errors(self, effect, error):
+        kwargs = (
+            {"return_value": effect} if isinstance(effect, MagicMock) else {"side_effect": effect}
+        )
+        with patch("subprocess.run", **kwargs):
+            assert GitHubData().repo("o/a").error == error
+
+
+class TestRepoSlug:
+    """Tests for reading a checkout's GitHub remote."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "git@github.com:owner/name.git",
+            "https://github.com/owner/name",
+            "https://github.com/owner/name.git/",
+            "ssh://git@github.com/owner/name.git",
+        ],
+    )
+    def test_remote_urls(self, tmp_path, url):
+        assert repo_slug(_checkout(tmp_path / "repo", url)) == "owner/name"
+
+    def test_non_github_remote(self, tmp_path):
+        assert repo_slug(_checkout(tmp_path / "repo", "git@gitlab.com:o/n.git")) is None
+        assert repo_slug(tmp_path / "nowhere") is None
+
+    def test_prefers_origin(self, tmp_path):
+        path = _checkout(tmp_path / "repo", "git@github.com:fork/name.git", remote="fork")
+        config = path / ".git" / "config"
+        config.write_text(
+            config.read_text() + '[remote "origin"]\n\turl = git@github.com:up/name.git\n'
+        )
+        assert repo_slug(path) == "up/name"
+
+    def test_worktree(self, tmp_path):
+        main = _checkout(tmp_path / "main", "git@github.com:owner/name.git")
+        worktree_git = main / ".git" / "worktrees" / "wt"
+        worktree_git.mkdir(parents=True)
+        (worktree_git / "commondir").write_text("../..\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+        assert repo_slug(worktree) == "owner/name"
+
+
+class TestConditionalRequests:
+    """Tests for the ETag-revalidated REST cache."""
+
+    def test_304_reuses_cached_body(self, api, data):
+        stub, _ = api
+        data.ttl = 0
+        first = data.rest("users/alice/events", {"per_page": 100})
+        second = data.rest("users/alice/events", {"per_page": 100})
+
+        assert first == second and len(first) == 3
+        assert stub.gets == [
+            ("/users/alice/events?per_page=100", None),
+            ("/users/alice/events?per_page=100", '"e1"'),
+        ]
+        assert (data.requests, data.not_modified) == (2, 1)
+
+    def test_changed_resource_replaces_body(self, api, data):
+        stub, _ = api
+        data.ttl = 0
+        data.rest("users/alice/events")
+        stub.events_etag = '"e2"'
+        data.rest("users/alice/events")
+        data.rest("users/alice/events")
+
+        assert [etag for _, etag in stub.gets] == [None, '"e1"', '"e2"']
+        assert data.not_modified == 1
+
+    def test_fresh_within_poll_interval(self, api, data):
+        stub, _ = api
+        stub.poll_interval = 60
+        data.ttl = 0
+        data.rest("user")
+        data.rest("user")
+        assert len(stub.gets) == 1
+
+    def test_cache_persists_on_disk(self, api, data, tmp_path):
+        stub, base_url = api
+        data.ttl = 0
+        data.rest("user")
+
+        restarted = GitHubData(endpoint=f"{base_url}/graphql", token="t", api_url=base_url)
+        restarted.ttl = 0
+        assert restarted.rest("user") == {"login": "alice"}
+        assert stub.gets[-1] == ("/user", '"u1"')
+        assert restarted.not_modified == 1
+        assert "user" in json.loads((tmp_path / "github-cache.json").read_text())
+
+    def test_errors(self, api, data):
+        stub, _ = api
+        stub.status = 404
+        with pytest.raises(github.GitHubError, match="404"):
+            data.rest("user")
+
+    @pytest.mark.parametrize("status", [403, 503])
+    def test_error_status_serves_stale_body(self, api, data, status):
+        stub, _ = api
+        data.ttl = 0
+        data.rest("user")
+        fetched_at = data.cache.get("user")["fetched_at"]
+
+        stub.status = status
+        assert data.rest("user") == {"login": "alice"}
+        assert data.cache.get("user")["fetched_at"] == fetched_at
+        assert len(stub.gets) == 2
+
+    def test_transport_error_serves_stale_body(self, data):
+        data.token = None
+        data.ttl = 0
+        data.cache.put("user", {"etag": '"u1"', "fetched_at": 0, "body": {"login": "alice"}})
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("gh", 30)):
+            assert data.rest("user") == {"login": "alice"}
+        assert data.cache.get("user")["fetched_at"] == 0
+
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("gh", 30)):
+            with pytest.raises(github.GitHubError, match="timed out"):
+                data.rest("users/bob")
+
+    def test_request_made_without_lock(self, api, data):
+        get_http = data._get_http
+
+        def checked(key, headers):
+            assert not data._lock.locked()
+            return get_http(key, headers)
+
+        with patch.object(data, "_get_http", checked):
+            assert data.rest("user") == {"login": "alice"}
+
+    def test_gh_304(self, data):
+        data.token = None
+        data.ttl = 0
+        data.cache.put("user", {"etag": '"u1"', "fetched_at": 0, "body": {"login": "alice"}})
+        output = (
+            'HTTP/2.0 304 Not Modified\r\nEtag: "u1"\r\nX-Ratelimit-Limit: 5000\r\n'
+            "X-Ratelimit-Remaining: 4999\r\nX-Ratelimit-Reset: 0\r\n"
+            "X-Ratelimit-Resource: core\r\n\r\n"
+        )
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout=output, stderr="HTTP 304")
+            assert data.rest("user") == {"login": "alice"}
+
+        args = mock_run.call_args[0][0]
+        assert args == ["gh", "api", "--include", "-H", 'If-None-Match: "u1"', "user"]
+        assert data.not_modified == 1
+        assert data.rate_limit("core").remaining == 4999
+
+
+class TestRateLimit:
+    """Tests for rate-limit tracking and polling back-off."""
+
+    def test_tracked_from_responses(self, api, data):
+        data.repo("o/a")
+        data.rest("user")
+
+        assert data.rate_limit("graphql").remaining == 4000
+        assert data.rate_limit("core").limit == 5000
+
+    def test_poll_interval(self):
+        now = 1000.0
+        limit = RateLimit("graphql", limit=5000, remaining=4000, reset=now + 3600)
+        assert limit.poll_interval(60, now) == 60
+
+        limit.remaining = 370  # Under a quarter left: spread it over the hour
+        assert limit.poll_interval(60, now) == 60
+        assert limit.poll_interval(1, now) == pytest.approx(3600 / 360)
+
+        limit.remaining = 5  # Only the reserve left: wait for the reset
+        assert limit.poll_interval(60, now) == pytest.approx(3600)
+        assert limit.poll_interval(60, now + 4000) == 60
+
+    def test_low_budget_slows_refreshes(self, api, data):
+        stub, _ = api
+        data.ttl = 0
+        data.repo("o/a")
+        data.repo("o/a")
+        assert len(stub.queries) == 2
+
+        stub.remaining = 100
+        data.invalidate()
+        data.repo("o/a")
+        data.repo("o/a")
+        assert len(stub.queries) == 3
+
+    def test_exposed_by_repos_collector(self, api, data, tmp_path, monkeypatch):
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+        _checkout(tmp_path / "a", "git@github.com:o/a.git")
+
+        with patch.object(repos, "_get_last_commit", return_value=("1 hour ago", None)):
+            result = repos.collect(["a"])
+        assert result["rate_limit"]["resource"] == "graphql"
+        assert result["rate_limit"]["remaining"] == 4000
+
+
+class TestConsumers:
+    """The collectors, metrics and automation share one batched query."""
+
+    def test_share_one_query(self, api, data, tmp_path, monkeypatch):
+        stub, _ = api
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+        _checkout(tmp_path / "a", "git@github.com:o/a.git")
+        _checkout(tmp_path / "b", "https://github.com/o/b")
+
+        with patch.object(repos, "_get_last_commit", return_value=("1 hour ago", None)):
+            result = repos.collect(["a", "b"])
+        assert [r["open_prs"] for r in result["repos"]] == [2, 2]
+
+        failures = alerts.collect_ci_failures(repos=["o/a", "o/b"])
+        # Runs older than a day are not alerted on
+        assert sorted(a.metadata["run_id"] for a in failures) == [1, 1, 3, 3]
+
+        cycle = GitHubMetrics(metrics_dir=tmp_path, repos=["o/a"]).get_pr_cycle_times()
+        assert [(pr.number, pr.cycle_hours, pr.repo) for pr in cycle] == [(5, 6.0, "o/a")]
+
+        prs = PRAutomation(tmp_path / "a").get_open_prs()
+        assert [(pr.number, pr.mergeable) for pr in prs] == [(7, True), (8, False)]
+
+        streak = GitHubMetrics(metrics_dir=tmp_path).get_contribution_streak()
+        assert (streak["username"], streak["streak_days"]) == ("alice", 2)
+
+        assert stub.queries == [["o/a", "o/b"]]
+
+    def test_repos_collector_reports_errors(self, api, data, tmp_path, monkeypatch):
+        stub, _ = api
+        stub.status = 500
+        monkeypatch.setattr(repos, "REPO_BASE", tmp_path)
+        _checkout(tmp_path / "a", "git@github.com:o/a.git")
+
+        with patch.object(repos, "_get_last_commit", return_value=("1 hour ago", None)):
+            result = repos.collect(["a"])
+        assert result["repos"][0]["_pr_error"] == "GitHub API error: 500"
+
+    def test_auto_merge_invalidates_after_merge(self, api, data, tmp_path):
+        stub, _ = api
+        path = _checkout(tmp_path / "a", "git@github.com:o/a.git")
+        automation = PRAutomation(path)
+        config = MergeConfig(safelist=["feature", "wip"])
+
+        with patch("openclaw_dash.automation.pr_auto.run", return_value=(0, "", "")) as mock_run:
+            results = automation.auto_merge(config)
+        assert [r["status"] for r in results] == ["merged", "skipped"]
+        mock_run.assert_called_once()
+
+        automation.get_open_prs()
+        assert len(stub.queries) == 2
+
+    def test_get_open_prs_errors(self, tmp_path):
+        with pytest.raises(RuntimeError, match="no GitHub remote"):
+            PRAutomation(tmp_path).get_open_prs()
+
+        path = _checkout(tmp_path / "a", "git@github.com:o/a.git")
+        with patch("subprocess.run", side_effect=FileNotFoundError()):
+            with pytest.raises(RuntimeError, match="GitHub CLI not installed"):
+                PRAutomation(path).get_open_prs()
+
+    def test_shared_instance(self):
+        assert get_github_data() is get_github_data()
@@ -0,0 +1,296 @@
+"""Tests for the gateway log search index."""
+
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from openclaw_dash.collectors import log_index, logs
+from openclaw_dash.collectors.log_index import LogIndex, LogQuery
+
+TAGS = ["gateway", "ws", "discord", "tool", "error"]
+WORDS = ["heartbeat", "timeout", "session", "connected", "failed", "ready", "chat.send"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes(tmp_path, monkeypatch):
+    """Keep indexes out of the home directory and unshared between tests."""
+    monkeypatch.setattr(log_index, "INDEX_DIR", tmp_path / "index")
+    log_index.reset_indexes()
+    yield
+    log_index.reset_indexes()
+
+
+def make_lines(n: int, seed: int = 0, start: datetime | None = None) -> list[str]:
+    rng = random.Random(seed)
+    ts = start or datetime(2026, 2, 1, tzinfo=timezone.utc)
+    lines = []
+    for _ in range(n):
+        ts += timedelta(seconds=rng.randint(1, 120))
+        words = " ".join(rng.sample(WORDS, 2))
+        lines.append(f"{log_index.format_log_timestamp(ts)} [{rng.choice(TAGS)}] {words}")
+    return lines
+
+
+def brute_force(lines: list[str], text: str) -> list[str]:
+    query = LogQuery.parse(text)
+    tokens = query.term_tokens
+    return [
+        line
+        for line in reversed(lines)
+        if log_index.matches_line(line.encode(), query, tokens) is not None
+    ]
+
+
+class TestTokenizeAndQuery:
+    def test_tokenize_lowercases_and_splits_punctuation(self):
+        assert log_index.tokenize(b"[WS] chat.send FAILED: e_42") == {
+            b"ws",
+            b"chat",
+            b"send",
+            b"failed",
+            b"e_42",
+        }
+
+    def test_parse_query(self):
+        now = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+        query = LogQuery.parse("tag:ws tag:gateway since:2h until:2026-02-01T11:30 timeout", now)
+        assert query.terms == ["timeout"]
+        assert query.tags == ["ws", "gateway"]
+        assert query.since == now - timedelta(hours=2)
+        assert query.since_stamp == b"2026-02-01T10:00:00.000Z"
+        assert query.until_stamp == b"2026-02-01T11:30:00.000Z"
+
+    def test_until_date_includes_whole_day(self):
+        query = LogQuery.parse("since:2026-02-01 until:2026-02-01")
+        assert query.since_stamp == b"2026-02-01T00:00:00.000Z"
+        assert query.until_stamp == b"2026-02-01T23:59:59.999Z"
+        assert LogQuery.parse("until:2026-02-01T00:00").until_stamp == b"2026-02-01T00:00:00.000Z"
+
+    def test_parse_query_keeps_other_colons_as_terms(self):
+        query = LogQuery.parse("error: tag: http://x")
+        assert query.terms == ["error:", "tag:", "http://x"]
+        assert query.tags == []
+
+    def test_parse_query_invalid_time(self):
+        with pytest.raises(ValueError):
+            LogQuery.parse("since:yesterday")
+
+
+class TestLogIndex:
+    def test_search_matches_brute_force(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_index, "BLOCK_SIZE", 512)
+        lines = make_lines(500)
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(lines) + "\n")
+        since = lines[100][:19]
+        until = lines[300][:19]
+
+        for text in [
+            "timeout",
+            "chat.send failed",
+            "tag:ws heartbeat",
+            "tag:ws tag:error ready",
+            f"since:{since} until:{until} session",
+            f"until:{until} tag:discord",
+            "nosuchword",
+        ]:
+            result = log_index.search(text, limit=10_000, log_files=[log])
+            assert [e["raw"] for e in result["entries"]] == brute_force(lines, text), text
+
+    def test_time_range_with_unordered_lines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_index, "BLOCK_SIZE", 256)
+        lines = make_lines(200)
+        random.Random(1).shuffle(lines)
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(lines) + "\n")
+        text = f"since:{sorted(lines)[50][:19]} until:{sorted(lines)[80][:19]}"
+        result = log_index.search(text, limit=10_000, log_files=[log])
+        assert [e["raw"] for e in result["entries"]] == brute_force(lines, text)
+
+    def test_candidate_blocks_skip_blocks_without_terms(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_index, "BLOCK_SIZE", 256)
+        lines = make_lines(100) + ["2026-03-01T00:00:00.000Z [ws] needle found"]
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(lines) + "\n")
+        index = LogIndex(log)
+        index.update()
+        assert index.block_count > 10
+        assert index.candidate_blocks(LogQuery.parse("needle")) == [index.block_count - 1]
+
+    def test_incremental_update_indexes_only_new_lines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_index, "BLOCK_SIZE", 1024)
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(make_lines(50)) + "\n")
+        index = LogIndex(log)
+        first = index.update()
+        assert first == log.stat().st_size
+        blocks = index.block_count
+
+        with open(log, "a") as f:
+            f.write("2026-03-01T00:00:00.000Z [ws] appended line\n")
+            f.write("2026-03-01T00:00:01.000Z [ws] partial")
+        added = index.update()
+        assert added == len("2026-03-01T00:00:00.000Z [ws] appended line\n")
+        # The short last block grows instead of a new block per update
+        assert index.block_count in (blocks, blocks + 1)
+        assert index.candidate_blocks(LogQuery.parse("appended"))
+        assert not index.candidate_blocks(LogQuery.parse("partial"))
+
+        with open(log, "a") as f:
+            f.write(" now complete\n")
+        index.update()
+        assert index.candidate_blocks(LogQuery.parse("partial complete"))
+
+    def test_long_line_becomes_its_own_block(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_index, "BLOCK_SIZE", 64)
+        log = tmp_path / "gateway.log"
+        long_line = "2026-02-01T00:00:00.000Z [ws] " + "x" * 200 + " marker"
+        log.write_text(f"2026-02-01T00:00:00.000Z [ws] short\n{long_line}\n")
+        result = log_index.search("marker", log_files=[log])
+        assert [e["raw"] for e in result["entries"]] == [long_line]
+
+    def test_replaced_file_is_reindexed(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] before rotation\n" * 20)
+        index = LogIndex(log)
+        index.update()
+
+        rotated = tmp_path / "gateway.log.1"
+        os.rename(log, rotated)
+        log.write_text("2026-02-02T00:00:00.000Z [ws] after\n")
+        index.update()
+        assert index.indexed_end == log.stat().st_size
+        assert not index.candidate_blocks(LogQuery.parse("rotation"))
+
+    def test_persisted_index_round_trip(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        lines = make_lines(200)
+        log.write_text("\n".join(lines) + "\n")
+        index = LogIndex(log)
+        index.update()
+        assert index.save()
+        assert not index.save()  # Nothing new to write
+
+        loaded = LogIndex(log)
+        assert loaded.load()
+        assert loaded.indexed_end == index.indexed_end
+        assert loaded.postings == index.postings
+        assert loaded.first_ts == index.first_ts
+        assert loaded.update() == 0
+
+    def test_persisted_index_for_replaced_file_is_discarded(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] old content here\n" * 10)
+        index = LogIndex(log)
+        index.update()
+        index.save()
+
+        log.unlink()
+        log.write_text("2026-02-02T00:00:00.000Z [ws] new\n")
+        loaded = LogIndex(log)
+        assert loaded.load()
+        loaded.update()
+        assert loaded.indexed_end == log.stat().st_size
+        assert not loaded.candidate_blocks(LogQuery.parse("old"))
+
+    def test_corrupt_persisted_index_is_ignored(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] hello\n")
+        index = LogIndex(log)
+        index.index_file.parent.mkdir(parents=True)
+        index.index_file.write_bytes(b"\xc1 not msgpack")
+        assert not index.load()
+
+
+class TestSearch:
+    def test_paging(self, tmp_path):
+        lines = [f"2026-02-01T00:00:{i:02d}.000Z [ws] match {i}" for i in range(25)]
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(lines) + "\n")
+
+        first = log_index.search("match", limit=10, log_files=[log])
+        assert first["total"] == 10
+        assert first["has_more"]
+        assert first["entries"][0]["message"] == "match 24"
+
+        last = log_index.search("match", limit=10, offset=20, log_files=[log])
+        assert [e["message"] for e in last["entries"]] == [f"match {i}" for i in range(4, -1, -1)]
+        assert not last["has_more"]
+
+    def test_searches_files_newest_first(self, tmp_path):
+        current = tmp_path / "gateway.log"
+        rotated = tmp_path / "gateway.log.1"
+        rotated.write_text("2026-02-01T00:00:00.000Z [ws] hit old\n")
+        current.write_text("2026-02-02T00:00:00.000Z [ws] hit new\n")
+        result = log_index.search("hit", log_files=[current, rotated])
+        assert [e["message"] for e in result["entries"]] == ["hit new", "hit old"]
+        assert result["entries"][1]["log_file"] == str(rotated)
+        assert result["entries"][0]["level"] == "debug"
+
+    def test_terms_without_word_tokens_match_as_substrings(self, tmp_path):
+        lines = [
+            "2026-02-01T00:00:00.000Z [ws] \u2717 chat.send failed",
+            "2026-02-01T00:00:01.000Z [ws] \u21e2 chat.send ok",
+            "2026-02-01T00:00:02.000Z [gateway] route a -> b",
+            "2026-02-01T00:00:03.000Z [gateway] ready",
+        ]
+        log = tmp_path / "gateway.log"
+        log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        def messages(text):
+            return [e["message"] for e in log_index.search(text, log_files=[log])["entries"]]
+
+        assert LogQuery.parse("\u2717 ->").term_tokens == set()
+        assert messages("\u2717") == ["\u2717 chat.send failed"]
+        assert messages("->") == ["route a -> b"]
+        assert messages("send \u2717") == ["\u2717 chat.send failed"]
+        assert messages("[WS]") == ["\u21e2 chat.send ok", "\u2717 chat.send failed"]
+        assert messages("\u2717") == [line.split("] ")[1] for line in brute_force(lines, "\u2717")]
+
+    def test_search_persists_index(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] hello\n")
+        log_index.search("hello", log_files=[log])
+        assert LogIndex(log).index_file.exists()
+
+    def test_no_log_files(self):
+        result = log_index.search("anything", log_files=[])
+        assert result["entries"] == []
+        assert result["error"] == "Log file not found"
+
+    def test_searchable_log_files_skip_compressed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            logs,
+            "find_log_files",
+            lambda: [tmp_path / "gateway.log", tmp_path / "gateway.log.1.gz"],
+        )
+        assert log_index.searchable_log_files() == [tmp_path / "gateway.log"]
+
+
+class TestTailerUpdates:
+    def test_collect_updates_open_index(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] first\n")
+        log_index.search("first", log_files=[log])
+
+        with open(log, "a") as f:
+            f.write("2026-02-01T00:00:01.000Z [ws] second\n")
+        logs.collect(log_path=log)
+        index = log_index.get_log_index(log)
+        assert index.indexed_end == log.stat().st_size
+
+    def test_collect_does_not_open_indexes(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] first\n")
+        logs.collect(log_path=log)
+        assert log not in log_index._INDEXES
+
+    def test_update_skipped_while_search_holds_index(self, tmp_path):
+        log = tmp_path / "gateway.log"
+        log.write_text("2026-02-01T00:00:00.000Z [ws] first\n")
+        index = log_index.get_log_index(log)
+        with index.lock:
+            log_index.update_open_index(log)
+        assert index.indexed_end == 0
@@ -1,5 +1,6 @@
 """Tests for logs collector and widget."""
 
+import random
 import tempfile
 from pathlib import Path
 
@@ -11,6 +12,40 @@ from openclaw_dash.collectors import logs
 from openclaw_dash.widgets.logs import LogsPanel, LogsSummaryPanel
 
 
+def reference_log_level(tag: str, message: str) -> str:
+    """Original keyword-scan implementation of get_log_level, used as the oracle."""
+    message_lower = message.lower()
+    tag_lower = tag.lower()
+
+    if any(word in message_lower for word in ["error", "failed", "exception"]):
+        return "error"
+    elif any(word in message_lower for word in ["warn", "warning"]):
+        return "warning"
+    elif any(word in tag_lower for word in ["error", "err"]):
+        return "error"
+    elif "disconnect" in message_lower or "shutting down" in message_lower:
+        return "warning"
+    elif "started" in message_lower or "ready" in message_lower or "listening" in message_lower:
+        return "info"
+    else:
+        return "debug"
+
+
+LEVEL_WORDS = [
+    "error",
+    "failed",
+    "exception",
+    "warn",
+    "warning",
+    "disconnect",
+    "shutting down",
+    "started",
+    "ready",
+    "listening",
+]
+FILLER = ["", " ", "x", "ok", "r", "d", "err", "shutting", "İ", "K", "ß", "ΣΑΣ", ":", "\t"]
+
+
 class TestLogsCollector:
     """Tests for the logs collector."""
 
@@ -59,6 +94,50 @@ class TestLogsCollector:
         assert logs.get_log_level("gateway", "service started") == "info"
         assert logs.get_log_level("gateway", "listening on port 3000") == "info"
 
+    def test_get_log_level_overlapping_keywords(self):
+        """Overlapping keywords must not hide the higher-priority one."""
+        assert logs.get_log_level("gateway", "startedisconnect") == "warning"
+        assert logs.get_log_level("gateway", "erroready") == "error"
+        assert logs.get_log_level("gateway", "failedisconnect") == "error"
+
+    def test_get_log_level_matches_reference_on_keyword_joins(self):
+        """Every pair of keywords, joined with every possible overlap, agrees."""
+        for first in LEVEL_WORDS:
+            for second in LEVEL_WORDS:
+                for k in range(len(first) + 1):
+                    if first[len(first) - k :] != second[:k]:
+                        continue
+                    message = first + second[k:]
+                    for tag in ["gateway", "err"]:
+                        assert logs.get_log_level(tag, message) == reference_log_level(
+                            tag, message
+                        ), (tag, message)
+
+    def test_get_log_level_matches_reference_randomized(self):
+        """Property test: random keyword/filler/case mixes agree with the reference."""
+        rng = random.Random(20260201)
+        tags = ["gateway", "ws", "ERR", "stderr", "Error", "tool", "İ"]
+        for _ in range(20_000):
+            parts = [
+                rng.choice(LEVEL_WORDS) if rng.random() < 0.3 else rng.choice(FILLER)
+                for _ in range(rng.randint(0, 6))
+            ]
+            message = "".join(
+                "".join(c.upper() if rng.random() < 0.3 else c for c in part) for part in parts
+            )
+            tag = rng.choice(tags)
+            assert logs.get_log_level(tag, message) == reference_log_level(tag, message), (
+                tag,
+                message,
+            )
+
+    def test_parse_log_line_strips_whitespace(self):
+        """Leading/trailing whitespace is removed from the raw field."""
+        parsed = logs.parse_log_line("  2026-02-01T08:09:41.294Z [gateway] ready \n")
+        assert parsed is not None
+        assert parsed["raw"] == "2026-02-01T08:09:41.294Z [gateway] ready"
+        assert parsed["message"] == "ready"
+
     def test_get_level_color(self):
         """Should return correct colors for levels."""
         assert logs.get_level_color("error") == "red"
@@ -147,6 +226,145 @@ class TestLogsCollector:
         finally:
             path.unlink()
 
+    def test_tail_file_no_trailing_newline(self, tmp_path):
+        """Should include the final line when the file lacks a trailing newline."""
+        path = tmp_path / "gateway.log"
+        path.write_bytes(b"a\n\nb\nc")
+        assert logs.tail_file(path, n=2) == ["b", "c"]
+        assert logs.tail_file(path, n=10) == ["a", "b", "c"]
+
+    def test_tail_file_empty(self, tmp_path):
+        """Should return an empty list for an empty file."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+        assert logs.tail_file(path) == []
+
+    def test_tail_file_prefilter_applies_within_window(self, tmp_path):
+        """Prefilter drops lines from the last n before decoding."""
+        path = tmp_path / "gateway.log"
+        path.write_text("keep 1\nskip 2\nkeep 3\nskip 4\n")
+        lines = logs.tail_file(path, n=3, prefilter=lambda raw: raw.startswith(b"keep"))
+        assert lines == ["keep 3"]
+
+    def test_tail_file_chunked_matches_mmap(self, tmp_path):
+        """The buffered fallback should return the same lines as the mmap path."""
+        path = tmp_path / "gateway.log"
+        path.write_text("".join(f"Line {i}\n" for i in range(5000)))
+        assert logs._tail_file_chunked(path, n=1200) == logs.tail_file(path, n=1200)
+
+    def test_iter_matching_lines(self, tmp_path):
+        """Should yield each matching line once, honouring range bounds."""
+        path = tmp_path / "gateway.log"
+        data = b"alpha beta\ngamma\nbeta alpha\ndelta\nalpha"
+        path.write_bytes(data)
+        with logs.mapped_file(path) as mm:
+            assert list(logs.iter_matching_lines(mm, (b"alpha", b"beta"))) == [
+                b"alpha beta",
+                b"beta alpha",
+                b"alpha",
+            ]
+            start = data.index(b"gamma")
+            end = data.index(b"delta")
+            assert list(logs.iter_matching_lines(mm, (b"alpha",), start, end)) == [b"beta alpha"]
+
+    @pytest.mark.parametrize("filter_level", ["error", "warning", "info", "debug"])
+    def test_prefilter_never_rejects_kept_lines(self, filter_level):
+        """Byte prefilter must accept every line the level filter keeps."""
+        level_priority = {"error": 0, "warning": 1, "info": 2, "debug": 3}
+        prefilter = logs.make_line_prefilter(filter_level=filter_level)
+        messages = [
+            "Request FAILED",
+            "WARNING: slow",
+            "client disconnected",
+            "Shutting Down now",
+            "server Started",
+            "READY",
+            "listening on :8080",
+            "heartbeat",
+            "İNSTANCE FAİLED",
+        ]
+        for tag in ["gateway", "ERR", "stderr", "ws"]:
+            for message in messages:
+                line = f"2026-02-01T08:09:41.000Z [{tag}] {message}"
+                level = logs.get_log_level(tag, message)
+                if level_priority[level] <= level_priority[filter_level]:
+                    assert prefilter is None or prefilter(line.encode())
+
+    def test_prefilter_by_tag(self):
+        """Tag prefilter should reject lines without a matching tag."""
+        prefilter = logs.make_line_prefilter(filter_tags=["ws"])
+        assert prefilter(b"2026-02-01T08:09:41.000Z [ws] connected")
+        assert not prefilter(b"2026-02-01T08:09:41.000Z [gateway] connected")
+
+    def test_collect_filter_by_tag(self, tmp_path):
+        """Tag filtering should still return only matching entries."""
+        path = tmp_path / "gateway.log"
+        path.write_text(
+            "2026-02-01T08:09:41.000Z [gateway] started\n"
+            "2026-02-01T08:09:42.000Z [ws] connected\n"
+            "2026-02-01T08:09:43.000Z [gateway] ready\n"
+        )
+        result = logs.collect(n=10, log_path=path, filter_tags=["gateway"])
+        assert [e["tag"] for e in result["entries"]] == ["gateway", "gateway"]
+
+    def test_find_rotated_logs(self, tmp_path):
+        """Should find rotated and compressed siblings, newest first."""
+        import os
+
+        names = [
+            "gateway.log",
+            "gateway.log.1",
+            "gateway.log.2.gz",
+            "gateway-old.log.zst",
+            "gateway.log.bak",
+            "other.log",
+        ]
+        for age, name in enumerate(names):
+            path = tmp_path / name
+            path.write_text("x\n")
+            os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+        found = [p.name for p in logs.find_rotated_logs(tmp_path, "gateway")]
+        assert found == ["gateway.log", "gateway.log.1", "gateway.log.2.gz", "gateway-old.log.zst"]
+        assert logs.find_rotated_logs(tmp_path / "missing", "gateway") == []
+
+    def test_is_archived_log(self):
+        """Numbered and compressed logs are archived; the live log is not."""
+        assert not logs.is_archived_log(Path("gateway.log"))
+        assert not logs.is_archived_log(Path("openclaw-2026-02-01.log"))
+        assert logs.is_archived_log(Path("gateway.log.1"))
+        assert logs.is_archived_log(Path("gateway.log.2.gz"))
+        assert logs.is_archived_log(Path("openclaw-2026-02-01.log.zst"))
+
+    def test_open_log_stream_gzip(self, tmp_path):
+        """Gzip logs should stream back their lines."""
+        import gzip
+
+        path = tmp_path / "gateway.log.1.gz"
+        with gzip.open(path, "wt") as f:
+            f.write("keep a\nskip\nkeep b\n")
+
+        with logs.open_log_stream(path) as f:
+            assert f.read() == b"keep a\nskip\nkeep b\n"
+        assert list(logs.iter_stream_matching_lines(path, (b"keep",))) == [b"keep a", b"keep b"]
+
+    def test_open_log_stream_zstd(self, tmp_path):
+        """Zstd logs (including multi-frame files) should stream back their lines."""
+        zstandard = pytest.importorskip("zstandard")
+
+        path = tmp_path / "gateway.log.1.zst"
+        cctx = zstandard.ZstdCompressor()
+        path.write_bytes(cctx.compress(b"keep a\n") + cctx.compress(b"skip\nkeep b\n"))
+
+        assert list(logs.iter_stream_matching_lines(path, (b"keep",))) == [b"keep a", b"keep b"]
+
+    def test_corrupt_gzip_raises_oserror(self, tmp_path):
+        """Corrupt archives surface as OSError so callers can skip them."""
+        path = tmp_path / "gateway.log.1.gz"
+        path.write_bytes(b"not gzip data")
+        with pytest.raises(OSError):
+            list(logs.iter_stream_matching_lines(path, (b"x",)))
+
     def test_find_log_file_returns_path_or_none(self):
         """find_log_file should return Path or None."""
         result = logs.find_log_file()
@@ -6,7 +6,7 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Static
 
-from openclaw_dash.widgets.logs import LogsPanel, LogsSummaryPanel
+from openclaw_dash.widgets.logs import LogSearchScreen, LogsPanel, LogsSummaryPanel
 
 
 class LogsPanelTestApp(App):
@@ -509,3 +509,90 @@ class TestLogsPanelAppIntegration:
 
         source = inspect.getsource(DashboardApp.compose)
         assert "logs-panel" in source
+
+
+class LogSearchTestApp(App):
+    """Test app that opens the log search screen."""
+
+    def on_mount(self) -> None:
+        self.push_screen(LogSearchScreen())
+
+
+class TestLogSearchScreen:
+    """Tests for the LogSearchScreen modal."""
+
+    def _result(self, n: int, has_more: bool = False, offset: int = 0) -> dict:
+        return {
+            "entries": [
+                {
+                    "timestamp": f"2026-02-01T08:00:{i:02d}.000Z",
+                    "tag": "ws",
+                    "message": f"[match] {i}",
+                    "level": "info",
+                }
+                for i in range(n)
+            ],
+            "total": n,
+            "has_more": has_more,
+            "offset": offset,
+            "files": ["/tmp/gateway.log"],
+            "duration_ms": 3.2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_submit_runs_search_and_renders(self):
+        """Submitting a query shows the page and escapes log markup."""
+        app = LogSearchTestApp()
+        with patch(
+            "openclaw_dash.widgets.logs.log_index.search", return_value=self._result(2)
+        ) as mock_search:
+            async with app.run_test() as pilot:
+                await pilot.press(*"tag:ws match", "enter")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                mock_search.assert_called_once_with("tag:ws match", 50, 0)
+                screen = app.screen
+                status = str(screen.query_one("#log-search-status", Static).render())
+                results = str(screen.query_one("#log-search-results", Static).render())
+                assert "1-2 matches" in status
+                assert "[match] 1" in results
+
+    @pytest.mark.asyncio
+    async def test_paging(self):
+        """PageDown fetches the next page only when more results exist."""
+        app = LogSearchTestApp()
+        with patch(
+            "openclaw_dash.widgets.logs.log_index.search",
+            return_value=self._result(50, has_more=True),
+        ) as mock_search:
+            async with app.run_test() as pilot:
+                await pilot.press(*"match", "enter")
+                await app.workers.wait_for_complete()
+                await pilot.press("pagedown")
+                await app.workers.wait_for_complete()
+                assert mock_search.call_args.args == ("match", 50, 50)
+                await pilot.press("pageup")
+                await app.workers.wait_for_complete()
+                assert mock_search.call_args.args == ("match", 50, 0)
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_shows_error(self):
+        """A bad time bound is reported instead of raising."""
+        app = LogSearchTestApp()
+        with patch(
+            "openclaw_dash.widgets.logs.log_index.search",
+            side_effect=ValueError("Invalid isoformat string: 'yesterday'"),
+        ):
+            async with app.run_test() as pilot:
+                await pilot.press(*"since:yesterday", "enter")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                status = str(app.screen.query_one("#log-search-status", Static).render())
+                assert "Invalid isoformat" in status
+
+    def test_app_binds_search(self):
+        """DashboardApp should bind ctrl+f to log search."""
+        from openclaw_dash.app import DashboardApp
+
+        bindings = {b[0]: b[1] for b in DashboardApp.BINDINGS}
+        assert bindings["ctrl+f"] == "search_logs"
@@ -1,10 +1,18 @@
 """Tests for metrics collectors."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone
+from time import sleep
 from unittest.mock import patch
 
+import pytest
+
 from openclaw_dash import demo
-from openclaw_dash.metrics import MAX_TOKENS, CostTracker, _validate_token_count
+from openclaw_dash.collectors.github import GitHubError, reset_github_data
+from openclaw_dash.metrics import MAX_TOKENS, CostTracker, _validate_token_count, costs
+from openclaw_dash.metrics.github import ActivityBitmap, GitHubMetrics
+from openclaw_dash.metrics.retention import RetentionPolicy
 
 
 class TestCostTracker:
@@ -220,3 +228,672 @@ class TestSecurityValidation:
 
         # Should return empty default structure
         assert history == {"daily": {}, "sessions": {}}
+
+
+class TestCostLedger:
+    """Tests for the append-only cost ledger behind CostTracker."""
+
+    @staticmethod
+    def _collect(tracker, *sessions):
+        with patch("openclaw_dash.collectors.sessions.collect") as mock_collect:
+            mock_collect.return_value = {"sessions": list(sessions)}
+            return tracker.collect()
+
+    @staticmethod
+    def _session(key, inp, out, model="claude-sonnet-4"):
+        return {
+            "key": key,
+            "model": model,
+            "inputTokens": inp,
+            "outputTokens": out,
+            "totalTokens": inp + out,
+        }
+
+    def test_collect_appends_only_changed_sessions(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100), self._session("b", 500, 50))
+        snapshot_mtime = tracker.costs_file.stat().st_mtime_ns
+
+        self._collect(tracker, self._session("a", 3000, 300), self._session("b", 500, 50))
+        lines = tracker.ledger_file.read_text().splitlines()
+        assert len(lines) == 1
+        event = json.loads(lines[0])
+        assert (event["key"], event["in"], event["out"]) == ("a", 2000, 200)
+        assert tracker.costs_file.stat().st_mtime_ns == snapshot_mtime
+
+        # Nothing changed: nothing written
+        size = tracker.ledger_file.stat().st_size
+        self._collect(tracker, self._session("a", 3000, 300))
+        assert tracker.ledger_file.stat().st_size == size
+
+    def test_totals_match_full_history(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        for step in range(1, 6):
+            result = self._collect(
+                tracker,
+                self._session("a", 1000 * step, 100 * step),
+                self._session("b", 700 * step, 70 * step, model="gpt-4o"),
+            )
+        history = tracker._load_history()
+        today = history["daily"][result["today"]["date"]]
+        assert result["today"]["input_tokens"] == today["total_input_tokens"] == 8500
+        assert result["today"]["cost"] == round(today["total_cost"], 4)
+        assert result["summary"]["days_tracked"] == len(history["daily"])
+        assert history["sessions"]["b"]["input_tokens"] == 3500
+
+    def test_compaction_folds_ledger_into_snapshot(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+        self._collect(tracker, self._session("a", 2000, 200))
+        before = tracker._load_history()
+        assert tracker.ledger_file.stat().st_size > 0
+
+        with patch("openclaw_dash.metrics.costs.LEDGER_COMPACT_BYTES", 1):
+            self._collect(tracker, self._session("a", 3000, 300))
+        assert tracker.ledger_file.stat().st_size == 0
+        snapshot = json.loads(tracker.costs_file.read_text())
+        assert snapshot["ledger_seq"] > 0
+        assert snapshot["sessions"]["a"]["input_tokens"] == 3000
+        today = next(iter(before["daily"]))
+        assert snapshot["daily"][today]["total_input_tokens"] == 3000
+
+    def test_compaction_by_snapshot_age(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+        self._collect(tracker, self._session("a", 2000, 200))
+        assert tracker.ledger_file.stat().st_size > 0
+        with patch("openclaw_dash.metrics.costs.LEDGER_COMPACT_INTERVAL", 0.0):
+            self._collect(tracker, self._session("a", 2000, 200))
+        assert tracker.ledger_file.stat().st_size == 0
+
+    def test_other_instance_events_are_replayed(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+
+        # A second dashboard process has its own in-memory state
+        with patch.dict("openclaw_dash.metrics.costs._COST_STATES", clear=True):
+            self._collect(CostTracker(metrics_dir=tmp_path), self._session("b", 4000, 400))
+
+        result = self._collect(tracker, self._session("a", 1000, 100))
+        assert result["today"]["input_tokens"] == 5000
+
+    def test_crash_between_snapshot_and_truncate_is_not_double_counted(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+        self._collect(tracker, self._session("a", 2000, 200))
+        ledger = tracker.ledger_file.read_bytes()
+
+        with patch("openclaw_dash.metrics.costs.LEDGER_COMPACT_BYTES", 1):
+            self._collect(tracker, self._session("a", 2000, 200))
+        tracker.ledger_file.write_bytes(ledger)  # Truncation never happened
+
+        with patch.dict("openclaw_dash.metrics.costs._COST_STATES", clear=True):
+            history = tracker._load_history()
+            result = self._collect(CostTracker(metrics_dir=tmp_path))
+        assert sum(d["total_input_tokens"] for d in history["daily"].values()) == 2000
+        assert result["today"]["input_tokens"] == 2000
+
+    def test_concurrent_readers_replay_ledger_once(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+        with patch.dict("openclaw_dash.metrics.costs._COST_STATES", clear=True):
+            self._collect(CostTracker(metrics_dir=tmp_path), self._session("b", 4000, 400))
+
+        replay = CostTracker._replay_ledger
+        replayed = []
+
+        def slow_replay(self, state):
+            replayed.append(state.ledger_offset)
+            sleep(0.05)  # Let the other readers reach the same offset
+            replay(self, state)
+
+        with patch.object(CostTracker, "_replay_ledger", slow_replay):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: tracker.get_history(days=1), range(4)))
+        assert [r[0]["total_input_tokens"] for r in results] == [5000] * 4
+        assert len(replayed) == 1
+        state = costs._COST_STATES[tracker.costs_file]
+        assert state.ledger_offset == tracker.ledger_file.stat().st_size
+
+    def test_partial_and_malformed_ledger_lines(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path)
+        self._collect(tracker, self._session("a", 1000, 100))
+        event = {
+            "seq": 100,
+            "day": "2026-01-01",
+            "ts": "2026-01-01T00:00:00",
+            "key": "x",
+            "model": "gpt-4o",
+            "in": 10,
+            "out": 1,
+            "cost": 0.5,
+            "total_tokens": 11,
+            "input_tokens": 10,
+            "output_tokens": 1,
+        }
+        with open(tracker.ledger_file, "a") as f:
+            f.write("{not json\n")
+            f.write(json.dumps(event) + "\n")
+            f.write('{"seq": 101, "day": "2026-01')  # Still being written
+
+        history = tracker.get_history(days=30)
+        assert [h["date"] for h in history][-1] == "2026-01-01"
+        assert history[-1]["total_cost"] == 0.5
+
+
+class TestCostRetention:
+    """Tests for downsampling old cost history."""
+
+    @staticmethod
+    def _history():
+        daily = {}
+        for day, cost in [("2025-01-05", 1.0), ("2025-01-20", 2.0), ("2025-02-03", 4.0)]:
+            daily[day] = {
+                "date": day,
+                "total_input_tokens": 100,
+                "total_output_tokens": 10,
+                "total_cost": cost,
+                "session_count": 1,
+                "by_model": {"gpt-4o": {"input_tokens": 100, "output_tokens": 10, "cost": cost}},
+            }
+        daily["2026-03-01"] = dict(daily["2025-02-03"], date="2026-03-01", total_cost=8.0)
+        sessions = {
+            "old": {"input_tokens": 1, "output_tokens": 1, "last_updated": "2025-02-03T10:00:00"},
+            "new": {"input_tokens": 1, "output_tokens": 1, "last_updated": "2026-03-01T10:00:00"},
+        }
+        hourly = {"2025-02-03T10": 4.0, "2026-03-01T10": 8.0}
+        return {"daily": daily, "sessions": sessions, "hourly": hourly}
+
+    def test_downsampling_keeps_totals(self, tmp_path):
+        policy = RetentionPolicy(raw_days=30, daily_days=365)
+        tracker = CostTracker(metrics_dir=tmp_path, retention=policy)
+        tracker._save_history(self._history())
+
+        counts = tracker.apply_retention(today=date(2026, 3, 10))
+        assert counts == {"sessions_dropped": 1, "days_folded": 3}
+
+        snapshot = json.loads(tracker.costs_file.read_text())
+        assert list(snapshot["daily"]) == ["2026-03-01"]
+        assert snapshot["sessions"]["new"]["last_updated"] == "2026-03-01T10:00:00"
+        # The stale record is reduced to the baseline for the session's next increment
+        assert snapshot["sessions"]["old"] == {
+            "input_tokens": 1,
+            "output_tokens": 1,
+            "total_tokens": 0,
+        }
+        assert snapshot["hourly"] == {"2026-03-01T10": 8.0}
+        january = snapshot["monthly"]["2025-01"]
+        assert january["days"] == 2
+        assert january["total_cost"] == 3.0
+        assert january["by_model"]["gpt-4o"]["input_tokens"] == 200
+        assert [m["month"] for m in tracker.get_monthly_history()] == ["2025-02", "2025-01"]
+
+        with patch("openclaw_dash.collectors.sessions.collect") as mock_collect:
+            mock_collect.return_value = {"sessions": []}
+            summary = tracker.collect()["summary"]
+        assert summary["total_cost"] == 15.0
+        assert summary["days_tracked"] == 5  # Four history days plus today
+
+        # A second run finds nothing left to fold and leaves the snapshot alone
+        mtime = tracker.costs_file.stat().st_mtime_ns
+        assert tracker.apply_retention(today=date(2026, 3, 10)) == {
+            "sessions_dropped": 0,
+            "days_folded": 0,
+        }
+        assert tracker.costs_file.stat().st_mtime_ns == mtime
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_dropped_session_is_not_charged_again(self, tmp_path, backend):
+        tracker = CostTracker(
+            metrics_dir=tmp_path, backend=backend, retention=RetentionPolicy(30, 365)
+        )
+        session = {
+            "key": "main",
+            "model": "gpt-4o",
+            "totalTokens": 1500,
+            "inputTokens": 1000,
+            "outputTokens": 500,
+        }
+        with patch("openclaw_dash.collectors.sessions.collect") as mock_collect:
+            mock_collect.return_value = {"sessions": [session]}
+            before = tracker.collect()["today"]
+            assert before["cost"] > 0
+
+            tracker.apply_retention(today=date.today() + timedelta(days=60))
+            after = tracker.collect()["today"]
+        assert after["input_tokens"] == before["input_tokens"] == 1000
+        assert after["cost"] == before["cost"]
+
+    def test_zero_keeps_tier_forever(self, tmp_path):
+        tracker = CostTracker(metrics_dir=tmp_path, retention=RetentionPolicy(0, 0))
+        tracker._save_history(self._history())
+        assert tracker.apply_retention(today=date(2030, 1, 1)) == {
+            "sessions_dropped": 0,
+            "days_folded": 0,
+        }
+
+    def test_collect_schedules_background_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(costs, "BACKGROUND_RETENTION", True)
+        monkeypatch.setattr(costs, "_RETENTION_RUNS", {})
+        tracker = CostTracker(metrics_dir=tmp_path, retention=RetentionPolicy(1, 1))
+        tracker._save_history(self._history())
+
+        thread = tracker._schedule_retention()
+        thread.join(timeout=5)
+        assert "monthly" in json.loads(tracker.costs_file.read_text())
+        # Not due again until RETENTION_INTERVAL has passed
+        assert tracker._schedule_retention() is None
+
+
+class TestPerformanceBackfill:
+    """Tests for parallel performance backfill."""
+
+    @staticmethod
+    def _write_log(path, days=("2026-02-01", "2026-02-02"), per_day=200):
+        lines = []
+        for day in days:
+            for i in range(per_day):
+                mark = "✗" if i % 10 == 0 else "✓"
+                lines.append(f"{day}T08:00:{i % 60:02d}.000Z [ws] SYNC res {mark} chat.send {i}ms")
+                lines.append(f"{day}T08:00:{i % 60:02d}.000Z [gateway] heartbeat ok")
+        path.write_text("\n".join(lines) + "\n")
+
+    def test_split_line_ranges_aligned(self, tmp_path):
+        from openclaw_dash.metrics.performance import split_line_ranges
+
+        log = tmp_path / "gateway.log"
+        self._write_log(log)
+        data = log.read_bytes()
+
+        ranges = split_line_ranges(log, chunk_size=1000)
+        assert len(ranges) > 1
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+
+    def test_split_line_ranges_empty_file(self, tmp_path):
+        from openclaw_dash.metrics.performance import split_line_ranges
+
+        log = tmp_path / "empty.log"
+        log.write_text("")
+        assert split_line_ranges(log) == []
+
+    def test_latency_sketch_merge_matches_single(self):
+        from openclaw_dash.metrics.performance import LatencySketch
+
+        whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+        for v in range(1, 1001):
+            whole.add(v)
+            (left if v % 2 else right).add(v)
+        left.merge(right)
+
+        assert left.count == whole.count == 1000
+        assert left.quantile(0.95) == whole.quantile(0.95)
+        assert abs(whole.quantile(0.5) - 500) / 500 < 0.02
+
+    def test_backfill_parallel_matches_inline(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        log = tmp_path / "gateway.log"
+        self._write_log(log)
+
+        inline = PerformanceMetrics(metrics_dir=tmp_path / "a").backfill(
+            jobs=1, chunk_size=2048, log_files=[log]
+        )
+        parallel = PerformanceMetrics(metrics_dir=tmp_path / "b").backfill(
+            jobs=2, chunk_size=2048, log_files=[log]
+        )
+
+        assert inline["days"] == parallel["days"]
+        assert parallel["chunks"] > 1
+        assert set(parallel["days"]) == {"2026-02-01", "2026-02-02"}
+        day = parallel["days"]["2026-02-01"]
+        assert day["total_calls"] == 200
+        assert day["total_errors"] == 20
+        assert day["avg_latency_ms"] == 99.5
+
+    def test_backfill_matches_parse_logs_on_mixed_formats(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+        from openclaw_dash.metrics.performance import parse_log_range
+
+        log = tmp_path / "gateway.log"
+        lines = []
+        for i in range(100):
+            mark = "✗" if i % 10 == 0 else "✓"
+            lines.append(f"2026-02-01T08:00:{i % 60:02d}.000Z [ws] SYNC res {mark} chat.send {i}ms")
+            lines.append(
+                f'{{"type": "ws_response", "action": "tools.list", '
+                f'"success": {"false" if i % 4 == 0 else "true"}, "latency_ms": {i + 1}}}'
+            )
+            lines.append('{"type": "heartbeat", "note": "not a ws_response"}')
+        log.write_text("\n".join(lines) + "\n")
+
+        perf = PerformanceMetrics(metrics_dir=tmp_path)
+        with patch.object(perf, "_find_log_files", return_value=[log]):
+            expected = perf.parse_logs()
+
+        partial = parse_log_range(log, 0, log.stat().st_size, "2026-02-02")
+        actions = {**partial.by_day["2026-02-01"], **partial.by_day["2026-02-02"]}
+        assert partial.responses == 200
+        for name, m in expected.items():
+            got = actions[name]
+            assert (got.count, got.success_count, got.error_count, got.total_ms) == (
+                m.count,
+                m.success_count,
+                m.error_count,
+                m.total_ms,
+            )
+
+        result = PerformanceMetrics(metrics_dir=tmp_path / "b").backfill(
+            jobs=2, chunk_size=1024, log_files=[log]
+        )
+        assert sum(d["total_calls"] for d in result["days"].values()) == 200
+        assert sum(d["total_errors"] for d in result["days"].values()) == sum(
+            m.error_count for m in expected.values()
+        )
+
+    def test_backfill_writes_history(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        log = tmp_path / "gateway.log"
+        self._write_log(log, days=("2026-02-03",))
+
+        perf = PerformanceMetrics(metrics_dir=tmp_path)
+        perf.backfill(jobs=1, log_files=[log])
+
+        trend = perf.get_trend(days=7)
+        assert trend[0]["date"] == "2026-02-03"
+        assert trend[0]["total_calls"] == 200
+        assert "p95_latency_ms" in trend[0]
+
+
+class TestPerformanceParseLogs:
+    """Tests for the mmap-backed gateway log scan."""
+
+    def test_parse_logs_matches_line_by_line(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        log = tmp_path / "gateway.log"
+        log.write_text(
+            "2026-02-01T08:00:00.000Z [ws] SYNC res ✓ chat.send 120ms\n"
+            "2026-02-01T08:00:01.000Z [gateway] heartbeat\n"
+            '{"type": "ws_response", "action": "tools.list", "success": false, "latency_ms": 5}\n'
+            '{"msg": "[ws] SYNC res ✓ ignored 1ms"}\n'
+            "2026-02-01T08:00:02.000Z [ws] SYNC res ✗ chat.send 80ms"
+        )
+        perf = PerformanceMetrics(metrics_dir=tmp_path)
+
+        expected: dict[str, list[int]] = {}
+        for line in log.read_text().splitlines():
+            parsed = perf._parse_log_line(line)
+            if parsed and parsed.get("type") == "ws_response":
+                expected.setdefault(parsed["action"], []).append(parsed["latency_ms"])
+
+        with patch.object(perf, "_find_log_files", return_value=[log]):
+            result = perf.parse_logs()
+
+        assert {name: m.count for name, m in result.items()} == {
+            name: len(v) for name, v in expected.items()
+        }
+        assert result["chat.send"].total_ms == 200
+        assert result["chat.send"].error_count == 1
+        assert result["tools.list"].error_count == 1
+
+    def test_parse_logs_empty_file(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        log = tmp_path / "gateway.log"
+        log.write_text("")
+        perf = PerformanceMetrics(metrics_dir=tmp_path)
+        with patch.object(perf, "_find_log_files", return_value=[log]):
+            assert perf.parse_logs() == {}
+
+
+class TestPerformanceRotatedLogs:
+    """Tests for rotated/compressed gateway logs in performance metrics."""
+
+    @staticmethod
+    def _write_gz(path, lines):
+        import gzip
+
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_find_log_files_includes_rotated(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        (tmp_path / "gateway.log").write_text("")
+        (tmp_path / "gateway.log.1").write_text("")
+        self._write_gz(tmp_path / "gateway.log.2.gz", ["x"])
+        (tmp_path / "unrelated.txt").write_text("")
+
+        perf = PerformanceMetrics(metrics_dir=tmp_path / "metrics")
+        with (
+            patch("openclaw_dash.metrics.performance.GATEWAY_LOG_DIR", tmp_path),
+            patch("openclaw_dash.metrics.performance.TMP_LOG_DIR", tmp_path / "none"),
+        ):
+            names = {p.name for p in perf._find_log_files(limit=None)}
+        assert names == {"gateway.log", "gateway.log.1", "gateway.log.2.gz"}
+
+    def test_parse_logs_reads_gzip_and_caches(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics, performance
+
+        live = tmp_path / "gateway.log"
+        live.write_text("2026-02-02T08:00:00.000Z [ws] SYNC res ✓ chat.send 10ms\n")
+        archived = tmp_path / "gateway.log.1.gz"
+        self._write_gz(
+            archived,
+            [
+                "2026-02-01T08:00:00.000Z [ws] SYNC res ✓ chat.send 30ms",
+                "2026-02-01T08:00:01.000Z [ws] SYNC res ✗ chat.send 50ms",
+            ],
+        )
+
+        perf = PerformanceMetrics(metrics_dir=tmp_path / "metrics")
+        with patch.object(perf, "_find_log_files", return_value=[live, archived]):
+            first = perf.parse_logs()
+            with patch.object(perf, "_scan_log_file", wraps=perf._scan_log_file) as scan:
+                second = perf.parse_logs()
+                # Only the live log is rescanned; the archive comes from cache
+                assert [c.args[0] for c in scan.call_args_list] == [live]
+
+            # A fresh instance reuses the on-disk cache too
+            performance._ARCHIVE_CACHES.clear()
+            other = PerformanceMetrics(metrics_dir=tmp_path / "metrics")
+            with (
+                patch.object(other, "_find_log_files", return_value=[live, archived]),
+                patch.object(other, "_scan_log_file", wraps=other._scan_log_file) as scan,
+            ):
+                third = other.parse_logs()
+                assert [c.args[0] for c in scan.call_args_list] == [live]
+
+        for result in (first, second, third):
+            m = result["chat.send"]
+            assert (m.count, m.error_count, m.total_ms) == (3, 1, 90)
+
+    def test_archive_cache_invalidated_on_change(self, tmp_path):
+        import os
+
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        archived = tmp_path / "gateway.log.1.gz"
+        self._write_gz(archived, ["[ws] SYNC res ✓ chat.send 30ms"])
+        perf = PerformanceMetrics(metrics_dir=tmp_path / "metrics")
+        with patch.object(perf, "_find_log_files", return_value=[archived]):
+            assert perf.parse_logs()["chat.send"].count == 1
+
+            self._write_gz(archived, ["[ws] SYNC res ✓ chat.send 30ms"] * 2)
+            os.utime(archived, (2_000_000_000, 2_000_000_000))
+            assert perf.parse_logs()["chat.send"].count == 2
+
+    def test_backfill_includes_gzip(self, tmp_path):
+        from openclaw_dash.metrics import PerformanceMetrics
+
+        archived = tmp_path / "gateway.log.1.gz"
+        self._write_gz(archived, ["2026-02-01T08:00:00.000Z [ws] SYNC res ✓ chat.send 30ms"] * 5)
+        live = tmp_path / "gateway.log"
+        live.write_text("2026-02-02T08:00:00.000Z [ws] SYNC res ✓ chat.send 10ms\n" * 3)
+
+        result = PerformanceMetrics(metrics_dir=tmp_path / "metrics").backfill(
+            jobs=2, log_files=[live, archived]
+        )
+        assert result["days"]["2026-02-01"]["total_calls"] == 5
+        assert result["days"]["2026-02-02"]["total_calls"] == 3
+
+
+class TestActivityBitmap:
+    """Tests for the per-day activity bitmap."""
+
+    def test_mark_and_scan(self):
+        bitmap = ActivityBitmap()
+        today = date(2026, 3, 20)
+        for i in range(20):
+            bitmap.mark(today - timedelta(days=i))
+        bitmap.mark(today - timedelta(days=25))
+
+        assert bitmap.streak(today) == 20
+        assert bitmap.streak(today + timedelta(days=1)) == 20  # Nothing yet today
+        assert bitmap.streak(today + timedelta(days=2)) == 0
+        assert bitmap.last_active() == today
+        assert bitmap.is_active(today - timedelta(days=25))
+        assert not bitmap.is_active(today - timedelta(days=21))
+
+    def test_grows_backwards_and_round_trips(self):
+        bitmap = ActivityBitmap()
+        bitmap.mark(date(2026, 3, 1))
+        bitmap.mark(date(2025, 6, 1))
+        bitmap.mark(date(2026, 3, 2))
+
+        restored = ActivityBitmap.from_dict(json.loads(json.dumps(bitmap.to_dict())))
+        assert restored.is_active(date(2025, 6, 1))
+        assert restored.is_active(date(2026, 3, 1))
+        assert not restored.is_active(date(2025, 6, 2))
+        assert restored.streak(date(2026, 3, 2)) == 2
+        assert len(restored.bits) <= (date(2026, 3, 2) - date(2025, 6, 1)).days // 8 + 2
+
+    def test_long_streak(self):
+        bitmap = ActivityBitmap()
+        today = date(2026, 3, 20)
+        for i in range(400):
+            bitmap.mark(today - timedelta(days=i))
+        assert bitmap.streak(today) == 400
+
+    def test_empty(self):
+        assert ActivityBitmap().streak(date(2026, 3, 20)) == 0
+        assert ActivityBitmap().last_active() is None
+        assert ActivityBitmap.from_dict({"bits": "not base64!"}).start is None
+
+
+class _FakeGitHub:
+    """Serves user events newest first, pages of ``per_page``."""
+
+    def __init__(self, events):
+        self.events = events
+        self.calls = []
+        self.fail = False
+
+    def rest(self, path, params=None):
+        self.calls.append((path, params))
+        if self.fail:
+            raise GitHubError("GitHub API error: 502")
+        if path == "user":
+            return {"login": "alice"}
+        per_page = params["per_page"]
+        start = (params.get("page", 1) - 1) * per_page
+        return self.events[start : start + per_page]
+
+    def close(self):
+        pass
+
+
+def _events(days_ago, first_id=1):
+    """One event per entry in ``days_ago`` (oldest last), ids ascending with time."""
+    today = datetime.combine(date.today(), time(12), tzinfo=timezone.utc)
+    ids = range(first_id + len(days_ago) - 1, first_id - 1, -1)
+    return [
+        {"id": str(event_id), "created_at": (today - timedelta(days=d)).isoformat()}
+        for event_id, d in zip(ids, days_ago)
+    ]
+
+
+class TestContributionStreak:
+    """Tests for the incrementally updated contribution streak."""
+
+    def test_only_new_events_are_applied(self, tmp_path):
+        fake = _FakeGitHub(_events([0, 1, 2, 5]))
+        reset_github_data(fake)
+        metrics = GitHubMetrics(metrics_dir=tmp_path)
+
+        result = metrics.get_contribution_streak("alice")
+        assert result["streak_days"] == 3
+        saved = json.loads((tmp_path / "github.json").read_text())["activity"]["alice"]
+        assert saved["last_event_id"] == 4
+
+        # Older events falling out of the API window are still counted
+        fake.events = _events([0, 1], first_id=3)
+        mtime = (tmp_path / "github.json").stat().st_mtime_ns
+        assert metrics.get_contribution_streak("alice")["streak_days"] == 3
+        assert (tmp_path / "github.json").stat().st_mtime_ns == mtime  # Nothing new
+
+        fake.events = _events([0], first_id=6) + fake.events
+        assert metrics.get_contribution_streak("alice")["streak_days"] == 3
+        assert (
+            json.loads((tmp_path / "github.json").read_text())["activity"]["alice"]["last_event_id"]
+            == 6
+        )
+
+    def test_history_outlasts_api_window(self, tmp_path):
+        metrics = GitHubMetrics(metrics_dir=tmp_path)
+        bitmap = ActivityBitmap(last_event_id=1000)
+        for i in range(1, 200):
+            bitmap.mark(date.today() - timedelta(days=i))
+        (tmp_path / "github.json").write_text(json.dumps({"activity": {"alice": bitmap.to_dict()}}))
+
+        reset_github_data(_FakeGitHub(_events([0], first_id=1001)))
+        result = metrics.get_contribution_streak("alice")
+        assert result["streak_days"] == 200
+        assert result["last_activity"] == date.today().isoformat()
+
+    def test_reads_further_pages_only_when_all_new(self, tmp_path):
+        fake = _FakeGitHub(_events(list(range(150))))
+        reset_github_data(fake)
+        metrics = GitHubMetrics(metrics_dir=tmp_path)
+
+        assert metrics.get_contribution_streak("alice")["streak_days"] == 150
+        assert [params.get("page", 1) for _, params in fake.calls] == [1, 2]
+
+        fake.calls.clear()
+        metrics.get_contribution_streak("alice")
+        assert len(fake.calls) == 1
+
+    def test_fetch_error_falls_back_to_bitmap(self, tmp_path):
+        fake = _FakeGitHub(_events([0, 1]))
+        reset_github_data(fake)
+        metrics = GitHubMetrics(metrics_dir=tmp_path)
+        metrics.get_contribution_streak("alice")
+
+        fake.fail = True
+        result = metrics.get_contribution_streak("alice")
+        assert result["streak_days"] == 2
+        assert result["error"] == "Could not fetch events"
+
+        assert metrics.get_contribution_streak("bob") == {
+            "streak_days": 0,
+            "error": "Could not fetch events",
+        }
+
+    def test_collect_keeps_activity(self, tmp_path):
+        reset_github_data(_FakeGitHub(_events([0, 1])))
+        metrics = GitHubMetrics(metrics_dir=tmp_path, repos=["o/a"])
+        with (
+            patch.object(metrics, "get_pr_cycle_times", return_value=[]),
+            patch.object(metrics, "get_todo_trends", return_value={"repos": {}}),
+        ):
+            result = metrics.collect()
+
+        assert result["streak"]["streak_days"] == 2
+        history = json.loads((tmp_path / "github.json").read_text())
+        assert "alice" in history["activity"]
+        assert date.today().isoformat() in history["streaks"]
@@ -0,0 +1,229 @@
+"""Tests for the SQLite metrics store."""
+
+from unittest.mock import patch
+
+import pytest
+
+from openclaw_dash.metrics import CostTracker, GitHubMetrics, PerformanceMetrics
+from openclaw_dash.metrics.performance import ToolCallMetric
+from openclaw_dash.metrics.store import MetricsStore, get_store
+
+
+def _session(key, inp, out, model="claude-sonnet-4"):
+    return {
+        "key": key,
+        "model": model,
+        "inputTokens": inp,
+        "outputTokens": out,
+        "totalTokens": inp + out,
+    }
+
+
+def _collect(tracker, *sessions):
+    with patch("openclaw_dash.collectors.sessions.collect") as mock_collect:
+        mock_collect.return_value = {"sessions": list(sessions)}
+        return tracker.collect()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(tmp_path / "metrics.db")
+    yield store
+    store.close()
+
+
+class TestMetricsStore:
+    def test_uses_wal(self, store):
+        assert store._query("PRAGMA journal_mode")[0][0] == "wal"
+
+    def test_get_store_follows_backend(self, tmp_path):
+        assert get_store(tmp_path, backend="json") is None
+        store = get_store(tmp_path, backend="sqlite")
+        assert store is get_store(tmp_path, backend="sqlite")
+        assert store.path == tmp_path / "metrics.db"
+
+    def test_history_queries_use_indexes(self, store):
+        plans = {
+            "latest": store._query(
+                "EXPLAIN QUERY PLAN SELECT * FROM session_snapshots WHERE session_key = ?"
+                " ORDER BY recorded_at DESC LIMIT 1",
+                ("k",),
+            ),
+            "range": store._query(
+                "EXPLAIN QUERY PLAN SELECT * FROM daily_costs WHERE date BETWEEN ? AND ?",
+                ("2026-01-01", "2026-02-01"),
+            ),
+            "snapshots_by_date": store._query(
+                "EXPLAIN QUERY PLAN SELECT * FROM session_snapshots WHERE date = ?",
+                ("2026-01-01",),
+            ),
+        }
+        for name, rows in plans.items():
+            detail = " ".join(row["detail"] for row in rows)
+            assert "USING INDEX" in detail or "USING PRIMARY KEY" in detail, (name, detail)
+
+    def test_cost_range_and_history(self, store):
+        for day in ("2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"):
+            store.record_cost_event(
+                {
+                    "day": day,
+                    "ts": f"{day}T10:00:00",
+                    "key": "s",
+                    "model": "gpt-4o",
+                    "in": 100,
+                    "out": 10,
+                    "cost": 0.25,
+                    "total_tokens": 110,
+                    "input_tokens": 100,
+                    "output_tokens": 10,
+                }
+            )
+        assert [d["date"] for d in store.cost_range("2026-01-02", "2026-01-03")] == [
+            "2026-01-03",
+            "2026-01-02",
+        ]
+        history = store.cost_history(2)
+        assert [d["date"] for d in history] == ["2026-01-04", "2026-01-03"]
+        assert history[0]["by_model"]["gpt-4o"] == {
+            "input_tokens": 100,
+            "output_tokens": 10,
+            "cost": 0.25,
+        }
+        assert store.cost_summary() == (1.0, 4)
+        assert store.latest_session("s")["last_updated"] == "2026-01-04T10:00:00"
+
+    def test_cost_retention_keeps_totals(self, store):
+        for day in ("2025-01-05", "2025-01-20", "2025-02-03", "2026-03-01"):
+            store.record_cost_event(
+                {
+                    "day": day,
+                    "ts": f"{day}T10:00:00",
+                    "key": day,
+                    "model": "gpt-4o",
+                    "in": 100,
+                    "out": 10,
+                    "cost": 0.5,
+                    "total_tokens": 110,
+                    "input_tokens": 100,
+                    "output_tokens": 10,
+                }
+            )
+        store.record_cost_event(
+            {
+                "day": "2026-03-01",
+                "ts": "2026-03-01T11:00:00",
+                "key": "2025-01-05",
+                "model": "gpt-4o",
+                "in": 10,
+                "out": 1,
+                "cost": 0.05,
+                "total_tokens": 121,
+                "input_tokens": 110,
+                "output_tokens": 11,
+            }
+        )
+        before = store.cost_summary()
+        counts = store.apply_cost_retention("2026-02-01", "2025-03-01")
+        # Only snapshots superseded by a later one go; each session keeps its latest
+        assert counts == {"sessions_dropped": 1, "days_folded": 3}
+        assert store.cost_summary() == before
+        assert [d["date"] for d in store.cost_history(30)] == ["2026-03-01"]
+        months = store.cost_months()
+        assert [(m["month"], m["days"]) for m in months] == [("2025-02", 1), ("2025-01", 2)]
+        assert months[1]["by_model"]["gpt-4o"]["input_tokens"] == 200
+        assert store.latest_session("2025-01-05")["input_tokens"] == 110
+        assert store.latest_session("2025-01-20")["input_tokens"] == 100
+
+        # Later folds into an existing month add to it
+        store.record_cost_event({"day": "2025-01-30"})
+        store.apply_cost_retention(None, "2025-03-01")
+        assert store.cost_months()[1]["days"] == 3
+
+    def test_failed_transaction_rolls_back(self, store):
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.record_cost_event({"day": "2026-01-01"})
+                raise RuntimeError
+        assert not store.has_cost_day("2026-01-01")
+
+
+class TestSqliteBackend:
+    def test_cost_tracker_matches_json_backend(self, tmp_path):
+        json_tracker = CostTracker(metrics_dir=tmp_path / "json", backend="json")
+        sqlite_tracker = CostTracker(metrics_dir=tmp_path / "sqlite", backend="sqlite")
+        steps = [
+            [_session("a", 1000, 100)],
+            [_session("a", 3000, 300), _session("b", 500, 50, model="gpt-4o")],
+            [_session("a", 3000, 300), _session("b", 500, 50, model="gpt-4o")],
+            [_session("b", 900, 90, model="gpt-4o"), {"key": "c", "totalTokens": 1000}],
+        ]
+        for sessions in steps:
+            expected = _collect(json_tracker, *sessions)
+            actual = _collect(sqlite_tracker, *sessions)
+            for result in (expected, actual):
+                result.pop("collected_at")
+            assert actual == expected
+
+        assert not (tmp_path / "sqlite" / "costs.json").exists()
+        json_history = json_tracker.get_history()
+        sqlite_history = sqlite_tracker.get_history()
+        assert sqlite_history[0]["total_cost"] == pytest.approx(json_history[0]["total_cost"])
+        assert sqlite_history[0]["session_count"] == json_history[0]["session_count"]
+
+    def test_performance_trend(self, tmp_path):
+        perf = PerformanceMetrics(metrics_dir=tmp_path, backend="sqlite")
+        metric = ToolCallMetric(name="status", count=4, total_ms=400, error_count=1)
+        with patch.object(perf, "parse_logs", return_value={"status": metric}):
+            perf.collect()
+        trend = perf.get_trend(days=7)
+        assert len(trend) == 1
+        assert trend[0]["total_calls"] == 4
+        assert trend[0]["avg_latency_ms"] == 100
+        assert "p95_latency_ms" not in trend[0]
+        assert not perf.perf_file.exists()
+
+    def test_streak_history(self, tmp_path):
+        github = GitHubMetrics(metrics_dir=tmp_path, backend="sqlite")
+        github.store.upsert_streak("2026-01-01", {"username": "me", "streak_days": 3})
+        github.store.upsert_streak("2026-01-02", {"streak_days": 0, "error": "gh command failed"})
+        assert github.get_streak_history(days=30) == [
+            {"date": "2026-01-02", "streak_days": 0, "error": "gh command failed"},
+            {"date": "2026-01-01", "username": "me", "streak_days": 3},
+        ]
+
+
+class TestMigration:
+    def test_migrate_from_json(self, tmp_path, store):
+        tracker = CostTracker(metrics_dir=tmp_path, backend="json")
+        _collect(tracker, _session("a", 1000, 100))
+        _collect(tracker, _session("a", 2000, 200), _session("b", 10, 1, model="gpt-4o"))
+        perf = PerformanceMetrics(metrics_dir=tmp_path, backend="json")
+        perf._update_days(
+            {"2026-01-01": {"total_calls": 5, "total_errors": 1, "avg_latency_ms": 12}}
+        )
+        github = GitHubMetrics(metrics_dir=tmp_path, backend="json")
+        github._save_history({"streaks": {"2026-01-01": {"streak_days": 2}}, "todo_trends": {}})
+
+        counts = store.migrate_from_json(tmp_path)
+        assert counts == {
+            "daily_costs": 1,
+            "monthly_costs": 0,
+            "hourly_costs": len(tracker._load_history()["hourly"]),
+            "session_snapshots": 2,
+            "perf_daily": 1,
+            "github_streaks": 1,
+        }
+        assert store.migrate_from_json(tmp_path) == counts  # Idempotent
+
+        migrated = store.cost_history(30)
+        original = tracker.get_history(30)
+        assert migrated[0]["total_input_tokens"] == original[0]["total_input_tokens"]
+        assert migrated[0]["by_model"] == original[0]["by_model"]
+        assert store.latest_session("a")["input_tokens"] == 2000
+        assert store.perf_trend(7)[0]["total_calls"] == 5
+        assert store.streak_history(7) == [{"date": "2026-01-01", "streak_days": 2}]
+
+        # Collecting on top of migrated history continues from the session snapshots
+        sqlite_tracker = CostTracker(metrics_dir=tmp_path, backend="sqlite")
+        result = _collect(sqlite_tracker, _session("a", 2000, 200))
+        assert result["today"]["input_tokens"] == original[0]["total_input_tokens"]
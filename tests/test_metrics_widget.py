@@ -217,6 +217,27 @@ class TestMetricsPanel:
         assert len(children) >= 1
         assert isinstance(children[0], Static)
 
+    def test_forecast_failure_falls_back(self):
+        """A failing tracker forecast should fall back to the simple projection."""
+        daily = [{"date": f"2026-02-0{d}", "cost": 1.0} for d in range(1, 8)]
+        content = MagicMock()
+        panel = MetricsPanel()
+        with (
+            patch("openclaw_dash.widgets.metrics.CostTracker") as mock_tracker_cls,
+            patch("openclaw_dash.widgets.metrics.BillingCollector") as mock_billing_cls,
+            patch.object(panel, "query_one", return_value=content),
+        ):
+            mock_tracker = mock_tracker_cls.return_value
+            mock_tracker.collect.return_value = {"today": {"cost": 1.0}, "daily_costs": daily}
+            mock_tracker.forecast.side_effect = ValueError("no history")
+            mock_billing_cls.return_value.collect.return_value = {"has_api_data": False}
+            panel.refresh_data()
+
+        text = content.update.call_args[0][0]
+        expected = calculate_cost_forecast(daily)["projected_monthly"]
+        assert f"Proj/Mo: ${expected:.2f}" in text
+        assert "Costs: unavailable" not in text
+
 
 class TestMetricsPanelIntegration:
     """Integration tests for metrics panels in the app."""
@@ -0,0 +1,111 @@
+"""Tests for model pricing resolution."""
+
+import pytest
+
+from openclaw_dash.metrics import CostTracker, pricing
+from openclaw_dash.metrics.pricing import PricingResolver, normalize_model
+
+
+class TestNormalizeModel:
+    @pytest.mark.parametrize(
+        "model, expected",
+        [
+            ("claude-sonnet-4-5-20250929", "claude-sonnet-4-5"),
+            ("anthropic/claude-3-5-sonnet", "claude-3-5-sonnet"),
+            ("openrouter/anthropic/claude-3.5-sonnet", "claude-3-5-sonnet"),
+            ("us.anthropic.claude-3-5-sonnet-20240620-v1:0", "claude-3-5-sonnet"),
+            ("claude-3-5-sonnet@20240620", "claude-3-5-sonnet"),
+            ("GPT-4o-2024-08-06", "gpt-4o"),
+            ("claude-3-5-haiku-latest", "claude-3-5-haiku"),
+            ("gpt-3.5-turbo", "gpt-3-5-turbo"),
+        ],
+    )
+    def test_normalize(self, model, expected):
+        assert normalize_model(model) == expected
+
+
+class TestPricingResolver:
+    @pytest.mark.parametrize(
+        "model, key",
+        [
+            ("claude-sonnet-4-5-20250929", "claude-sonnet-4-5"),
+            ("anthropic/claude-opus-4-5", "claude-opus-4-5"),
+            ("claude-opus-4-1-20250805", "claude-opus-4"),
+            ("gpt-4o-mini-2024-07-18", "gpt-4o-mini"),
+            ("gpt-4o-audio-preview", "gpt-4o"),
+            ("gpt-4-0613", "gpt-4"),
+            ("gpt-3.5-turbo-0125", "gpt-3.5-turbo"),
+            ("o1-preview", "o1"),
+            ("gemini-1.5-pro-002", "gemini-1.5-pro"),
+            ("ollama/llama3.1:8b", "local"),
+            ("unknown-model", "default"),
+        ],
+    )
+    def test_resolves_variants(self, model, key):
+        assert PricingResolver().resolve(model).key == key
+
+    @pytest.mark.parametrize(
+        "model, key, rates",
+        [
+            ("gpt-4.1", "gpt-4.1", (2.00, 8.00)),
+            ("gpt-4.1-2025-04-14", "gpt-4.1", (2.00, 8.00)),
+            ("gpt-4.1-mini", "gpt-4.1-mini", (0.40, 1.60)),
+            ("openai/gpt-4.1-nano", "gpt-4.1-nano", (0.10, 0.40)),
+            ("gpt-4.5-preview", "gpt-4.5", (75.00, 150.00)),
+        ],
+    )
+    def test_dotted_versions(self, model, key, rates):
+        price = PricingResolver().resolve(model)
+        assert (price.key, price.input, price.output) == (key, *rates)
+
+    def test_dotted_version_is_not_cut(self):
+        resolver = PricingResolver(
+            {"gpt-4": {"input": 30, "output": 60}, "default": {"input": 3, "output": 15}}
+        )
+        assert resolver.resolve("gpt-4.1").key == "default"
+        assert resolver.resolve("gpt-4.1-mini").key == "default"
+        assert resolver.resolve("gpt-4.5-preview").key == "default"
+        assert resolver.resolve("gpt-4-32k").key == "gpt-4"
+
+    def test_prefix_needs_segment_boundary(self):
+        resolver = PricingResolver(
+            {"gpt-4": {"input": 1, "output": 1}, "default": {"input": 9, "output": 9}}
+        )
+        assert resolver.resolve("gpt-4o").key == "default"
+        assert resolver.resolve("gpt-4-32k").key == "gpt-4"
+
+    def test_table_match_beats_local_indicator(self):
+        resolver = PricingResolver(
+            {**pricing.MODEL_PRICING, "mistral-large": {"input": 2.0, "output": 6.0}}
+        )
+        assert resolver.resolve("mistral-large-latest").input == 2.0
+        assert resolver.resolve("mistral-7b").key == "local"
+
+    def test_aliases(self):
+        resolver = PricingResolver(aliases={"sonnet": "claude-sonnet-4-5", "bad": "nope"})
+        assert resolver.resolve("Sonnet").key == "claude-sonnet-4-5"
+        assert resolver.resolve("bad").key == "default"
+
+    def test_memoizes(self, monkeypatch):
+        resolver = PricingResolver()
+        calls = []
+        original = resolver._resolve
+        monkeypatch.setattr(resolver, "_resolve", lambda m: calls.append(m) or original(m))
+        for _ in range(3):
+            resolver.resolve("claude-sonnet-4-5-20250929")
+        assert calls == ["claude-sonnet-4-5-20250929"]
+
+
+class TestConfiguredPricing:
+    def test_config_extends_table(self, monkeypatch):
+        monkeypatch.setattr(
+            pricing,
+            "configured_pricing",
+            lambda: ({"my-finetune": {"input": 1.0, "output": 2.0}}, {"house": "my-finetune"}),
+        )
+        pricing.reset_resolver()
+        _, _, total = CostTracker.calculate_cost("house", 1_000_000, 1_000_000)
+        assert total == 3.0
+
+    def test_dated_model_gets_model_price(self):
+        assert CostTracker.calculate_cost("claude-haiku-4-5-20251001", 1_000_000, 0)[0] == 0.25
@@ -0,0 +1,187 @@
+"""Tests for per-process resource tracking."""
+
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from openclaw_dash.collectors import processes, resources
+from openclaw_dash.collectors.processes import PROCESS_SPECS, ProcessSpec, ProcessTracker
+from openclaw_dash.sinks.manager import SinkManager
+from openclaw_dash.widgets.resources import _format_process
+
+pytestmark = pytest.mark.skipif(not processes.PSUTIL_AVAILABLE, reason="psutil not installed")
+
+FAKE = ProcessSpec("fake", "Fake server", names=("python",), cmdline=("fake-model-server",))
+
+
+@pytest.fixture
+def spawn():
+    """Start sleeping Python processes tagged as a fake model server."""
+    started = []
+
+    def start():
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)", "fake-model-server"]
+        )
+        started.append(proc)
+        deadline = time.monotonic() + 5
+        while "fake-model-server" not in processes.psutil.Process(proc.pid).cmdline():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)  # Not exec'd yet
+        return proc
+
+    yield start
+    for proc in started:
+        proc.kill()
+        proc.wait()
+
+
+def _by_key(results):
+    return {entry["key"]: entry for entry in results}
+
+
+class TestProcessSpec:
+    """Tests for recognising the tracked processes."""
+
+    @pytest.mark.parametrize(
+        ("name", "cmdline", "key"),
+        [
+            ("node", "node /usr/lib/node_modules/openclaw/dist/index.js gateway", "gateway"),
+            ("openclaw-gateway", "openclaw-gateway gateway --port 18789", "gateway"),
+            ("ollama", "/usr/local/bin/ollama serve", "ollama"),
+            ("LM Studio", "/Applications/LM Studio.app/Contents/MacOS/LM Studio", "lm-studio"),
+            ("python3.11", "python -m vllm.entrypoints.openai.api_server --model m", "vllm"),
+            ("vllm", "/opt/venv/bin/vllm serve meta-llama/Llama-3-8B", "vllm"),
+        ],
+    )
+    def test_matches(self, name, cmdline, key):
+        assert [spec.key for spec in PROCESS_SPECS if spec.matches(name, cmdline)] == [key]
+
+    @pytest.mark.parametrize(
+        ("name", "cmdline"),
+        [
+            ("ollama", "ollama run llama3"),
+            ("node", "node server.js"),
+            ("vim", "vim vllm/config.py"),
+        ],
+    )
+    def test_ignores(self, name, cmdline):
+        assert not any(spec.matches(name, cmdline) for spec in PROCESS_SPECS)
+
+
+class TestProcessTracker:
+    """Tests for discovery and sampling."""
+
+    def test_samples_found_process(self, spawn):
+        proc = spawn()
+        tracker = ProcessTracker((FAKE,))
+
+        tracker.sample()
+        entry = _by_key(tracker.sample())["fake"]
+
+        assert entry["running"] and entry["pid"] == proc.pid
+        assert entry["name"] == "Fake server"
+        assert entry["rss"] > 0 and entry["rss_mb"] > 0
+        assert entry["threads"] >= 1
+        assert entry["cpu_percent"] >= 0
+        if sys.platform.startswith("linux"):
+            assert entry["fds"] >= 3
+            assert entry["read_bps"] is not None
+
+    def test_handles_are_reused(self, spawn):
+        spawn()
+        tracker = ProcessTracker((FAKE,))
+        for _ in range(3):
+            tracker.sample()
+        assert tracker.scans == 1
+
+    def test_rediscovers_when_pid_disappears(self, spawn, monkeypatch):
+        first = spawn()
+        tracker = ProcessTracker((FAKE,))
+        assert _by_key(tracker.sample())["fake"]["pid"] == first.pid
+
+        first.kill()
+        first.wait()
+        assert _by_key(tracker.sample())["fake"] == {
+            "key": "fake",
+            "name": "Fake server",
+            "running": False,
+        }
+        assert tracker.scans == 2
+
+        # Not running: only rescanned every REDISCOVER_INTERVAL
+        second = spawn()
+        assert not _by_key(tracker.sample())["fake"]["running"]
+        monkeypatch.setattr(processes, "REDISCOVER_INTERVAL", 0.0)
+        assert _by_key(tracker.sample())["fake"]["pid"] == second.pid
+
+    def test_tracks_oldest_match(self, spawn):
+        parent = spawn()
+        spawn()
+        tracker = ProcessTracker((FAKE,))
+        assert _by_key(tracker.sample())["fake"]["pid"] == parent.pid
+
+    def test_not_running(self):
+        tracker = ProcessTracker((ProcessSpec("none", "None", cmdline=("no-such-process-x",)),))
+        assert tracker.sample() == [{"key": "none", "name": "None", "running": False}]
+
+
+class TestProcessReporting:
+    """Tests for the sampler, panel and sinks."""
+
+    def test_sampler_records_processes(self, spawn):
+        spawn()
+        sampler = resources.ResourceSampler()
+        sampler.processes = ProcessTracker((FAKE,))
+        sampler._prime()
+        data = sampler.sample()
+
+        assert _by_key(data["processes"])["fake"]["running"]
+        store = resources.get_timeseries()
+        assert store.latest("proc.fake.rss_mb") > 0
+
+    def test_format_process(self):
+        line = _format_process(
+            {
+                "name": "Ollama",
+                "cpu_percent": 41.5,
+                "rss": 5 * 1024**3,
+                "fds": 32,
+                "threads": 24,
+                "read_bps": 1024.0,
+                "write_bps": 1024.0,
+            }
+        )
+        assert "Ollama" in line and "41.5%" in line
+        assert "5.0GB" in line and "32f/24t" in line and "2.0 KB/s" in line
+
+        assert "?%" in _format_process({"name": "LM Studio", "pid": 1})
+
+    def test_published_to_sinks(self, monkeypatch):
+        sampler = resources.get_sampler()
+        sampler._latest = {
+            "available": True,
+            "processes": [
+                {"key": "gateway", "name": "Gateway", "running": True, "cpu_percent": 1.0},
+                {"key": "vllm", "name": "vLLM", "running": False},
+            ],
+        }
+        monkeypatch.setattr(SinkManager, "_recent_resources", staticmethod(lambda: {}))
+        monkeypatch.setattr("openclaw_dash.sinks.manager.resources.collect", lambda: {})
+        monkeypatch.setattr("openclaw_dash.sinks.manager.gateway.collect", lambda: {})
+        monkeypatch.setattr("openclaw_dash.sinks.manager.alerts.collect", lambda: {})
+        manager = SinkManager()
+        sink = MagicMock()
+        manager._sinks = [sink]
+
+        manager.refresh_and_publish()
+
+        payload = sink.publish_batch.call_args[0][0]
+        assert [p["key"] for p in payload["processes"]] == ["gateway"]
+
+    def test_demo_mode(self, demo_mode):
+        data = resources.collect()
+        assert _by_key(data["processes"])["ollama"]["running"]
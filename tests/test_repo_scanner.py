@@ -0,0 +1,182 @@
+"""Tests for the repo-scanner.py tool's incremental TODO counting."""
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).parent.parent / "src" / "openclaw_dash" / "tools"
+
+# Load the module with dash in filename using importlib; it imports the
+# tools' shared config module, so the tools directory must be importable
+sys.path.insert(0, str(TOOLS_DIR))
+try:
+    _spec = importlib.util.spec_from_file_location("repo_scanner", TOOLS_DIR / "repo-scanner.py")
+    repo_scanner = importlib.util.module_from_spec(_spec)
+    sys.modules["repo_scanner"] = repo_scanner
+    _spec.loader.exec_module(repo_scanner)
+finally:
+    sys.path.remove(str(TOOLS_DIR))
+
+ENV = {
+    "GIT_AUTHOR_NAME": "Ada",
+    "GIT_AUTHOR_EMAIL": "ada@example.com",
+    "GIT_COMMITTER_NAME": "Ada",
+    "GIT_COMMITTER_EMAIL": "ada@example.com",
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+FILES = {
+    "app.py": "x = 1  # TODO: handle retries\n",
+    "util.py": '"""Helpers.\n\nTODO: document these\n"""\n\n\ndef f():\n    pass  # FIXME: slow\n',
+    "clean.py": "def g():\n    return 2\n",
+    "web/index.ts": "// HACK: remove once the flag ships\nexport const a = 1;\n",
+}
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(path, *args):
+    subprocess.run(["git", *args], cwd=path, capture_output=True, check=True, env=ENV)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A committed checkout, with tool caches under tmp_path."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "repo"
+    for rel_path, text in FILES.items():
+        (path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (path / rel_path).write_text(text)
+    git(path, "init", "-q", "-b", "main")
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", "first")
+    return path
+
+
+@pytest.fixture
+def rescanned(monkeypatch):
+    """The files each scan reads, for both scan modes."""
+    scans: list[list[str]] = []
+    real_smart, real_grep = repo_scanner._scan_smart_chunk, repo_scanner._scan_grep
+
+    def smart(repo_path, rel_paths):
+        scans.append(sorted(rel_paths))
+        return real_smart(repo_path, rel_paths)
+
+    def grep(repo_path, rel_paths):
+        scans.append(sorted(rel_paths))
+        return real_grep(repo_path, rel_paths)
+
+    monkeypatch.setattr(repo_scanner, "_scan_smart_chunk", smart)
+    monkeypatch.setattr(repo_scanner, "_scan_grep", grep)
+    return scans
+
+
+def cold_count(repo_path, skip_docstrings):
+    """count_todos() with the blob cache deleted."""
+    shutil.rmtree(repo_scanner._blob_cache_path(repo_path).parent, ignore_errors=True)
+    return repo_scanner.count_todos(repo_path, skip_docstrings=skip_docstrings)
+
+
+@pytest.mark.parametrize("skip_docstrings", [True, False], ids=["smart", "grep"])
+class TestIncrementalTodoCount:
+    """count_todos() only reads files whose blob changed, with the same result."""
+
+    def test_unchanged_repo_rescans_nothing(self, repo, rescanned, skip_docstrings):
+        first = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        assert rescanned == [sorted(FILES)]
+        assert repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings) == first
+        assert rescanned == [sorted(FILES)]
+
+    def test_staged_edit_is_rescanned(self, repo, rescanned, skip_docstrings):
+        first = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        (repo / "clean.py").write_text("def g():\n    return 2  # FIXME: magic number\n")
+        git(repo, "add", "clean.py")
+
+        warm = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        assert rescanned[1] == ["clean.py"]
+        assert warm["total"] == first["total"] + 1
+        assert warm == cold_count(repo, skip_docstrings)
+
+    def test_unstaged_edit_is_rescanned(self, repo, rescanned, skip_docstrings):
+        first = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        (repo / "app.py").write_text("x = 1\n")
+        assert repo_scanner._tracked_blobs(repo)["app.py"] is None  # Listed by ls-files -m
+
+        warm = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        assert rescanned[1] == ["app.py"]
+        assert warm["total"] == first["total"] - 1
+        # Still modified: read again on every scan
+        assert repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings) == warm
+        assert rescanned[2] == ["app.py"]
+        assert warm == cold_count(repo, skip_docstrings)
+
+    def test_counts(self, repo, skip_docstrings):
+        todos = repo_scanner.count_todos(repo, skip_docstrings=skip_docstrings)
+        assert (todos["total"], todos["files_affected"]) == (4, 3)
+        if skip_docstrings:
+            assert (todos["actionable"], todos["in_docstrings"]) == (3, 1)
+        else:
+            assert todos["counts"] == {"TODO": 2, "FIXME": 1, "HACK": 1, "XXX": 0}
+
+
+def test_scan_repo_picks_up_unstaged_edits(repo, monkeypatch):
+    """The repo fingerprint cache does not hide unstaged edits from TODO counts."""
+    monkeypatch.setattr(repo_scanner, "get_open_prs", lambda repo, org: [])
+    cache: dict = {}
+    first = repo_scanner.scan_repo("repo", repo.parent, "org", cache=cache)
+    (repo / "clean.py").write_text("def g():\n    return 2  # TODO: name this\n")
+    second = repo_scanner.scan_repo("repo", repo.parent, "org", cache=cache)
+
+    assert second["todos"]["total"] == first["todos"]["total"] + 1
+    assert second["test_files"] == first["test_files"]
+
+
+@pytest.fixture
+def big_repo(repo):
+    """The checkout plus enough files to be split into several worker chunks."""
+    for i in range(2 * repo_scanner.SCAN_CHUNK + 50):
+        marker = ["# TODO: item", '"""TODO: doc"""', "# FIXME: bug", ""][i % 4]
+        (repo / "pkg" / f"mod_{i}.py").parent.mkdir(exist_ok=True)
+        (repo / "pkg" / f"mod_{i}.py").write_text(f"def f{i}():\n    {marker}\n    return {i}\n")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "many files")
+    return repo
+
+
+@pytest.mark.parametrize("skip_docstrings", [True, False], ids=["smart", "grep"])
+def test_jobs_match_serial_scan(big_repo, monkeypatch, skip_docstrings):
+    """--jobs N gives the same results, in the same order, as a serial scan."""
+    monkeypatch.setattr(repo_scanner, "get_open_prs", lambda repo, org: [])
+    small = big_repo.parent / "small"
+    (small / "a.py").parent.mkdir()
+    (small / "a.py").write_text("x = 1  # HACK: tmp\n")
+    git(small, "init", "-q", "-b", "main")
+    git(small, "add", ".")
+    git(small, "commit", "-q", "-m", "first")
+
+    def scan(jobs):
+        for path in (big_repo, small):  # Cold: every file is scanned
+            shutil.rmtree(repo_scanner._blob_cache_path(path).parent, ignore_errors=True)
+        results = repo_scanner.scan_repos(
+            ["repo", "small"], big_repo.parent, "org", skip_docstrings=skip_docstrings, jobs=jobs
+        )
+        return [(r["name"], r["todos"], r["test_files"]) for r in results]
+
+    serial = scan(1)
+    assert serial[0][1]["total"] == 342  # 4 + three markers in every four files
+    assert scan(3) == serial
+
+
+def test_scan_smart_chunks_match(big_repo):
+    """Splitting the smart scan into chunks across processes changes nothing."""
+    rel_paths = sorted(repo_scanner._tracked_blobs(big_repo))
+    assert len(rel_paths) > 2 * repo_scanner.SCAN_CHUNK
+    with repo_scanner._start_process_pool(2) as pool:
+        chunked = repo_scanner._scan_smart(big_repo, rel_paths, pool)
+    assert chunked == repo_scanner._scan_smart(big_repo, rel_paths)
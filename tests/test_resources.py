@@ -1,8 +1,14 @@
 """Tests for system resources collector and widget."""
 
+import time
+from unittest.mock import patch
+
 import pytest
 
 from openclaw_dash.collectors import resources
+from openclaw_dash.collectors.timeseries import get_timeseries
+
+needs_psutil = pytest.mark.skipif(not resources.PSUTIL_AVAILABLE, reason="psutil not installed")
 
 
 class TestResourcesCollector:
@@ -94,6 +100,121 @@ class TestResourcesCollector:
         assert "rate_sent_bps" in net or "rate_recv_bps" in net
 
 
+@needs_psutil
+class TestResourceSampler:
+    """Tests for the background sampler."""
+
+    def test_cpu_is_read_without_sleeping(self):
+        with patch.object(
+            resources.psutil, "cpu_percent", wraps=resources.psutil.cpu_percent
+        ) as cpu_percent:
+            sampler = resources.ResourceSampler()
+            sampler._prime()
+            sampler.sample()
+        assert cpu_percent.call_count == 4
+        assert all(call.kwargs.get("interval") is None for call in cpu_percent.call_args_list)
+
+    def test_collect_reads_latest_sample(self):
+        first = resources.collect()
+        assert resources.get_sampler().running
+        start = time.perf_counter()
+        assert resources.collect() is first  # No new sample within SAMPLE_INTERVAL
+        assert time.perf_counter() - start < 0.05
+
+    def test_samples_at_fixed_rate(self):
+        sampler = resources.ResourceSampler(interval=0.02)
+        with patch.object(sampler, "sample", wraps=sampler.sample) as sample:
+            sampler.start()
+            time.sleep(0.3)
+            sampler.stop()
+        assert not sampler.running
+        assert sample.call_count >= 3
+        assert sampler.latest["available"]
+
+    def test_samples_are_new_dicts_with_rates(self):
+        sampler = resources.ResourceSampler()
+        sampler._prime()
+        first = sampler.sample()
+        second = sampler.sample()
+
+        assert first is not second
+        assert second["network"]["rate_sent_bps"] >= 0
+        assert second["network"]["rate_recv_kbps"] >= 0
+        assert get_timeseries().latest("net.recv_bps") is not None
+        assert get_timeseries().latest("cpu.percent") is not None
+
+    def test_without_psutil(self, monkeypatch):
+        monkeypatch.setattr(resources, "PSUTIL_AVAILABLE", False)
+        result = resources.collect()
+        assert result["available"] is False
+        assert resources._SAMPLER is None
+
+
+@needs_psutil
+class TestHostInfo:
+    """Tests for the cached static host facts."""
+
+    @pytest.fixture
+    def mounts(self, tmp_path, monkeypatch):
+        path = tmp_path / "mounts"
+        path.write_text("/dev/root / ext4 rw 0 0\n")
+        monkeypatch.setattr(resources, "MOUNTS_FILE", path)
+        return path
+
+    def test_static_facts_read_once(self, mounts):
+        sampler = resources.ResourceSampler()
+        with patch.object(
+            resources.psutil, "cpu_count", wraps=resources.psutil.cpu_count
+        ) as cpu_count:
+            for _ in range(3):
+                data = sampler.sample()
+        assert cpu_count.call_count == 2  # Logical and physical, once
+        assert data["cpu"]["cores_logical"] == resources.psutil.cpu_count()
+
+    def test_partitions_rescanned_when_mounts_change(self, mounts):
+        host = resources.HostInfo()
+        host.disks(0.0)
+        host.disks(1.0)
+        assert host.partition_scans == 1
+
+        mounts.write_text(mounts.read_text() + "/dev/sdb1 /mnt/data ext4 rw 0 0\n")
+        host.disks(2.0)
+        assert host.partition_scans == 2
+
+    def test_partitions_on_timer_without_proc(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resources, "MOUNTS_FILE", tmp_path / "missing")
+        host = resources.HostInfo()
+        host.disks(0.0)
+        host.disks(resources.MOUNTS_INTERVAL - 1)
+        assert host.partition_scans == 1
+        host.disks(resources.MOUNTS_INTERVAL)
+        assert host.partition_scans == 2
+
+    def test_disk_usage_on_slow_cadence(self, mounts):
+        host = resources.HostInfo()
+        with patch.object(
+            resources.psutil, "disk_usage", wraps=resources.psutil.disk_usage
+        ) as disk_usage:
+            first = host.disks(0.0)
+            reads = disk_usage.call_count
+            assert host.disks(resources.SLOW_INTERVAL - 1) is first
+            assert disk_usage.call_count == reads
+            host.disks(resources.SLOW_INTERVAL)
+            assert disk_usage.call_count == 2 * reads
+        assert any(disk["mount"] == "/" for disk in first)
+
+    def test_network_totals_from_one_read(self, mounts):
+        with patch.object(
+            resources.psutil, "net_io_counters", wraps=resources.psutil.net_io_counters
+        ) as counters:
+            data = resources.ResourceSampler().sample()
+        assert counters.call_count == 1
+        net = data["network"]
+        assert net["bytes_recv"] >= sum(i["bytes_recv"] for i in net["interfaces"])
+        assert len(net["interfaces"]) <= 3
+        assert not any(i["name"].startswith("lo") for i in net["interfaces"])
+
+
 class TestResourcesWidgetHelpers:
     """Tests for widget helper functions."""
 
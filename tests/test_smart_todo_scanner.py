@@ -0,0 +1,105 @@
+"""Tests for the smart-todo-scanner.py tool's byte-level prefilter."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Load the module with dash in filename using importlib
+# NOTE: Must register in sys.modules BEFORE exec_module() for its dataclasses
+_spec = importlib.util.spec_from_file_location(
+    "smart_todo_scanner",
+    Path(__file__).parent.parent / "src" / "openclaw_dash" / "tools" / "smart-todo-scanner.py",
+)
+smart_todo_scanner = importlib.util.module_from_spec(_spec)
+sys.modules["smart_todo_scanner"] = smart_todo_scanner
+_spec.loader.exec_module(smart_todo_scanner)
+
+has_todo_marker = smart_todo_scanner.has_todo_marker
+scan_file = smart_todo_scanner.scan_file
+
+SOURCES = {
+    "none.py": "def f():\n    return 1  # Nothing to do here\n",
+    "comment.py": "x = 1  # TODO: handle retries\n",
+    "docstring.py": '"""Module.\n\nFIXME: document the return value\n"""\n',
+    "inline.ts": "const a = 1; // hack around the old API\n",
+    "mixed_case.py": "# ToDo: one\n# fIxMe: two\n# HaCk: three\n",
+    "dotless_i.py": "# F\u0131XME: dotless i\n",
+    "dotted_i.py": "# F\u0130XME: capital dotted I\n",
+    "kelvin.py": "# HAC\u212a: the Kelvin sign\n",
+    "kelvin_no_marker.py": "temperature = 300  # \u212a\n",
+}
+
+
+@pytest.fixture
+def sources(tmp_path):
+    for name, text in SOURCES.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+class TestBytesHaveMarker:
+    """Tests for _bytes_have_marker()."""
+
+    @pytest.mark.parametrize(
+        "data", [b"TODO", b"todo", b"ToDo", b"FIXME", b"fixme", b"Hack", b"x = 1  # hAcK"]
+    )
+    def test_case_variants(self, data):
+        assert smart_todo_scanner._bytes_have_marker(data)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["F\u0131XME", "F\u0130XME", "f\u0131xme", "HAC\u212a", "hac\u212a"],
+        ids=["dotless-i", "dotted-I", "dotless-i-lower", "kelvin", "kelvin-lower"],
+    )
+    def test_folded_characters(self, text):
+        assert smart_todo_scanner._bytes_have_marker(text.encode("utf-8"))
+
+    @pytest.mark.parametrize("data", [b"", b"def f(): pass", b"to do", "\u212a".encode()])
+    def test_no_marker(self, data):
+        assert not smart_todo_scanner._bytes_have_marker(data)
+
+
+class TestHasTodoMarker:
+    """Tests for has_todo_marker()."""
+
+    def test_small_files(self, sources):
+        found = {name for name in SOURCES if has_todo_marker(sources / name)}
+        assert found == set(SOURCES) - {"none.py", "kelvin_no_marker.py"}
+
+    def test_unreadable_file(self, tmp_path):
+        assert not has_todo_marker(tmp_path / "missing.py")
+
+    @pytest.mark.parametrize("offset", [-4, -2, -1, 0])
+    def test_marker_across_mmap_chunk_boundary(self, tmp_path, offset):
+        chunk = smart_todo_scanner.MMAP_CHUNK
+        assert chunk + 64 >= smart_todo_scanner.MMAP_THRESHOLD
+        data = bytearray(b" " * (chunk + 64))
+        data[chunk + offset : chunk + offset + 5] = b"FIXME"
+        path = tmp_path / "large.py"
+        path.write_bytes(bytes(data))
+        assert has_todo_marker(path)
+
+    def test_large_file_without_marker(self, tmp_path):
+        path = tmp_path / "large.py"
+        path.write_bytes(b"x = 1\n" * (smart_todo_scanner.MMAP_THRESHOLD // 6 + 100))
+        assert not has_todo_marker(path)
+
+
+class TestScanFilePrefilter:
+    """scan_file() finds the same items with and without the prefilter."""
+
+    @pytest.mark.parametrize("name", sorted(SOURCES))
+    def test_same_items(self, sources, name):
+        path = sources / name
+        items = scan_file(path, prefilter=False)
+        assert scan_file(path, prefilter=True) == items
+        assert bool(items) == (name not in ("none.py", "kelvin_no_marker.py"))
+
+    def test_file_without_markers_is_not_decoded(self, sources, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("decoded a file without markers")
+
+        monkeypatch.setattr(Path, "read_text", fail)
+        assert scan_file(sources / "none.py") == []
@@ -0,0 +1,121 @@
+"""Tests for the in-memory metric time series."""
+
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openclaw_dash.collectors import resources
+from openclaw_dash.collectors.timeseries import (
+    DEFAULT_TIERS,
+    Series,
+    TimeSeriesStore,
+    get_timeseries,
+)
+from openclaw_dash.sinks.manager import SinkManager
+
+T0 = 1_700_000_000.0
+
+
+class TestSeries:
+    def test_rollups_are_exact_means(self):
+        series = Series(((1.0, 60), (10.0, 6)))
+        for i in range(30):
+            series.add(float(i), T0 + i)
+        fine, coarse = series.tiers
+        assert fine.recent(3) == [27.0, 28.0, 29.0]
+        # T0 is a multiple of 10, so each 10 s slot holds ten samples
+        assert [v for _, v in coarse.window(T0, T0 + 29)] == [4.5, 14.5, 24.5]
+
+    def test_ring_overwrites_oldest_slots(self):
+        series = Series(((1.0, 10),))
+        for i in range(25):
+            series.add(float(i), T0 + i)
+        tier = series.tiers[0]
+        assert tier.recent(100) == [float(i) for i in range(15, 25)]
+        assert math.isnan(tier.mean(int(T0) + 5))
+
+    def test_gaps_are_cleared_and_skipped(self):
+        series = Series(((1.0, 10),))
+        for i in range(10):
+            series.add(1.0, T0 + i)
+        series.add(5.0, T0 + 14)  # Slots 10-13 had no samples
+        tier = series.tiers[0]
+        assert tier.recent(100) == [1.0] * 5 + [5.0]
+        series.add(7.0, T0 + 100)  # Longer gap than the ring
+        assert tier.recent(100) == [7.0]
+
+    def test_samples_older_than_ring_are_ignored(self):
+        series = Series(((1.0, 10),))
+        series.add(1.0, T0 + 50)
+        series.add(99.0, T0)
+        assert series.tiers[0].recent(10) == [1.0]
+        assert series.last == (T0 + 50, 1.0)
+
+    def test_tier_for_window(self):
+        series = Series()
+        assert series.tier_for(600).resolution == 1.0
+        assert series.tier_for(86400).resolution == 10.0
+        assert series.tier_for(3600, max_points=360).resolution == 10.0
+        assert series.tier_for(30 * 86400).resolution == 60.0
+
+
+class TestTimeSeriesStore:
+    def test_record_and_read(self):
+        store = TimeSeriesStore()
+        store.record({"cpu.percent": 10, "mem.percent": None}, ts=T0)
+        store.record({"cpu.percent": 30}, ts=T0 + 1)
+        assert store.names() == ["cpu.percent"]
+        assert store.recent("cpu.percent") == [10.0, 30.0]
+        assert store.recent("missing") == []
+        assert store.window("cpu.percent", 60, now=T0 + 2) == [(T0, 10.0), (T0 + 1, 30.0)]
+
+    def test_latest_max_age(self):
+        store = TimeSeriesStore()
+        store.record({"cpu.percent": 42})
+        assert store.latest("cpu.percent", max_age=60) == 42
+        store.record({"mem.percent": 1}, ts=T0)
+        assert store.latest("mem.percent") == 1
+        assert store.latest("mem.percent", max_age=60) is None
+
+    def test_export_is_serializable(self):
+        store = TimeSeriesStore()
+        store.record({"gateway.latency_ms": 12.5})
+        exported = store.export(seconds=3600)
+        assert exported["gateway.latency_ms"]["resolution"] == 10.0
+        assert exported["gateway.latency_ms"]["points"][0][1] == 12.5
+
+    def test_default_footprint(self):
+        store = TimeSeriesStore()
+        names = ["cpu.percent", "mem.percent", "swap.percent", "load.1min", "net.sent_bps"]
+        names += [f"cpu.core.{i}" for i in range(16)]
+        store.record(dict.fromkeys(names, 1.0))
+        per_metric = sum(capacity * 10 for _, capacity in DEFAULT_TIERS)
+        assert store.nbytes == per_metric * len(names)
+        assert store.nbytes < 5 * 1024 * 1024
+
+
+class TestCollectorsRecord:
+    @pytest.mark.skipif(not resources.PSUTIL_AVAILABLE, reason="psutil not installed")
+    def test_resources_collect_records_samples(self):
+        resources.collect_with_rates()
+        resources.collect_with_rates()
+        store = get_timeseries()
+        assert len(store.recent("cpu.percent")) >= 1
+        assert "cpu.core.0" in store.names()
+        assert store.latest("net.sent_bps") is not None
+
+    def test_sinks_reuse_recent_samples(self):
+        get_timeseries().record({"cpu.percent": 12.0, "mem.percent": 34.0})
+        manager = SinkManager()
+        sink = MagicMock()
+        manager._sinks = [sink]
+        with (
+            patch.object(resources, "collect") as mock_collect,
+            patch("openclaw_dash.sinks.manager.gateway.collect", return_value={}),
+            patch("openclaw_dash.sinks.manager.alerts.collect", return_value={}),
+        ):
+            manager.refresh_and_publish()
+        mock_collect.assert_not_called()
+        payload = sink.publish_batch.call_args[0][0]
+        assert payload["resources"] == {"cpu": {"percent": 12.0}, "memory": {"percent": 34.0}}
@@ -3,8 +3,10 @@
 from unittest.mock import patch
 
 import pytest
-from textual.widgets import Static
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable, Static
 
+from openclaw_dash.app import ReposPanel
 from openclaw_dash.widgets.channels import ChannelsPanel
 
 
@@ -74,3 +76,42 @@ class TestChannelsPanelIntegration:
 
         source = inspect.getsource(DashboardApp.action_refresh)
         assert "ChannelsPanel" in source
+
+
+class ReposPanelTestApp(App):
+    """Test app for mounting ReposPanel."""
+
+    def compose(self) -> ComposeResult:
+        yield ReposPanel()
+
+
+class TestReposPanel:
+    """Tests for the ReposPanel widget."""
+
+    @pytest.mark.asyncio
+    async def test_rows_appear_before_pr_counts(self):
+        """Rows show as each repository finishes; PR counts fill in afterwards."""
+        app = ReposPanelTestApp()
+        seen = []
+
+        def fake_collect(on_repo):
+            table = app.query_one("#repos-table", DataTable)
+            entry = {"name": "b", "last_commit": "1h ago", "open_prs": None, "health": None}
+            on_repo(entry)
+            seen.append(app.call_from_thread(lambda: list(table.get_row("b"))))
+            entry.update(open_prs=3, health="MEDIUM")
+            on_repo(entry)
+            seen.append(app.call_from_thread(lambda: list(table.get_row("b"))))
+            first = {"name": "a", "last_commit": "2h ago", "open_prs": 0, "health": "EXCELLENT"}
+            return {"repos": [first, entry]}
+
+        async with app.run_test() as pilot:
+            with patch("openclaw_dash.app.repos.collect", side_effect=fake_collect):
+                app.query_one(ReposPanel).refresh_data()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+            table = app.query_one("#repos-table", DataTable)
+            rows = [table.get_row_at(i) for i in range(table.row_count)]
+
+        assert seen == [["b", "…", "…", "1h ago"], ["b", "MEDIUM", "3", "1h ago"]]
+        assert rows == [["a", "EXCELLENT", "0", "2h ago"], ["b", "MEDIUM", "3", "1h ago"]]